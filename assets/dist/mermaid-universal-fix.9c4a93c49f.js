@@ -0,0 +1,174 @@
+(function() {
+'use strict';
+console.log('Mermaid initialization script starting...');
+if (typeof mermaid === 'undefined') {
+console.log('Mermaid not found, loading from CDN...');
+const script = document.createElement('script');
+script.src = 'https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.min.js';
+script.onload = function() {
+console.log('Mermaid loaded successfully');
+initializeMermaid();
+};
+script.onerror = function() {
+console.error('Failed to load Mermaid from CDN');
+};
+document.head.appendChild(script);
+} else {
+console.log('Mermaid already loaded');
+initializeMermaid();
+}
+function initializeMermaid() {
+try {
+console.log('Initializing Mermaid configuration...');
+mermaid.initialize({
+startOnLoad: false,
+theme: 'default',
+securityLevel: 'loose',
+flowchart: {
+useMaxWidth: true,
+htmlLabels: true,
+curve: 'basis'
+},
+logLevel: 'debug'
+});
+if (document.readyState === 'loading') {
+document.addEventListener('DOMContentLoaded', processMermaidDiagrams);
+} else {
+processMermaidDiagrams();
+}
+} catch (error) {
+console.error('Error initializing Mermaid:', error);
+}
+}
+function processMermaidDiagrams() {
+console.log('Processing Mermaid diagrams...');
+try {
+const mermaidElements = document.querySelectorAll('pre.mermaid, .mermaid');
+console.log(`Found ${mermaidElements.length} Mermaid diagram(s)`);
+if (mermaidElements.length === 0) {
+console.log('No Mermaid diagrams found on this page');
+return;
+}
+mermaidElements.forEach((element, index) => {
+try {
+const graphDefinition = element.textContent.trim();
+console.log(`Processing diagram ${index + 1}:`, graphDefinition.substring(0, 50) + '...');
+if (!element.id) {
+element.id = `mermaid-diagram-${index}`;
+}
+element.innerHTML = graphDefinition;
+element.removeAttribute('data-processed');
+mermaid.init(undefined, element);
+console.log(`Diagram ${index + 1} processed successfully`);
+} catch (error) {
+console.error(`Error processing diagram ${index + 1}:`, error);
+try {
+console.log(`Trying alternative rendering for diagram ${index + 1}`);
+const graphDefinition = element.textContent.trim();
+const insertSvg = function(svgCode) {
+element.innerHTML = svgCode;
+};
+mermaid.mermaidAPI.render(`mermaid-svg-${index}`, graphDefinition, insertSvg);
+} catch (altError) {
+console.error(`Alternative rendering also failed for diagram ${index + 1}:`, altError);
+element.innerHTML = `<div style="color: red; padding: 10px; border: 1px solid red;">
+                            Error rendering Mermaid diagram. Check console for details.
+                        </div>`;
+}
+}
+});
+} catch (error) {
+console.error('Error processing Mermaid diagrams:', error);
+}
+}
+window.reinitializeMermaid = function() {
+console.log('Manually reinitializing Mermaid...');
+if (typeof mermaid !== 'undefined') {
+processMermaidDiagrams();
+} else {
+console.error('Mermaid is not loaded');
+}
+};
+console.log('Mermaid initialization script loaded. Use window.reinitializeMermaid() to manually trigger.');
+})();
+;
+(function() {
+'use strict';
+function centerMermaidDiagrams() {
+const centerFixContainers = document.querySelectorAll('.mermaid-center-fix');
+centerFixContainers.forEach(function(container) {
+const svg = container.querySelector('svg');
+if (svg) {
+if (svg.style.maxWidth) {
+svg.style.removeProperty('max-width');
+}
+svg.style.display = 'inline-block';
+svg.style.marginLeft = '-20px';
+svg.style.marginRight = 'auto';
+const svgContainer = svg.parentElement;
+if (svgContainer && svgContainer.id && svgContainer.id.startsWith('mermaid')) {
+svgContainer.style.textAlign = 'left';
+svgContainer.style.display = 'inline-block';
+svgContainer.style.width = 'auto';
+svgContainer.style.paddingLeft = '0';
+}
+const wrapperDiv = container.querySelector('.mermaid-wrapper');
+if (wrapperDiv) {
+wrapperDiv.style.textAlign = 'center';
+wrapperDiv.style.paddingLeft = '50px';
+}
+const preMermaid = container.querySelector('pre.mermaid');
+if (preMermaid) {
+const mermaidDiv = container.querySelector('div[id^="mermaid"]');
+if (mermaidDiv) {
+mermaidDiv.style.textAlign = 'left';
+mermaidDiv.style.display = 'inline-block';
+mermaidDiv.style.width = 'auto';
+mermaidDiv.style.marginLeft = '-30px';
+}
+}
+}
+});
+}
+if (typeof mermaid !== 'undefined') {
+const originalInit = mermaid.init;
+mermaid.init = function() {
+const result = originalInit.apply(this, arguments);
+setTimeout(centerMermaidDiagrams, 100);
+return result;
+};
+if (mermaid.run) {
+const originalRun = mermaid.run;
+mermaid.run = function() {
+const result = originalRun.apply(this, arguments);
+setTimeout(centerMermaidDiagrams, 100);
+return result;
+};
+}
+}
+if (document.readyState === 'loading') {
+document.addEventListener('DOMContentLoaded', function() {
+setTimeout(centerMermaidDiagrams, 500);
+});
+} else {
+setTimeout(centerMermaidDiagrams, 500);
+}
+window.addEventListener('load', function() {
+setTimeout(centerMermaidDiagrams, 1000);
+});
+const observer = new MutationObserver(function(mutations) {
+mutations.forEach(function(mutation) {
+if (mutation.type === 'childList') {
+mutation.addedNodes.forEach(function(node) {
+if (node.nodeType === 1 && (node.tagName === 'SVG' || (node.id && node.id.startsWith('mermaid')))) {
+setTimeout(centerMermaidDiagrams, 100);
+}
+});
+}
+});
+});
+observer.observe(document.body, {
+childList: true,
+subtree: true
+});
+})();
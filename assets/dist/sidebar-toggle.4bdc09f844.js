@@ -0,0 +1,106 @@
+(function() {
+'use strict';
+const sidebar = document.querySelector('.sidebar, aside.sidebar');
+if (!sidebar) return;
+const toggleButton = document.createElement('button');
+toggleButton.className = 'sidebar-toggle';
+toggleButton.setAttribute('aria-label', 'Toggle Sidebar');
+toggleButton.setAttribute('title', 'Toggle Sidebar (Ctrl+B)');
+toggleButton.innerHTML = `
+        <svg xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24" stroke="currentColor">
+            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M15 19l-7-7 7-7" />
+        </svg>
+    `;
+const backdrop = document.createElement('div');
+backdrop.className = 'sidebar-backdrop';
+document.body.appendChild(toggleButton);
+document.body.appendChild(backdrop);
+const savedState = localStorage.getItem('sidebarCollapsed');
+if (savedState === null || savedState === 'true') {
+sidebar.classList.add('collapsed');
+document.body.classList.add('sidebar-collapsed');
+if (savedState === null) {
+localStorage.setItem('sidebarCollapsed', 'true');
+}
+}
+function forceReflow() {
+window.dispatchEvent(new Event('resize'));
+}
+function toggleSidebar() {
+const isCollapsed = sidebar.classList.contains('collapsed');
+if (isCollapsed) {
+sidebar.classList.remove('collapsed');
+document.body.classList.remove('sidebar-collapsed');
+localStorage.setItem('sidebarCollapsed', 'false');
+showStateIndicator('Sidebar shown');
+} else {
+sidebar.classList.add('collapsed');
+document.body.classList.add('sidebar-collapsed');
+localStorage.setItem('sidebarCollapsed', 'true');
+showStateIndicator('Sidebar hidden');
+}
+forceReflow();
+setTimeout(() => {
+window.dispatchEvent(new Event('resize'));
+}, 350);
+}
+function showStateIndicator(message) {
+let indicator = document.querySelector('.sidebar-state-indicator');
+if (!indicator) {
+indicator = document.createElement('div');
+indicator.className = 'sidebar-state-indicator';
+sidebar.appendChild(indicator);
+}
+indicator.textContent = message;
+indicator.classList.add('show');
+setTimeout(() => {
+indicator.classList.remove('show');
+}, 2000);
+}
+toggleButton.addEventListener('click', toggleSidebar);
+backdrop.addEventListener('click', () => {
+if (window.innerWidth <= 768) {
+toggleSidebar();
+}
+});
+document.addEventListener('keydown', (e) => {
+if ((e.ctrlKey || e.metaKey) && e.key === 'b') {
+e.preventDefault();
+toggleSidebar();
+}
+});
+let resizeTimer;
+window.addEventListener('resize', () => {
+clearTimeout(resizeTimer);
+resizeTimer = setTimeout(() => {
+if (window.innerWidth > 768) {
+backdrop.classList.remove('active');
+}
+forceReflow();
+}, 250);
+});
+const sidebarLinks = sidebar.querySelectorAll('.sidebar-link');
+let currentFocusIndex = -1;
+document.addEventListener('keydown', (e) => {
+if (sidebar.classList.contains('collapsed')) return;
+if (e.altKey && e.key === 's') {
+e.preventDefault();
+if (sidebarLinks.length > 0) {
+currentFocusIndex = 0;
+sidebarLinks[currentFocusIndex].focus();
+}
+}
+if (document.activeElement.classList.contains('sidebar-link')) {
+if (e.key === 'ArrowDown') {
+e.preventDefault();
+currentFocusIndex = (currentFocusIndex + 1) % sidebarLinks.length;
+sidebarLinks[currentFocusIndex].focus();
+} else if (e.key === 'ArrowUp') {
+e.preventDefault();
+currentFocusIndex = currentFocusIndex <= 0 ? sidebarLinks.length - 1 : currentFocusIndex - 1;
+sidebarLinks[currentFocusIndex].focus();
+}
+}
+});
+console.log('Sidebar toggle initialized. Use Ctrl/Cmd+B to toggle.');
+})();
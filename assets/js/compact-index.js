@@ -0,0 +1,289 @@
+// Decoder for the compact binary search indexes in /assets/data/search/
+// (typeahead.bin, code.bin; format in scripts/compact_index.py).
+// A file is decoded once into typed arrays; a lookup then walks the radix
+// tree edge by edge, and a prefix with many matches below it answers from
+// its precomputed best entries, so a keystroke never scans the dictionary.
+(function() {
+    'use strict';
+
+    const MAGIC = 'CSIX';
+    const FORMAT_VERSION = 2;
+    const FLAG_POSTINGS = 1;
+    const FLAG_TOP_ENTRIES = 2;
+    const WORD_PATTERN = /[a-z0-9][a-z0-9_]+/g;
+
+    class CompactIndex {
+        constructor(buffer) {
+            const bytes = new Uint8Array(buffer);
+            let pos = 0;
+            const varint = () => {
+                let value = 0;
+                let shift = 0;
+                let byte;
+                do {
+                    byte = bytes[pos++];
+                    value |= (byte & 0x7f) << shift;
+                    shift += 7;
+                } while (byte & 0x80);
+                return value >>> 0;
+            };
+            const skipVarint = () => {
+                while (bytes[pos++] & 0x80) { /* continuation byte */ }
+            };
+
+            if (String.fromCharCode(bytes[0], bytes[1], bytes[2], bytes[3]) !== MAGIC) {
+                throw new Error('Not a compact search index');
+            }
+            pos = 4;
+            if (varint() !== FORMAT_VERSION) {
+                throw new Error('Unsupported compact search index version');
+            }
+            this.scale = new DataView(bytes.buffer, bytes.byteOffset + pos, 4).getFloat32(0, true);
+            pos += 4;
+
+            // Strings are decoded on first use
+            const stringCount = varint();
+            this.stringStart = new Uint32Array(stringCount);
+            this.stringLength = new Uint32Array(stringCount);
+            this.strings = new Array(stringCount);
+            for (let i = 0; i < stringCount; i++) {
+                this.stringLength[i] = varint();
+                this.stringStart[i] = pos;
+                pos += this.stringLength[i];
+            }
+            this.bytes = bytes;
+            this.decoder = new TextDecoder();
+
+            this.stopWords = new Set();
+            for (let i = varint(); i > 0; i--) {
+                this.stopWords.add(this.string(varint()));
+            }
+
+            // One string id per field (e.g. label, url, group) per entry
+            this.fields = [];
+            for (let i = varint(); i > 0; i--) {
+                this.fields.push(this.string(varint()));
+            }
+            const entryCount = varint();
+            this.entryStrings = new Uint32Array(entryCount * this.fields.length);
+            for (let i = 0; i < this.entryStrings.length; i++) {
+                this.entryStrings[i] = varint();
+            }
+
+            // Nodes are in preorder: a node's first child directly follows it
+            const count = varint();
+            this.labelStart = new Uint32Array(count);
+            this.labelLength = new Uint16Array(count);
+            this.childCount = new Uint16Array(count);
+            this.nextSibling = new Int32Array(count).fill(-1);
+            this.postingsStart = new Uint32Array(count);
+            this.postingsCount = new Uint32Array(count);
+            this.topStart = new Uint32Array(count);
+            this.topCount = new Uint8Array(count);
+
+            const parents = [];
+            const remaining = new Uint16Array(count);
+            const lastChild = new Int32Array(count).fill(-1);
+            for (let node = 0; node < count; node++) {
+                if (parents.length) {
+                    const parent = parents[parents.length - 1];
+                    if (lastChild[parent] >= 0) this.nextSibling[lastChild[parent]] = node;
+                    lastChild[parent] = node;
+                    if (--remaining[parent] === 0) parents.pop();
+                }
+                this.labelLength[node] = varint();
+                this.labelStart[node] = pos;
+                pos += this.labelLength[node];
+                const flags = varint();
+                const children = varint();
+                this.childCount[node] = children;
+                if (flags & FLAG_POSTINGS) {
+                    const postings = varint();
+                    this.postingsCount[node] = postings;
+                    this.postingsStart[node] = pos;
+                    for (let i = 0; i < postings; i++) {
+                        skipVarint();
+                        pos++;
+                    }
+                }
+                if (flags & FLAG_TOP_ENTRIES) {
+                    const top = varint();
+                    this.topCount[node] = top;
+                    this.topStart[node] = pos;
+                    for (let i = 0; i < top; i++) skipVarint();
+                }
+                if (children) {
+                    remaining[node] = children;
+                    parents.push(node);
+                }
+            }
+        }
+
+        static load(url) {
+            return fetch(url).then(response => {
+                if (!response.ok) {
+                    throw new Error('Search index file missing: ' + url);
+                }
+                return response.arrayBuffer();
+            }).then(buffer => new CompactIndex(buffer));
+        }
+
+        get size() {
+            return this.entryStrings.length / this.fields.length;
+        }
+
+        string(id) {
+            if (this.strings[id] === undefined) {
+                const start = this.stringStart[id];
+                this.strings[id] = this.decoder.decode(this.bytes.subarray(start, start + this.stringLength[id]));
+            }
+            return this.strings[id];
+        }
+
+        entry(id) {
+            const entry = { id: id };
+            const base = id * this.fields.length;
+            this.fields.forEach((field, i) => {
+                entry[field] = this.string(this.entryStrings[base + i]);
+            });
+            return entry;
+        }
+
+        // Node at which text ends: for a prefix, the root of the subtree of
+        // every term starting with it; for an exact term, its own node.
+        // Returns -1 if there is none.
+        find(text, exact) {
+            const bytes = this.bytes;
+            let node = 0;
+            let i = 0;
+            while (i < text.length) {
+                const code = text.charCodeAt(i);
+                let child = this.childCount[node] ? node + 1 : -1;
+                while (child >= 0 && bytes[this.labelStart[child]] !== code) {
+                    child = this.nextSibling[child];
+                }
+                if (child < 0) return -1;
+                const start = this.labelStart[child];
+                const length = this.labelLength[child];
+                for (let j = 1; j < length; j++) {
+                    if (i + j >= text.length) return exact ? -1 : child;
+                    if (bytes[start + j] !== text.charCodeAt(i + j)) return -1;
+                }
+                i += length;
+                node = child;
+            }
+            return exact && !this.postingsCount[node] ? -1 : node;
+        }
+
+        // Call visit(entry, weight) for every posting of a node
+        forEachPosting(node, visit) {
+            const bytes = this.bytes;
+            let pos = this.postingsStart[node];
+            let entry = 0;
+            for (let i = this.postingsCount[node]; i > 0; i--) {
+                let delta = 0;
+                let shift = 0;
+                let byte;
+                do {
+                    byte = bytes[pos++];
+                    delta |= (byte & 0x7f) << shift;
+                    shift += 7;
+                } while (byte & 0x80);
+                entry += delta;
+                visit(entry, bytes[pos++] * this.scale);
+            }
+        }
+
+        // Highest weight per entry over every term below a node
+        subtreeWeights(node) {
+            const weights = new Map();
+            const keepBest = (entry, weight) => {
+                if (!(weights.get(entry) >= weight)) weights.set(entry, weight);
+            };
+            const stack = [node];
+            while (stack.length) {
+                const current = stack.pop();
+                this.forEachPosting(current, keepBest);
+                for (let child = this.childCount[current] ? current + 1 : -1; child >= 0;
+                    child = this.nextSibling[child]) {
+                    stack.push(child);
+                }
+            }
+            return weights;
+        }
+
+        // Best entries for a word prefix, e.g. complete('wpd') for type-ahead
+        complete(prefix, limit) {
+            limit = limit || 10;
+            const node = this.find(prefix.toLowerCase(), false);
+            if (node < 0) return [];
+            if (this.topCount[node] >= limit) {
+                const ids = [];
+                let pos = this.topStart[node];
+                for (let i = Math.min(limit, this.topCount[node]); i > 0; i--) {
+                    let id = 0;
+                    let shift = 0;
+                    let byte;
+                    do {
+                        byte = this.bytes[pos++];
+                        id |= (byte & 0x7f) << shift;
+                        shift += 7;
+                    } while (byte & 0x80);
+                    ids.push(id);
+                }
+                return ids.map(id => this.entry(id));
+            }
+            return rank(this.subtreeWeights(node), limit).map(id => this.entry(id));
+        }
+
+        // Entries matching every word of a query, by summed BM25 weight. The
+        // last word is still being typed (unless the query ends in a space),
+        // so it matches as a prefix.
+        search(query, limit) {
+            limit = limit || 10;
+            const typing = !/\s$/.test(query);
+            const words = query.toLowerCase().match(WORD_PATTERN) || [];
+            const last = typing ? words.pop() : null;
+            const complete = words.filter(word => !this.stopWords.has(word));
+            if (!complete.length) {
+                return last ? this.complete(last, limit) : [];
+            }
+
+            let totals = null;
+            const add = scores => {
+                if (totals === null) {
+                    totals = scores;
+                    return;
+                }
+                const combined = new Map();
+                totals.forEach((score, entry) => {
+                    if (scores.has(entry)) combined.set(entry, score + scores.get(entry));
+                });
+                totals = combined;
+            };
+            for (const word of complete) {
+                const node = this.find(word, true);
+                if (node < 0) return [];
+                const scores = new Map();
+                this.forEachPosting(node, (entry, weight) => scores.set(entry, weight));
+                add(scores);
+            }
+            if (last) {
+                const node = this.find(last, false);
+                if (node < 0) return [];
+                add(this.subtreeWeights(node));
+            }
+            return rank(totals, limit).map(id => this.entry(id));
+        }
+    }
+
+    // Ids of the highest-scoring entries, best first
+    function rank(scores, limit) {
+        return Array.from(scores)
+            .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+            .slice(0, limit)
+            .map(pair => pair[0]);
+    }
+
+    window.CompactIndex = CompactIndex;
+})();
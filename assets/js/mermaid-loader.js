@@ -0,0 +1,67 @@
+// Mermaid Loader - load the Mermaid runtime only when a diagram is near.
+// The asset pipeline (scripts/asset_pipeline.py) adds this script, deferred,
+// to the pages that have diagrams; data-mermaid-bundle names the bundle of
+// the page's own Mermaid scripts (e.g. mermaid-universal-fix.js). Nothing is
+// fetched until a diagram is about to scroll into view.
+(function() {
+    'use strict';
+
+    const MERMAID_URL = 'https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.min.js';
+    // Start loading a little before the first diagram becomes visible
+    const ROOT_MARGIN = '300px 0px';
+
+    const loader = document.currentScript;
+    const bundle = loader ? loader.getAttribute('data-mermaid-bundle') : null;
+    let started = false;
+
+    function loadScript(src) {
+        return new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = src;
+            script.onload = resolve;
+            script.onerror = () => reject(new Error('Failed to load ' + src));
+            document.head.appendChild(script);
+        });
+    }
+
+    function loadMermaid() {
+        if (started) return;
+        started = true;
+        // With the runtime already present, the page's scripts initialize it
+        // right away instead of fetching it themselves
+        const runtime = typeof window.mermaid === 'undefined' ? loadScript(MERMAID_URL) : Promise.resolve();
+        runtime
+            .then(() => bundle ? loadScript(bundle) : null)
+            .then(() => {
+                // Scripts configured with startOnLoad wait for the window load
+                // event, which may have passed already
+                if (document.readyState === 'complete' && window.mermaid &&
+                    typeof window.mermaid.contentLoaded === 'function') {
+                    window.mermaid.contentLoaded();
+                }
+            })
+            .catch(error => console.error('Mermaid could not be loaded:', error));
+    }
+
+    function watchDiagrams() {
+        const diagrams = document.querySelectorAll('.mermaid');
+        if (!diagrams.length) return;
+        if (!('IntersectionObserver' in window)) {
+            loadMermaid();
+            return;
+        }
+        const observer = new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.isIntersecting)) {
+                observer.disconnect();
+                loadMermaid();
+            }
+        }, { rootMargin: ROOT_MARGIN });
+        diagrams.forEach(diagram => observer.observe(diagram));
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', watchDiagrams);
+    } else {
+        watchDiagrams();
+    }
+})();
@@ -43,5 +43,37 @@
         }
     });
     
+    // Code examples: give every <pre> without an id the anchor the code
+    // search index links to (code-<n> for the n-th <pre> of the page)
+    document.querySelectorAll('pre').forEach((pre, i) => {
+        if (!pre.id) pre.id = 'code-' + (i + 1);
+    });
+    if (/^#code-\d+$/.test(window.location.hash)) {
+        const target = document.getElementById(window.location.hash.slice(1));
+        if (target) target.scrollIntoView();
+    }
+    
+    // Search: load the search scripts (and through them the index) only
+    // once the visitor starts using the search box
+    const searchInputs = document.querySelectorAll('.search-input');
+    let searchLoading = false;
+    
+    function loadSearch() {
+        if (searchLoading) return;
+        searchLoading = true;
+        // Not async, so the type-ahead decoder runs before search.js
+        ['/assets/js/compact-index.js', '/assets/js/search.js'].forEach(src => {
+            const script = document.createElement('script');
+            script.src = src;
+            script.async = false;
+            document.head.appendChild(script);
+        });
+    }
+    
+    searchInputs.forEach(input => {
+        input.addEventListener('focus', loadSearch, { once: true });
+        input.addEventListener('input', loadSearch, { once: true });
+    });
+    
     console.log('Navigation initialized');
 })();
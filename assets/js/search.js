@@ -0,0 +1,213 @@
+// Lesson search over the sharded index in /assets/data/search/
+// (built by scripts/build_search_index.py). Only the term buckets and the
+// module shards a query needs are fetched, and each file is fetched once.
+// While typing, lesson titles and headings are suggested on every keystroke
+// from typeahead.bin (decoded by compact-index.js), without waiting for the
+// debounced full search. The full search also lists the lessons whose code
+// examples use the query's identifiers (code.bin, fetched on first search).
+(function() {
+    'use strict';
+
+    const INDEX_BASE = '/assets/data/search/';
+    const MAX_RESULTS = 10;
+    const MAX_SUGGESTIONS = 5;
+    const MAX_CODE_BLOCKS = 100;
+    const MAX_CODE_LESSONS = 5;
+    const MAX_PREFIX_TERMS = 20;
+    const WORD_PATTERN = /[a-z0-9_][a-z0-9_]+/g;
+
+    const requests = new Map();
+
+    function fetchIndexFile(path) {
+        if (!requests.has(path)) {
+            requests.set(path, fetch(INDEX_BASE + path).then(response => {
+                if (!response.ok) {
+                    throw new Error('Search index file missing: ' + path);
+                }
+                return response.json();
+            }));
+        }
+        return requests.get(path);
+    }
+
+    function tokenize(query, stopWords) {
+        return (query.toLowerCase().match(WORD_PATTERN) || [])
+            .filter(term => !stopWords.has(term));
+    }
+
+    // Shards (by name) whose bit is set in a term's mask
+    function shardsOf(mask, shards) {
+        return shards.filter((shard, i) => mask & (1 << i));
+    }
+
+    // Terms in the dictionary matching a query word: the word itself, or
+    // (for the word being typed) every term it is a prefix of
+    async function expandTerm(word, isPrefix) {
+        const bucket = await fetchIndexFile('terms/' + word[0] + '.json').catch(() => ({}));
+        if (!isPrefix) {
+            return word in bucket ? [[word, bucket[word]]] : [];
+        }
+        const matches = [];
+        for (const term in bucket) {
+            if (term.startsWith(word)) {
+                matches.push([term, bucket[term]]);
+                if (matches.length >= MAX_PREFIX_TERMS) break;
+            }
+        }
+        return matches;
+    }
+
+    // Summed weights per "shard:doc" for one query word
+    async function scoreWord(word, isPrefix, shards) {
+        const scores = new Map();
+        const terms = await expandTerm(word, isPrefix);
+        await Promise.all(terms.map(async ([term, mask]) => {
+            await Promise.all(shardsOf(mask, shards).map(async shard => {
+                const postings = (await fetchIndexFile(shard + '/' + term[0] + '.json'))[term] || [];
+                for (let i = 0; i < postings.length; i += 2) {
+                    const key = shard + ':' + postings[i];
+                    scores.set(key, (scores.get(key) || 0) + postings[i + 1]);
+                }
+            }));
+        }));
+        return scores;
+    }
+
+    async function search(query) {
+        const manifest = await fetchIndexFile('manifest.json');
+        const words = tokenize(query, new Set(manifest.stop_words));
+        if (!words.length) return [];
+
+        // The last word is still being typed, so match it as a prefix
+        const perWord = await Promise.all(words.map((word, i) =>
+            scoreWord(word, i === words.length - 1, manifest.shards)));
+
+        // Every word must match; a document's score is the sum over words
+        let totals = perWord[0];
+        for (const scores of perWord.slice(1)) {
+            const combined = new Map();
+            totals.forEach((score, key) => {
+                if (scores.has(key)) combined.set(key, score + scores.get(key));
+            });
+            totals = combined;
+        }
+
+        const top = Array.from(totals).sort((a, b) => b[1] - a[1]).slice(0, MAX_RESULTS);
+        return Promise.all(top.map(async ([key]) => {
+            const [shard, doc] = key.split(':');
+            const documents = await fetchIndexFile(shard + '/docs.json');
+            return documents[Number(doc)];
+        }));
+    }
+
+    // Compact indexes by file name; null if one cannot be loaded
+    const compactIndexes = new Map();
+
+    function loadCompactIndex(name) {
+        if (!compactIndexes.has(name)) {
+            compactIndexes.set(name, window.CompactIndex
+                ? window.CompactIndex.load(INDEX_BASE + name).catch(error => {
+                    console.error('Search index failed to load:', name, error);
+                    return null;
+                })
+                : Promise.resolve(null));
+        }
+        return compactIndexes.get(name);
+    }
+
+    // Lessons whose code examples match a query, each linking to its best
+    // matching block
+    async function searchCode(query) {
+        const index = await loadCompactIndex('code.bin');
+        if (!index) return [];
+        const lessons = new Map();
+        index.search(query, MAX_CODE_BLOCKS).forEach(block => {
+            const lesson = lessons.get(block.url);
+            if (lesson) {
+                lesson.count++;
+            } else {
+                lessons.set(block.url, {
+                    title: block.title,
+                    url: block.url + '#' + block.anchor,
+                    count: 1
+                });
+            }
+        });
+        return Array.from(lessons.values()).slice(0, MAX_CODE_LESSONS);
+    }
+
+    function escapeHTML(text) {
+        const div = document.createElement('div');
+        div.textContent = text;
+        return div.innerHTML;
+    }
+
+    // Suggestions first, then lesson results and lessons with matching code
+    // examples (results is null while still searching)
+    function renderResults(container, query, suggestions, results, code) {
+        if (!query.trim()) {
+            container.innerHTML = '';
+            container.classList.remove('show');
+            return;
+        }
+        const items = suggestions.map(entry => `
+                <a class="search-result search-suggestion" href="${entry.url}">
+                    <div class="search-result-title">${escapeHTML(entry.label)}</div>
+                    <div class="search-result-module">${escapeHTML(entry.group)}</div>
+                </a>`).concat((results || []).map(doc => `
+                <a class="search-result" href="${doc.url}">
+                    <div class="search-result-title">${escapeHTML(doc.title)}</div>
+                    <div class="search-result-module">${escapeHTML(doc.module)}</div>
+                    <div class="search-result-module">${escapeHTML(doc.content)}</div>
+                </a>`), (code || []).map(lesson => `
+                <a class="search-result search-code-result" href="${lesson.url}">
+                    <div class="search-result-title">${escapeHTML(lesson.title)}</div>
+                    <div class="search-result-module">${lesson.count} matching code example${lesson.count === 1 ? '' : 's'}</div>
+                </a>`));
+        if (!items.length && !results) return;
+        container.innerHTML = items.length
+            ? items.join('')
+            : '<p class="search-no-results">No lessons found</p>';
+        container.classList.add('show');
+    }
+
+    function attach(input) {
+        const wrapper = input.closest('.search-container');
+        const container = wrapper && wrapper.querySelector('.search-results');
+        if (!container || input.dataset.searchReady) return;
+        input.dataset.searchReady = 'true';
+
+        let timer = null;
+        let latest = 0;
+        let suggestIndex = null;
+        let suggestions = [];
+        const suggest = () => {
+            const query = input.value;
+            suggestions = suggestIndex ? suggestIndex.search(query, MAX_SUGGESTIONS) : [];
+            renderResults(container, query, suggestions, null);
+        };
+        const run = () => {
+            const query = input.value;
+            const current = ++latest;
+            Promise.all([search(query), searchCode(query)])
+                .then(([results, code]) => {
+                    // Ignore answers to queries the user has already typed past
+                    if (current === latest) renderResults(container, query, suggestions, results, code);
+                })
+                .catch(error => console.error('Search failed:', error));
+        };
+        input.addEventListener('input', () => {
+            suggest();
+            clearTimeout(timer);
+            timer = setTimeout(run, 150);
+        });
+        loadCompactIndex('typeahead.bin').then(index => {
+            suggestIndex = index;
+            if (input.value && !latest) suggest();
+        });
+        if (input.value) run();
+    }
+
+    window.CourseSearch = { search: search, attach: attach };
+    document.querySelectorAll('.search-input').forEach(attach);
+})();
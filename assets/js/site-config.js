@@ -5,6 +5,7 @@ const SiteConfig = {
     siteAuthor: 'PHP WordPress Course',
     siteYear: new Date().getFullYear(),
     
+    // BEGIN generated from course.json (python scripts/course_manifest.py generate)
     modules: [
         {
             number: 1,
@@ -64,7 +65,7 @@ const SiteConfig = {
         },
         {
             number: 8,
-            title: 'WordPress Deployment & Maintenance',
+            title: 'WordPress Deployment, Docker & Maintenance',
             folder: '08module',
             duration: '1 week',
             sessions: 5,
@@ -79,6 +80,7 @@ const SiteConfig = {
             description: 'Apply everything learned to build a complete WordPress application.'
         }
     ],
+    // END generated from course.json
     
     navigation: [
         { title: 'Home', url: '/', type: 'link' },
@@ -4,8 +4,13 @@ Simple script to update links in all moved HTML files
 """
 
 import os
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from link_graph import get_link_graph
+from output_writer import write_if_changed
+
 # Base path
 base_path = Path(r"\\wsl$\Ubuntu\home\practicalace\projects\php_wordpress\06module")
 
@@ -38,12 +43,22 @@ files_to_update = [
     'homework_security_audit.html'
 ]
 
+# Only files that still link into the old module directories need a rewrite
+graph = get_link_graph(base_path.parent)
+needs_update = {
+    Path(page).name
+    for page in graph.pages_linking_into(['07module', '08module', '09module', '10module'])
+    if Path(page).parent.name == base_path.name
+}
+
 updated_count = 0
 
 for filename in files_to_update:
     file_path = base_path / filename
     
-    if file_path.exists():
+    if file_path.exists() and filename not in needs_update:
+        print(f"  No changes: {filename}")
+    elif file_path.exists():
         try:
             # Read file
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -58,8 +73,7 @@ for filename in files_to_update:
             
             # Write back if changed
             if content != original:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                write_if_changed(file_path, content)
                 updated_count += 1
                 print(f"✓ Updated: {filename}")
             else:
@@ -7,8 +7,12 @@ into 06module folder and update breadcrumb paths in the moved files.
 import os
 import re
 import shutil
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from output_writer import write_if_changed
+
 def get_wsl_path():
     """Get the base WSL path for the project"""
     # For Windows WSL path
@@ -105,8 +109,7 @@ def update_breadcrumbs(file_path):
         
         # Only write if changes were made
         if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_if_changed(file_path, content)
             return updates_made
         
     except Exception as e:
@@ -5,8 +5,16 @@ Update all links in moved HTML files from 07module, 08module, 09module to 06modu
 
 import os
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from link_graph import get_link_graph
+from output_writer import write_if_changed
+
+# Module directories whose links need rewriting
+OLD_MODULE_DIRS = ['07module', '08module', '09module', '10module']
+
 def update_file_links(filepath):
     """Update all module links in a single file"""
     try:
@@ -40,8 +48,7 @@ def update_file_links(filepath):
         
         # Only write if changes were made
         if content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_if_changed(filepath, content)
             return changes_made
         
         return []
@@ -92,6 +99,14 @@ def main():
     print(f"Files to update: {len(moved_files)}")
     print("-" * 60)
     
+    # Only files that still link into the old module directories need a rewrite
+    graph = get_link_graph(os.path.dirname(base_path))
+    module_dir = os.path.basename(base_path)
+    needs_update = {
+        os.path.basename(page) for page in graph.pages_linking_into(OLD_MODULE_DIRS)
+        if os.path.dirname(page) == module_dir
+    }
+    
     # Track statistics
     files_updated = 0
     files_not_found = 0
@@ -103,7 +118,7 @@ def main():
         
         if os.path.exists(filepath):
             print(f"\nProcessing: {filename}")
-            changes = update_file_links(filepath)
+            changes = update_file_links(filepath) if filename in needs_update else []
             
             if changes:
                 files_updated += 1
@@ -12,6 +12,9 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import sys
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from output_writer import write_if_changed
+
 class SessionSidebarFixer:
     def __init__(self, base_path: str):
         """Initialize with the project base path"""
@@ -251,8 +254,7 @@ class SessionSidebarFixer:
                 new_content = re.sub(article_pattern, new_sidebar + '\n                    \\1', content)
             
             if new_content != content:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
+                write_if_changed(file_path, new_content)
                 print(f"  ✓ Updated {filename} ({session_title})")
                 return True
             else:
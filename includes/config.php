@@ -19,6 +19,7 @@ define('JS_PATH', ASSETS_PATH . '/js');
 define('IMG_PATH', ASSETS_PATH . '/images');
 
 // Module Information
+// BEGIN generated from course.json (python scripts/course_manifest.py generate)
 $modules = [
     1 => [
         'title' => 'Web Development Fundamentals',
@@ -84,6 +85,7 @@ $modules = [
         'description' => 'Apply everything learned to build a complete WordPress application.'
     ]
 ];
+// END generated from course.json
 
 // Social Media Links (Optional)
 $social_links = [
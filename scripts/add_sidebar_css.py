@@ -5,18 +5,18 @@ This should be run AFTER fix_01module_navigation.py
 """
 
 import os
-from bs4 import BeautifulSoup
+
+from asset_pipeline import find_asset_tag
+from course_corpus import get_store
+from output_writer import write_if_changed
 
 def add_css_to_file(filepath):
     """Add the enhanced sidebar CSS link to an HTML file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = get_store().mutable_soup(filepath)
         
         # Check if the CSS is already linked
-        existing_link = soup.find('link', {'href': '/assets/css/sidebar-enhanced.css'})
+        existing_link = find_asset_tag(soup, 'link', 'href', '/assets/css/sidebar-enhanced.css')
         if existing_link:
             print(f"  ✓ CSS already linked in {os.path.basename(filepath)}")
             return True
@@ -47,8 +47,7 @@ def add_css_to_file(filepath):
             head.append(new_link)
         
         # Write back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(str(soup))
+        write_if_changed(filepath, str(soup))
         
         print(f"  ✓ Added CSS link to {os.path.basename(filepath)}")
         return True
@@ -5,9 +5,10 @@ This helps identify inconsistencies between module navigation implementations.
 """
 
 import os
-from bs4 import BeautifulSoup
 import json
 
+from course_corpus import get_store
+
 def analyze_module_navigation(module_dir, module_name):
     """Analyze navigation structure in a module's files."""
     results = {
@@ -41,10 +42,7 @@ def analyze_module_navigation(module_dir, module_name):
         }
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = get_store().soup(filepath)
             
             # Check for sidebar
             sidebar = soup.find('aside', class_='sidebar')
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Minifiers and content-hash naming for the site's CSS and JavaScript.
+
+Both minifiers are conservative: they scan the source once, copy strings,
+template literals and regular expressions verbatim, and only drop comments
+and redundant whitespace around them. The JavaScript minifier keeps line
+breaks, so automatic semicolon insertion sees the same statements. The
+CSS minifier also inlines local @import rules and rewrites relative url()
+references to site-absolute paths, since a bundle is served from a
+different directory than its sources.
+"""
+
+import hashlib
+import posixpath
+import re
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+from course_corpus import PROJECT_ROOT
+
+HASH_LENGTH = 10
+
+# Characters after which a '/' starts a regular expression, not a division
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+REGEX_KEYWORDS = frozenset(['return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'delete', 'void',
+                            'throw', 'new', 'instanceof', 'yield', 'await'])
+
+CSS_IMPORT_PATTERN = re.compile(
+    r'@import\s+(?:url\(\s*)?["\']?([^"\')\s;]+)["\']?\s*\)?\s*([^;]*);', re.IGNORECASE)
+CSS_URL_PATTERN = re.compile(r'url\(\s*(["\']?)([^"\')]+)\1\s*\)', re.IGNORECASE)
+# Not relative to the stylesheet: remote, data:, site-absolute or fragment
+EXTERNAL_URL_PATTERN = re.compile(r'^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|//|/|#)')
+REMOTE_URL_PATTERN = re.compile(r'^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|//)')
+
+
+def content_hash(content: str) -> str:
+    """Short hash of an asset's content, for its fingerprinted file name."""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:HASH_LENGTH]
+
+
+def fingerprinted_name(stem: str, content: str, extension: str) -> str:
+    """e.g. fingerprinted_name("styles", css, ".css") -> "styles.1a2b3c4d5e.css"."""
+    return f"{stem}.{content_hash(content)}{extension}"
+
+
+def _string_end(source: str, start: int) -> int:
+    """Index just past the string literal opening at start."""
+    quote = source[start]
+    i = start + 1
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == quote or (char == '\n' and quote != '`'):
+            return i + 1
+        if quote == '`' and source.startswith('${', i):
+            i = _code_end(source, i + 2)
+            continue
+        i += 1
+    return i
+
+
+def _code_end(source: str, start: int) -> int:
+    """Index just past the '}' closing a template literal's ${ expression."""
+    depth = 1
+    i = start
+    while i < len(source):
+        char = source[i]
+        if char in '"\'`':
+            i = _string_end(source, i)
+            continue
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def _regex_end(source: str, start: int) -> int:
+    """Index just past the regular expression literal opening at start."""
+    i = start + 1
+    in_class = False
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == '\n':
+            return i
+        if char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        elif char == '/' and not in_class:
+            i += 1
+            while i < len(source) and (source[i].isalnum() or source[i] == '_'):
+                i += 1
+            return i
+        i += 1
+    return i
+
+
+def _regex_allowed(before: str) -> bool:
+    """Whether a '/' after the given (end of the) code starts a regular expression."""
+    text = before.rstrip()
+    if not text:
+        return True
+    if text[-1] in REGEX_PRECEDERS:
+        return True
+    word = re.search(r'[A-Za-z_$][\w$]*$', text)
+    return bool(word) and word.group(0) in REGEX_KEYWORDS
+
+
+def _squeeze_js(code: str) -> str:
+    """Collapse whitespace in a stretch of code (no literals in it)."""
+    code = re.sub(r'[ \t\r\f\v]+', ' ', code)
+    return re.sub(r' ?\n[\s]*', '\n', code)
+
+
+def minify_js(source: str) -> str:
+    """Drop comments, indentation and blank lines; keep line breaks and literals."""
+    parts: List[str] = []
+    code: List[str] = []
+
+    def flush():
+        if code:
+            parts.append(_squeeze_js(''.join(code)))
+            code.clear()
+
+    i = 0
+    length = len(source)
+    while i < length:
+        char = source[i]
+        if char in '"\'`':
+            end = _string_end(source, i)
+            flush()
+            parts.append(source[i:end])
+            i = end
+        elif source.startswith('//', i):
+            end = source.find('\n', i)
+            i = length if end < 0 else end
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = length if end < 0 else end + 2
+            code.append(' ')
+        elif char == '/' and _regex_allowed((parts[-1][-20:] if parts else '') + ''.join(code[-20:])):
+            end = _regex_end(source, i)
+            flush()
+            parts.append(source[i:end])
+            i = end
+        else:
+            code.append(char)
+            i += 1
+    flush()
+    return ''.join(parts).strip() + '\n'
+
+
+def _squeeze_css(code: str) -> str:
+    code = re.sub(r'\s+', ' ', code)
+    code = re.sub(r' ?([{};,>]) ?', r'\1', code)
+    code = re.sub(r': ', ':', code)
+    return code.replace(';}', '}')
+
+
+def minify_css(source: str) -> str:
+    """Drop comments and redundant whitespace; strings are kept as they are."""
+    parts: List[str] = []
+    code: List[str] = []
+    i = 0
+    length = len(source)
+    while i < length:
+        char = source[i]
+        if char in '"\'':
+            end = _string_end(source, i)
+            parts.append(_squeeze_css(''.join(code)))
+            code.clear()
+            parts.append(source[i:end])
+            i = end
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = length if end < 0 else end + 2
+            code.append(' ')
+        else:
+            code.append(char)
+            i += 1
+    parts.append(_squeeze_css(''.join(code)))
+    return ''.join(parts).strip() + '\n'
+
+
+def site_path(path: Path, root: Path = PROJECT_ROOT) -> str:
+    """Site-absolute URL path of a file in the project, e.g. /assets/css/main.css."""
+    return '/' + Path(path).resolve().relative_to(Path(root).resolve()).as_posix()
+
+
+def resolve_css_parts(path: Path, root: Path = PROJECT_ROOT,
+                      seen: Optional[Set[Path]] = None) -> List[Tuple[Path, str]]:
+    """
+    resolve_css() as (file, CSS) pieces in order, so each piece of the
+    result can be traced back to the stylesheet it came from.
+    """
+    path = Path(path).resolve()
+    seen = set() if seen is None else seen
+    seen.add(path)
+    base_url = posixpath.dirname(site_path(path, root))
+    with open(path, 'r', encoding='utf-8') as f:
+        css = f.read()
+
+    def absolute_url(match):
+        quote, url = match.group(1), match.group(2).strip()
+        if EXTERNAL_URL_PATTERN.match(url):
+            return match.group(0)
+        return f"url({quote}{posixpath.normpath(posixpath.join(base_url, url))}{quote})"
+
+    css = CSS_URL_PATTERN.sub(absolute_url, css)
+    parts: List[Tuple[Path, str]] = []
+    own: List[str] = []
+    position = 0
+    for match in CSS_IMPORT_PATTERN.finditer(css):
+        own.append(css[position:match.start()])
+        position = match.end()
+        url, media = match.group(1), match.group(2).strip()
+        if media or REMOTE_URL_PATTERN.match(url):
+            own.append(match.group(0))
+            continue
+        target = (Path(root) / url.lstrip('/')) if url.startswith('/') else path.parent / url
+        target = target.resolve()
+        if target in seen:
+            continue
+        if not target.is_file():
+            own.append(match.group(0))
+            continue
+        parts.append((path, ''.join(own)))
+        own.clear()
+        parts.extend(resolve_css_parts(target, root, seen))
+    own.append(css[position:])
+    parts.append((path, ''.join(own)))
+    return [(part_path, text) for part_path, text in parts if text]
+
+
+def resolve_css(path: Path, root: Path = PROJECT_ROOT, seen: Optional[Set[Path]] = None) -> str:
+    """
+    CSS of a file with its local @import rules inlined (recursively, each
+    file once) and relative url() references made site-absolute. Imports
+    with a media query, or of remote files, are left as they are.
+    """
+    return ''.join(css for _, css in resolve_css_parts(path, root, seen))
+
+
+def split_rules(css: str) -> List[str]:
+    """
+    Top-level rules of a stylesheet, in order: each rule set, each @ block
+    (e.g. @media, with everything inside it) and each @ statement (e.g.
+    @import) is one rule. Comments and whitespace before a rule belong to it.
+    """
+    rules = []
+    start = 0
+    depth = 0
+    i = 0
+    length = len(css)
+    while i < length:
+        char = css[i]
+        if char in '"\'':
+            end = css.find(char, i + 1)
+            while end > 0 and css[end - 1] == '\\':
+                end = css.find(char, end + 1)
+            i = length if end < 0 else end + 1
+            continue
+        if css.startswith('/*', i):
+            end = css.find('*/', i + 2)
+            i = length if end < 0 else end + 2
+            continue
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth = max(depth - 1, 0)
+            if depth == 0:
+                rules.append(css[start:i + 1])
+                start = i + 1
+        elif char == ';' and depth == 0:
+            rules.append(css[start:i + 1])
+            start = i + 1
+        i += 1
+    if minify_css(css[start:]).strip():
+        rules.append(css[start:])
+    return rules
@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""
+Asset pipeline for the lesson pages: bundles, minifies and fingerprints
+their local stylesheets and scripts.
+
+Every run of adjacent local <link rel="stylesheet"> tags (or of adjacent
+<script src> tags) in a page becomes a single tag for one bundle, e.g.
+
+    <link href="/assets/css/main.css" rel="stylesheet"/>
+    <link href="/assets/css/sidebar-enhanced.css" rel="stylesheet"/>
+    <link href="/assets/css/sidebar-toggle.css" rel="stylesheet"/>
+
+becomes
+
+    <link href="/assets/dist/main.1a2b3c4d5e.css" rel="stylesheet"
+          data-bundle="/assets/css/main.css /assets/css/sidebar-enhanced.css /assets/css/sidebar-toggle.css"/>
+
+Pages of the same type (same assets in the same order) share a bundle.
+Bundles are written to assets/dist/ under content-hashed names, so they can
+be served with far-future caching (Cache-Control: max-age=31536000,
+immutable): a changed source gets a new name, and the pages are rewritten
+to it on the next run. The data-bundle attribute keeps the source list, so
+re-running picks up source changes and `unbundle` restores the original
+tags (one per file; the exact previous markup is in the backup store).
+Tags with other attributes (async, defer, media, ...), remote URLs and
+files that do not exist are left alone.
+
+The Mermaid scripts (assets/js/mermaid-*.js) pull the ~1 MB Mermaid runtime
+from a CDN, so they are never bundled with the rest. On a page with
+diagrams (an element with class "mermaid") they are bundled on their own
+and replaced by a deferred loader that fetches the runtime and that bundle
+only once a diagram scrolls near the viewport:
+
+    <script src="/assets/dist/mermaid-loader.1a2b3c4d5e.js" defer
+            data-mermaid-bundle="/assets/dist/mermaid-universal-fix.6f7a8b9c0d.js"
+            data-bundle="/assets/js/mermaid-universal-fix.js"></script>
+
+On a page without diagrams they are dropped (`unbundle` cannot bring those
+back; they are in the backup store).
+
+Some pages import the runtime themselves from an inline module instead:
+
+    <script type="module">import mermaid from 'https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.esm.min.mjs';
+        mermaid.initialize({ startOnLoad: true });</script>
+
+Such a loader is dropped from a page without diagrams too, and on a page
+with diagrams it becomes the deferred loader on its own,
+<script src="/assets/js/mermaid-loader.js" defer></script>.
+
+Each stylesheet bundle keeps only the rules the pages that link it can use
+(see css_prune.py), and the bytes saved per stylesheet are reported.
+Bundles are per page type, so each type gets its own trimmed CSS. Re-run
+after adding markup with new classes. --no-prune bundles the stylesheets
+whole (and rewrites every pruned bundle, so use it for every run or none).
+
+Run it after the fixers. They check for the files a page already loads
+with find_asset_tag() / bundled_sources(), so they do not re-add a bundled
+file; if a tag for a file the page already loads (from an earlier tag of
+the same kind) turns up anyway, the next run drops it rather than
+bundling the file a second time.
+
+    python scripts/asset_pipeline.py bundle [--dry-run] [--no-prune]
+    python scripts/asset_pipeline.py unbundle
+
+All pages are rewritten in one pass, each read and written at most once.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from asset_minify import fingerprinted_name, minify_css, minify_js, resolve_css, resolve_css_parts, site_path
+from backup_store import backup_files
+from course_corpus import PROJECT_ROOT, get_store
+from css_prune import UsedNames, prune_css, used_names
+from html_splice import ATTR_PATTERN, apply_edits, iter_tags
+from link_graph import LESSON_DIR_PATTERN, ROOT_PAGE_PATTERN
+from output_writer import write_if_changed
+
+DIST_DIR = PROJECT_ROOT / "assets" / "dist"
+DIST_URL = "/assets/dist/"
+MANIFEST_NAME = "manifest.json"
+BUNDLE_ATTR = "data-bundle"
+MERMAID_ATTR = "data-mermaid-bundle"
+MERMAID_LOADER = "/assets/js/mermaid-loader.js"
+BACKUP_LABEL = "asset_pipeline"
+
+# Attributes a tag may have and still be bundled
+BUNDLABLE_ATTRS = {
+    "css": frozenset(["rel", "href", "type", BUNDLE_ATTR]),
+    "js": frozenset(["src", "type", BUNDLE_ATTR]),
+}
+MERMAID_LOADER_ATTRS = frozenset(["src", "defer", BUNDLE_ATTR, MERMAID_ATTR])
+MERMAID_SOURCE_PATTERN = re.compile(r'^/assets/js/mermaid-[\w.-]+\.js$')
+# The body of an inline <script type="module"> that only imports and starts Mermaid
+EAGER_MERMAID_PATTERN = re.compile(
+    r'^\s*import\s+mermaid\s+from\s+([\'"])[^\'"]*mermaid[^\'"]*\.mjs\1;?'
+    r'\s*mermaid\.initialize\(\s*\{[^{}]*\}\s*\);?\s*$'
+)
+ASSET_EXTENSIONS = {"css": ".css", "js": ".js"}
+# Only whitespace and comments may separate the tags of one run
+GAP_PATTERN = re.compile(r'^(?:\s|<!--.*?-->)*$', re.DOTALL)
+COMMENT_PATTERN = re.compile(r'<!--.*?-->', re.DOTALL)
+REMOTE_URL_PATTERN = re.compile(r'^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|//)')
+
+
+class AssetTag(NamedTuple):
+    """A bundlable <link>/<script> tag and the source files it loads."""
+    kind: str
+    sources: Tuple[str, ...]
+    start: int
+    end: int
+    bundled: bool  # already a bundle tag (has data-bundle)
+
+
+def site_pages(root: Path = PROJECT_ROOT) -> List[str]:
+    """Project-relative paths of the lesson and module pages, sorted."""
+    pages = []
+    for name in sorted(os.listdir(root)):
+        path = root / name
+        if path.is_file() and ROOT_PAGE_PATTERN.match(name):
+            pages.append(name)
+        elif path.is_dir() and LESSON_DIR_PATTERN.match(name):
+            pages.extend(f"{name}/{file_name}" for file_name in sorted(os.listdir(path))
+                         if file_name.endswith('.html'))
+    return pages
+
+
+def local_asset(page: str, url: Optional[str], kind: str, root: Path = PROJECT_ROOT) -> Optional[str]:
+    """Site-absolute path of a page's local CSS/JS file, or None if it is remote or missing."""
+    if not url or REMOTE_URL_PATTERN.match(url):
+        return None
+    url = url.split('?', 1)[0].split('#', 1)[0]
+    if url.startswith('/'):
+        path = os.path.normpath(url.lstrip('/'))
+    else:
+        path = os.path.normpath(os.path.join(os.path.dirname(page), url))
+    if path.startswith('..') or not path.endswith(ASSET_EXTENSIONS[kind]) or not (root / path).is_file():
+        return None
+    return '/' + Path(path).as_posix()
+
+
+def tag_sources(page: str, kind: str, attrs: str, root: Path = PROJECT_ROOT) -> Optional[Tuple[str, ...]]:
+    """Sources a tag loads if it can be bundled: its data-bundle list, or its one file."""
+    names = {match.group(1).lower() for match in ATTR_PATTERN.finditer(attrs.rstrip('/ '))}
+    if kind == "js" and MERMAID_ATTR in names:
+        # A Mermaid loader; its data-bundle lists the page's Mermaid scripts
+        if not names <= MERMAID_LOADER_ATTRS:
+            return None
+    elif not names <= BUNDLABLE_ATTRS[kind]:
+        return None
+    values = {match.group(1).lower(): next((g for g in match.groups()[1:] if g is not None), '')
+              for match in ATTR_PATTERN.finditer(attrs.rstrip('/ '))}
+    if kind == "css" and values.get("rel", "").lower() != "stylesheet":
+        return None
+    if kind == "js" and values.get("type", "text/javascript").lower() not in ("text/javascript", "application/javascript"):
+        return None
+    if BUNDLE_ATTR in values:
+        sources = tuple(values[BUNDLE_ATTR].split())
+        if sources and all(local_asset(page, source, kind, root) for source in sources):
+            return sources
+        return None
+    source = local_asset(page, values.get("href" if kind == "css" else "src"), kind, root)
+    return (source,) if source else None
+
+
+def find_asset_runs(page: str, html: str, root: Path = PROJECT_ROOT) -> List[List[AssetTag]]:
+    """Runs of adjacent bundlable tags of the same kind, in document order."""
+    runs: List[List[AssetTag]] = []
+    current: List[AssetTag] = []
+    pending_script = None
+
+    def close_run():
+        if current:
+            runs.append(list(current))
+            current.clear()
+
+    for token in iter_tags(html):
+        if pending_script is not None:
+            start, sources = pending_script
+            pending_script = None
+            if token.name == "script" and token.closing and sources and not html[start.end:token.start].strip():
+                tag = AssetTag("js", sources, start.start, token.end, start.get(BUNDLE_ATTR) is not None)
+            else:
+                close_run()
+                continue
+        elif token.name == "script" and not token.closing:
+            pending_script = (token, tag_sources(page, "js", token.attrs, root))
+            continue
+        elif token.name == "link" and not token.closing:
+            sources = tag_sources(page, "css", token.attrs, root)
+            if not sources:
+                close_run()
+                continue
+            tag = AssetTag("css", sources, token.start, token.end, token.get(BUNDLE_ATTR) is not None)
+        else:
+            close_run()
+            continue
+
+        if current and (current[-1].kind != tag.kind or not GAP_PATTERN.match(html[current[-1].end:tag.start])):
+            close_run()
+        current.append(tag)
+    close_run()
+    return runs
+
+
+def bundled_sources(html: str) -> Set[str]:
+    """The files a page loads through bundle tags (their data-bundle lists)."""
+    sources: Set[str] = set()
+    for token in iter_tags(html):
+        if token.name in ("link", "script") and not token.closing:
+            sources.update((token.get(BUNDLE_ATTR) or '').split())
+    return sources
+
+
+def find_asset_tag(soup, tag_name: str, url_attr: str, url: str):
+    """
+    The tag of a parsed page that loads url, on its own or as part of a
+    bundle; fixers check with this before adding a stylesheet or script.
+    """
+    tag = soup.find(tag_name, {url_attr: url})
+    if tag is None:
+        tag = soup.find(tag_name, attrs={BUNDLE_ATTR: lambda sources: sources and url in sources.split()})
+    return tag
+
+
+def is_mermaid_source(source: str) -> bool:
+    return bool(MERMAID_SOURCE_PATTERN.match(source)) and source != MERMAID_LOADER
+
+
+def has_diagrams(html: str) -> bool:
+    """Whether a page has a Mermaid diagram (e.g. <pre class="mermaid">)."""
+    return any(not token.closing and token.has_class("mermaid") for token in iter_tags(html))
+
+
+def eager_mermaid_scripts(html: str) -> List[Tuple[int, int]]:
+    """Spans of the inline module scripts that import the Mermaid runtime up front."""
+    spans = []
+    opening = None
+    for token in iter_tags(html):
+        if token.name != "script":
+            continue
+        if not token.closing:
+            opening = token if (token.get("type") or '').lower() == "module" and not token.get("src") else None
+        elif opening is not None:
+            if EAGER_MERMAID_PATTERN.match(html[opening.end:token.start]):
+                spans.append((opening.start, token.end))
+            opening = None
+    return spans
+
+
+def eager_mermaid_edits(html: str, diagrams: bool) -> List[Tuple[int, int, str]]:
+    """
+    Drop the inline Mermaid imports of a page without diagrams, with their
+    line; on a page with diagrams, defer loading to the Mermaid loader.
+    """
+    edits = []
+    for start, end in eager_mermaid_scripts(html):
+        if diagrams:
+            edits.append((start, end, f'<script src="{MERMAID_LOADER}" defer></script>'))
+            continue
+        edits.append(removal(html, start, end))
+    return edits
+
+
+def removal(html: str, start: int, end: int) -> Tuple[int, int, str]:
+    """The edit removing html[start:end], with its line if nothing else is on it."""
+    line_start = html.rfind('\n', 0, start) + 1
+    if not html[line_start:start].strip() and html[end:end + 1] == '\n':
+        start, end = line_start, end + 1
+    return start, end, ''
+
+
+def bundle_tag(kind: str, url: str, sources: Tuple[str, ...]) -> str:
+    if kind == "css":
+        return f'<link href="{url}" rel="stylesheet" {BUNDLE_ATTR}="{" ".join(sources)}"/>'
+    return f'<script src="{url}" {BUNDLE_ATTR}="{" ".join(sources)}"></script>'
+
+
+def mermaid_loader_tag(loader_url: str, bundle_url: str, sources: Tuple[str, ...]) -> str:
+    return (f'<script src="{loader_url}" defer {MERMAID_ATTR}="{bundle_url}" '
+            f'{BUNDLE_ATTR}="{" ".join(sources)}"></script>')
+
+
+def source_tags(kind: str, sources: Tuple[str, ...]) -> str:
+    """The original one-file-per-tag markup of a bundle."""
+    if kind == "css":
+        return ''.join(f'<link href="{source}" rel="stylesheet"/>' for source in sources)
+    return '\n'.join(f'<script src="{source}"></script>' for source in sources)
+
+
+class AssetBundler:
+    """
+    Builds each distinct bundle once, reading each source once. Given the
+    names used by the pages of each stylesheet bundle, it prunes the rules
+    they cannot use and records the sizes per stylesheet in `pruned`.
+    """
+
+    def __init__(self, root: Path = PROJECT_ROOT, dist_dir: Path = DIST_DIR,
+                 used: Optional[Dict[Tuple[str, ...], UsedNames]] = None):
+        self.root = Path(root)
+        self.dist_dir = Path(dist_dir)
+        self.used = used
+        self.bundles: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+        self.files: Dict[str, Tuple[str, ...]] = {}
+        self.sources: Dict[str, str] = {}
+        self.css_parts: Dict[str, List[Tuple[str, str]]] = {}
+        # bundle name -> [(stylesheet, minified bytes, pruned bytes)]
+        self.pruned: Dict[str, List[Tuple[str, int, int]]] = {}
+
+    def _minified(self, kind: str, source: str) -> str:
+        if source not in self.sources:
+            path = self.root / source.lstrip('/')
+            if kind == "css":
+                self.sources[source] = minify_css(resolve_css(path, self.root))
+            else:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.sources[source] = minify_js(f.read())
+        return self.sources[source]
+
+    def _minified_parts(self, source: str) -> List[Tuple[str, str]]:
+        """A stylesheet's minified CSS, per file it imports."""
+        if source not in self.css_parts:
+            parts = resolve_css_parts(self.root / source.lstrip('/'), self.root)
+            self.css_parts[source] = [(site_path(path, self.root), minify_css(css)) for path, css in parts]
+        return self.css_parts[source]
+
+    def _pruned_css(self, sources: Tuple[str, ...], used: UsedNames) -> Tuple[str, List[Tuple[str, int, int]]]:
+        content = []
+        sizes: Dict[str, List[int]] = {}
+        for source in sources:
+            for path, css in self._minified_parts(source):
+                pruned = prune_css(css, used)
+                if pruned:
+                    content.append(pruned + '\n')
+                size = sizes.setdefault(path, [0, 0])
+                size[0] += len(css.encode('utf-8'))
+                size[1] += len(pruned.encode('utf-8')) + (1 if pruned else 0)
+        return ''.join(content), [(path, before, after) for path, (before, after) in sizes.items()]
+
+    def bundle(self, kind: str, sources: Tuple[str, ...]) -> str:
+        """URL of the bundle of these sources, building it on first use."""
+        key = (kind, sources)
+        if key not in self.bundles:
+            sizes = None
+            if kind == "css" and self.used is not None and sources in self.used:
+                content, sizes = self._pruned_css(sources, self.used[sources])
+            else:
+                parts = [self._minified(kind, source) for source in sources]
+                # A script may end without a semicolon; keep the next one separate
+                content = ''.join(parts) if kind == "css" else ';\n'.join(parts)
+            stem = Path(sources[0]).stem
+            name = fingerprinted_name(stem, content, ASSET_EXTENSIONS[kind])
+            if sizes is not None:
+                self.pruned[name] = sizes
+            self.files[name] = sources
+            self.dist_dir.mkdir(parents=True, exist_ok=True)
+            write_if_changed(self.dist_dir / name, content)
+            self.bundles[key] = DIST_URL + name
+        return self.bundles[key]
+
+    def write_manifest(self) -> None:
+        """Record every bundle's sources, and delete bundles no page uses."""
+        manifest = {name: list(sources) for name, sources in sorted(self.files.items())}
+        write_if_changed(self.dist_dir / MANIFEST_NAME, json.dumps(manifest, indent=2) + "\n")
+        for path in self.dist_dir.iterdir():
+            if path.suffix in (".css", ".js") and path.name not in self.files:
+                os.remove(path)
+
+
+def run_sources(run: List[AssetTag]) -> Tuple[str, ...]:
+    """The files a run loads, in order; a file linked twice in a row (e.g. re-added by a fixer) once."""
+    return tuple(dict.fromkeys(source for tag in run for source in tag.sources))
+
+
+def bundle_sources(run: List[AssetTag]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """A run's sources split into those bundled and the Mermaid scripts loaded lazily."""
+    sources = run_sources(run)
+    mermaid = tuple(source for source in sources if run[0].kind == "js" and is_mermaid_source(source))
+    return tuple(source for source in sources if source not in mermaid), mermaid
+
+
+def page_bundle_sources(runs: List[List[AssetTag]]) -> List[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+    """
+    bundle_sources() of each run of a page, without the files an earlier
+    run of the same kind already loads (e.g. a sidebar stylesheet a fixer
+    linked again after the bundle that has it).
+    """
+    loaded: Dict[str, Set[str]] = {"css": set(), "js": set()}
+    result = []
+    for run in runs:
+        seen = loaded[run[0].kind]
+        sources, mermaid = bundle_sources(run)
+        sources = tuple(source for source in sources if source not in seen)
+        mermaid = tuple(source for source in mermaid if source not in seen)
+        seen.update(sources + mermaid)
+        result.append((sources, mermaid))
+    return result
+
+
+def collect_used_names(pages: List[str], root: Path = PROJECT_ROOT) -> Dict[Tuple[str, ...], UsedNames]:
+    """The names used by the pages of each stylesheet bundle, markup and scripts included."""
+    store = get_store()
+    scripts: Dict[str, str] = {}
+    used: Dict[Tuple[str, ...], UsedNames] = {}
+    for page in pages:
+        html = store.read_text(root / page)
+        runs = find_asset_runs(page, html, root)
+        page_scripts = []
+        for run in runs:
+            if run[0].kind == "js":
+                for source in run_sources(run):
+                    if source not in scripts:
+                        with open(root / source.lstrip('/'), 'r', encoding='utf-8') as f:
+                            scripts[source] = f.read()
+                    page_scripts.append(scripts[source])
+        page_used = used_names(html, page_scripts)
+        for run, (sources, _) in zip(runs, page_bundle_sources(runs)):
+            if run[0].kind == "css" and sources:
+                used.setdefault(sources, UsedNames.empty()).update(page_used)
+    return used
+
+
+def rewrite_page(html: str, runs: List[List[AssetTag]], bundler: Optional[AssetBundler]) -> str:
+    """
+    Replace each run with its bundle tag (and the Mermaid loader, if the
+    page has diagrams), and defer or drop inline Mermaid imports; without a
+    bundler, replace each bundle tag with the tags of its sources instead.
+    """
+    edits = []
+    diagrams = None
+    if bundler is not None and eager_mermaid_scripts(html):
+        diagrams = has_diagrams(html)
+        edits.extend(eager_mermaid_edits(html, diagrams))
+    if bundler is None:
+        for run in runs:
+            edits.extend((tag.start, tag.end, source_tags(tag.kind, tag.sources)) for tag in run if tag.bundled)
+        return apply_edits(html, edits) if edits else html
+    for run, (sources, mermaid) in zip(runs, page_bundle_sources(runs)):
+        kind = run[0].kind
+        # Comments between the tags are kept, above the bundle tag
+        gaps = ''.join(html[before.end:after.start] for before, after in zip(run, run[1:]))
+        tags = COMMENT_PATTERN.findall(gaps)
+        if sources:
+            tags.append(bundle_tag(kind, bundler.bundle(kind, sources), sources))
+        if mermaid:
+            if diagrams is None:
+                diagrams = has_diagrams(html)
+            if diagrams:
+                tags.append(mermaid_loader_tag(bundler.bundle(kind, (MERMAID_LOADER,)),
+                                               bundler.bundle(kind, mermaid), mermaid))
+        text = '\n'.join(tags)
+        if not text:
+            edits.append(removal(html, run[0].start, run[-1].end))
+        elif html[run[0].start:run[-1].end] != text:
+            edits.append((run[0].start, run[-1].end, text))
+    return apply_edits(html, edits) if edits else html
+
+
+def process_pages(pages: List[str], bundle: bool = True, dry_run: bool = False, prune: bool = True,
+                  root: Path = PROJECT_ROOT, dist_dir: Path = DIST_DIR) -> Dict:
+    """Bundle (or unbundle) the assets of every page in one pass (two with prune)."""
+    store = get_store()
+    bundler = None
+    if bundle and not dry_run:
+        bundler = AssetBundler(root, dist_dir, collect_used_names(pages, root) if prune else None)
+    stats = {"pages": len(pages), "changed": 0, "tags": 0, "bundles": 0}
+    changed = []
+    for page in pages:
+        path = root / page
+        html = store.read_text(path)
+        runs = find_asset_runs(page, html, root)
+        stats["tags"] += sum(len(run) for run in runs)
+        if dry_run:
+            if runs or eager_mermaid_scripts(html):
+                changed.append(page)
+            continue
+        new_html = rewrite_page(html, runs, bundler)
+        if new_html != html:
+            backup_files([path], label=BACKUP_LABEL)
+            write_if_changed(path, new_html)
+            changed.append(page)
+
+    if bundler is not None:
+        bundler.write_manifest()
+        stats["bundles"] = len(bundler.files)
+        stats["pruned"] = {name: bundler.pruned[name] for name in sorted(bundler.pruned)}
+    elif not bundle and not dry_run and Path(dist_dir).is_dir():
+        # No page uses a bundle any more
+        AssetBundler(root, dist_dir).write_manifest()
+    stats["changed"] = len(changed)
+    stats["changed_pages"] = changed
+    return stats
+
+
+def print_prune_report(pruned: Dict[str, List[Tuple[str, int, int]]], root: Path = PROJECT_ROOT) -> None:
+    """Bytes saved per stylesheet in each bundle, and the stylesheets no page links."""
+    print("✂️  Unused CSS removed (minified bytes):")
+    total_before = total_after = 0
+    linked = set()
+    for name, sizes in pruned.items():
+        print(f"  {name}")
+        for path, before, after in sizes:
+            linked.add(path)
+            total_before += before
+            total_after += after
+            print(f"    {path:<45} {before:>7,} -> {after:>7,}  saved {before - after:>7,}")
+    print(f"  Total: {total_before:,} -> {total_after:,} bytes, saved {total_before - total_after:,}")
+    unlinked = [path for path in sorted((root / "assets" / "css").rglob("*.css"))
+                if site_path(path, root) not in linked]
+    if unlinked:
+        print("  Stylesheets no page links (could be deleted):")
+        for path in unlinked:
+            print(f"    {site_path(path, root):<45} {path.stat().st_size:>7,} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bundle, minify and fingerprint the lesson pages' CSS and JS")
+    commands = parser.add_subparsers(dest="command", required=True)
+    bundle_parser = commands.add_parser("bundle", help="bundle each page's assets and rewrite its tags")
+    bundle_parser.add_argument("--dry-run", action="store_true", help="only report the pages that would change")
+    bundle_parser.add_argument("--no-prune", dest="prune", action="store_false",
+                               help="keep the CSS rules no page of a bundle uses")
+    commands.add_parser("unbundle", help="restore the original per-file tags")
+    args = parser.parse_args()
+
+    pages = site_pages(PROJECT_ROOT)
+    if args.command == "bundle":
+        print(f"📦 Bundling assets of {len(pages)} pages")
+        stats = process_pages(pages, bundle=True, dry_run=args.dry_run, prune=args.prune)
+        if args.dry_run:
+            print(f"  {stats['tags']} tags in {stats['changed']} pages would be bundled")
+            return 0
+        print(f"  {stats['bundles']} bundles in {DIST_DIR.relative_to(PROJECT_ROOT)}/")
+        if args.prune:
+            print_prune_report(stats["pruned"])
+    else:
+        print(f"📦 Restoring per-file asset tags in {len(pages)} pages")
+        stats = process_pages(pages, bundle=False)
+    print(f"✅ {stats['changed']} pages updated")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
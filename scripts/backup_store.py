@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Content-addressed backup store for the course files.
+
+Instead of dropping full copies next to each lesson (.mermaid_backup,
+.diagram_backup, .html.backup) or copying whole module directories, fixers
+take snapshots here. File contents are stored once per unique content,
+zlib-compressed, under .backup_store/objects/; each snapshot is a small JSON
+file mapping project-relative paths to blob hashes.
+
+Usage from a fixer:
+
+    from backup_store import backup_files
+    backup_files([filepath], label="mermaid_fix")
+
+All calls with the same label in one process go into the same snapshot;
+scripts that fan out over worker processes take their backup in the parent
+first, so a run still makes one snapshot.
+
+Command line:
+
+    python scripts/backup_store.py list
+    python scripts/backup_store.py snapshot 02module 03module --label manual
+    python scripts/backup_store.py restore 20250908_134950 [paths...] [--dest DIR]
+    python scripts/backup_store.py import 02module_old_preprocess_backup_20250908_134950
+    python scripts/backup_store.py stats
+
+restore takes a snapshot id or a timestamp (or timestamp prefix, e.g.
+20250908 or 20250908_13); each file is restored to its latest backed-up
+version at or before that time.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from course_corpus import PROJECT_ROOT
+from output_writer import atomic_write, get_change_log, write_if_changed
+
+STORE_DIR = Path(os.environ.get("COURSE_BACKUP_DIR") or PROJECT_ROOT / ".backup_store")
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+# A full timestamp or a prefix of one: 2025, 20250908, 20250908_13
+TIMESTAMP_PREFIX_PATTERN = re.compile(r'^\d{4,8}$|^\d{8}_\d{1,6}$')
+
+# Sibling backups left by older fixers: suffix -> original file suffix removed
+SIBLING_SUFFIXES = ('.mermaid_backup', '.diagram_backup', '.backup_final', '.backup2', '.backup')
+
+# Whole-directory backups, e.g. 02module_old_preprocess_backup_20250908_134950
+BACKUP_DIR_PATTERN = re.compile(
+    r'^(?P<source>\d{2}(?:module|extras)(?:_old)?)_(?:\w+_)?backup_(?P<timestamp>\d{8}_\d{6})$'
+)
+
+
+def blob_hash(data: bytes) -> str:
+    """Return the hex SHA-1 of a file's bytes."""
+    return hashlib.sha1(data).hexdigest()
+
+
+class BackupStore:
+    """Deduplicating, compressed snapshot store."""
+
+    def __init__(self, store_dir: Path = STORE_DIR):
+        self.store_dir = Path(store_dir)
+        self.objects_dir = self.store_dir / "objects"
+        self.snapshots_dir = self.store_dir / "snapshots"
+        # Snapshots opened in this run, by label
+        self._open: Dict[str, Dict] = {}
+
+    # -- blobs -------------------------------------------------------------
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def put_blob(self, data: bytes) -> Tuple[str, bool]:
+        """Store data once. Returns (hash, True if it was new)."""
+        digest = blob_hash(data)
+        path = self._object_path(digest)
+        if path.exists():
+            return digest, False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Concurrent writers of the same blob each use their own temp file;
+        # whichever rename lands last wins, with identical content
+        fd, tmp_path = tempfile.mkstemp(prefix='.' + path.name + '.', suffix='.tmp', dir=path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(zlib.compress(data, 9))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return digest, True
+
+    def get_blob(self, digest: str) -> bytes:
+        """Return the original bytes of a stored blob."""
+        with open(self._object_path(digest), 'rb') as f:
+            return zlib.decompress(f.read())
+
+    # -- snapshots ---------------------------------------------------------
+
+    @staticmethod
+    def relative(path) -> str:
+        """Path relative to the project root (absolute if outside it)."""
+        path = Path(os.path.abspath(str(path)))
+        try:
+            return path.relative_to(PROJECT_ROOT).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _write_snapshot(self, snapshot: Dict) -> None:
+        path = self.snapshots_dir / f"{snapshot['id']}.json"
+        atomic_write(path, json.dumps(snapshot, indent=1, sort_keys=True))
+
+    def _new_snapshot(self, label: str, timestamp: Optional[str] = None) -> Dict:
+        """
+        Start a snapshot under a fresh id. The id is claimed by creating its
+        file with O_EXCL, so processes backing up concurrently under the same
+        label each get their own snapshot instead of overwriting each other's.
+        """
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = timestamp or datetime.now().strftime(TIMESTAMP_FORMAT)
+        snapshot_id = f"{timestamp}_{label}"
+        suffix = 1
+        while True:
+            snapshot = {"id": snapshot_id, "timestamp": timestamp, "label": label, "files": {}}
+            try:
+                fd = os.open(self.snapshots_dir / f"{snapshot_id}.json",
+                             os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            except FileExistsError:
+                suffix += 1
+                snapshot_id = f"{timestamp}_{label}_{suffix}"
+                continue
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, indent=1, sort_keys=True)
+            return snapshot
+
+    def backup(self, paths: Iterable, label: str = "backup",
+               timestamp: Optional[str] = None) -> Dict:
+        """
+        Add the current contents of files to this run's snapshot for label
+        (created on first use). Directories are walked recursively. Returns
+        {"snapshot", "files", "new_blobs", "bytes"}.
+        """
+        files = list(iter_files(paths))
+        snapshot = self._open.get(label)
+        if files and (snapshot is None or timestamp):
+            snapshot = self._new_snapshot(label, timestamp)
+            self._open[label] = snapshot
+
+        stats = {"snapshot": snapshot["id"] if snapshot else None, "files": 0, "new_blobs": 0, "bytes": 0}
+        for file_path in files:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            digest, is_new = self.put_blob(data)
+            snapshot["files"][self.relative(file_path)] = digest
+            stats["files"] += 1
+            if is_new:
+                stats["new_blobs"] += 1
+                stats["bytes"] += len(data)
+
+        if stats["files"]:
+            self._write_snapshot(snapshot)
+        return stats
+
+    def snapshots(self) -> List[Dict]:
+        """Return every snapshot, oldest first."""
+        if not self.snapshots_dir.is_dir():
+            return []
+        result = []
+        for path in self.snapshots_dir.glob('*.json'):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    result.append(json.load(f))
+            except ValueError:
+                # Claimed by another process that has not written it yet
+                continue
+        return sorted(result, key=lambda s: (s["timestamp"], s["id"]))
+
+    def state_at(self, when: str) -> Dict[str, Tuple[str, str]]:
+        """
+        Resolve a snapshot id or timestamp (prefix) to {path: (hash, snapshot id)}.
+        A snapshot id gives exactly that snapshot; a timestamp gives, for every
+        file, its latest backed-up version at or before that time. Raises
+        ValueError for anything else, rather than treating it as a cutoff.
+        """
+        snapshots = self.snapshots()
+        for snapshot in snapshots:
+            if snapshot["id"] == when:
+                return {path: (digest, snapshot["id"]) for path, digest in snapshot["files"].items()}
+        if not TIMESTAMP_PREFIX_PATTERN.match(when):
+            raise ValueError(f"{when!r} is neither a snapshot id nor a timestamp like 20250908_134950")
+
+        # A prefix like 20250908 covers the whole day ('~' sorts after digits and '_')
+        cutoff = when if len(when) >= len("YYYYmmdd_HHMMSS") else when + "~"
+        state = {}
+        for snapshot in snapshots:
+            if snapshot["timestamp"] > cutoff:
+                break
+            for path, digest in snapshot["files"].items():
+                state[path] = (digest, snapshot["id"])
+        return state
+
+    def restore(self, when: str, paths: Optional[Iterable] = None,
+                dest: Optional[Path] = None) -> List[str]:
+        """
+        Restore files as of a snapshot id or timestamp. Only the given paths
+        (files or directories, project-relative or absolute) are restored if
+        any are passed. With dest, files are written under that directory
+        instead of over the originals. Returns the restored paths.
+        """
+        state = self.state_at(when)
+        if paths:
+            wanted = [self.relative(p) for p in paths]
+            state = {
+                path: entry for path, entry in state.items()
+                if any(path == w or path.startswith(w.rstrip('/') + '/') for w in wanted)
+            }
+
+        restored = []
+        for rel_path, (digest, _) in sorted(state.items()):
+            target = Path(dest) / rel_path if dest else PROJECT_ROOT / rel_path
+            data = self.get_blob(digest)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if target.exists() and target.read_bytes() == data:
+                continue
+            atomic_write(target, data)
+            if not dest:
+                get_change_log().record(target)
+            restored.append(rel_path)
+        return restored
+
+    def latest(self, path) -> Optional[bytes]:
+        """Return the most recently backed-up content of a file, if any."""
+        rel_path = self.relative(path)
+        for snapshot in reversed(self.snapshots()):
+            if rel_path in snapshot["files"]:
+                return self.get_blob(snapshot["files"][rel_path])
+        return None
+
+    def stats(self) -> Dict:
+        """Return counts and sizes of the store's contents."""
+        objects = [p for p in self.objects_dir.glob('*/*')] if self.objects_dir.is_dir() else []
+        snapshots = self.snapshots()
+        referenced = set()
+        file_entries = 0
+        for snapshot in snapshots:
+            referenced.update(snapshot["files"].values())
+            file_entries += len(snapshot["files"])
+        return {
+            "snapshots": len(snapshots),
+            "file_entries": file_entries,
+            "blobs": len(objects),
+            "unreferenced_blobs": len({p.parent.name + p.name for p in objects} - referenced),
+            "stored_bytes": sum(p.stat().st_size for p in objects),
+        }
+
+
+def iter_files(paths: Iterable) -> Iterable[str]:
+    """Yield files, walking directories recursively in sorted order."""
+    for path in paths:
+        path = str(path)
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    yield os.path.join(root, name)
+        elif os.path.isfile(path):
+            yield path
+
+
+_backup_store: Optional[BackupStore] = None
+
+
+def get_backup_store() -> BackupStore:
+    """Return the process-wide backup store."""
+    global _backup_store
+    if _backup_store is None:
+        _backup_store = BackupStore()
+    return _backup_store
+
+
+def backup_files(paths: Iterable, label: str = "backup") -> Dict:
+    """Snapshot files (or directories) into the shared backup store."""
+    return get_backup_store().backup(paths, label)
+
+
+def restore_latest(path) -> bool:
+    """Put a file back to its most recent backup. Returns False if it has none."""
+    data = get_backup_store().latest(path)
+    if data is None:
+        return False
+    write_if_changed(path, data.decode('utf-8'))
+    return True
+
+
+def import_legacy(paths: Iterable, delete: bool = False) -> Dict:
+    """
+    Absorb old sibling backups (lesson.html.mermaid_backup, ...) and
+    timestamped backup directories into the store. Each backup becomes a
+    snapshot of the file it was taken from, dated by its name or mtime.
+    """
+    store = get_backup_store()
+    totals = {"snapshots": 0, "files": 0, "new_blobs": 0, "bytes": 0, "deleted": 0}
+
+    def add(source_paths: List[str], original_for, label: str, timestamp: str) -> None:
+        snapshot = store._new_snapshot(label, timestamp)
+        for source in source_paths:
+            with open(source, 'rb') as f:
+                data = f.read()
+            digest, is_new = store.put_blob(data)
+            snapshot["files"][store.relative(original_for(source))] = digest
+            totals["files"] += 1
+            if is_new:
+                totals["new_blobs"] += 1
+                totals["bytes"] += len(data)
+        if snapshot["files"]:
+            store._write_snapshot(snapshot)
+            totals["snapshots"] += 1
+
+    for path in paths:
+        path = Path(os.path.abspath(str(path)))
+        match = BACKUP_DIR_PATTERN.match(path.name)
+
+        if path.is_dir() and match:
+            original_dir = path.parent / match.group("source")
+            files = list(iter_files([path]))
+            add(files, lambda f: original_dir / Path(f).relative_to(path),
+                f"import_{path.name}", match.group("timestamp"))
+            if delete:
+                import shutil
+                shutil.rmtree(path)
+                totals["deleted"] += len(files)
+
+        elif path.is_dir():
+            # Scan for sibling backups, one snapshot per backup kind and day
+            groups: Dict[Tuple[str, str], List[str]] = {}
+            for file_path in iter_files([path]):
+                suffix = next((s for s in SIBLING_SUFFIXES if file_path.endswith(s)), None)
+                if suffix is None:
+                    continue
+                mtime = datetime.fromtimestamp(os.path.getmtime(file_path))
+                key = (suffix.lstrip('.'), mtime.strftime("%Y%m%d_000000"))
+                groups.setdefault(key, []).append(file_path)
+
+            for (kind, timestamp), files in sorted(groups.items()):
+                suffix = '.' + kind
+                add(files, lambda f, suffix=suffix: f[:-len(suffix)], f"import_{kind}", timestamp)
+                if delete:
+                    for file_path in files:
+                        os.remove(file_path)
+                    totals["deleted"] += len(files)
+
+    return totals
+
+
+def format_size(num_bytes: int) -> str:
+    """Human-readable byte count."""
+    for unit in ('B', 'KB', 'MB'):
+        if num_bytes < 1024:
+            return f"{num_bytes:.0f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed backup store for course files")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="list snapshots")
+    commands.add_parser("stats", help="show store size and deduplication")
+
+    snapshot_parser = commands.add_parser("snapshot", help="back up files or directories")
+    snapshot_parser.add_argument("paths", nargs="+")
+    snapshot_parser.add_argument("--label", default="manual")
+
+    restore_parser = commands.add_parser("restore", help="restore files as of a snapshot or timestamp")
+    restore_parser.add_argument("when", help="snapshot id or timestamp (prefix), e.g. 20250908_134950")
+    restore_parser.add_argument("paths", nargs="*", help="only restore these files/directories")
+    restore_parser.add_argument("--dest", help="write restored files under this directory instead")
+
+    import_parser = commands.add_parser("import", help="absorb old sibling backups and backup directories")
+    import_parser.add_argument("paths", nargs="+")
+    import_parser.add_argument("--delete", action="store_true", help="delete the old backups once imported")
+
+    args = parser.parse_args()
+    store = get_backup_store()
+
+    if args.command == "list":
+        snapshots = store.snapshots()
+        if not snapshots:
+            print("No snapshots yet")
+        for snapshot in snapshots:
+            print(f"  {snapshot['id']:<60} {len(snapshot['files']):>5} files")
+
+    elif args.command == "stats":
+        stats = store.stats()
+        print(f"📦 Backup store: {store.store_dir}")
+        print(f"  Snapshots: {stats['snapshots']}")
+        print(f"  File versions: {stats['file_entries']}")
+        print(f"  Unique blobs: {stats['blobs']} ({stats['unreferenced_blobs']} unreferenced)")
+        print(f"  Size on disk: {format_size(stats['stored_bytes'])}")
+
+    elif args.command == "snapshot":
+        stats = store.backup(args.paths, args.label)
+        print(f"✅ Snapshot {stats['snapshot']}: {stats['files']} files, "
+              f"{stats['new_blobs']} new blobs ({format_size(stats['bytes'])})")
+
+    elif args.command == "restore":
+        try:
+            restored = store.restore(args.when, args.paths, args.dest)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        for rel_path in restored:
+            print(f"  ↩ {rel_path}")
+        print(f"✅ Restored {len(restored)} files")
+
+    elif args.command == "import":
+        totals = import_legacy(args.paths, args.delete)
+        print(f"✅ Imported {totals['files']} backup files into {totals['snapshots']} snapshots "
+              f"({totals['new_blobs']} new blobs, {format_size(totals['bytes'])})")
+        if args.delete:
+            print(f"  🗑  Removed {totals['deleted']} old backup files")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,11 +4,17 @@ Batch update script for ALL Module 1 HTML files
 Ensures every single file in 01module directory is updated with new template
 """
 
+import argparse
 import os
 import re
 from pathlib import Path
 from datetime import datetime
 
+from build_manifest import (BuildManifest, generated_markup, input_hash, source_fingerprint,
+                            CURRENT, HAND_EDITED, UNTRACKED)
+from course_manifest import load_manifest
+from output_writer import write_if_changed
+
 # Base directory - Linux path
 BASE_DIR = Path("/home/practicalace/projects/php_wordpress/01module")
 
@@ -63,87 +69,11 @@ def check_if_updated(filepath):
         print(f"    ⚠️ Could not check file: {e}")
         return False
 
-# Define all known Module 1 files with metadata
+# Metadata of every Module 1 lesson, from the course manifest (course.json)
 module1_structure = {
-    # Introduction
-    "course_introduction.html": ("Course Introduction", "30 minutes", "Welcome to the PHP WordPress Development course. Learn what you'll build and the skills you'll gain."),
-    "homework_setup.html": ("Homework: Development Setup", "45 minutes", "Set up your development environment for the course."),
-    
-    # Session 1: Introduction to Web Development
-    "how_web_works.html": ("How the Web Works", "45 minutes", "Understand the fundamentals of how websites and the internet work together."),
-    "development_environment.html": ("Setting Up Development Environment", "60 minutes", "Install and configure the tools you'll need for web development."),
-    
-    # Session 2: HTML Fundamentals
-    "first_html_page.html": ("Creating Your First HTML Page", "30 minutes", "Build your very first webpage using HTML."),
-    "html_structure_syntax.html": ("HTML Structure and Syntax", "45 minutes", "Learn the fundamental structure and syntax of HTML documents."),
-    "essential_html_tags.html": ("Essential HTML Tags", "45 minutes", "Master the most important HTML tags for structuring content."),
-    "html_forms_inputs.html": ("HTML Forms and Inputs", "45 minutes", "Create interactive forms for user input."),
-    "html_validation_practices.html": ("HTML Validation and Best Practices", "30 minutes", "Learn to write valid, semantic HTML following best practices."),
-    "homework_html_profile.html": ("Homework: Create a Personal Profile Page", "60 minutes", "Build a complete personal profile page using HTML."),
-    
-    # Session 3: CSS Basics
-    "introduction_to_css.html": ("Introduction to CSS", "30 minutes", "Discover how CSS transforms HTML into beautiful web pages."),
-    "css_syntax_and_selectors.html": ("CSS Syntax and Selectors", "45 minutes", "Master CSS syntax and learn to target HTML elements."),
-    "css_implementation_methods.html": ("CSS Implementation Methods", "30 minutes", "Learn different ways to add CSS to HTML documents."),
-    "css_colors_fonts_text.html": ("CSS Colors, Fonts, and Text", "45 minutes", "Style text with colors, fonts, and typography properties."),
-    "css_box_model.html": ("The CSS Box Model", "45 minutes", "Understand how elements are sized and spaced with the box model."),
-    "homework_css_profile.html": ("Homework: Style Your Profile Page", "60 minutes", "Apply CSS to create an attractive profile page design."),
-    
-    # Session 4: CSS Layout & Responsive Design
-    "css_layout_tech.html": ("CSS Layout Techniques", "60 minutes", "Learn modern CSS layout methods including Flexbox and Grid."),
-    "responsive_design.html": ("Introduction to Responsive Design", "45 minutes", "Create websites that work perfectly on all devices."),
-    "media_queries.html": ("Media Queries", "45 minutes", "Use media queries to create responsive designs."),
-    "mobile_first.html": ("Mobile-First Approach", "30 minutes", "Design for mobile devices first, then scale up."),
-    "homework_responsive_profile.html": ("Homework: Make Your Profile Responsive", "60 minutes", "Transform your profile into a responsive design."),
-    
-    # Session 5: CSS Frameworks
-    "bootstrap.html": ("Introduction to Bootstrap", "45 minutes", "Get started with the Bootstrap CSS framework."),
-    "bootstrap_grid.html": ("Bootstrap Grid System", "45 minutes", "Master Bootstrap's powerful grid system."),
-    "bootstrap_components.html": ("Bootstrap Components", "45 minutes", "Use Bootstrap's pre-built UI components."),
-    "bootstrap_utilities.html": ("Bootstrap Utilities", "30 minutes", "Apply Bootstrap utility classes for quick styling."),
-    "css_organization_best_practices.html": ("CSS Organization Best Practices", "30 minutes", "Organize and maintain scalable CSS code."),
-    "css_preprocessors.html": ("CSS Preprocessors Overview", "30 minutes", "Introduction to SASS and CSS preprocessing."),
-    "homework_bootstrap_profile.html": ("Homework: Bootstrap Profile", "60 minutes", "Rebuild your profile using Bootstrap."),
-    
-    # Session 6: JavaScript Fundamentals
-    "js_intro.html": ("Introduction to JavaScript", "45 minutes", "Discover JavaScript and its role in web development."),
-    "js_syntax_fundamentals.html": ("JavaScript Syntax Fundamentals", "45 minutes", "Learn JavaScript syntax and basic concepts."),
-    "js_syntaxx1.html": ("JavaScript Syntax Extended", "45 minutes", "Deep dive into JavaScript syntax patterns."),
-    "js_operators_and_expressions.html": ("Operators and Expressions", "30 minutes", "Master JavaScript operators and expressions."),
-    "js_control_flow.html": ("Control Flow", "45 minutes", "Implement conditional logic and loops."),
-    "js_functions_and_scope.html": ("Functions and Scope", "45 minutes", "Create functions and understand scope."),
-    "homework_simple_js_programs.html": ("Homework: Simple JavaScript Programs", "60 minutes", "Build interactive JavaScript programs."),
-    
-    # Session 7: DOM Manipulation
-    "understanding_dom.html": ("Understanding the DOM", "45 minutes", "Learn how JavaScript interacts with HTML."),
-    "dom_selection_manipulation.html": ("DOM Selection and Manipulation", "45 minutes", "Select and modify HTML elements with JavaScript."),
-    "event_handling.html": ("Event Handling", "45 minutes", "Handle user interactions with events."),
-    "creating_removing_elements.html": ("Creating and Removing Elements", "30 minutes", "Dynamically modify page content."),
-    "form_validation.html": ("Form Validation", "45 minutes", "Validate forms with JavaScript."),
-    "homework_interactive.html": ("Homework: Add Interactivity", "60 minutes", "Make your page interactive with JavaScript."),
-    
-    # Session 8: Modern JavaScript & jQuery
-    "es6_overview.html": ("ES6+ Features Overview", "45 minutes", "Explore modern JavaScript features."),
-    "jquery_intro.html": ("Introduction to jQuery", "45 minutes", "Get started with the jQuery library."),
-    "jquery_dom_manipulation.html": ("jQuery DOM Manipulation", "45 minutes", "Simplify DOM manipulation with jQuery."),
-    "jquery_animations_and_effects.html": ("jQuery Animations", "30 minutes", "Create animations with jQuery."),
-    "jquery_ajax.html": ("AJAX with jQuery", "45 minutes", "Make asynchronous requests with jQuery."),
-    "homework_jquery_refactor.html": ("Homework: jQuery Refactor", "60 minutes", "Refactor your code using jQuery."),
-    
-    # Session 9: Introduction to PHP
-    "php_and_wordpress.html": ("PHP and WordPress", "45 minutes", "Understand PHP's role in WordPress."),
-    "php_setup_xampp_mamp.html": ("Setting Up XAMPP/MAMP", "45 minutes", "Install a local PHP server."),
-    "php_syntax.html": ("PHP Syntax", "45 minutes", "Learn PHP syntax basics."),
-    "php_variables_data_and_operators.html": ("PHP Variables and Operators", "45 minutes", "Work with PHP variables and operators."),
-    "php_includes.html": ("PHP Includes", "30 minutes", "Include PHP files in HTML."),
-    "homework_simple_php.html": ("Homework: Simple PHP Script", "60 minutes", "Create your first PHP application."),
-    
-    # Session 10: Mini-Project
-    "planning_website.html": ("Planning a Website", "45 minutes", "Plan a multi-page website project."),
-    "creating_layout.html": ("Creating a Layout", "60 minutes", "Build a consistent website layout."),
-    "adding_interactivity_with_js.html": ("Adding Interactivity", "60 minutes", "Enhance your site with JavaScript."),
-    "php_header_footer.html": ("PHP Headers and Footers", "45 minutes", "Use PHP for consistent headers/footers."),
-    "project_static_site.html": ("Final Project: Static Website", "180 minutes", "Build a complete 5-page website.")
+    lesson.file: (lesson.title, lesson.duration, lesson.description)
+    for session in load_manifest().module("01module").sessions
+    for lesson in session.all_lessons
 }
 
 def generate_html(filename, title, duration, description):
@@ -594,8 +524,21 @@ def generate_footer():
         </footer>"""
 
 # Main execution
-def main():
-    """Main function to update ALL files in 01module"""
+def template_fingerprint():
+    """Hash of every template function used to render a Module 1 page"""
+    return source_fingerprint(
+        generate_html, determine_session, generate_nav_urls, generate_header,
+        generate_progress_bar, generate_breadcrumb, generate_sidebar,
+        generate_objectives, generate_content, generate_homework,
+        generate_resources, generate_navigation, generate_footer
+    )
+
+def main(force=False):
+    """
+    Main function to update ALL files in 01module.
+    Only pages whose metadata or template changed since the last run are
+    regenerated; hand-edited pages are left alone unless force is set.
+    """
     
     print(f"🚀 Module 1 Complete Update Script")
     print("="*60)
@@ -619,8 +562,12 @@ def main():
     
     updated_files = []
     skipped_files = []
+    hand_edited_files = []
     failed_files = []
     processed = 0
+    
+    manifest = BuildManifest("01module", owned=generated_markup)
+    template = template_fingerprint()
     total_files = len(all_files)
     
     print(f"\n📝 Processing ALL {total_files} files...")
@@ -631,28 +578,41 @@ def main():
         filename = filepath.name
         processed += 1
         
-        # Check if already updated
-        if check_if_updated(filepath):
+        # Get metadata from structure or create generic
+        if filename in module1_structure:
+            title, duration, description = module1_structure[filename]
+        else:
+            # Create generic metadata for unstructured files
+            title = filename.replace('.html', '').replace('_', ' ').title()
+            duration = "45 minutes"
+            description = f"Learn about {title.lower()} in this comprehensive lesson."
+        
+        # Check the build manifest: skip pages whose inputs did not change
+        inputs = input_hash(template, filename, title, duration, description)
+        status = manifest.status(filename, filepath, inputs)
+        
+        if status == UNTRACKED and check_if_updated(filepath) and not force:
+            # Already has the new template: regenerate it once its inputs change
+            manifest.record_existing(filename, filepath, inputs)
+            status = CURRENT
+        
+        if status == CURRENT:
             skipped_files.append(filename)
             print(f"[{processed:3}/{total_files}] ⏭️  Already updated: {filename}")
             continue
         
+        if status == HAND_EDITED and not force:
+            hand_edited_files.append(filename)
+            print(f"[{processed:3}/{total_files}] ✋ Edited by hand, not regenerated: {filename}")
+            continue
+        
         try:
-            # Get metadata from structure or create generic
-            if filename in module1_structure:
-                title, duration, description = module1_structure[filename]
-            else:
-                # Create generic metadata for unstructured files
-                title = filename.replace('.html', '').replace('_', ' ').title()
-                duration = "45 minutes"
-                description = f"Learn about {title.lower()} in this comprehensive lesson."
-            
             # Generate HTML content
             html_content = generate_html(filename, title, duration, description)
             
             # Write file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            write_if_changed(filepath, html_content)
+            manifest.record(filename, filepath, inputs, html_content)
             
             updated_files.append(filename)
             print(f"[{processed:3}/{total_files}] ✅ Updated: {filename}")
@@ -661,12 +621,15 @@ def main():
             failed_files.append((filename, str(e)))
             print(f"[{processed:3}/{total_files}] ❌ Failed: {filename} - {e}")
     
+    manifest.save()
+    
     # Summary
     print("-" * 60)
     print(f"\n📊 Update Complete Summary:")
     print(f"  📁 Total files in directory: {total_files}")
     print(f"  ✅ Successfully updated: {len(updated_files)}")
     print(f"  ⏭️  Already up-to-date: {len(skipped_files)}")
+    print(f"  ✋ Edited by hand (use --force to regenerate): {len(hand_edited_files)}")
     print(f"  ❌ Failed: {len(failed_files)}")
     
     # Show details if needed
@@ -676,13 +639,13 @@ def main():
             print(f"  - {filename}: {error}")
     
     # Calculate completion
-    completion = ((len(updated_files) + len(skipped_files)) / total_files * 100) if total_files > 0 else 0
+    completion = ((len(updated_files) + len(skipped_files) + len(hand_edited_files)) / total_files * 100) if total_files > 0 else 0
     print(f"\n📈 Module 1 Completion: {completion:.1f}%")
     
     if completion == 100:
         print("🎉 All Module 1 files are now updated!")
     else:
-        print(f"⚠️  {total_files - len(updated_files) - len(skipped_files)} files still need attention")
+        print(f"⚠️  {total_files - len(updated_files) - len(skipped_files) - len(hand_edited_files)} files still need attention")
     
     print(f"\n📅 Update finished: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
@@ -747,8 +710,13 @@ if __name__ == "__main__":
         print("❌ Python 3.6 or higher is required!")
         sys.exit(1)
     
+    parser = argparse.ArgumentParser(description="Regenerate Module 1 lesson pages")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate hand-edited and untracked pages too")
+    args = parser.parse_args()
+    
     try:
-        updated, failed = main()
+        updated, failed = main(force=args.force)
         
         # Exit with appropriate code
         if failed:
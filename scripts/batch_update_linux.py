@@ -8,6 +8,8 @@ import os
 import re
 from pathlib import Path
 
+from output_writer import write_if_changed
+
 # Base directory - UPDATE THIS PATH
 BASE_DIR = Path("/home/practicalace/projects/php_wordpress/01module")
 
@@ -116,15 +118,13 @@ def main():
                     print(f"  ⚠️  File not found: {filename}")
                     # Create the file
                     html_content = generate_html(session_key, session_data, file_index, file_info)
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(html_content)
+                    write_if_changed(filepath, html_content)
                     updated_files.append(filename)
                     print(f"  ✅ Created: {filename}")
                 else:
                     # Update existing file
                     html_content = generate_html(session_key, session_data, file_index, file_info)
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(html_content)
+                    write_if_changed(filepath, html_content)
                     updated_files.append(filename)
                     print(f"  ✅ Updated: {filename}")
                 
@@ -5,10 +5,18 @@ Updates ALL Module 2 HTML files with the new template structure
 Includes all 122 files found in the 02module directory
 """
 
+import argparse
 import os
 import re
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache, partial
+
+from build_manifest import (BuildManifest, generated_markup, input_hash, source_fingerprint,
+                            CURRENT, HAND_EDITED, UNTRACKED)
+from output_writer import write_if_changed
+from page_regions import Region, mark_region, patch_regions, region_digest
+from page_template import Template
 
 # Base directory - Linux path
 BASE_DIR = Path("/home/practicalace/projects/php_wordpress/02module")
@@ -407,21 +415,11 @@ def get_all_files_from_structure():
             all_files.append(file_info[0])
     return all_files
 
-def generate_html(session_key, session_data, file_index, file_info, module_num="2"):
-    """Generate complete HTML for a lesson file with proper navigation"""
-    
-    filename, title, duration, description = file_info
-    session_title = session_data["title"]
-    
-    # Generate components
-    sidebar_html = generate_sidebar(session_title, session_data["files"], file_index, module_num)
-    nav_html = generate_navigation_simple(title, module_num)  # Simplified navigation
-    objectives = generate_objectives(title)
-    content = generate_content(title, description)
-    homework = generate_homework(title)
-    
-    # Complete HTML template
-    html = f"""<!DOCTYPE html>
+# Page templates: compiled once at import, see page_template.py. The
+# fragments of a page that only depend on the module are bound once per
+# module (page_template()), so generate_html() only renders the lesson's
+# own slots.
+PAGE_TEMPLATE = Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -429,9 +427,9 @@ def generate_html(session_key, session_data, file_index, file_info, module_num="
     <meta http-equiv="X-UA-Compatible" content="ie=edge">
     
     <!-- SEO Meta Tags -->
-    <title>{title} - PHP WordPress Course</title>
-    <meta name="description" content="{description}">
-    <meta name="keywords" content="PHP, WordPress, web development, {title.lower().replace(' ', ', ')}">
+    <title>{{ title }} - PHP WordPress Course</title>
+    <meta name="description" content="{{ description }}">
+    <meta name="keywords" content="PHP, WordPress, web development, {{ keywords }}">
     <meta name="author" content="PHP WordPress Course">
     
     <!-- Favicon -->
@@ -446,54 +444,54 @@ def generate_html(session_key, session_data, file_index, file_info, module_num="
     <a href="#main-content" class="sr-only">Skip to main content</a>
     
     <div class="page-wrapper">
-        {generate_header(module_num)}
-        {generate_progress_bar()}
-        {generate_breadcrumb(title, module_num)}
+        {{ header }}
+        {{ progress_bar }}
+        {{ breadcrumb }}
         
         <!-- Main Content -->
         <main id="main-content" class="main-content" role="main">
             <div class="container">
                 <div class="content-with-sidebar">
-                    {sidebar_html}
+                    {{ sidebar }}
                     
                     <!-- Main Lesson Content -->
                     <article class="lesson-content">
                         <header class="lesson-header">
-                            <h1>{title}</h1>
+                            <h1>{{ title }}</h1>
                             <div class="lesson-meta">
                                 <div class="lesson-meta-item">
                                     <svg width="20" height="20" fill="currentColor">
                                         <path d="M12 8v4l3 3m6-3a9 9 0 11-18 0 9 9 0 0118 0z"/>
                                     </svg>
-                                    <span>Duration: {duration}</span>
+                                    <span>Duration: {{ duration }}</span>
                                 </div>
                                 <div class="lesson-meta-item">
                                     <svg width="20" height="20" fill="currentColor">
                                         <path d="M12 14l9-5-9-5-9 5 9 5z"/>
                                     </svg>
-                                    <span>Module {module_num}: {session_title}</span>
+                                    <span>Module {{ module_num }}: {{ session_title }}</span>
                                 </div>
                             </div>
                         </header>
 
-                        {objectives}
+                        {{ objectives }}
                         
                         <!-- Lesson Body -->
                         <div class="lesson-body">
-                            {content}
+                            {{ content }}
                             
-                            {homework}
+                            {{ homework }}
                             
-                            {generate_resources(title)}
+                            {{ resources }}
                         </div>
 
-                        {nav_html}
+                        {{ navigation }}
                     </article>
                 </div>
             </div>
         </main>
 
-        {generate_footer()}
+        {{ footer }}
     </div>
 
     <!-- Back to Top -->
@@ -507,21 +505,17 @@ def generate_html(session_key, session_data, file_index, file_info, module_num="
     <script src="/assets/js/navigation.js"></script>
     <script src="/assets/js/site-config.js"></script>
 </body>
-</html>"""
-    
-    return html
+</html>""", name="page")
 
-def generate_navigation_simple(title, module_num="2"):
-    """Generate simplified lesson navigation"""
-    nav_html = f"""                        <!-- Lesson Navigation -->
+NAVIGATION_TEMPLATE = Template("""                        <!-- Lesson Navigation -->
                         <div class="lesson-navigation">
-                            <a href="/module{module_num}.html" class="lesson-nav-button prev">
+                            <a href="/module{{ module_num }}.html" class="lesson-nav-button prev">
                                 <svg width="20" height="20" viewBox="0 0 20 20" fill="currentColor">
                                     <path d="M12.707 5.293a1 1 0 010 1.414L9.414 10l3.293 3.293a1 1 0 01-1.414 1.414l-4-4a1 1 0 010-1.414l4-4a1 1 0 011.414 0z"/>
                                 </svg>
                                 <span>
                                     <small>Back to</small><br>
-                                    Module {module_num} Overview
+                                    Module {{ module_num }} Overview
                                 </span>
                             </a>
                             
@@ -538,13 +532,9 @@ def generate_navigation_simple(title, module_num="2"):
                                     <path d="M7.293 14.707a1 1 0 010-1.414L10.586 10 7.293 6.707a1 1 0 011.414-1.414l4 4a1 1 0 010 1.414l-4 4a1 1 0 01-1.414 0z"/>
                                 </svg>
                             </a>
-                        </div>"""
-    
-    return nav_html
+                        </div>""", name="navigation")
 
-def generate_header(module_num="2"):
-    """Generate standard header HTML with Module 2 active"""
-    return f"""        <!-- Header -->
+HEADER_TEMPLATE = Template("""        <!-- Header -->
         <header class="site-header" role="banner">
             <div class="header-container">
                 <div class="site-branding">
@@ -593,11 +583,9 @@ def generate_header(module_num="2"):
                     <div class="search-results"></div>
                 </div>
             </div>
-        </header>"""
+        </header>""", name="header")
 
-def generate_progress_bar():
-    """Generate progress bar HTML"""
-    return """        <!-- Progress Bar -->
+PROGRESS_BAR_TEMPLATE = Template("""        <!-- Progress Bar -->
         <div class="progress-container">
             <div class="progress-header">
                 <h2 class="progress-title">Course Progress</h2>
@@ -608,11 +596,9 @@ def generate_progress_bar():
                     <span class="progress-bar-text"></span>
                 </div>
             </div>
-        </div>"""
+        </div>""", name="progress_bar")
 
-def generate_breadcrumb(title, module_num="2"):
-    """Generate breadcrumb HTML"""
-    return f"""        <!-- Breadcrumb -->
+BREADCRUMB_TEMPLATE = Template("""        <!-- Breadcrumb -->
         <nav class="breadcrumb container" aria-label="Breadcrumb">
             <ol class="breadcrumb-list">
                 <li class="breadcrumb-item">
@@ -620,131 +606,119 @@ def generate_breadcrumb(title, module_num="2"):
                     <span class="breadcrumb-separator">/</span>
                 </li>
                 <li class="breadcrumb-item">
-                    <a href="/module{module_num}.html">Module {module_num}</a>
+                    <a href="/module{{ module_num }}.html">Module {{ module_num }}</a>
                     <span class="breadcrumb-separator">/</span>
                 </li>
                 <li class="breadcrumb-item">
-                    <span aria-current="page">{title}</span>
+                    <span aria-current="page">{{ title }}</span>
                 </li>
             </ol>
-        </nav>"""
+        </nav>""", name="breadcrumb")
 
-def generate_sidebar(session_title, files, current_index, module_num="2"):
-    """Generate sidebar HTML"""
-    sidebar = f"""                    <!-- Sidebar -->
+SIDEBAR_TEMPLATE = Template("""                    <!-- Sidebar -->
                     <aside class="sidebar">
                         <div class="sidebar-nav">
-                            <h3 class="sidebar-title">Module {module_num}: {session_title}</h3>
+                            <h3 class="sidebar-title">Module {{ module_num }}: {{ session_title }}</h3>
                             <div class="sidebar-section">
-                                <h4 class="sidebar-section-title">Lessons</h4>"""
-    
-    for i, file_info in enumerate(files):
-        filename, title, _, _ = file_info
-        active = " active" if i == current_index else ""
-        sidebar += f"""
-                                <a href="/0{module_num}module/{filename}" class="sidebar-link{active}">{title}</a>"""
-    
-    sidebar += """
+                                <h4 class="sidebar-section-title">Lessons</h4>{{ links }}
                             </div>
                         </div>
-                    </aside>"""
-    
-    return sidebar
+                    </aside>""", name="sidebar")
 
-def generate_objectives(title):
-    """Generate learning objectives based on title"""
-    objectives = """                        <!-- Learning Objectives -->
+SIDEBAR_LINK_TEMPLATE = Template("""
+                                <a href="/0{{ module_num }}module/{{ filename }}" class="sidebar-link{{ active }}">{{ title }}</a>""",
+                                 name="sidebar_link")
+
+OBJECTIVES_TEMPLATE = Template("""                        <!-- Learning Objectives -->
                         <div class="lesson-objectives">
                             <h2>Learning Objectives</h2>
-                            <ul>"""
-    
-    title_lower = title.lower()
-    
-    # PHP-specific objectives based on keywords
-    if "setup" in title_lower:
-        objectives += """
-                                <li>Set up PHP development environment</li>
-                                <li>Configure PHP for optimal development</li>
-                                <li>Understand PHP installation options</li>
-                                <li>Test PHP installation and configuration</li>"""
-    elif any(word in title_lower for word in ["variable", "data type", "constant"]):
-        objectives += """
-                                <li>Understand PHP variables and constants</li>
-                                <li>Master PHP data types</li>
-                                <li>Learn variable scope and lifetime</li>
-                                <li>Apply best practices for naming and usage</li>"""
-    elif "operator" in title_lower:
-        objectives += """
-                                <li>Master PHP operators</li>
-                                <li>Understand operator precedence</li>
-                                <li>Apply operators in practical scenarios</li>
-                                <li>Write efficient expressions</li>"""
-    elif any(word in title_lower for word in ["loop", "for", "while", "foreach"]):
-        objectives += """
-                                <li>Master PHP loop structures</li>
-                                <li>Choose appropriate loop types</li>
-                                <li>Control loop execution flow</li>
-                                <li>Optimize loop performance</li>"""
-    elif "function" in title_lower:
-        objectives += """
-                                <li>Create and use PHP functions</li>
-                                <li>Understand function parameters and returns</li>
-                                <li>Master variable scope in functions</li>
-                                <li>Build reusable code components</li>"""
-    elif "array" in title_lower:
-        objectives += """
-                                <li>Master PHP array operations</li>
-                                <li>Work with different array types</li>
-                                <li>Use array functions effectively</li>
-                                <li>Manipulate complex data structures</li>"""
-    elif "form" in title_lower:
-        objectives += """
-                                <li>Process HTML forms with PHP</li>
-                                <li>Validate and sanitize form data</li>
-                                <li>Handle file uploads securely</li>
-                                <li>Implement form security best practices</li>"""
-    elif any(word in title_lower for word in ["oop", "object", "class"]):
-        objectives += """
-                                <li>Understand OOP principles in PHP</li>
-                                <li>Create and use classes and objects</li>
-                                <li>Implement inheritance and polymorphism</li>
-                                <li>Apply OOP best practices</li>"""
-    elif any(word in title_lower for word in ["database", "mysql", "crud"]):
-        objectives += """
-                                <li>Connect PHP to databases</li>
-                                <li>Execute database queries from PHP</li>
-                                <li>Implement CRUD operations</li>
-                                <li>Secure database operations</li>"""
-    elif "api" in title_lower:
-        objectives += """
-                                <li>Work with APIs in PHP</li>
-                                <li>Parse and generate JSON data</li>
-                                <li>Consume external web services</li>
-                                <li>Create RESTful endpoints</li>"""
-    elif "security" in title_lower:
-        objectives += """
-                                <li>Identify security vulnerabilities</li>
-                                <li>Implement secure coding practices</li>
-                                <li>Protect against common attacks</li>
-                                <li>Validate and sanitize all input</li>"""
-    else:
-        objectives += """
-                                <li>Master PHP programming concepts</li>
-                                <li>Write clean, maintainable code</li>
-                                <li>Apply best practices</li>
-                                <li>Build dynamic applications</li>"""
-    
-    objectives += """
+                            <ul>{{ items }}
                             </ul>
-                        </div>"""
-    
-    return objectives
+                        </div>""", name="objectives")
 
-def generate_content(title, description):
-    """Generate lesson content based on title"""
-    content = f"""                            <section>
+OBJECTIVE_ITEM_TEMPLATE = Template("""
+                                <li>{{ objective }}</li>""", name="objective_item")
+
+# PHP-specific objectives by title keyword; the first matching entry wins
+OBJECTIVES_BY_KEYWORD = [
+    (("setup",), [
+        "Set up PHP development environment",
+        "Configure PHP for optimal development",
+        "Understand PHP installation options",
+        "Test PHP installation and configuration",
+    ]),
+    (("variable", "data type", "constant"), [
+        "Understand PHP variables and constants",
+        "Master PHP data types",
+        "Learn variable scope and lifetime",
+        "Apply best practices for naming and usage",
+    ]),
+    (("operator",), [
+        "Master PHP operators",
+        "Understand operator precedence",
+        "Apply operators in practical scenarios",
+        "Write efficient expressions",
+    ]),
+    (("loop", "for", "while", "foreach"), [
+        "Master PHP loop structures",
+        "Choose appropriate loop types",
+        "Control loop execution flow",
+        "Optimize loop performance",
+    ]),
+    (("function",), [
+        "Create and use PHP functions",
+        "Understand function parameters and returns",
+        "Master variable scope in functions",
+        "Build reusable code components",
+    ]),
+    (("array",), [
+        "Master PHP array operations",
+        "Work with different array types",
+        "Use array functions effectively",
+        "Manipulate complex data structures",
+    ]),
+    (("form",), [
+        "Process HTML forms with PHP",
+        "Validate and sanitize form data",
+        "Handle file uploads securely",
+        "Implement form security best practices",
+    ]),
+    (("oop", "object", "class"), [
+        "Understand OOP principles in PHP",
+        "Create and use classes and objects",
+        "Implement inheritance and polymorphism",
+        "Apply OOP best practices",
+    ]),
+    (("database", "mysql", "crud"), [
+        "Connect PHP to databases",
+        "Execute database queries from PHP",
+        "Implement CRUD operations",
+        "Secure database operations",
+    ]),
+    (("api",), [
+        "Work with APIs in PHP",
+        "Parse and generate JSON data",
+        "Consume external web services",
+        "Create RESTful endpoints",
+    ]),
+    (("security",), [
+        "Identify security vulnerabilities",
+        "Implement secure coding practices",
+        "Protect against common attacks",
+        "Validate and sanitize all input",
+    ]),
+]
+
+DEFAULT_OBJECTIVES = [
+    "Master PHP programming concepts",
+    "Write clean, maintainable code",
+    "Apply best practices",
+    "Build dynamic applications",
+]
+
+CONTENT_TEMPLATE = Template("""                            <section>
                                 <h2>Introduction</h2>
-                                <p class="lead">{description}</p>
+                                <p class="lead">{{ description }}</p>
                                 
                                 <div class="alert alert-info">
                                     <div class="alert-icon">💡</div>
@@ -814,14 +788,9 @@ def generate_content(title, description):
                                         <div class="alert-message">Open your PHP environment and practice these concepts!</div>
                                     </div>
                                 </div>
-                            </section>"""
-    
-    return content
+                            </section>""", name="content")
 
-def generate_homework(title):
-    """Generate homework section based on title"""
-    if "homework" in title.lower() or "project" in title.lower():
-        return """                            <!-- Homework -->
+ASSIGNMENT_TEMPLATE = Template("""                            <!-- Homework -->
                             <div class="homework">
                                 <h2>Assignment Requirements</h2>
                                 <p>Complete this project to demonstrate mastery of the concepts:</p>
@@ -842,9 +811,9 @@ def generate_homework(title):
                                 </ul>
                                 
                                 <p><strong>Due:</strong> Before next session</p>
-                            </div>"""
-    else:
-        return """                            <!-- Practice -->
+                            </div>""", name="assignment")
+
+PRACTICE_TEMPLATE = Template("""                            <!-- Practice -->
                             <div class="homework">
                                 <h2>Practice Exercises</h2>
                                 <p>Reinforce your learning with these exercises:</p>
@@ -856,11 +825,9 @@ def generate_homework(title):
                                 </ul>
                                 
                                 <p><strong>Challenge:</strong> Build a small project using these concepts.</p>
-                            </div>"""
+                            </div>""", name="practice")
 
-def generate_resources(title):
-    """Generate resources section"""
-    return """                            <!-- Resources -->
+RESOURCES_TEMPLATE = Template("""                            <!-- Resources -->
                             <section class="resources">
                                 <h2>Additional Resources</h2>
                                 <ul>
@@ -870,11 +837,9 @@ def generate_resources(title):
                                     <li><a href="https://developer.wordpress.org/apis/" target="_blank">WordPress Developer Resources</a></li>
                                     <li><a href="https://www.phptutorial.net/" target="_blank">PHP Tutorial</a></li>
                                 </ul>
-                            </section>"""
+                            </section>""", name="resources")
 
-def generate_footer():
-    """Generate footer HTML"""
-    return """        <!-- Footer -->
+FOOTER_TEMPLATE = Template("""        <!-- Footer -->
         <footer class="site-footer" role="contentinfo">
             <div class="footer-container">
                 <div class="footer-content">
@@ -913,11 +878,312 @@ def generate_footer():
                     </div>
                 </div>
             </div>
-        </footer>"""
+        </footer>""", name="footer")
+
+TEMPLATES = [
+    PAGE_TEMPLATE, NAVIGATION_TEMPLATE, HEADER_TEMPLATE, PROGRESS_BAR_TEMPLATE,
+    BREADCRUMB_TEMPLATE, SIDEBAR_TEMPLATE, SIDEBAR_LINK_TEMPLATE, OBJECTIVES_TEMPLATE,
+    OBJECTIVE_ITEM_TEMPLATE, CONTENT_TEMPLATE, ASSIGNMENT_TEMPLATE, PRACTICE_TEMPLATE,
+    RESOURCES_TEMPLATE, FOOTER_TEMPLATE,
+]
+
+@lru_cache(maxsize=None)
+def module_regions(module_num="2"):
+    """The marked regions that are the same on every page of a module"""
+    return {
+        "header": Region(region_digest(HEADER_TEMPLATE.source, module_num),
+                         partial(generate_header, module_num)),
+        "lesson-navigation": Region(region_digest(NAVIGATION_TEMPLATE.source, module_num),
+                                    partial(generate_navigation_simple, "", module_num)),
+        "footer": Region(region_digest(FOOTER_TEMPLATE.source), generate_footer),
+    }
+
+def lesson_regions(session_data, file_index, file_info, module_num="2"):
+    """All the marked regions of a lesson page, keyed by region name"""
+    title = file_info[1]
+    sidebar = session_sidebar(session_data["title"], tuple(session_data["files"]), module_num)
+    regions = dict(module_regions(module_num))
+    regions["breadcrumb"] = Region(region_digest(BREADCRUMB_TEMPLATE.source, module_num, title),
+                                   partial(generate_breadcrumb, title, module_num))
+    regions["sidebar"] = Region(region_digest(sidebar.digest, file_index),
+                                partial(sidebar.render, file_index))
+    return regions
+
+# Regions --patch re-renders. The sidebar and lesson navigation are marked
+# when a page is generated, but fix_02module_navigation.py rewrites them
+# afterwards (session lesson lists, prev/next session, Module Overview), so
+# patching them would undo the fixer.
+PATCHED_REGIONS = ("header", "breadcrumb", "footer")
+
+def marked(name, region):
+    """A region's fragment rendered with its markers"""
+    return mark_region(name, region.digest, region.render())
+
+@lru_cache(maxsize=None)
+def page_template(module_num="2"):
+    """The page template with the fragments shared by every page of a module bound"""
+    regions = module_regions(module_num)
+    return PAGE_TEMPLATE.bind(
+        module_num=module_num,
+        header=marked("header", regions["header"]),
+        progress_bar=generate_progress_bar(),
+        resources=RESOURCES_TEMPLATE.render(),
+        navigation=marked("lesson-navigation", regions["lesson-navigation"]),
+        footer=marked("footer", regions["footer"]),
+    )
+
+@lru_cache(maxsize=None)
+def breadcrumb_template(module_num="2"):
+    return BREADCRUMB_TEMPLATE.bind(module_num=module_num)
+
+def generate_html(session_key, session_data, file_index, file_info, module_num="2"):
+    """Generate complete HTML for a lesson file with proper navigation"""
+    
+    filename, title, duration, description = file_info
+    session_title = session_data["title"]
+    regions = lesson_regions(session_data, file_index, file_info, module_num)
+    
+    # Only the lesson's own slots are rendered here
+    return page_template(module_num).render(
+        title=title,
+        description=description,
+        keywords=title.lower().replace(' ', ', '),
+        breadcrumb=marked("breadcrumb", regions["breadcrumb"]),
+        sidebar=marked("sidebar", regions["sidebar"]),
+        duration=duration,
+        session_title=session_title,
+        objectives=generate_objectives(title),
+        content=generate_content(title, description),
+        homework=generate_homework(title),
+    )
+
+def generate_navigation_simple(title, module_num="2"):
+    """Generate simplified lesson navigation"""
+    return NAVIGATION_TEMPLATE.render(module_num=module_num)
+
+def generate_header(module_num="2"):
+    """Generate standard header HTML with Module 2 active"""
+    return HEADER_TEMPLATE.render()
+
+def generate_progress_bar():
+    """Generate progress bar HTML"""
+    return PROGRESS_BAR_TEMPLATE.render()
+
+def generate_breadcrumb(title, module_num="2"):
+    """Generate breadcrumb HTML"""
+    return breadcrumb_template(module_num).render(title=title)
+
+class SessionSidebar:
+    """
+    A session's sidebar, rendered once for all of its lessons. The offset
+    where each link takes its active marker is recorded while rendering,
+    so a lesson's sidebar is one splice instead of a loop over the session.
+    """
+    ACTIVE = " active"
+
+    def __init__(self, session_title, files, module_num="2"):
+        links = []
+        self.active_offsets = []
+        length = 0
+        for filename, title, _, _ in files:
+            link, offsets = SIDEBAR_LINK_TEMPLATE.render_with_offsets(
+                module_num=module_num, filename=filename, title=title, active="")
+            self.active_offsets.append(length + offsets["active"])
+            links.append(link)
+            length += len(link)
+        self.html, offsets = SIDEBAR_TEMPLATE.render_with_offsets(
+            module_num=module_num, session_title=session_title, links=''.join(links))
+        self.active_offsets = [offsets["links"] + offset for offset in self.active_offsets]
+        # Input hash of the sidebar region, less the current lesson
+        self.digest = region_digest(SIDEBAR_TEMPLATE.source, SIDEBAR_LINK_TEMPLATE.source,
+                                    module_num, session_title, files)
+
+    def render(self, current_index):
+        """The sidebar with the link of lesson current_index marked active"""
+        if not 0 <= current_index < len(self.active_offsets):
+            return self.html
+        offset = self.active_offsets[current_index]
+        return self.html[:offset] + self.ACTIVE + self.html[offset:]
+
+@lru_cache(maxsize=None)
+def session_sidebar(session_title, files, module_num="2"):
+    """The shared SessionSidebar of a session (files as a tuple)"""
+    return SessionSidebar(session_title, files, module_num)
+
+def generate_sidebar(session_title, files, current_index, module_num="2"):
+    """Generate sidebar HTML"""
+    return session_sidebar(session_title, tuple(files), module_num).render(current_index)
+
+@lru_cache(maxsize=None)
+def objectives_block(category):
+    """The objectives section of one OBJECTIVES_BY_KEYWORD entry (None: the default)"""
+    items = DEFAULT_OBJECTIVES if category is None else OBJECTIVES_BY_KEYWORD[category][1]
+    return OBJECTIVES_TEMPLATE.render(
+        items=''.join(OBJECTIVE_ITEM_TEMPLATE.render(objective=item) for item in items))
+
+def generate_objectives(title):
+    """Generate learning objectives based on title"""
+    title_lower = title.lower()
+    for category, (keywords, _) in enumerate(OBJECTIVES_BY_KEYWORD):
+        if any(word in title_lower for word in keywords):
+            return objectives_block(category)
+    return objectives_block(None)
+
+def generate_content(title, description):
+    """Generate lesson content based on title"""
+    return CONTENT_TEMPLATE.render(description=description)
+
+def generate_homework(title):
+    """Generate homework section based on title"""
+    if "homework" in title.lower() or "project" in title.lower():
+        return ASSIGNMENT_TEMPLATE.render()
+    else:
+        return PRACTICE_TEMPLATE.render()
+
+def generate_resources(title):
+    """Generate resources section"""
+    return RESOURCES_TEMPLATE.render()
+
+def generate_footer():
+    """Generate footer HTML"""
+    return FOOTER_TEMPLATE.render()
+
+def template_fingerprint():
+    """Hash of every template and template function used to render a Module 2 page"""
+    return input_hash(
+        source_fingerprint(
+            generate_html, module_regions, lesson_regions, marked, page_template,
+            breadcrumb_template, generate_navigation_simple,
+            generate_header, generate_progress_bar, generate_breadcrumb, SessionSidebar,
+            session_sidebar, generate_sidebar, objectives_block, generate_objectives,
+            generate_content, generate_homework, generate_resources, generate_footer
+        ),
+        [template.source for template in TEMPLATES],
+        OBJECTIVES_BY_KEYWORD, DEFAULT_OBJECTIVES
+    )
+
+def unstructured_lesson(filename):
+    """Generic session data and file info for a file not in module2_files"""
+    title = filename.replace('.html', '').replace('_', ' ').title()
+    description = f"PHP lesson covering {title.lower()} concepts."
+    file_info = (filename, title, "45 minutes", description)
+    return {"title": "PHP Additional Topics", "files": [file_info]}, file_info
+
+def module_lessons(existing_filenames):
+    """(session_data, file_index, file_info) of every structured and unstructured lesson"""
+    structured_files = set(get_all_files_from_structure())
+    for session_data in module2_files.values():
+        for file_index, file_info in enumerate(session_data["files"]):
+            yield session_data, file_index, file_info
+    for filename in existing_filenames:
+        if filename not in structured_files:
+            session_data, file_info = unstructured_lesson(filename)
+            yield session_data, 0, file_info
+
+def patch_pages(adopt=False):
+    """
+    Re-render only the marked PATCHED_REGIONS whose inputs changed, and
+    splice them into the existing pages; see page_regions.py. The rest of
+    each page, hand edits included, is left byte for byte. Pages that do
+    not exist are skipped and reported: creating a page takes a full run.
+    With adopt, unmarked regions of pages generated before the markers
+    existed are replaced and marked too.
+
+    A patched page is recorded in the build manifest with its previous
+    inputs if it was current before: the next full run still regenerates
+    it when the other templates changed, without taking the patch for a
+    hand edit. Hand-edited and untracked pages are patched but stay as
+    they were in the manifest.
+    """
+    print(f"🩹 Module 2 region patch: {BASE_DIR}")
+    manifest = BuildManifest("02module", owned=generated_markup)
+    existing_filenames = sorted(f.name for f in BASE_DIR.glob("*.html"))
+    
+    patched_files = []
+    missing_files = []
+    failed_files = []
+    unmarked_files = []
+    regions_patched = 0
+    bytes_spliced = 0
+    
+    for session_data, file_index, file_info in module_lessons(existing_filenames):
+        filename = file_info[0]
+        filepath = BASE_DIR / filename
+        if filename in ALREADY_UPDATED:
+            continue
+        if not filepath.exists():
+            missing_files.append(filename)
+            continue
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                html_content = f.read()
+            regions = lesson_regions(session_data, file_index, file_info)
+            regions = {name: regions[name] for name in PATCHED_REGIONS}
+            new_html, patched, missing, spliced = patch_regions(html_content, regions, adopt=adopt)
+            if missing:
+                unmarked_files.append(filename)
+            if not patched:
+                continue
+            
+            entry = manifest.entries.get(filename)
+            was_current = entry is not None and manifest.status(filename, filepath, entry["input"]) == CURRENT
+            write_if_changed(filepath, new_html)
+            if was_current:
+                manifest.record(filename, filepath, entry["input"], new_html)
+            
+            patched_files.append(filename)
+            regions_patched += len(patched)
+            bytes_spliced += spliced
+            print(f"  🩹 Patched: {filename} ({', '.join(patched)})")
+        except Exception as e:
+            failed_files.append((filename, str(e)))
+            print(f"  ❌ Failed: {filename} - {e}")
+    
+    manifest.save()
+    
+    print(f"\n{'='*60}")
+    print(f"📊 Module 2 Region Patch Summary:")
+    print(f"  🩹 Pages patched: {len(patched_files)} ({regions_patched} regions, {bytes_spliced:,} bytes spliced)")
+    if unmarked_files:
+        hint = "no element to adopt" if adopt else "use --adopt to mark them"
+        print(f"  ⚠️  With unmarked regions ({hint}): {len(unmarked_files)}")
+    print(f"  ❌ Failed: {len(failed_files)}")
+    
+    if missing_files:
+        print(f"\n⚠️ Not found (run without --patch to create them): {len(missing_files)}")
+        for filename in missing_files[:10]:
+            print(f"  - {filename}")
+        if len(missing_files) > 10:
+            print(f"  ... and {len(missing_files) - 10} more")
+    return patched_files, failed_files
+
+def should_skip(manifest, filename, filepath, inputs, force):
+    """
+    Decide from the build manifest whether a page can be skipped.
+    Returns a skip reason, or None if the page must be (re)generated.
+    An untracked page that already has the new template is recorded as
+    built from the current inputs, so it is regenerated once they change.
+    """
+    status = manifest.status(filename, filepath, inputs)
+    if status == CURRENT:
+        return "updated"
+    if status == UNTRACKED and not force and check_if_updated(filepath):
+        manifest.record_existing(filename, filepath, inputs)
+        return "updated"
+    if status == HAND_EDITED and not force:
+        return "hand-edited"
+    return None
 
 # Main execution
-def main():
-    """Main function to update all Module 2 files"""
+def main(force=False, patch=False, adopt=False):
+    """
+    Main function to update all Module 2 files.
+    Only pages whose metadata or template changed since the last run are
+    regenerated; hand-edited pages are left alone unless force is set.
+    With patch, only the changed regions of the pages are re-rendered.
+    """
+    if patch:
+        return patch_pages(adopt=adopt)
     
     print(f"🚀 PHP WordPress Course - Module 2 Complete Update Script")
     print("="*60)
@@ -943,6 +1209,10 @@ def main():
     failed_files = []
     skipped_files = []
     already_updated_files = []
+    hand_edited_files = []
+    
+    manifest = BuildManifest("02module", owned=generated_markup)
+    template = template_fingerprint()
     
     # Process structured files
     processed = 0
@@ -963,18 +1233,26 @@ def main():
                 print(f"  ⏭️  Skipped (manual): {filename}")
                 continue
             
-            if filepath.exists() and check_if_updated(filepath):
+            # The sidebar lists the whole session, so it is part of the inputs
+            inputs = input_hash(template, session_data["title"], session_data["files"], file_index)
+            skip_reason = should_skip(manifest, filename, filepath, inputs, force)
+            if skip_reason == "hand-edited":
+                hand_edited_files.append(filename)
+                print(f"  ✋ Skipped (edited by hand): {filename}")
+                continue
+            if skip_reason:
                 skipped_files.append(filename)
                 print(f"  ⏭️  Skipped (updated): {filename}")
                 continue
             
             try:
+                is_new = not filepath.exists()
                 html_content = generate_html(session_key, session_data, file_index, file_info)
                 
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
+                write_if_changed(filepath, html_content)
+                manifest.record(filename, filepath, inputs, html_content)
                 
-                if filepath.exists():
+                if not is_new:
                     updated_files.append(filename)
                     print(f"  ✅ Updated: {filename} [{processed}/{total_files}]")
                 else:
@@ -992,24 +1270,25 @@ def main():
             filepath = BASE_DIR / filename
             processed += 1
             
-            if check_if_updated(filepath):
+            # Generate generic content for unstructured files
+            session_data, file_info = unstructured_lesson(filename)
+            
+            inputs = input_hash(template, session_data["title"], session_data["files"], 0)
+            skip_reason = should_skip(manifest, filename, filepath, inputs, force)
+            if skip_reason == "hand-edited":
+                hand_edited_files.append(filename)
+                print(f"  ✋ Skipped (edited by hand): {filename}")
+                continue
+            if skip_reason:
                 skipped_files.append(filename)
                 print(f"  ⏭️  Skipped (updated): {filename}")
                 continue
             
             try:
-                # Generate generic content for unstructured files
-                title = filename.replace('.html', '').replace('_', ' ').title()
-                description = f"PHP lesson covering {title.lower()} concepts."
-                
-                # Create generic file info
-                file_info = (filename, title, "45 minutes", description)
-                session_data = {"title": "PHP Additional Topics", "files": [file_info]}
-                
                 html_content = generate_html("additional", session_data, 0, file_info)
                 
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
+                write_if_changed(filepath, html_content)
+                manifest.record(filename, filepath, inputs, html_content)
                 
                 updated_files.append(filename)
                 print(f"  ✅ Updated: {filename} [{processed}/{total_files}]")
@@ -1018,6 +1297,8 @@ def main():
                 failed_files.append((filename, str(e)))
                 print(f"  ❌ Failed: {filename} - {e}")
     
+    manifest.save()
+    
     # Summary
     print(f"\n{'='*60}")
     print(f"📊 Module 2 Complete Update Summary:")
@@ -1027,6 +1308,7 @@ def main():
     print(f"  ✅ Successfully updated: {len(updated_files)}")
     print(f"  🆕 Newly created: {len(created_files)}")
     print(f"  ⏭️  Already updated: {len(skipped_files) + len(already_updated_files)}")
+    print(f"  ✋ Edited by hand (use --force to regenerate): {len(hand_edited_files)}")
     print(f"  ❌ Failed: {len(failed_files)}")
     
     if failed_files:
@@ -1086,7 +1368,7 @@ def main():
 {chr(10).join(f"- {f[0]}: {f[1]}" for f in failed_files) if failed_files else "None"}
 
 ## Completion Status
-- **Total Progress:** {((len(updated_files) + len(created_files) + len(skipped_files) + len(already_updated_files)) / total_files * 100):.1f}%
+- **Total Progress:** {((len(updated_files) + len(created_files) + len(skipped_files) + len(already_updated_files) + len(hand_edited_files)) / total_files * 100):.1f}%
 - **Module 2 Ready:** {"✅ Yes" if len(failed_files) == 0 else "⚠️ Review failed files"}
 
 ## Next Steps
@@ -1107,9 +1389,19 @@ if __name__ == "__main__":
         print("❌ Python 3.6 or higher is required!")
         sys.exit(1)
     
+    parser = argparse.ArgumentParser(description="Regenerate Module 2 lesson pages")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate hand-edited and untracked pages too")
+    parser.add_argument("--patch", action="store_true",
+                        help="only re-render the header, breadcrumb and footer regions whose "
+                             "inputs changed; missing pages are reported, not created")
+    parser.add_argument("--adopt", action="store_true",
+                        help="with --patch, also replace and mark regions of pages generated without markers")
+    args = parser.parse_args()
+    
     # Run the update
     try:
-        successful, failed = main()
+        successful, failed = main(force=args.force, patch=args.patch or args.adopt, adopt=args.adopt)
         
         # Exit with appropriate code
         if failed:
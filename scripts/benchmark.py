@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the fixers and batch generators.
+
+For each corpus size a synthetic course tree is generated (see
+synthetic_corpus.py) and every registered benchmark runs against it in a
+fresh process, so peak memory is measured per tool. Tool output is
+suppressed; caches, the change list and backups go to the corpus directory
+(via COURSE_CACHE_DIR / COURSE_BACKUP_DIR) instead of the project's.
+
+Benchmarks run in a fixed order on the same corpus (read-only validation
+first), so results from different runs are comparable. Each run is saved as
+JSON in .build_cache/benchmarks/ (or --output):
+
+    python benchmark.py run --sizes 1000 10000 100000
+    python benchmark.py run --sizes 1000 --only validate_structure fix_quick_links
+    python benchmark.py compare old.json new.json
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from course_corpus import CACHE_DIR, PROJECT_ROOT
+from synthetic_corpus import MODULES, generate_corpus
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+RESULTS_DIR = CACHE_DIR / "benchmarks"
+
+# Registered benchmarks, in the order they run
+BENCHMARKS: Dict[str, Callable] = {}
+
+
+def register_benchmark(name: str):
+    """Decorator registering a benchmark: func(corpus_root) -> items processed."""
+    def decorator(func: Callable) -> Callable:
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+def corpus_files(root: Path, module: Optional[str] = None) -> List[Tuple[str, str]]:
+    """(path, module) of every synthetic lesson, optionally only one module."""
+    files = []
+    for part in sorted(root.glob("part_*")):
+        for module_name in MODULES:
+            if module and module_name != module:
+                continue
+            module_dir = part / module_name
+            if module_dir.is_dir():
+                files.extend((str(path), module_name) for path in sorted(module_dir.glob("*.html")))
+    return files
+
+
+@register_benchmark("validate_structure")
+def bench_validate_structure(root: Path) -> int:
+    from validate_structure import HTMLValidator
+    files = corpus_files(root)
+    for path, _ in files:
+        HTMLValidator(path).validate()
+    return len(files)
+
+
+@register_benchmark("fix_quick_links")
+def bench_fix_quick_links(root: Path) -> int:
+    from fix_quick_links import fix_quick_links
+    files = corpus_files(root)
+    for path, module in files:
+        fix_quick_links(path, module)
+    return len(files)
+
+
+@register_benchmark("fix_mermaid_02module")
+def bench_fix_mermaid_02module(root: Path) -> int:
+    from fix_mermaid_02module import process_file
+    files = corpus_files(root, "02module")
+    for path, _ in files:
+        process_file(path)
+    return len(files)
+
+
+@register_benchmark("update_lesson_navigation_v2")
+def bench_update_lesson_navigation_v2(root: Path) -> int:
+    from update_lesson_navigation_v2 import update_lesson_file
+    files = corpus_files(root, "01module")
+    for path, _ in files:
+        update_lesson_file(Path(path))
+    return len(files)
+
+
+def run_generator(root: Path, module: str, script: str) -> int:
+    """Run a batch generator's main(force=True) once per synthetic part."""
+    parts = sorted(root.glob("part_*"))
+    # The generators look for their module directory at import time
+    os.chdir(parts[0])
+    generator = __import__(script)
+    items = 0
+    for part in parts:
+        generator.BASE_DIR = part / module
+        items += len(list(generator.BASE_DIR.glob("*.html")))
+        generator.main(force=True)
+    return items
+
+
+@register_benchmark("batch_update_all")
+def bench_batch_update_all(root: Path) -> int:
+    return run_generator(root, "01module", "batch_update_all")
+
+
+@register_benchmark("batch_update_module2")
+def bench_batch_update_module2(root: Path) -> int:
+    return run_generator(root, "02module", "batch_update_module2")
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def measure(name: str, root: str, trace_memory: bool) -> Dict:
+    """Run one benchmark in this (fresh) process and measure it."""
+    import tracemalloc
+
+    result = {"baseline_rss_mb": peak_rss_mb()}
+    if trace_memory:
+        tracemalloc.start()
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            result["items"] = BENCHMARKS[name](Path(root))
+    except BaseException as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = round(time.perf_counter() - wall, 3)
+    result["cpu_seconds"] = round(time.process_time() - cpu, 3)
+    result["peak_rss_mb"] = peak_rss_mb()
+    if trace_memory:
+        result["peak_traced_mb"] = round(tracemalloc.get_traced_memory()[1] / 1024 / 1024, 1)
+        tracemalloc.stop()
+    if result.get("items"):
+        result["ms_per_item"] = round(result["seconds"] * 1000 / result["items"], 3)
+    return result
+
+
+def run_isolated(name: str, root: Path, trace_memory: bool) -> Dict:
+    """Run a benchmark in a new interpreter so its peak memory is its own."""
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        return pool.apply(measure, (name, str(root), trace_memory))
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes: List[int], names: List[str], workdir: Optional[str],
+                   keep: bool, trace_memory: bool) -> Dict:
+    """Generate a corpus per size and run every benchmark against it."""
+    results = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "sizes": {},
+    }
+    base = Path(workdir) if workdir else Path(tempfile.mkdtemp(prefix="course_bench_"))
+
+    for size in sizes:
+        root = base / f"corpus_{size}"
+        if root.exists():
+            shutil.rmtree(root)
+        print(f"\n📁 Generating {size} pages in {root}")
+        start = time.perf_counter()
+        corpus = generate_corpus(root, size)
+        corpus["seconds"] = round(time.perf_counter() - start, 3)
+        print(f"  ✓ {corpus['bytes'] / 1024 / 1024:.1f} MB in {corpus['seconds']}s")
+
+        # Spawned workers inherit these, so no run touches the project's caches
+        os.environ["COURSE_CACHE_DIR"] = str(root / ".build_cache")
+        os.environ["COURSE_BACKUP_DIR"] = str(root / ".backup_store")
+
+        timings = {}
+        for name in names:
+            result = run_isolated(name, root, trace_memory)
+            timings[name] = result
+            if "error" in result:
+                print(f"  ✗ {name}: {result['error']}")
+            else:
+                print(f"  ✓ {name}: {result['seconds']}s, {result['items']} files, "
+                      f"peak {result['peak_rss_mb']} MB")
+
+        results["sizes"][str(size)] = {"corpus": corpus, "benchmarks": timings}
+        if not keep:
+            shutil.rmtree(root)
+
+    if not keep and not workdir:
+        shutil.rmtree(base, ignore_errors=True)
+    return results
+
+
+def compare(old_file: str, new_file: str) -> None:
+    """Print the time and memory ratio of every benchmark between two runs."""
+    with open(old_file, 'r', encoding='utf-8') as f:
+        old = json.load(f)
+    with open(new_file, 'r', encoding='utf-8') as f:
+        new = json.load(f)
+
+    print(f"📊 {old.get('commit')} ({old['timestamp']}) → {new.get('commit')} ({new['timestamp']})")
+    for size, new_size in new["sizes"].items():
+        old_size = old["sizes"].get(size)
+        if not old_size:
+            continue
+        print(f"\n  {size} pages")
+        for name, after in new_size["benchmarks"].items():
+            before = old_size["benchmarks"].get(name)
+            if not before or "error" in before or "error" in after:
+                continue
+            ratio = after["seconds"] / before["seconds"] if before["seconds"] else float('inf')
+            marker = "🟢" if ratio < 0.95 else "🔴" if ratio > 1.05 else "⚪"
+            print(f"  {marker} {name:<30} {before['seconds']:>9.3f}s → {after['seconds']:>9.3f}s "
+                  f"({ratio:.2f}x)  peak {before['peak_rss_mb']} → {after['peak_rss_mb']} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the fixers on synthetic course corpora")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="generate corpora and time every benchmark")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    run_parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="run only these benchmarks")
+    run_parser.add_argument("--workdir", help="where to generate the corpora (default: a temp dir)")
+    run_parser.add_argument("--keep", action="store_true", help="keep the generated corpora")
+    run_parser.add_argument("--tracemalloc", action="store_true",
+                            help="also record peak Python allocations (slower)")
+    run_parser.add_argument("--output", help="results file (default: .build_cache/benchmarks/<timestamp>.json)")
+
+    compare_parser = commands.add_parser("compare", help="compare two results files")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        compare(args.old, args.new)
+        return 0
+
+    names = args.only or list(BENCHMARKS)
+    results = run_benchmarks(args.sizes, names, args.workdir, args.keep, args.tracemalloc)
+
+    output = Path(args.output) if args.output else \
+        RESULTS_DIR / f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n✅ Results saved to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
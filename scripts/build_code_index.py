@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Build the code-example search index (assets/data/search/code.bin).
+
+Every <pre> block in the lessons is tokenized by language, and its
+identifiers, function and method calls, variables, classes, CSS properties
+and hook names are indexed to the lesson and the block's anchor, so a
+search for array_map or htmlspecialchars lists the examples that use it.
+The language comes from the block's language-* class; unlabeled blocks
+(most of them) are recognized by their content.
+
+A block's anchor is its id, or code-<n> for the n-th <pre> of the page;
+navigation.js gives unlabeled blocks the same ids in the browser. Calls
+weigh more than other mentions of a name. The index uses the compact
+binary format of compact_index.py, with one entry per block:
+
+    title, url, anchor, language
+
+Tokenized blocks are cached per page in .build_cache/code_terms.json with
+the page's fingerprint, so a rebuild only re-reads the lessons that changed.
+"""
+
+import argparse
+import html
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List
+
+from build_search_index import INDEX_DIR, STOP_WORDS, TITLE_PATTERN, TITLE_SUFFIX_PATTERN, WORD_PATTERN, \
+    clean_text, lesson_pages, module_label
+from compact_index import encode_index
+from course_corpus import CACHE_DIR, PROJECT_ROOT, get_store
+from output_writer import write_if_changed
+
+CODE_INDEX_FILE = INDEX_DIR / "code.bin"
+CODE_CACHE_FILE = CACHE_DIR / "code_terms.json"
+CODE_INDEX_VERSION = 2
+ENTRY_FIELDS = ("title", "url", "anchor", "language")
+
+# How much a mention counts, by kind
+CALL_WEIGHT = 3
+DEFINITION_WEIGHT = 3
+NAME_WEIGHT = 1
+# Below this weight, a name found in a single block is left out of the index
+SINGLE_BLOCK_MIN_WEIGHT = CALL_WEIGHT
+
+COMMENT_PATTERN = re.compile(r'<!--.*?-->', re.DOTALL)
+PRE_PATTERN = re.compile(r'<pre\b([^>]*)>(.*?)</pre\s*>', re.IGNORECASE | re.DOTALL)
+ID_PATTERN = re.compile(r'\bid\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+LANGUAGE_PATTERN = re.compile(r'\blang(?:uage)?-([\w+-]+)', re.IGNORECASE)
+CODE_OPEN_PATTERN = re.compile(r'^\s*<code\b([^>]*)>', re.IGNORECASE)
+LINE_NUMBER_PATTERN = re.compile(r'<span class="line-number">.*?</span>', re.DOTALL)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# language-* class values, by the tokenizer that reads them
+LANGUAGE_ALIASES = {
+    "js": "javascript", "jsx": "javascript", "ts": "javascript", "typescript": "javascript",
+    "scss": "css", "sass": "css", "less": "css",
+    "markup": "html", "xml": "html", "svg": "html",
+    "mysql": "sql",
+    "sh": "bash", "shell": "bash", "console": "bash",
+}
+
+# Content sniffing for unlabeled blocks, tried in order
+DETECTORS = [
+    ("php", re.compile(r'<\?php|\$[A-Za-z_]\w*\s*(?:=|->|\[|;|\))')),
+    ("html", re.compile(r'^\s*<(?:!DOCTYPE|[a-zA-Z])')),
+    ("sql", re.compile(r'^\s*(?:SELECT|INSERT|UPDATE|DELETE|CREATE|ALTER|DROP)\b', re.MULTILINE)),
+    ("javascript", re.compile(r'\b(?:const|let|var)\s+\w+\s*=|=>|\bdocument\.|\bconsole\.|\bfunction\s*\w*\s*\(')),
+    ("css", re.compile(r'[\w\]\)-]\s*\{[^{}]*[\w-]+\s*:[^{}]*;')),
+]
+
+IDENTIFIER = r'[A-Za-z_][A-Za-z0-9_]*'
+CALL_PATTERN = re.compile(r'(?:->|::|\.)?(' + IDENTIFIER + r')\s*\(')
+NAME_PATTERN = re.compile(r'\$?' + IDENTIFIER)
+DEFINITION_PATTERN = re.compile(r'\b(?:function|class|interface|trait|extends|implements|new|const|let|var)\s+&?('
+                                + IDENTIFIER + r')')
+STRING_PATTERN = re.compile(r'"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\'|`(?:[^`\\]|\\.)*`')
+# A quoted identifier, e.g. a hook name: add_action('wp_enqueue_scripts', ...)
+QUOTED_NAME_PATTERN = re.compile(r'^["\'`]([A-Za-z_][\w/-]*)["\'`]$')
+C_COMMENT_PATTERN = re.compile(r'/\*.*?\*/|(?<![:\w])//[^\n]*', re.DOTALL)
+HASH_COMMENT_PATTERN = re.compile(r'(?m)(?:^|\s)#(?!\w*\[)[^\n]*')
+SQL_COMMENT_PATTERN = re.compile(r'--[^\n]*|/\*.*?\*/', re.DOTALL)
+CSS_PROPERTY_PATTERN = re.compile(r'(?<![\w-])(-{0,2}[a-zA-Z][\w-]*)\s*:(?!:)')
+CSS_SELECTOR_PATTERN = re.compile(r'[.#]([a-zA-Z_][\w-]*)')
+CSS_AT_RULE_PATTERN = re.compile(r'@([a-zA-Z][\w-]*)')
+HTML_TAG_PATTERN = re.compile(r'</?([a-zA-Z][\w-]*)')
+HTML_ATTRIBUTE_PATTERN = re.compile(r'\s([a-zA-Z][\w:-]*)\s*=')
+
+KEYWORDS = {
+    "php": """abstract and array as break callable case catch class clone const continue declare
+        default do echo else elseif empty enddeclare endfor endforeach endif endswitch endwhile
+        extends final finally fn for foreach function global goto if implements include
+        include_once instanceof insteadof interface isset list match namespace new or print
+        private protected public readonly require require_once return static switch this throw
+        trait try unset use var while xor yield true false null php self parent""",
+    "javascript": """async await break case catch class const continue debugger default delete do
+        else export extends finally for from function if import in instanceof let new of return
+        static super switch this throw try typeof var void while with yield true false null
+        undefined""",
+    "sql": """add all alter and as asc auto_increment between by cascade check column constraint
+        create database default delete desc distinct drop exists foreign from group having if in
+        index inner insert int integer into is join key left like limit not null on or order
+        outer primary references right select set table unique update values varchar where
+        text datetime timestamp""",
+}
+KEYWORD_SETS = {language: frozenset(words.split()) for language, words in KEYWORDS.items()}
+
+
+def code_blocks(page_html: str) -> List[Dict[str, str]]:
+    """Anchor, language and plain text of every <pre> block of a page, in order."""
+    blocks = []
+    page_html = COMMENT_PATTERN.sub('', page_html)
+    for number, match in enumerate(PRE_PATTERN.finditer(page_html), 1):
+        attributes, inner = match.group(1), match.group(2)
+        id_match = ID_PATTERN.search(attributes)
+        code_open = CODE_OPEN_PATTERN.match(inner)
+        language_match = LANGUAGE_PATTERN.search(attributes) or \
+            (code_open and LANGUAGE_PATTERN.search(code_open.group(1)))
+        text = html.unescape(TAG_PATTERN.sub('', LINE_NUMBER_PATTERN.sub('', inner)))
+        blocks.append({
+            "anchor": id_match.group(1) if id_match else f"code-{number}",
+            "language": language_match.group(1).lower() if language_match else detect_language(text),
+            "text": text,
+        })
+    return blocks
+
+
+def detect_language(code: str) -> str:
+    for language, pattern in DETECTORS:
+        if pattern.search(code):
+            return language
+    return "text"
+
+
+def add_term(terms: Counter, name: str, weight: int, keywords=frozenset()) -> None:
+    """
+    Count a name under the lowercase word(s) a search query would use:
+    hyphenated and path-like names (CSS, HTML, hooks) word by word.
+    """
+    for word in WORD_PATTERN.findall(name.lower()):
+        if word not in keywords and word not in STOP_WORDS and not word.isdigit():
+            terms[word] += weight
+
+
+def program_terms(code: str, language: str) -> Counter:
+    """Terms of PHP, JavaScript or other C-like code."""
+    keywords = KEYWORD_SETS.get(language, frozenset())
+    terms = Counter()
+    code = C_COMMENT_PATTERN.sub(' ', code)
+    if language == "php":
+        code = HASH_COMMENT_PATTERN.sub(' ', code)
+
+    def quoted(match):
+        name = QUOTED_NAME_PATTERN.match(match.group(0))
+        if name:
+            add_term(terms, name.group(1), NAME_WEIGHT, keywords)
+        return ' '
+    code = STRING_PATTERN.sub(quoted, code)
+
+    for match in CALL_PATTERN.finditer(code):
+        add_term(terms, match.group(1), CALL_WEIGHT, keywords)
+    for match in DEFINITION_PATTERN.finditer(code):
+        add_term(terms, match.group(1), DEFINITION_WEIGHT, keywords)
+    for name in NAME_PATTERN.findall(code):
+        add_term(terms, name, NAME_WEIGHT, keywords)
+    return terms
+
+
+def sql_terms(code: str) -> Counter:
+    terms = Counter()
+    code = STRING_PATTERN.sub(' ', SQL_COMMENT_PATTERN.sub(' ', code))
+    for match in CALL_PATTERN.finditer(code):
+        add_term(terms, match.group(1), CALL_WEIGHT)
+    for name in NAME_PATTERN.findall(code):
+        add_term(terms, name, NAME_WEIGHT, KEYWORD_SETS["sql"])
+    return terms
+
+
+def css_terms(code: str) -> Counter:
+    terms = Counter()
+    code = C_COMMENT_PATTERN.sub(' ', code)
+    for pattern in (CSS_PROPERTY_PATTERN, CSS_SELECTOR_PATTERN, CSS_AT_RULE_PATTERN):
+        for name in pattern.findall(code):
+            add_term(terms, name, NAME_WEIGHT)
+    for match in CALL_PATTERN.finditer(code):
+        add_term(terms, match.group(1), CALL_WEIGHT)
+    return terms
+
+
+def html_terms(code: str) -> Counter:
+    """Tag and attribute names, plus any embedded PHP."""
+    terms = Counter()
+    for pattern in (HTML_TAG_PATTERN, HTML_ATTRIBUTE_PATTERN):
+        for name in pattern.findall(code):
+            add_term(terms, name, NAME_WEIGHT)
+    for php in re.findall(r'<\?php(.*?)(?:\?>|$)', code, re.DOTALL):
+        terms.update(program_terms(php, "php"))
+    return terms
+
+
+def text_terms(code: str) -> Counter:
+    """Identifier-like words of shell commands, config files and output."""
+    terms = Counter()
+    for name in NAME_PATTERN.findall(code):
+        if len(name) > 2:
+            add_term(terms, name, NAME_WEIGHT)
+    return terms
+
+
+def block_terms(text: str, language: str) -> Dict[str, int]:
+    """Weighted terms of a code block, tokenized for its language."""
+    kind = LANGUAGE_ALIASES.get(language, language)
+    if kind in ("php", "javascript"):
+        terms = program_terms(text, kind)
+    elif kind == "sql":
+        terms = sql_terms(text)
+    elif kind == "css":
+        terms = css_terms(text)
+    elif kind == "html":
+        terms = html_terms(text)
+    else:
+        terms = text_terms(text)
+    return dict(terms)
+
+
+class CodeIndexBuilder:
+    """Incremental builder: each page's tokenized blocks are cached by fingerprint."""
+
+    def __init__(self, root: Path = PROJECT_ROOT, cache_file: Path = CODE_CACHE_FILE):
+        self.root = Path(root)
+        self.cache_file = Path(cache_file)
+        self.cache: Dict[str, Dict] = self._load()
+        self.stats = {"extracted": 0, "cached": 0, "removed": 0}
+        self.touched = False
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get("pages", {}) if data.get("version") == CODE_INDEX_VERSION else {}
+
+    def is_cached(self, page: str) -> bool:
+        entry = self.cache.get(page)
+        stat = (self.root / page).stat()
+        return bool(entry) and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size
+
+    def page_entry(self, page: str) -> Dict:
+        """Cached title and block terms of a page, re-tokenized only if it changed."""
+        path = self.root / page
+        stat = path.stat()
+        entry = self.cache.get(page)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            self.stats["cached"] += 1
+            return entry
+
+        doc = get_store().get(path)
+        if entry and entry["sha1"] == doc.digest:
+            entry.update(mtime_ns=doc.mtime_ns, size=doc.size)
+            self.touched = True
+            self.stats["cached"] += 1
+            return entry
+
+        title_match = TITLE_PATTERN.search(doc.text)
+        title = TITLE_SUFFIX_PATTERN.sub('', clean_text(title_match.group(1))) if title_match else ''
+        entry = {
+            "mtime_ns": doc.mtime_ns,
+            "size": doc.size,
+            "sha1": doc.digest,
+            "title": title or module_label(page) or Path(page).stem.replace('_', ' ').title(),
+            "blocks": [
+                {"anchor": block["anchor"], "language": block["language"],
+                 "terms": block_terms(block["text"], block["language"])}
+                for block in code_blocks(doc.text)
+            ],
+        }
+        self.cache[page] = entry
+        self.stats["extracted"] += 1
+        return entry
+
+    def build(self) -> bytes:
+        """
+        Encode one entry per code block. Names mentioned in only one block
+        of the whole course, and never called or defined there, are mostly
+        local variables and element ids nobody searches for; leaving them
+        out removes over half of the dictionary.
+        """
+        pages = lesson_pages(self.root)
+        blocks = []
+        block_counts = Counter()
+        for page in pages:
+            entry = self.page_entry(page)
+            for block in entry["blocks"]:
+                blocks.append((entry["title"], "/" + page, block))
+                block_counts.update(block["terms"].keys())
+
+        for page in set(self.cache) - set(pages):
+            del self.cache[page]
+            self.stats["removed"] += 1
+
+        entries = []
+        entry_terms = []
+        for title, url, block in blocks:
+            terms = {term: weight for term, weight in block["terms"].items()
+                     if block_counts[term] > 1 or weight >= SINGLE_BLOCK_MIN_WEIGHT}
+            if terms:
+                entries.append((title, url, block["anchor"], block["language"]))
+                entry_terms.append(terms)
+
+        self.stats["blocks"] = len(entries)
+        self.stats["terms"] = len({term for terms in entry_terms for term in terms})
+        return encode_index(entries, entry_terms, STOP_WORDS, ENTRY_FIELDS)
+
+    def save_cache(self) -> None:
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"version": CODE_INDEX_VERSION, "pages": self.cache}, separators=(',', ':')))
+        os.replace(tmp_file, self.cache_file)
+
+
+def build_code_index(output_file: Path = CODE_INDEX_FILE, root: Path = PROJECT_ROOT) -> Dict:
+    """Rebuild the code-example index. Returns build statistics."""
+    output_file = Path(output_file)
+    builder = CodeIndexBuilder(root)
+    pages = lesson_pages(builder.root)
+    if output_file.exists() and set(pages) == set(builder.cache) \
+            and all(builder.is_cached(page) for page in pages):
+        # Nothing changed since the last build
+        return dict(builder.stats, cached=len(pages), pages=len(pages), blocks=None, written=False)
+
+    data = builder.build()
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    written = write_if_changed(output_file, data)
+    if builder.stats["extracted"] or builder.stats["removed"] or builder.touched:
+        builder.save_cache()
+    return dict(builder.stats, pages=len(pages), bytes=len(data), written=written)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the code-example search index from the lesson pages")
+    parser.add_argument("--output", default=str(CODE_INDEX_FILE), help="index file to write")
+    parser.add_argument("--full", action="store_true", help="ignore the cache and re-tokenize every page")
+    args = parser.parse_args()
+
+    if args.full and CODE_CACHE_FILE.exists():
+        os.remove(CODE_CACHE_FILE)
+
+    print("🔎 Building code-example index")
+    start = time.perf_counter()
+    stats = build_code_index(Path(args.output))
+    elapsed = time.perf_counter() - start
+
+    print(f"  Pages: {stats['pages']} ({stats['extracted']} extracted, "
+          f"{stats['cached']} cached, {stats['removed']} removed)")
+    if stats["blocks"] is not None:
+        print(f"  Blocks: {stats['blocks']}, terms: {stats['terms']}, {stats['bytes'] / 1024:.0f} KB"
+              f"{'' if stats['written'] else ' (unchanged)'}")
+    print(f"✅ Code index {args.output} up to date in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
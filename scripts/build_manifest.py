@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Persistent build manifest for the batch page generators.
+
+For every generated file the manifest records a hash of the generator inputs
+(lesson metadata plus the template functions' source) and a hash of the
+output that was written. A regenerator only rebuilds a page when its inputs
+changed, and never silently overwrites a page that was edited by hand after
+it was generated.
+
+Later stages rewrite generated pages too: the asset pipeline, prefetch hints
+and inline-style extraction change the <head> and the scripts, and the
+navigation fixers rewrite the sidebar and re-serialize the page. So the
+output hash of a lesson page covers only the parts its generator owns
+(GENERATED_ELEMENTS, see generated_markup()); a change anywhere else is not
+taken for a hand edit.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import re
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from bs4 import BeautifulSoup
+
+from course_corpus import CACHE_DIR, content_hash
+
+# Status values returned by BuildManifest.status()
+NEW = "new"                  # output file does not exist yet
+CHANGED = "changed"          # inputs differ from the last build
+CURRENT = "current"          # inputs and output match the last build
+HAND_EDITED = "hand-edited"  # output differs from what was last generated
+UNTRACKED = "untracked"      # output exists but was never built with a manifest
+
+# (tag, class) of the elements of a lesson page that its generator owns
+GENERATED_ELEMENTS = [
+    ("header", "site-header"),
+    ("nav", "breadcrumb"),
+    ("article", "lesson-content"),
+    ("footer", "site-footer"),
+]
+
+WHITESPACE = re.compile(r'\s+')
+
+
+def input_hash(*parts) -> str:
+    """Hash any JSON-serializable generator inputs (tuples, dicts, strings...)."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def source_fingerprint(*functions: Callable) -> str:
+    """Hash the source code of the template functions a generator uses."""
+    sources = [inspect.getsource(func) for func in functions]
+    return input_hash(*sources)
+
+
+def generated_markup(html: str) -> str:
+    """
+    The GENERATED_ELEMENTS of a page as BeautifulSoup serializes them, with
+    whitespace collapsed, so the same content hashes the same whether or not
+    a fixer has re-serialized the page since.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    parts = []
+    for tag, class_name in GENERATED_ELEMENTS:
+        element = soup.find(tag, class_=class_name)
+        parts.append(WHITESPACE.sub(' ', str(element)) if element is not None else "")
+    return "\n".join(parts)
+
+
+class BuildManifest:
+    """
+    Input/output hashes of generated files, persisted as JSON. owned maps a
+    file's content to the part of it the output hash covers (all of it by
+    default, generated_markup for lesson pages).
+    """
+
+    def __init__(self, name: str, manifest_dir: Path = CACHE_DIR,
+                 owned: Optional[Callable[[str], str]] = None):
+        self.manifest_file = Path(manifest_dir) / f"manifest_{name}.json"
+        self.owned = owned
+        self.entries: Dict[str, Dict] = self._load()
+        self.dirty = False
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get("files", {})
+        except (OSError, ValueError):
+            return {}
+
+    def output_hash(self, content: str) -> str:
+        return content_hash(self.owned(content) if self.owned else content)
+
+    def _output_matches(self, entry: Dict, filepath: str) -> bool:
+        """True if the owned part of the file on disk is what was last generated."""
+        stat = os.stat(filepath)
+        if entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+            return True
+        with open(filepath, 'r', encoding='utf-8') as f:
+            if self.output_hash(f.read()) != entry["output"]:
+                return False
+        # Rewritten by a later stage only: take the fast path next time
+        entry["mtime_ns"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+        self.dirty = True
+        return True
+
+    def status(self, key: str, filepath, inputs: str) -> str:
+        """Classify a generated file against the manifest."""
+        filepath = str(filepath)
+        if not os.path.exists(filepath):
+            return NEW
+
+        entry = self.entries.get(key)
+        if entry is None:
+            return UNTRACKED
+        if not self._output_matches(entry, filepath):
+            return HAND_EDITED
+        if entry["input"] != inputs:
+            return CHANGED
+        return CURRENT
+
+    def record(self, key: str, filepath, inputs: str, output: str) -> None:
+        """Record the inputs and the content just written for a file."""
+        stat = os.stat(str(filepath))
+        self.entries[key] = {
+            "input": inputs,
+            "output": self.output_hash(output),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+        }
+        self.dirty = True
+
+    def record_existing(self, key: str, filepath, inputs: str) -> None:
+        """Take a file that was not built with the manifest as the baseline for inputs."""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            self.record(key, filepath, inputs, f.read())
+
+    def forget(self, key: str) -> Optional[Dict]:
+        """Drop a file from the manifest."""
+        self.dirty = True
+        return self.entries.pop(key, None)
+
+    def save(self) -> None:
+        """Write the manifest back to disk if anything changed."""
+        if not self.dirty:
+            return
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.manifest_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"files": self.entries}, f, indent=1, sort_keys=True)
+        os.replace(tmp_file, self.manifest_file)
+        self.dirty = False
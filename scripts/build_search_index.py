@@ -0,0 +1,563 @@
+#!/usr/bin/env python3
+"""
+Build the site search index (assets/data/search/) from the lessons.
+
+Every lesson page in the lesson directories (01module-07module, 02extras),
+plus the module overview pages, is reduced to its title, headings, body text
+and code identifiers. Terms are weighted by where they appear (title >
+headings > code > body) and collected into an inverted index, which is then
+split into small static files (see SearchIndexBuilder.build()): a term dictionary
+bucketed by first character, and per-shard document lists and postings.
+assets/js/search.js fetches only the buckets and shards a query needs, so a
+first search downloads tens of KB rather than the whole index.
+
+Postings are flat (doc, weight) pairs; a client scores a query by summing
+the weights of its terms per document. "content" is a short summary for the
+results list.
+
+The lessons' titles and headings are also written for type-ahead in the
+compact binary format of compact_index.py (typeahead.bin), with BM25
+weights.
+
+Extraction results are cached per page in .build_cache/search_terms.json
+with the page's fingerprint, so a rebuild only re-reads the lessons that
+changed since the last build. It then only re-assembles the shards those
+lessons are in and the term buckets whose terms entered or left a shard,
+and re-encodes typeahead.bin only if a title or heading changed (see
+SearchIndexBuilder.rebuild()). Only index files whose content changed are
+rewritten.
+"""
+
+import argparse
+import html
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from compact_index import encode_index
+from course_corpus import CACHE_DIR, PROJECT_ROOT, get_store
+from html_splice import find_element, iter_tags
+from output_writer import remove_file, write_if_changed
+
+INDEX_DIR = PROJECT_ROOT / "assets" / "data" / "search"
+TERMS_CACHE_FILE = CACHE_DIR / "search_terms.json"
+INDEX_VERSION = 3
+# The index files outside the shard and term directories
+TOP_LEVEL_FILES = ("manifest.json", "typeahead.bin")
+# Fields of a lesson's entry in its shard's docs.json
+DOCUMENT_FIELDS = ("title", "url", "module", "content")
+
+# Lesson directories (not backups); each one is a shard
+LESSON_DIR_PATTERN = re.compile(r'^\d{2}(module|extras)$')
+OVERVIEW_PATTERN = re.compile(r'^module(\d+)\.html$')
+# Shard holding the module overview pages
+OVERVIEW_SHARD = "overview"
+
+# How much a term counts, by where it appears
+FIELD_WEIGHTS = {"title": 10, "headings": 5, "code": 2, "body": 1}
+# In the type-ahead index, a lesson title counts this much more than a heading
+TYPEAHEAD_TITLE_BOOST = 2
+
+# Elements whose text is not lesson content
+SKIP_ELEMENTS = frozenset(['aside', 'nav', 'script', 'style', 'svg', 'button', 'form', 'noscript'])
+HEADING_ELEMENTS = frozenset(['h1', 'h2', 'h3', 'h4'])
+CODE_ELEMENTS = frozenset(['code', 'pre'])
+
+TITLE_PATTERN = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+TITLE_SUFFIX_PATTERN = re.compile(r'\s*[-|]\s*PHP WordPress (?:Course|Development)\s*$')
+WORD_PATTERN = re.compile(r'[a-z0-9][a-z0-9_]+')
+IDENTIFIER_PATTERN = re.compile(r'\$?[A-Za-z_][A-Za-z0-9_]{2,}')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+COMMENT_PATTERN = re.compile(r'<!--.*?-->', re.DOTALL)
+
+STOP_WORDS = frozenset("""
+    a an and are as at be but by can do does for from has have how if in into is it
+    its not of on or so than that the their then there these this to was we were
+    what when which will with you your our can't don't also more most such each
+""".split())
+
+SUMMARY_LENGTH = 160
+
+
+def clean_text(text: str) -> str:
+    return WHITESPACE_PATTERN.sub(' ', html.unescape(text)).strip()
+
+
+def extract_fields(page_html: str) -> Dict[str, object]:
+    """
+    Pull the title, headings, body text and code text out of a page. Only
+    the lesson article is read (or <main> on pages without one), skipping
+    the sidebar, navigation, scripts and inline SVG.
+    """
+    title_match = TITLE_PATTERN.search(page_html)
+    title = TITLE_SUFFIX_PATTERN.sub('', clean_text(title_match.group(1))) if title_match else ''
+
+    span = (find_element(page_html, 'article', class_name='lesson-content')
+            or find_element(page_html, 'main'))
+    start, end = (span.inner_start, span.inner_end) if span else (0, len(page_html))
+
+    headings: List[str] = []
+    body: List[str] = []
+    code: List[str] = []
+    depth = Counter()
+    current_heading: List[str] = []
+    last = start
+
+    for token in iter_tags(page_html, start):
+        if token.start >= end:
+            break
+        text = COMMENT_PATTERN.sub(' ', page_html[last:token.start])
+        last = token.end
+        if text.strip() and not any(depth[name] for name in SKIP_ELEMENTS):
+            if any(depth[name] for name in CODE_ELEMENTS):
+                code.append(text)
+            elif any(depth[name] for name in HEADING_ELEMENTS):
+                current_heading.append(text)
+            else:
+                body.append(text)
+
+        if token.self_closing and not token.closing:
+            continue
+        if token.closing:
+            depth[token.name] = max(0, depth[token.name] - 1)
+            if token.name in HEADING_ELEMENTS and current_heading:
+                headings.append(clean_text(' '.join(current_heading)))
+                current_heading = []
+        else:
+            depth[token.name] += 1
+
+    if not title and headings:
+        title = headings[0]
+
+    return {
+        "title": title,
+        "headings": [heading for heading in headings if heading],
+        "body": clean_text(' '.join(body)),
+        "code": html.unescape(' '.join(code)),
+    }
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase search terms of a piece of prose."""
+    return [word for word in WORD_PATTERN.findall(text.lower()) if word not in STOP_WORDS]
+
+
+def code_terms(code: str) -> List[str]:
+    """Identifiers in code, e.g. add_action, $wpdb -> wpdb, plus their parts."""
+    terms = []
+    for identifier in IDENTIFIER_PATTERN.findall(code):
+        identifier = identifier.lstrip('$').lower()
+        terms.append(identifier)
+        if '_' in identifier:
+            terms.extend(part for part in identifier.split('_') if len(part) > 2)
+    return terms
+
+
+def weigh_terms(fields: Dict[str, object]) -> Dict[str, int]:
+    """Weighted term frequencies of a page."""
+    weights = Counter()
+    for term in tokenize(fields["title"]):
+        weights[term] += FIELD_WEIGHTS["title"]
+    for term in tokenize(' '.join(fields["headings"])):
+        weights[term] += FIELD_WEIGHTS["headings"]
+    for term in code_terms(fields["code"]):
+        weights[term] += FIELD_WEIGHTS["code"]
+    for term in tokenize(fields["body"]):
+        weights[term] += FIELD_WEIGHTS["body"]
+    return dict(weights)
+
+
+def summarize(body: str) -> str:
+    if len(body) <= SUMMARY_LENGTH:
+        return body
+    return body[:SUMMARY_LENGTH].rsplit(' ', 1)[0] + '…'
+
+
+def lesson_pages(root: Path = PROJECT_ROOT) -> List[str]:
+    """Project-relative paths of the pages to index, sorted."""
+    pages = []
+    for name in sorted(os.listdir(root)):
+        path = root / name
+        if path.is_file() and OVERVIEW_PATTERN.match(name):
+            pages.append(name)
+        elif path.is_dir() and LESSON_DIR_PATTERN.match(name):
+            pages.extend(f"{name}/{file_name}" for file_name in sorted(os.listdir(path))
+                         if file_name.endswith('.html'))
+    return pages
+
+
+def module_label(page: str) -> str:
+    match = OVERVIEW_PATTERN.match(page) or re.match(r'^(\d{2})(?:module|extras)/', page)
+    return f"Module {int(match.group(1))}" if match else ""
+
+
+class SearchIndexBuilder:
+    """Incremental builder: per-page extraction is cached by fingerprint."""
+
+    def __init__(self, root: Path = PROJECT_ROOT, cache_file: Path = TERMS_CACHE_FILE):
+        self.root = Path(root)
+        self.cache_file = Path(cache_file)
+        self.cache: Dict[str, Dict] = self._load()
+        # The entries the index files were last built from: the saved cache
+        # is written after the index, so at first that is the cache itself
+        self.indexed: Dict[str, Dict] = dict(self.cache)
+        self.stats = {"extracted": 0, "cached": 0, "removed": 0}
+        # Set when an unchanged page's new mtime is recorded, so the cache is saved
+        self.touched = False
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get("pages", {}) if data.get("version") == INDEX_VERSION else {}
+
+    def is_cached(self, page: str) -> bool:
+        """True if the page's mtime and size match its cache entry."""
+        entry = self.cache.get(page)
+        stat = (self.root / page).stat()
+        return bool(entry) and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size
+
+    def page_entry(self, page: str) -> Dict:
+        """Cached document and term weights of a page, re-extracted only if it changed."""
+        path = self.root / page
+        stat = path.stat()
+        entry = self.cache.get(page)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            self.stats["cached"] += 1
+            return entry
+
+        doc = get_store().get(path)
+        if entry and entry["sha1"] == doc.digest:
+            entry.update(mtime_ns=doc.mtime_ns, size=doc.size)
+            self.touched = True
+            self.stats["cached"] += 1
+            return entry
+
+        fields = extract_fields(doc.text)
+        entry = {
+            "mtime_ns": doc.mtime_ns,
+            "size": doc.size,
+            "sha1": doc.digest,
+            "document": {
+                "title": fields["title"] or Path(page).stem.replace('_', ' ').title(),
+                "url": "/" + page,
+                "module": module_label(page),
+                "content": summarize(fields["body"]),
+                "headings": fields["headings"],
+            },
+            "terms": weigh_terms(fields),
+        }
+        self.cache[page] = entry
+        self.stats["extracted"] += 1
+        return entry
+
+    def build(self) -> Dict[str, object]:
+        """
+        Assemble the index files from every page's (cached) terms, keyed by
+        path relative to the index directory:
+
+            manifest.json         shard names and stop words
+            terms/<b>.json        {term: bitmask of the shards containing it}
+            <shard>/docs.json     [{title, url, module, content}, ...]
+            <shard>/<b>.json      {term: [doc, weight, ...]} with shard-local doc ids
+            typeahead.bin         lesson titles and headings, compact format
+
+        A query fetches one term bucket per word, then only the postings
+        buckets and document lists of the shards its terms occur in.
+        typeahead.bin (see compact_index.py) is one download and answers
+        prefix lookups without any scanning.
+        """
+        pages = lesson_pages(self.root)
+        shard_names = sorted({shard_of(page) for page in pages})
+        entries = self.current_entries(pages)
+
+        files: Dict[str, object] = {}
+        masks: Dict[str, int] = {}
+        for i, shard in enumerate(shard_names):
+            shard_index, shard_terms = shard_files(shard, [entries[page] for page in pages
+                                                           if shard_of(page) == shard])
+            files.update(shard_index)
+            for term in shard_terms:
+                masks[term] = masks.get(term, 0) | 1 << i
+        for term in sorted(masks):
+            files.setdefault(f"terms/{bucket_of(term)}.json", {})[term] = masks[term]
+        files["manifest.json"] = index_manifest(shard_names, len(pages))
+        files["typeahead.bin"] = encode_index(*typeahead_entries(entries.values()), STOP_WORDS)
+        self.indexed = entries
+        return files
+
+    def rebuild(self, output_dir: Path) -> Optional[Tuple[Dict[str, object], List[Path]]]:
+        """
+        Only the index files that the pages changed since the last build
+        touch, plus the files they leave stale, or None if there is no
+        previous build in output_dir to start from (or the shards changed):
+
+            <shard>/...           every file of a shard with a changed page
+            terms/<b>.json        buckets of terms that entered or left such
+                                  a shard, patched from the files on disk
+            typeahead.bin         only if a title or heading changed
+            manifest.json         always (document count)
+        """
+        pages = lesson_pages(self.root)
+        shard_names = sorted({shard_of(page) for page in pages})
+        manifest = read_index_file(output_dir / "manifest.json")
+        if (not self.indexed or not manifest or manifest.get("version") != INDEX_VERSION
+                or manifest.get("shards") != shard_names
+                or manifest.get("documents") != len(self.indexed)
+                or not (output_dir / "typeahead.bin").exists()):
+            return None
+
+        entries = self.current_entries(pages)
+        changed = [page for page in sorted(set(entries) | set(self.indexed))
+                   if indexed_fields(entries.get(page)) != indexed_fields(self.indexed.get(page))]
+        files: Dict[str, object] = {"manifest.json": index_manifest(shard_names, len(pages))}
+        stale: List[Path] = []
+
+        # Shard bits each term gained and lost
+        gained: Dict[str, int] = defaultdict(int)
+        lost: Dict[str, int] = defaultdict(int)
+        for shard in sorted({shard_of(page) for page in changed}):
+            bit = 1 << shard_names.index(shard)
+            shard_index, shard_terms = shard_files(shard, [entries[page] for page in pages
+                                                           if shard_of(page) == shard])
+            files.update(shard_index)
+            stale.extend(path for path in sorted((output_dir / shard).glob("*.json"))
+                         if path.relative_to(output_dir).as_posix() not in shard_index)
+            old_terms = set().union(*(entry["terms"] for page, entry in self.indexed.items()
+                                      if shard_of(page) == shard))
+            for term in shard_terms - old_terms:
+                gained[term] |= bit
+            for term in old_terms - shard_terms:
+                lost[term] |= bit
+
+        buckets = defaultdict(list)
+        for term in set(gained) | set(lost):
+            buckets[bucket_of(term)].append(term)
+        for bucket, terms in sorted(buckets.items()):
+            rel_path = f"terms/{bucket}.json"
+            masks = read_index_file(output_dir / rel_path) or {}
+            for term in terms:
+                mask = masks.get(term, 0) & ~lost[term] | gained[term]
+                if mask:
+                    masks[term] = mask
+                else:
+                    masks.pop(term, None)
+            if masks:
+                files[rel_path] = {term: masks[term] for term in sorted(masks)}
+            else:
+                stale.append(output_dir / rel_path)
+
+        if any(typeahead_fields(entries.get(page)) != typeahead_fields(self.indexed.get(page))
+               for page in changed):
+            files["typeahead.bin"] = encode_index(*typeahead_entries(entries.values()), STOP_WORDS)
+        self.indexed = entries
+        return files, stale
+
+    def current_entries(self, pages: List[str]) -> Dict[str, Dict]:
+        """The (cached) entries of the pages, in page order; pages gone are dropped from the cache."""
+        entries = {page: self.page_entry(page) for page in pages}
+        for page in set(self.cache) - set(entries):
+            del self.cache[page]
+            self.stats["removed"] += 1
+        return entries
+
+    def update(self, output_dir: Path = INDEX_DIR) -> Dict[str, int]:
+        """Bring the index files up to date, rebuilding only what changed if possible."""
+        output_dir = Path(output_dir)
+        changes = self.rebuild(output_dir)
+        if changes is None:
+            return dict(write_index_files(self.build(), output_dir), full=True)
+        files, stale = changes
+        return dict(write_index_files(files, output_dir, stale), full=False)
+
+    def save_cache(self) -> None:
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            # dumps() uses the C encoder; dump() streams through the slow pure-Python one
+            f.write(json.dumps({"version": INDEX_VERSION, "pages": self.cache}, separators=(',', ':')))
+        os.replace(tmp_file, self.cache_file)
+
+
+def shard_files(shard: str, entries: List[Dict]) -> Tuple[Dict[str, object], set]:
+    """A shard's docs.json and postings buckets, and the set of its terms."""
+    documents = []
+    postings: Dict[str, List[int]] = {}
+    for doc_id, entry in enumerate(entries):
+        documents.append({key: entry["document"][key] for key in DOCUMENT_FIELDS})
+        for term, weight in entry["terms"].items():
+            term_postings = postings.get(term)
+            if term_postings is None:
+                postings[term] = [doc_id, weight]
+            else:
+                term_postings.append(doc_id)
+                term_postings.append(weight)
+
+    files: Dict[str, object] = {f"{shard}/docs.json": documents}
+    for term in sorted(postings):
+        files.setdefault(f"{shard}/{bucket_of(term)}.json", {})[term] = postings[term]
+    return files, set(postings)
+
+
+def index_manifest(shard_names: List[str], documents: int) -> Dict[str, object]:
+    return {
+        "version": INDEX_VERSION,
+        "shards": shard_names,
+        "documents": documents,
+        "stop_words": sorted(STOP_WORDS),
+    }
+
+
+def indexed_fields(entry: Optional[Dict]):
+    """What the JSON index takes from a page's entry (None for a page that is gone)."""
+    return (entry["document"], entry["terms"]) if entry else None
+
+
+def typeahead_fields(entry: Optional[Dict]):
+    """What typeahead.bin takes from a page's entry."""
+    if not entry:
+        return None
+    document = entry["document"]
+    return document["title"], document["url"], document["module"], document["headings"]
+
+
+def read_index_file(path: Path) -> Optional[Dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def typeahead_entries(lessons: List[Dict]):
+    """
+    Type-ahead entries and their term frequencies: each lesson's title
+    (grouped under its module) and each of its headings (grouped under the
+    lesson title), all linking to the lesson.
+    """
+    entries = []
+    entry_terms = []
+    for lesson in lessons:
+        document = lesson["document"]
+        entries.append((document["title"], document["url"], document["module"]))
+        entry_terms.append({term: count * TYPEAHEAD_TITLE_BOOST
+                            for term, count in Counter(tokenize(document["title"])).items()})
+        for heading in dict.fromkeys(document["headings"]):
+            if heading == document["title"]:
+                continue
+            entries.append((heading, document["url"], document["title"]))
+            entry_terms.append(dict(Counter(tokenize(heading))))
+    return entries, entry_terms
+
+
+def shard_of(page: str) -> str:
+    """Shard a page's postings go in: its lesson directory, or "overview"."""
+    return page.split('/', 1)[0] if '/' in page else OVERVIEW_SHARD
+
+
+def bucket_of(term: str) -> str:
+    """Dictionary/postings bucket of a term: its first character."""
+    return term[0]
+
+
+def previous_index_files(output_dir: Path) -> List[Path]:
+    """
+    The files the previous build wrote: the top-level index files, the term
+    buckets and the shard directories listed in its manifest.json. Other
+    files in the directory (e.g. code.bin, see build_code_index.py) belong
+    to other builders.
+    """
+    try:
+        with open(output_dir / "manifest.json", 'r', encoding='utf-8') as f:
+            shards = json.load(f).get("shards", [])
+    except (OSError, ValueError):
+        shards = []
+    paths = [output_dir / name for name in TOP_LEVEL_FILES]
+    for directory in ["terms"] + shards:
+        paths.extend(sorted((output_dir / directory).glob("*.json")))
+    return paths
+
+
+def write_index_files(files: Dict[str, object], output_dir: Path,
+                      stale: Optional[List[Path]] = None) -> Dict[str, int]:
+    """
+    Write the index files (only those that changed) and delete the stale
+    ones: the given paths, or else the previous build's files that are not
+    in files.
+    """
+    stats = {"files": len(files), "written": 0, "deleted": 0, "bytes": 0}
+    previous = previous_index_files(output_dir) if stale is None else []
+    for rel_path, data in files.items():
+        path = output_dir / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(data, bytes):
+            content = data
+            stats["bytes"] += len(data)
+        else:
+            content = json.dumps(data, ensure_ascii=False, separators=(',', ':')) + "\n"
+            stats["bytes"] += len(content.encode('utf-8'))
+        if write_if_changed(path, content):
+            stats["written"] += 1
+
+    for path in previous:
+        if path.relative_to(output_dir).as_posix() not in files and remove_file(path):
+            stats["deleted"] += 1
+    for path in stale or []:
+        if remove_file(path):
+            stats["deleted"] += 1
+    return stats
+
+
+def build_search_index(output_dir: Path = INDEX_DIR, root: Path = PROJECT_ROOT) -> Dict:
+    """Rebuild the sharded search index. Returns build statistics."""
+    output_dir = Path(output_dir)
+    builder = SearchIndexBuilder(root)
+    pages = lesson_pages(builder.root)
+    if all((output_dir / name).exists() for name in TOP_LEVEL_FILES) and set(pages) == set(builder.cache) \
+            and all(builder.is_cached(page) for page in pages):
+        # Nothing changed since the last build
+        return dict(builder.stats, cached=len(pages), documents=len(pages), files=0, written=0)
+
+    written = builder.update(output_dir)
+    if builder.stats["extracted"] or builder.stats["removed"] or builder.touched:
+        builder.save_cache()
+
+    stats = dict(builder.stats)
+    stats.update(written)
+    stats.update(documents=len(pages))
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the site search index from the lesson pages")
+    parser.add_argument("--output", default=str(INDEX_DIR), help="directory to write the index files to")
+    parser.add_argument("--full", action="store_true", help="ignore the cache and re-extract every page")
+    args = parser.parse_args()
+
+    if args.full and TERMS_CACHE_FILE.exists():
+        os.remove(TERMS_CACHE_FILE)
+
+    print("🔎 Building search index")
+    start = time.perf_counter()
+    stats = build_search_index(Path(args.output))
+    elapsed = time.perf_counter() - start
+
+    print(f"  Pages: {stats['documents']} ({stats['extracted']} extracted, "
+          f"{stats['cached']} cached, {stats['removed']} removed)")
+    if stats["files"]:
+        scope = "whole index" if stats["full"] else "changed shards and terms"
+        print(f"  Re-encoded {stats['files']} files ({scope}), {stats['bytes'] / 1024:.0f} KB")
+        print(f"  Files written: {stats['written']}, deleted: {stats['deleted']}")
+    print(f"✅ Search index in {args.output} up to date in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,8 @@ This script removes ALL old mermaid references and adds only the universal fix
 import os
 import re
 
+from output_writer import write_if_changed
+
 def clean_all_mermaid_references(content):
     """Remove ALL existing Mermaid-related scripts and fixes"""
     
@@ -93,8 +95,7 @@ def process_file(filepath):
             content = add_universal_fix_once(content)
             
             # Write back
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_if_changed(filepath, content)
             
             return True
         return False
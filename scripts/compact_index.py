@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Compact binary search index: a prefix-trie term dictionary (a radix tree,
+single-child chains merged into one edge) with delta- and varint-encoded
+postings carrying precomputed BM25 weights.
+
+The JSON index (build_search_index.py) is split for lazy loading; this
+format packs a whole index into one small file that assets/js/compact-index.js
+decodes once into typed arrays. Looking up a term or a prefix then walks
+the trie edge by edge, and the nodes with many matches below
+them carry their best entries precomputed, so completing a prefix never
+scans the dictionary or a long postings list.
+
+Layout (all integers are unsigned LEB128 varints unless noted):
+
+    "CSIX"                          magic
+    version
+    float32 LE                      weight scale: weight = byte * scale
+    string count, strings           varint byte length + UTF-8 each
+    stop word count, stop words     string ids
+    field count, field names        string ids, e.g. label, url, group
+    entry count, entries            one string id per field per entry
+    node count, nodes in preorder:
+        edge label                  string; empty for the root
+        flags                       1 = has postings, 2 = has top entries
+        child count                 children follow, by first character
+        [postings]                  count, then (entry delta, u8 weight) pairs
+        [top entries]               count, then entry ids, best first
+"""
+
+import math
+import struct
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+MAGIC = b'CSIX'
+FORMAT_VERSION = 2
+
+# Default entry fields; an index can name its own
+ENTRY_FIELDS = ("label", "url", "group")
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Nodes with more postings than this below them store their best entries
+TOP_ENTRIES_THRESHOLD = 32
+TOP_ENTRIES = 10
+
+FLAG_POSTINGS = 1
+FLAG_TOP_ENTRIES = 2
+
+
+def encode_varint(value: int, out: bytearray) -> None:
+    """Append value as an unsigned LEB128 varint."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def encode_string(text: str, out: bytearray) -> None:
+    data = text.encode('utf-8')
+    encode_varint(len(data), out)
+    out += data
+
+
+def bm25_weights(entry_terms: Sequence[Dict[str, float]],
+                 k1: float = BM25_K1, b: float = BM25_B) -> Dict[str, Dict[int, float]]:
+    """
+    BM25 weight of every (term, entry) pair, from each entry's term
+    frequencies. A query's score is then the sum of its terms' weights.
+    """
+    lengths = [sum(terms.values()) for terms in entry_terms]
+    average = (sum(lengths) / len(lengths)) if lengths else 0.0
+    frequencies: Dict[str, Dict[int, float]] = {}
+    for entry, terms in enumerate(entry_terms):
+        for term, tf in terms.items():
+            frequencies.setdefault(term, {})[entry] = tf
+
+    count = len(entry_terms)
+    # The length normalization of each entry, k1 * (1 - b + b * length / average)
+    norms = [k1 * (1 - b + b * length / (average or 1)) for length in lengths]
+    weights: Dict[str, Dict[int, float]] = {}
+    for term, postings in frequencies.items():
+        idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5)) * (k1 + 1)
+        weights[term] = {entry: idf * tf / (tf + norms[entry]) for entry, tf in postings.items()}
+    return weights
+
+
+class _Node:
+    __slots__ = ("label", "postings", "children", "top")
+
+    def __init__(self, label: str, postings: List[Tuple[int, int]], children: List["_Node"]):
+        self.label = label
+        self.postings = postings
+        self.children = children
+        self.top: List[int] = []
+
+
+def _build_trie(terms: List[str], postings: Dict[str, List[Tuple[int, int]]],
+                label: str = '', lo: int = 0, hi: Optional[int] = None, depth: int = 0) -> _Node:
+    """
+    Radix tree over terms[lo:hi] (sorted, all sharing their first depth
+    characters): chains of single-child nodes are merged into one edge, so
+    every node either ends a term or branches.
+    """
+    if hi is None:
+        hi = len(terms)
+    node_postings: List[Tuple[int, int]] = []
+    if lo < hi and len(terms[lo]) == depth:
+        node_postings = postings[terms[lo]]
+        lo += 1
+    children = []
+    while lo < hi:
+        char = terms[lo][depth]
+        end = lo + 1
+        while end < hi and terms[end][depth] == char:
+            end += 1
+        # In a sorted run, the first and last terms share the run's common prefix
+        first, last = terms[lo], terms[end - 1]
+        common = depth + 1
+        while common < len(first) and common < len(last) and first[common] == last[common]:
+            common += 1
+        children.append(_build_trie(terms, postings, first[depth:common], lo, end, common))
+        lo = end
+    return _Node(label, node_postings, children)
+
+
+def _rank_subtree(node: _Node) -> Tuple[int, List[Tuple[int, int]]]:
+    """
+    Set the top entries of the nodes that need them. Returns the number of
+    postings below node and its best (weight, entry) pairs, where an
+    entry's weight is its highest over the terms below the node. The best
+    entries of a node are always among its own postings and its children's
+    best entries, so they are merged bottom-up.
+    """
+    total = len(node.postings)
+    if not node.children:
+        best = node.postings
+    else:
+        merged: Dict[int, int] = dict(node.postings)
+        for child in node.children:
+            count, child_best = _rank_subtree(child)
+            total += count
+            for entry, weight in child_best:
+                if weight > merged.get(entry, 0):
+                    merged[entry] = weight
+        best = merged.items()
+    ranked = sorted(best, key=lambda pair: (-pair[1], pair[0]))[:TOP_ENTRIES]
+    if total > TOP_ENTRIES_THRESHOLD:
+        node.top = [entry for entry, _ in ranked]
+    return total, ranked
+
+
+def _encode_node(node: _Node, out: bytearray) -> int:
+    encode_string(node.label, out)
+    encode_varint((FLAG_POSTINGS if node.postings else 0) | (FLAG_TOP_ENTRIES if node.top else 0), out)
+    encode_varint(len(node.children), out)
+    if node.postings:
+        encode_varint(len(node.postings), out)
+        previous = 0
+        for entry, weight in node.postings:
+            delta = entry - previous
+            if delta < 0x80:
+                out.append(delta)
+            else:
+                encode_varint(delta, out)
+            out.append(weight)
+            previous = entry
+    if node.top:
+        encode_varint(len(node.top), out)
+        for entry in node.top:
+            encode_varint(entry, out)
+    count = 1
+    for child in node.children:
+        count += _encode_node(child, out)
+    return count
+
+
+def encode_index(entries: Sequence[Sequence[str]], entry_terms: Sequence[Dict[str, float]],
+                 stop_words: Iterable[str] = (), fields: Sequence[str] = ENTRY_FIELDS) -> bytes:
+    """
+    Encode an index of entries (one string per field, by default label,
+    url and group), each with its term frequencies, into the compact binary
+    format.
+    """
+    weights = bm25_weights(entry_terms)
+    highest = max((w for postings in weights.values() for w in postings.values()), default=1.0)
+    scale = highest / 255
+
+    # Quantize to one byte; every posting keeps a weight of at least 1.
+    # bm25_weights() lists each term's entries in increasing order already.
+    inverse = 1 / scale
+    postings = {
+        term: [(entry, int(weight * inverse + 0.5) or 1) for entry, weight in term_weights.items()]
+        for term, term_weights in weights.items()
+    }
+    root = _build_trie(sorted(postings), postings)
+    _rank_subtree(root)
+
+    # Labels, URLs and groups repeat a lot (a lesson's headings share its
+    # URL and title), so each distinct string is stored once
+    strings: Dict[str, int] = {}
+    stop_words = sorted(stop_words)
+    for text in list(stop_words) + list(fields):
+        strings.setdefault(text, len(strings))
+    for entry in entries:
+        for text in entry:
+            strings.setdefault(text, len(strings))
+
+    out = bytearray(MAGIC)
+    encode_varint(FORMAT_VERSION, out)
+    out += struct.pack('<f', scale)
+    encode_varint(len(strings), out)
+    for text in strings:
+        encode_string(text, out)
+    encode_varint(len(stop_words), out)
+    for word in stop_words:
+        encode_varint(strings[word], out)
+    encode_varint(len(fields), out)
+    for field in fields:
+        encode_varint(strings[field], out)
+    encode_varint(len(entries), out)
+    for entry in entries:
+        for text in entry:
+            encode_varint(strings[text], out)
+
+    nodes = bytearray()
+    node_count = _encode_node(root, nodes)
+    encode_varint(node_count, out)
+    out += nodes
+    return bytes(out)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Shared corpus loader for the course HTML files.
+
+Every fixer and analyzer should get its documents from this store instead of
+opening files and building its own BeautifulSoup tree. Each file is read and
+parsed at most once per run, and re-read only when its mtime or size changes.
+
+Note: BeautifulSoup pickles a tree by re-serializing and re-parsing the
+markup, so loading a pickled tree is slower than parsing the file again.
+Nothing is cached on disk; the build caches that persist between runs
+(build_manifest.py, the link graph, the index builders) keep their own
+fingerprints.
+"""
+
+import copy
+import hashlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+# COURSE_CACHE_DIR lets sandboxed runs (e.g. benchmarks) keep their caches elsewhere
+CACHE_DIR = Path(os.environ.get("COURSE_CACHE_DIR") or PROJECT_ROOT / ".build_cache")
+PARSER = 'html.parser'
+
+
+def content_hash(content: str) -> str:
+    """Return the hex SHA-1 of a document's text."""
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+class CourseDocument:
+    """A single course file: its text, fingerprint and (lazily) parsed tree."""
+
+    def __init__(self, path: str, text: str, mtime_ns: int, size: int):
+        self.path = path
+        self.text = text
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = content_hash(text)
+        self._soup = None
+
+    @property
+    def soup(self) -> 'BeautifulSoup':
+        """
+        Shared parsed tree. Read-only: analyzers may query it, fixers that
+        modify the tree must use fresh_soup() instead.
+        """
+        if self._soup is None:
+            # Imported here so regex-only fixers can use the store without bs4
+            from bs4 import BeautifulSoup
+            self._soup = BeautifulSoup(self.text, PARSER)
+        return self._soup
+
+    def fresh_soup(self) -> 'BeautifulSoup':
+        """Return a private copy of the parsed tree that is safe to mutate."""
+        return copy.copy(self.soup)
+
+
+class CorpusStore:
+    """Parse-once store for course documents, shared by all scripts in a run."""
+
+    def __init__(self):
+        self.documents: Dict[str, CourseDocument] = {}
+        self.stats = {"loaded": 0, "hits": 0, "parsed": 0}
+
+    @staticmethod
+    def _key(path) -> str:
+        return os.path.abspath(str(path))
+
+    def get(self, path) -> CourseDocument:
+        """
+        Return the document for a path, reading it only if it is not cached
+        or has changed on disk since it was cached.
+        """
+        key = self._key(path)
+        stat = os.stat(key)
+        doc = self.documents.get(key)
+
+        if doc and doc.mtime_ns == stat.st_mtime_ns and doc.size == stat.st_size:
+            self.stats["hits"] += 1
+            return doc
+
+        with open(key, 'r', encoding='utf-8') as f:
+            text = f.read()
+
+        doc = CourseDocument(key, text, stat.st_mtime_ns, stat.st_size)
+        self.documents[key] = doc
+        self.stats["loaded"] += 1
+        return doc
+
+    def read_text(self, path) -> str:
+        """Return the text of a course file."""
+        return self.get(path).text
+
+    def soup(self, path) -> 'BeautifulSoup':
+        """Return the shared (read-only) parsed tree of a course file."""
+        doc = self.get(path)
+        if doc._soup is None:
+            self.stats["parsed"] += 1
+        return doc.soup
+
+    def mutable_soup(self, path) -> 'BeautifulSoup':
+        """Return a private, mutable copy of the parsed tree of a course file."""
+        doc = self.get(path)
+        if doc._soup is None:
+            self.stats["parsed"] += 1
+        return doc.fresh_soup()
+
+    def refresh(self, path, content: Optional[str] = None) -> None:
+        """
+        Update the cache after a file has been written. If the new content is
+        given it is cached directly, so the next reader does not re-read it.
+        """
+        key = self._key(path)
+        if content is None or not os.path.exists(key):
+            self.documents.pop(key, None)
+            return
+        stat = os.stat(key)
+        self.documents[key] = CourseDocument(key, content, stat.st_mtime_ns, stat.st_size)
+
+    def html_files(self, directory) -> List[str]:
+        """Return the sorted HTML files in a directory."""
+        if not os.path.isdir(directory):
+            return []
+        return sorted(
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.endswith('.html')
+        )
+
+
+_store: Optional[CorpusStore] = None
+
+
+def get_store() -> CorpusStore:
+    """Return the process-wide corpus store."""
+    global _store
+    if _store is None:
+        _store = CorpusStore()
+    return _store
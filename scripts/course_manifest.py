@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+The course manifest: one machine-readable description of the course in
+course.json at the project root, loaded once into an indexed structure.
+
+course.json lists the modules in order. Each module has the fields of the
+site configuration (title, folder, duration, session_count, description),
+its overview page data and its sessions; a session has a name, a short
+name for links and its lessons, in order:
+
+    {"file": "how_web_works.html", "title": "How the Web Works",
+     "nav_title": "...", "sidebar_title": "...",
+     "duration": "45 minutes", "description": "..."}
+
+nav_title (prev/next buttons) and sidebar_title (session lists) default to
+the title. A lesson marked "hidden" belongs to its session but is not
+listed in it, nor part of the prev/next sequence.
+
+load_manifest() returns a CourseManifest whose lookups are all O(1): a
+lesson by folder and file name, its session and position, and its
+previous and next lessons. The scripts that used to carry their own copy
+of the lesson order (batch_update_all.py, update_lesson_navigation_v2.py,
+fix_01module_navigation.py, fix_session_names.py,
+generate_module_overviews.py) read it from here.
+
+The module list of includes/config.php ($modules) and
+assets/js/site-config.js (SiteConfig.modules) is generated from the
+manifest too, between "generated from course.json" marker comments:
+
+    python scripts/course_manifest.py generate [--check]
+    python scripts/course_manifest.py show 01module/how_web_works.html
+"""
+
+import argparse
+import json
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from course_corpus import PROJECT_ROOT
+from output_writer import write_if_changed
+
+COURSE_MANIFEST_FILE = PROJECT_ROOT / "course.json"
+MANIFEST_VERSION = 1
+
+PHP_CONFIG_FILE = PROJECT_ROOT / "includes" / "config.php"
+JS_CONFIG_FILE = PROJECT_ROOT / "assets" / "js" / "site-config.js"
+GENERATED_BEGIN = "BEGIN generated from course.json"
+GENERATED_END = "END generated from course.json"
+GENERATED_REGION = re.compile(r'(// %s[^\n]*\n).*?(\n[ \t]*// %s)'
+                              % (re.escape(GENERATED_BEGIN), re.escape(GENERATED_END)), re.DOTALL)
+
+
+class ManifestError(ValueError):
+    """A course.json that cannot be loaded, or a config file without its generated region."""
+
+
+class Lesson(NamedTuple):
+    module: int
+    session: int
+    file: str
+    title: str
+    nav_title: str
+    sidebar_title: str
+    duration: str
+    description: str
+    hidden: bool
+    # Index in the module's prev/next sequence (None for hidden lessons)
+    position: Optional[int]
+    folder: str
+
+    @property
+    def path(self) -> str:
+        """Project-relative path, e.g. 01module/how_web_works.html"""
+        return f"{self.folder}/{self.file}"
+
+    @property
+    def url(self) -> str:
+        return "/" + self.path
+
+
+class Session(NamedTuple):
+    module: int
+    number: int
+    name: str
+    short_name: str
+    # Listed lessons in order; hidden ones are only in all_lessons
+    lessons: Tuple[Lesson, ...]
+    all_lessons: Tuple[Lesson, ...]
+
+    @property
+    def label(self) -> str:
+        """e.g. Session 2: HTML Fundamentals"""
+        return f"Session {self.number}: {self.name}"
+
+
+class Module(NamedTuple):
+    number: int
+    folder: str
+    title: str
+    duration: str
+    session_count: int
+    description: str
+    sessions: Tuple[Session, ...]
+    # The prev/next sequence of the module's listed lessons
+    lessons: Tuple[Lesson, ...]
+    overview: Optional[Dict]
+
+
+class CourseManifest:
+    """The course, indexed for constant-time navigation lookups."""
+
+    def __init__(self, data: Dict):
+        if data.get("version") != MANIFEST_VERSION:
+            raise ManifestError(f"unsupported course manifest version {data.get('version')!r}")
+        self.title = data.get("title", "")
+        self.modules: Tuple[Module, ...] = tuple(self._load_module(entry) for entry in data["modules"])
+        self._modules_by_number = {module.number: module for module in self.modules}
+        self._modules_by_folder = {module.folder: module for module in self.modules}
+        self._sessions = {(module.number, session.number): session
+                          for module in self.modules for session in module.sessions}
+        self._lessons: Dict[Tuple[str, str], Lesson] = {}
+        for module in self.modules:
+            for session in module.sessions:
+                for lesson in session.all_lessons:
+                    key = (lesson.folder, lesson.file)
+                    if key in self._lessons:
+                        raise ManifestError(f"{lesson.path} is listed twice")
+                    self._lessons[key] = lesson
+
+    @staticmethod
+    def _load_module(entry: Dict) -> Module:
+        number, folder = entry["number"], entry["folder"]
+        sessions = []
+        position = 0
+        for session_entry in entry.get("sessions", []):
+            lessons = []
+            for lesson_entry in session_entry.get("lessons", []):
+                hidden = bool(lesson_entry.get("hidden", False))
+                title = lesson_entry["title"]
+                lessons.append(Lesson(
+                    module=number, session=session_entry["number"], file=lesson_entry["file"],
+                    title=title, nav_title=lesson_entry.get("nav_title", title),
+                    sidebar_title=lesson_entry.get("sidebar_title", title),
+                    duration=lesson_entry.get("duration", ""),
+                    description=lesson_entry.get("description", ""),
+                    hidden=hidden, position=None if hidden else position, folder=folder))
+                if not hidden:
+                    position += 1
+            sessions.append(Session(
+                module=number, number=session_entry["number"], name=session_entry["name"],
+                short_name=session_entry.get("short_name", session_entry["name"]),
+                lessons=tuple(lesson for lesson in lessons if not lesson.hidden),
+                all_lessons=tuple(lessons)))
+        return Module(
+            number=number, folder=folder, title=entry["title"], duration=entry.get("duration", ""),
+            session_count=entry.get("session_count", len(sessions)),
+            description=entry.get("description", ""), sessions=tuple(sessions),
+            lessons=tuple(lesson for session in sessions for lesson in session.lessons),
+            overview=entry.get("overview"))
+
+    def module(self, key) -> Optional[Module]:
+        """A module by number (1) or folder ("01module")."""
+        if isinstance(key, int):
+            return self._modules_by_number.get(key)
+        return self._modules_by_folder.get(key)
+
+    def session(self, module: int, number: int) -> Optional[Session]:
+        return self._sessions.get((module, number))
+
+    def lesson(self, folder: str, file: str) -> Optional[Lesson]:
+        """A lesson by its folder and file name, hidden ones included."""
+        return self._lessons.get((folder, file))
+
+    def lesson_at(self, path: str) -> Optional[Lesson]:
+        """A lesson by its path or URL, e.g. /01module/how_web_works.html"""
+        folder, _, file = path.strip('/').rpartition('/')
+        return self._lessons.get((folder.rpartition('/')[2], file))
+
+    def previous(self, lesson: Lesson) -> Optional[Lesson]:
+        """The lesson before this one in its module (None for the first or a hidden one)."""
+        if lesson.position is None or lesson.position == 0:
+            return None
+        return self._modules_by_number[lesson.module].lessons[lesson.position - 1]
+
+    def next(self, lesson: Lesson) -> Optional[Lesson]:
+        """The lesson after this one in its module (None for the last or a hidden one)."""
+        if lesson.position is None:
+            return None
+        lessons = self._modules_by_number[lesson.module].lessons
+        return lessons[lesson.position + 1] if lesson.position + 1 < len(lessons) else None
+
+
+def read_manifest(path: Path = COURSE_MANIFEST_FILE) -> CourseManifest:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ManifestError(f"cannot load {path}: {e}")
+    return CourseManifest(data)
+
+
+@lru_cache(maxsize=None)
+def load_manifest(path: Path = COURSE_MANIFEST_FILE) -> CourseManifest:
+    """The course manifest, loaded and indexed once per process."""
+    return read_manifest(path)
+
+
+def php_string(value: str) -> str:
+    return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def js_string(value: str) -> str:
+    return "'" + value.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n') + "'"
+
+
+def php_modules(manifest: CourseManifest) -> str:
+    """The $modules array of includes/config.php."""
+    entries = []
+    for module in manifest.modules:
+        entries.append(f"""    {module.number} => [
+        'title' => {php_string(module.title)},
+        'folder' => {php_string(module.folder)},
+        'duration' => {php_string(module.duration)},
+        'sessions' => {module.session_count},
+        'description' => {php_string(module.description)}
+    ]""")
+    return "$modules = [\n" + ",\n".join(entries) + "\n];"
+
+
+def js_modules(manifest: CourseManifest) -> str:
+    """The modules list of SiteConfig in assets/js/site-config.js."""
+    entries = []
+    for module in manifest.modules:
+        entries.append(f"""        {{
+            number: {module.number},
+            title: {js_string(module.title)},
+            folder: {js_string(module.folder)},
+            duration: {js_string(module.duration)},
+            sessions: {module.session_count},
+            description: {js_string(module.description)}
+        }}""")
+    return "    modules: [\n" + ",\n".join(entries) + "\n    ],"
+
+
+def replace_generated(content: str, generated: str, path: Path) -> str:
+    """Swap the text between the generated-region markers for generated."""
+    if not GENERATED_REGION.search(content):
+        raise ManifestError(f"{path} has no '// {GENERATED_BEGIN}' ... '// {GENERATED_END}' region")
+    return GENERATED_REGION.sub(lambda match: match.group(1) + generated + match.group(2), content, count=1)
+
+
+def generate_configs(manifest: CourseManifest, check: bool = False) -> List[Path]:
+    """
+    Regenerate the module lists of the PHP and JS configuration. Returns the
+    files that changed (with check, the files that are out of date).
+    """
+    changed = []
+    for path, generated in ((PHP_CONFIG_FILE, php_modules(manifest)), (JS_CONFIG_FILE, js_modules(manifest))):
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        new_content = replace_generated(content, generated, path)
+        if new_content == content:
+            continue
+        changed.append(path)
+        if not check:
+            write_if_changed(path, new_content)
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Course manifest (course.json) tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    generate_parser = subparsers.add_parser("generate", help="regenerate the PHP and JS module configuration")
+    generate_parser.add_argument("--check", action="store_true",
+                                 help="only report whether the configuration is up to date")
+    show_parser = subparsers.add_parser("show", help="show a lesson's session, position and neighbours")
+    show_parser.add_argument("lesson", help="lesson path, e.g. 01module/how_web_works.html")
+    args = parser.parse_args()
+
+    try:
+        manifest = load_manifest()
+    except ManifestError as e:
+        print(f"❌ {e}")
+        return 1
+
+    if args.command == "show":
+        lesson = manifest.lesson_at(args.lesson)
+        if lesson is None:
+            print(f"❌ {args.lesson} is not in the course manifest")
+            return 1
+        session = manifest.session(lesson.module, lesson.session)
+        module = manifest.module(lesson.module)
+        print(f"📄 {lesson.title} ({lesson.path})")
+        print(f"  Module {module.number}: {module.title}, {session.label}")
+        if lesson.position is None:
+            print("  Hidden: not listed in the session or the lesson sequence")
+        else:
+            print(f"  Lesson {lesson.position + 1} of {len(module.lessons)}")
+        for label, neighbour in (("Previous", manifest.previous(lesson)), ("Next", manifest.next(lesson))):
+            print(f"  {label}: {neighbour.path if neighbour else '-'}")
+        return 0
+
+    try:
+        changed = generate_configs(manifest, check=args.check)
+    except ManifestError as e:
+        print(f"❌ {e}")
+        return 1
+    names = ", ".join(path.relative_to(PROJECT_ROOT).as_posix() for path in changed)
+    if args.check:
+        if changed:
+            print(f"❌ Out of date with course.json: {names}")
+            return 1
+        print("✅ Configuration is up to date with course.json")
+        return 0
+    print(f"✅ Updated {names}" if changed else "✅ Configuration already up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Unused-CSS pruning for the asset pipeline's stylesheet bundles.
+
+used_names() collects the tag names, classes and ids a page really uses:
+those in its markup, plus those its scripts can add at runtime, found in
+their string literals (class="..." in HTML templates, classList.add('x'),
+className = 'x', document.createElement('x'), ...). prune_css() then drops
+every selector that needs a tag, class or id none of a bundle's pages
+uses, and every rule left without a selector.
+
+Pruning errs on the side of keeping: selectors with escapes are kept,
+attribute selectors and :not()/:is()/... arguments are not required to
+match, @keyframes, @font-face and the like are always kept, and whatever
+comes after a class whose markup a library renders (e.g. the SVG Mermaid
+draws into .mermaid) is not checked. ALLOWLIST_PATTERNS lists the classes
+and ids scripts build in ways the scan cannot see; add to it when a style
+goes missing.
+
+Used by `asset_pipeline.py bundle` (unless --no-prune), which prunes each
+bundle against the pages that link it (one bundle per page type) and
+reports the bytes saved per stylesheet.
+"""
+
+import re
+from typing import Iterable, List, NamedTuple, Set
+
+from asset_minify import split_rules
+from html_splice import iter_tags
+
+# Classes and ids added by scripts in ways the string scan cannot see
+ALLOWLIST_PATTERNS = [re.compile(pattern) for pattern in (
+    r'^active$',
+    r'^show$',
+    r'^open$',
+    r'^collapsed$',
+    r'^completed?$',
+    r'^visible$',
+    r'^hidden$',
+    r'^loading$',
+    r'^sidebar-',
+    r'^search-',
+    r'^mermaid',
+)]
+
+# Classes whose content a library renders: what is below them is kept
+SCOPE_CLASSES = frozenset(["mermaid", "mermaid-container", "mermaid-diagram"])
+
+# Tags every page has, and the SVG elements scripts draw
+ALWAYS_USED_TAGS = frozenset(["html", "head", "body", "svg", "g", "path", "rect", "circle", "ellipse",
+                              "line", "polygon", "polyline", "text", "tspan", "foreignobject", "marker"])
+
+# @ rules kept as they are; @media, @supports and @layer blocks are pruned inside
+NESTED_AT_RULES = ("@media", "@supports", "@layer", "@document")
+
+NAME = r'-?[_a-zA-Z][\w-]*'
+CLASS_PATTERN = re.compile(r'\.(' + NAME + ')')
+ID_PATTERN = re.compile(r'#(' + NAME + ')')
+TAG_PATTERN = re.compile(r'^([a-zA-Z][\w-]*)')
+NAME_PATTERN = re.compile(r'^' + NAME + r'$')
+COMBINATOR_PATTERN = re.compile(r'\s*[\s>+~]\s*')
+ATTRIBUTE_SELECTOR_PATTERN = re.compile(r'\[[^\]]*\]')
+FUNCTIONAL_PSEUDO_PATTERN = re.compile(r'::?[\w-]+\([^()]*\)')
+PSEUDO_PATTERN = re.compile(r'::?[\w-]+')
+
+JS_STRING_PATTERN = re.compile(r'''"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\.)*`''')
+HTML_CLASS_ATTR_PATTERN = re.compile(r'''\b(class|id)\s*=\s*\\?["']([^"'\\]*)''')
+HTML_TAG_PATTERN = re.compile(r'<([a-zA-Z][\w-]*)')
+TEMPLATE_EXPRESSION_PATTERN = re.compile(r'\$\{[^}]*\}')
+
+
+class UsedNames(NamedTuple):
+    tags: Set[str]
+    classes: Set[str]
+    ids: Set[str]
+
+    @classmethod
+    def empty(cls) -> "UsedNames":
+        return cls(set(), set(), set())
+
+    def update(self, other: "UsedNames") -> None:
+        self.tags.update(other.tags)
+        self.classes.update(other.classes)
+        self.ids.update(other.ids)
+
+
+def script_names(source: str, used: UsedNames) -> None:
+    """Add the tags, classes and ids a script's string literals can put in the page."""
+    for match in JS_STRING_PATTERN.finditer(source):
+        text = TEMPLATE_EXPRESSION_PATTERN.sub(' ', match.group(0)[1:-1])
+        for attr, value in HTML_CLASS_ATTR_PATTERN.findall(text):
+            (used.classes if attr == "class" else used.ids).update(value.split())
+        used.tags.update(tag.lower() for tag in HTML_TAG_PATTERN.findall(text))
+        # A bare name may be a class or id (classList.add('open')) or a tag
+        # (createElement('nav')); counting it as all three keeps more, never less
+        words = [word for word in text.split() if NAME_PATTERN.match(word)]
+        used.classes.update(words)
+        used.ids.update(words)
+        used.tags.update(word.lower() for word in words)
+
+
+def used_names(html: str, scripts: Iterable[str] = ()) -> UsedNames:
+    """Tags, classes and ids of a page's markup, inline scripts and the given script sources."""
+    used = UsedNames.empty()
+    open_script = None
+    for token in iter_tags(html):
+        if token.closing:
+            if token.name == "script" and open_script is not None:
+                script_names(html[open_script.end:token.start], used)
+                open_script = None
+            continue
+        used.tags.add(token.name)
+        used.classes.update((token.get("class") or '').split())
+        element_id = token.get("id")
+        if element_id:
+            used.ids.add(element_id)
+        if token.name == "script":
+            open_script = token
+    for source in scripts:
+        script_names(source, used)
+    return used
+
+
+def _allowed(name: str) -> bool:
+    return any(pattern.search(name) for pattern in ALLOWLIST_PATTERNS)
+
+
+def selector_used(selector: str, used: UsedNames) -> bool:
+    """Whether every tag, class and id a selector requires is used (or allowlisted)."""
+    if '\\' in selector:
+        return True
+    simplified = ATTRIBUTE_SELECTOR_PATTERN.sub('', selector)
+    previous = None
+    while previous != simplified:
+        previous = simplified
+        simplified = FUNCTIONAL_PSEUDO_PATTERN.sub('', simplified)
+    simplified = PSEUDO_PATTERN.sub('', simplified)
+
+    for compound in COMBINATOR_PATTERN.split(simplified.strip()):
+        if not compound:
+            continue
+        tag = TAG_PATTERN.match(compound)
+        if tag and tag.group(1).lower() not in used.tags and tag.group(1).lower() not in ALWAYS_USED_TAGS:
+            return False
+        classes = CLASS_PATTERN.findall(compound)
+        for name in classes:
+            if name not in used.classes and not _allowed(name):
+                return False
+        for name in ID_PATTERN.findall(compound):
+            if name not in used.ids and not _allowed(name):
+                return False
+        if SCOPE_CLASSES.intersection(classes):
+            return True
+    return True
+
+
+def split_selectors(selectors: str) -> List[str]:
+    """Split a selector list at its top-level commas."""
+    parts = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(selectors):
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(selectors[start:i])
+            start = i + 1
+    parts.append(selectors[start:])
+    return parts
+
+
+def prune_css(css: str, used: UsedNames) -> str:
+    """The rules (and selectors) of minified CSS that the used names can match."""
+    kept = []
+    for rule in split_rules(css):
+        rule = rule.strip()
+        brace = rule.find('{')
+        if rule.startswith('@'):
+            if brace > 0 and rule.lower().startswith(NESTED_AT_RULES):
+                inner = prune_css(rule[brace + 1:-1], used)
+                if inner:
+                    kept.append(rule[:brace + 1] + inner + '}')
+            else:
+                kept.append(rule)
+            continue
+        if brace < 0:
+            continue
+        selectors = [selector for selector in split_selectors(rule[:brace])
+                     if selector_used(selector, used)]
+        if selectors:
+            kept.append(','.join(selectors) + rule[brace:])
+    return ''.join(kept)
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Moves the CSS that lesson pages repeat in their inline <style> blocks into
+shared, fingerprinted stylesheets.
+
+Most lesson pages carry the same few hundred lines of page styles inline,
+so every page view downloads them again. Each <style> block in a page's
+<head> is split into its top-level rules (an @media block is one rule), and
+every rule is keyed by its minified text. A run of consecutive rules that
+appears, identically and in the same order, on at least MIN_PAGES pages and
+is at least MIN_SHARED_BYTES long is written once to
+
+    assets/dist/styles/inline.<hash>.css
+
+and replaced in place by a link to it:
+
+    <link href="/assets/dist/styles/inline.1a2b3c4d5e.css" rel="stylesheet" data-inline-style=""/>
+
+Rules used by a single page (or by too few pages to be worth a request)
+stay in an inline <style> at the same position, so the cascade order of
+every rule is unchanged. Blocks without a shared run are left untouched.
+
+Each run starts from the pages as if every shared stylesheet were inline
+again, so re-running gives the same files and only rewrites pages whose
+styles changed; stylesheets no page links any more are deleted. `restore`
+puts the shared rules back inline (minified; the exact previous markup is
+in the backup store). The data-inline-style attribute keeps the asset
+pipeline from bundling these links.
+
+    python scripts/extract_inline_styles.py extract [--dry-run]
+    python scripts/extract_inline_styles.py restore
+"""
+
+import argparse
+import os
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from asset_minify import fingerprinted_name, minify_css, split_rules
+from asset_pipeline import DIST_DIR, DIST_URL, site_pages
+from backup_store import backup_files
+from course_corpus import PROJECT_ROOT, get_store
+from html_splice import apply_edits, iter_tags
+from output_writer import write_if_changed
+
+STYLES_DIR = DIST_DIR / "styles"
+STYLES_URL = DIST_URL + "styles/"
+STYLE_ATTR = "data-inline-style"
+BACKUP_LABEL = "inline_styles"
+
+# A run of rules is shared if this many pages have it, and it is this long
+MIN_PAGES = 3
+MIN_SHARED_BYTES = 256
+
+# Only plain <style> blocks are moved; e.g. a media attribute would be lost
+MOVABLE_STYLE_ATTRS = frozenset(['', 'type="text/css"', "type='text/css'"])
+
+
+class StyleBlock(NamedTuple):
+    """An inline <style> block, or a link to a shared stylesheet, in a page's <head>."""
+    start: int
+    end: int
+    attrs: str
+    rules: Tuple[str, ...]  # source text of each rule
+    keys: Tuple[str, ...]   # minified text of each rule
+    linked: bool            # a <link data-inline-style> to a shared stylesheet
+
+
+def rule_key(rule: str) -> str:
+    return minify_css(rule).strip()
+
+
+def shared_file_content(keys: Tuple[str, ...]) -> str:
+    return '\n'.join(keys) + '\n'
+
+
+def shared_file_name(keys: Tuple[str, ...]) -> str:
+    return fingerprinted_name("inline", shared_file_content(keys), ".css")
+
+
+def shared_file(url: Optional[str], styles_dir: Path) -> Optional[Path]:
+    """The shared stylesheet a link points to, if it exists."""
+    if not url or not url.startswith(STYLES_URL):
+        return None
+    path = Path(styles_dir) / url[len(STYLES_URL):]
+    return path if path.is_file() else None
+
+
+def head_styles(html: str, styles_dir: Path = STYLES_DIR) -> List[StyleBlock]:
+    """Inline <style> blocks and shared stylesheet links of a page's <head>, in order."""
+    blocks = []
+    open_style = None
+    for token in iter_tags(html):
+        if token.name == "body" or (token.name == "head" and token.closing):
+            break
+        if token.name == "style":
+            if not token.closing:
+                open_style = token
+            elif open_style is not None:
+                if open_style.attrs.strip() in MOVABLE_STYLE_ATTRS:
+                    rules = tuple(split_rules(html[open_style.end:token.start]))
+                    blocks.append(StyleBlock(open_style.start, token.end, open_style.attrs.strip(),
+                                             rules, tuple(rule_key(rule) for rule in rules), False))
+                open_style = None
+        elif token.name == "link" and not token.closing and token.get(STYLE_ATTR) is not None:
+            path = shared_file(token.get("href"), styles_dir)
+            if path is None:
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                keys = tuple(rule_key(rule) for rule in split_rules(f.read()))
+            blocks.append(StyleBlock(token.start, token.end, '', keys, keys, True))
+    return blocks
+
+
+def find_segments(keys: Tuple[str, ...], common: Set[str]) -> List[Tuple[int, int]]:
+    """[start, end) ranges of the maximal runs of rules found on enough pages."""
+    segments = []
+    start = None
+    for i, key in enumerate(keys):
+        if key in common:
+            if start is None:
+                start = i
+        elif start is not None:
+            segments.append((start, i))
+            start = None
+    if start is not None:
+        segments.append((start, len(keys)))
+    return segments
+
+
+def style_tag(attrs: str, css: str) -> str:
+    return f"<style{' ' + attrs if attrs else ''}>{css}</style>"
+
+
+def link_tag(name: str) -> str:
+    return f'<link href="{STYLES_URL}{name}" rel="stylesheet" {STYLE_ATTR}=""/>'
+
+
+def rewrite_block(block: StyleBlock, shared: Set[Tuple[str, ...]], segments: List[Tuple[int, int]]) -> str:
+    """
+    The markup for a block: a link for each shared run and an inline
+    <style> for each run of the rules in between.
+    """
+    parts = []
+    position = 0
+
+    def keep_inline(end):
+        if position >= end:
+            return
+        if block.linked:
+            parts.append(style_tag('', '\n' + shared_file_content(block.keys[position:end])))
+        else:
+            css = ''.join(block.rules[position:end])
+            parts.append(style_tag(block.attrs, css if css.endswith('\n') else css + '\n'))
+
+    for start, end in segments:
+        if block.keys[start:end] not in shared:
+            continue
+        keep_inline(start)
+        parts.append(link_tag(shared_file_name(block.keys[start:end])))
+        position = end
+    keep_inline(len(block.keys))
+    return '\n'.join(parts)
+
+
+def process_pages(pages: List[str], extract: bool = True, dry_run: bool = False,
+                  root: Path = PROJECT_ROOT, styles_dir: Path = STYLES_DIR) -> Dict:
+    """Extract (or restore) the shared inline styles of every page in one pass."""
+    store = get_store()
+    htmls = {}
+    page_blocks: Dict[str, List[StyleBlock]] = {}
+    for page in pages:
+        htmls[page] = store.read_text(root / page)
+        page_blocks[page] = head_styles(htmls[page], styles_dir)
+
+    # Pages per rule, then pages per run of rules that are each on enough pages
+    rule_pages: Dict[str, Set[str]] = defaultdict(set)
+    for page, blocks in page_blocks.items():
+        for block in blocks:
+            for key in block.keys:
+                rule_pages[key].add(page)
+    common = {key for key, found in rule_pages.items() if len(found) >= MIN_PAGES} if extract else set()
+
+    block_segments = {}
+    run_pages: Dict[Tuple[str, ...], Set[str]] = defaultdict(set)
+    for page, blocks in page_blocks.items():
+        for block in blocks:
+            block_segments[page, block.start] = find_segments(block.keys, common)
+            for start, end in block_segments[page, block.start]:
+                run_pages[block.keys[start:end]].add(page)
+    shared = {run for run, found in run_pages.items()
+              if len(found) >= MIN_PAGES and len(shared_file_content(run)) >= MIN_SHARED_BYTES}
+
+    stats = {"pages": len(pages), "changed": 0, "blocks": sum(len(b) for b in page_blocks.values()),
+             "files": len(shared), "shared_bytes": sum(len(shared_file_content(run)) for run in shared),
+             "inline_before": 0, "inline_after": 0}
+    changed = []
+    for page, blocks in page_blocks.items():
+        html = htmls[page]
+        edits = []
+        for block in blocks:
+            segments = block_segments[page, block.start]
+            if not block.linked and not any(block.keys[start:end] in shared for start, end in segments):
+                continue
+            text = rewrite_block(block, shared, segments)
+            if html[block.start:block.end] != text:
+                edits.append((block.start, block.end, text))
+        new_html = apply_edits(html, edits) if edits else html
+        stats["inline_before"] += sum(len(html[b.start:b.end]) for b in blocks if not b.linked)
+        stats["inline_after"] += sum(len(new_html[b.start:b.end]) for b in head_styles(new_html, styles_dir)
+                                     if not b.linked)
+        if new_html == html:
+            continue
+        changed.append(page)
+        if not dry_run:
+            backup_files([root / page], label=BACKUP_LABEL)
+            write_if_changed(root / page, new_html)
+
+    if not dry_run:
+        names = {shared_file_name(run) for run in shared}
+        if shared:
+            Path(styles_dir).mkdir(parents=True, exist_ok=True)
+        for run in shared:
+            write_if_changed(Path(styles_dir) / shared_file_name(run), shared_file_content(run))
+        if Path(styles_dir).is_dir():
+            for name in os.listdir(styles_dir):
+                if name.endswith('.css') and name not in names:
+                    os.remove(Path(styles_dir) / name)
+    stats["changed"] = len(changed)
+    stats["changed_pages"] = changed
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Move the inline CSS the lesson pages share into fingerprinted stylesheets")
+    commands = parser.add_subparsers(dest="command", required=True)
+    extract_parser = commands.add_parser("extract", help="link the shared rules instead of inlining them")
+    extract_parser.add_argument("--dry-run", action="store_true", help="only report the pages that would change")
+    commands.add_parser("restore", help="put the shared rules back inline")
+    args = parser.parse_args()
+
+    pages = site_pages(PROJECT_ROOT)
+    if args.command == "extract":
+        print(f"🎨 Extracting shared inline styles of {len(pages)} pages")
+        stats = process_pages(pages, extract=True, dry_run=args.dry_run)
+        print(f"  {stats['files']} shared stylesheets ({stats['shared_bytes'] / 1024:.1f} KB) "
+              f"in {STYLES_DIR.relative_to(PROJECT_ROOT)}/")
+        if args.dry_run:
+            print(f"  {stats['changed']} pages would change")
+            return 0
+        print(f"  Inline styles: {stats['inline_before'] / 1024:.1f} KB -> {stats['inline_after'] / 1024:.1f} KB")
+    else:
+        print(f"🎨 Restoring inline styles in {len(pages)} pages")
+        stats = process_pages(pages, extract=False)
+    print(f"✅ {stats['changed']} pages updated")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,9 @@ from bs4 import BeautifulSoup
 from typing import List, Dict, Tuple
 import sys
 
+from asset_pipeline import bundled_sources, find_asset_tag
+from output_writer import write_if_changed
+
 class ModuleFixer:
     def __init__(self, base_path: str):
         """Initialize the module fixer with the base project path"""
@@ -63,6 +66,9 @@ class ModuleFixer:
         if not head:
             return False
         
+        # Files a bundle tag already loads are not linked again (see asset_pipeline.py)
+        bundled = bundled_sources(str(soup))
+        
         # Remove existing main.css link
         existing_css = head.find_all('link', {'href': re.compile(r'/assets/css/main\.css')})
         for css in existing_css:
@@ -82,6 +88,8 @@ class ModuleFixer:
         ]
         
         for css in css_links:
+            if css['href'] in bundled:
+                continue
             new_link = soup.new_tag('link', href=css['href'], rel=css['rel'])
             if insert_after:
                 insert_after.insert_after(new_link)
@@ -96,7 +104,7 @@ class ModuleFixer:
             return False
         
         # Check if sidebar-toggle.js already exists
-        existing_sidebar_js = body.find('script', {'src': '/assets/js/sidebar-toggle.js'})
+        existing_sidebar_js = find_asset_tag(body, 'script', 'src', '/assets/js/sidebar-toggle.js')
         if existing_sidebar_js:
             return True
         
@@ -121,7 +129,10 @@ class ModuleFixer:
                 if 'mermaid' not in str(script):
                     last_script = script
             
+            bundled = bundled_sources(str(body))
             for script_src in scripts:
+                if script_src in bundled:
+                    continue
                 new_script = soup.new_tag('script', src=script_src)
                 if last_script:
                     last_script.insert_after(new_script)
@@ -299,8 +310,7 @@ class ModuleFixer:
                 pretty_html = re.sub(r'>\s+([^<>\s])', r'>\1', pretty_html)
                 pretty_html = re.sub(r'([^<>\s])\s+<', r'\1<', pretty_html)
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(pretty_html)
+                write_if_changed(file_path, pretty_html)
                 
                 return True
             else:
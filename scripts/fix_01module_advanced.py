@@ -4,27 +4,29 @@ Advanced script to fix 01module HTML files by:
 1. Checking if they have proper content (not just template placeholders)
 2. Populating them with content from 01module_old if needed
 3. Ensuring proper mermaid diagram support
-4. Creating backups before modifying files
+4. Snapshotting files into the backup store before modifying them
 5. Providing detailed reporting and validation
 """
 
 import os
-import shutil
 from datetime import datetime
 import re
 from pathlib import Path
 import json
 import hashlib
 
+from backup_store import backup_files, restore_latest
+from output_writer import write_if_changed
+
 # Paths
 BASE_DIR = Path(__file__).parent
 MODULE_DIR = BASE_DIR / "01module"
 OLD_MODULE_DIR = BASE_DIR / "01module_old"
-BACKUP_DIR = BASE_DIR / "01module_backups"
 
-# Create backup directory with timestamp
+# All backups from one run go into a single snapshot in the backup store
+BACKUP_LABEL = "01module_advanced"
+
 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-CURRENT_BACKUP_DIR = BACKUP_DIR / timestamp
 
 # Report file
 REPORT_FILE = BASE_DIR / f"fix_01module_report_{timestamp}.txt"
@@ -40,6 +42,7 @@ class ContentFixer:
             'errors': 0,
             'mermaid_fixed': 0
         }
+        self.backup_snapshot = None
         
     def log(self, message, level="INFO"):
         """Log message to console and report."""
@@ -49,14 +52,10 @@ class ContentFixer:
         self.report.append(log_entry)
     
     def create_backup(self, file_path):
-        """Create a backup of the file before modification."""
-        if not CURRENT_BACKUP_DIR.exists():
-            CURRENT_BACKUP_DIR.mkdir(parents=True, exist_ok=True)
-        
-        backup_path = CURRENT_BACKUP_DIR / file_path.name
-        shutil.copy2(file_path, backup_path)
-        self.log(f"  ✓ Backup created: {backup_path.name}", "INFO")
-        return backup_path
+        """Snapshot the file into the backup store before modification."""
+        self.backup_snapshot = backup_files([file_path], label=BACKUP_LABEL)["snapshot"]
+        self.log(f"  ✓ Backup saved to snapshot: {self.backup_snapshot}", "INFO")
+        return self.backup_snapshot
     
     def get_file_hash(self, content):
         """Get hash of file content for comparison."""
@@ -74,8 +73,7 @@ class ContentFixer:
     def write_file(self, file_path, content):
         """Write content to file."""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_if_changed(file_path, content)
             return True
         except Exception as e:
             self.log(f"  ✗ Error writing {file_path}: {e}", "ERROR")
@@ -318,7 +316,7 @@ class ContentFixer:
                 return False
             
             # Create backup before modifying
-            backup_path = self.create_backup(file_path)
+            self.create_backup(file_path)
             
             # Merge content
             self.log(f"  🔄 Merging content from old file", "INFO")
@@ -341,7 +339,7 @@ class ContentFixer:
             else:
                 self.log(f"  ❌ Failed to update {file_path.name}", "ERROR")
                 # Restore from backup
-                shutil.copy2(backup_path, file_path)
+                restore_latest(file_path)
                 self.log(f"  ↩ Restored from backup", "INFO")
                 self.stats['errors'] += 1
                 return False
@@ -397,7 +395,7 @@ class ContentFixer:
         
         self.log(f"📁 Module directory: {MODULE_DIR}", "INFO")
         self.log(f"📁 Old module directory: {OLD_MODULE_DIR}", "INFO")
-        self.log(f"📁 Backup directory: {CURRENT_BACKUP_DIR}", "INFO")
+        self.log(f"📁 Backups: .backup_store (label {BACKUP_LABEL})", "INFO")
         
         # Get all HTML files in 01module
         html_files = sorted(MODULE_DIR.glob("*.html"))
@@ -428,8 +426,8 @@ class ContentFixer:
         self.log(f"  ⚠ Skipped: {self.stats['skipped']}", "INFO")
         self.log(f"  ❌ Errors: {self.stats['errors']}", "INFO")
         
-        if CURRENT_BACKUP_DIR.exists() and any(CURRENT_BACKUP_DIR.iterdir()):
-            self.log(f"\n💾 Backups saved in: {CURRENT_BACKUP_DIR}", "INFO")
+        if self.backup_snapshot:
+            self.log(f"\n💾 Backups saved in snapshot: {self.backup_snapshot}", "INFO")
         
         # Save report
         self.save_report()
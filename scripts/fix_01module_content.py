@@ -4,34 +4,31 @@ Script to fix 01module HTML files by:
 1. Checking if they have proper content (not just template placeholders)
 2. Populating them with content from 01module_old if needed
 3. Ensuring proper mermaid diagram support
-4. Creating backups before modifying files
+4. Snapshotting files into the backup store before modifying them
 """
 
 import os
-import shutil
-from datetime import datetime
 import re
 from pathlib import Path
 
+from backup_store import backup_files, restore_latest
+from output_writer import write_if_changed
+
 # Paths
 BASE_DIR = Path(__file__).parent
 MODULE_DIR = BASE_DIR / "01module"
 OLD_MODULE_DIR = BASE_DIR / "01module_old"
-BACKUP_DIR = BASE_DIR / "01module_backups"
 
-# Create backup directory with timestamp
-timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-CURRENT_BACKUP_DIR = BACKUP_DIR / timestamp
+# All backups from one run go into a single snapshot in the backup store
+BACKUP_LABEL = "01module_content"
+backup_snapshot = None
 
 def create_backup(file_path):
-    """Create a backup of the file before modification."""
-    if not CURRENT_BACKUP_DIR.exists():
-        CURRENT_BACKUP_DIR.mkdir(parents=True, exist_ok=True)
-    
-    backup_path = CURRENT_BACKUP_DIR / file_path.name
-    shutil.copy2(file_path, backup_path)
-    print(f"  ✓ Backup created: {backup_path.name}")
-    return backup_path
+    """Snapshot the file into the backup store before modification."""
+    global backup_snapshot
+    backup_snapshot = backup_files([file_path], label=BACKUP_LABEL)["snapshot"]
+    print(f"  ✓ Backup saved to snapshot: {backup_snapshot}")
+    return backup_snapshot
 
 def read_file(file_path):
     """Read and return file content."""
@@ -45,8 +42,7 @@ def read_file(file_path):
 def write_file(file_path, content):
     """Write content to file."""
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_if_changed(file_path, content)
         return True
     except Exception as e:
         print(f"  ✗ Error writing {file_path}: {e}")
@@ -222,7 +218,7 @@ def process_file(file_path):
             return False
         
         # Create backup before modifying
-        backup_path = create_backup(file_path)
+        create_backup(file_path)
         
         # Merge content
         print(f"  🔄 Merging content from old file")
@@ -239,7 +235,7 @@ def process_file(file_path):
         else:
             print(f"  ❌ Failed to update {file_path.name}")
             # Restore from backup
-            shutil.copy2(backup_path, file_path)
+            restore_latest(file_path)
             print(f"  ↩ Restored from backup")
             return False
     else:
@@ -272,7 +268,7 @@ def main():
     
     print(f"📁 Module directory: {MODULE_DIR}")
     print(f"📁 Old module directory: {OLD_MODULE_DIR}")
-    print(f"📁 Backup directory: {CURRENT_BACKUP_DIR}")
+    print(f"📁 Backups: .backup_store (label {BACKUP_LABEL})")
     
     # Get all HTML files in 01module
     html_files = sorted(MODULE_DIR.glob("*.html"))
@@ -313,8 +309,8 @@ def main():
     print(f"  ⚠ Skipped: {skipped}")
     print(f"  ❌ Errors: {errors}")
     
-    if CURRENT_BACKUP_DIR.exists() and any(CURRENT_BACKUP_DIR.iterdir()):
-        print(f"\n💾 Backups saved in: {CURRENT_BACKUP_DIR}")
+    if backup_snapshot:
+        print(f"\n💾 Backups saved in snapshot: {backup_snapshot}")
     
     print("\n✨ Script completed!")
 
@@ -9,21 +9,15 @@ Fix common HTML issues in 01module files:
 import os
 import re
 from pathlib import Path
-import shutil
-from datetime import datetime
+
+from backup_store import backup_files
+from output_writer import write_if_changed
 
 def backup_file(filepath):
-    """Create a backup of the file before modifying"""
-    backup_dir = Path(filepath).parent / "backups"
-    backup_dir.mkdir(exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_name = f"{Path(filepath).stem}_{timestamp}{Path(filepath).suffix}"
-    backup_path = backup_dir / backup_name
-    
-    shutil.copy2(filepath, backup_path)
-    print(f"  Backup created: {backup_path}")
-    return backup_path
+    """Snapshot the file into the shared backup store before modifying"""
+    snapshot = backup_files([filepath], label="01module_html_issues")["snapshot"]
+    print(f"  Backup saved to snapshot: {snapshot}")
+    return snapshot
 
 def fix_mermaid_initialization(content):
     """Add missing securityLevel: 'loose' to mermaid initialization"""
@@ -189,8 +183,7 @@ def process_file(filepath):
             backup_file(filepath)
             
             # Save fixed content
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_if_changed(filepath, content)
             
             print(f"  ✅ File updated with {total_fixes} fixes")
             return True
@@ -240,7 +233,7 @@ def main():
     
     if files_modified > 0:
         print(f"\n✅ Successfully fixed {files_modified} files!")
-        print("Backups have been created in the 'backups' subdirectory")
+        print("Backups have been saved in .backup_store (python scripts/backup_store.py list)")
     else:
         print("\n✅ All files are already correct!")
 
@@ -4,97 +4,34 @@ Script to fix the side navigation in 01module HTML files to match the consistent
 functionality found in 02module and 03module files.
 """
 
+import argparse
 import os
 import re
 from bs4 import BeautifulSoup
-import sys
+from functools import partial
+from html import unescape
+
+from asset_pipeline import BUNDLE_ATTR, find_asset_tag
+from course_corpus import get_store
+from course_manifest import load_manifest
+from html_splice import ATTR_PATTERN, apply_edits, find_element, iter_tags
+from output_writer import write_if_changed
+from parallel_runner import run_per_file
+
+MODULE_NUMBER = 1
+MODULE_FOLDER = "01module"
+COURSE = load_manifest()
+
+# Where the last session's "next" link leads
+NEXT_MODULE_LINK = '/02module/review_php_setup.html'
+NEXT_MODULE_TITLE = 'Module 2: PHP Setup'
 
 def get_session_lessons(session_number):
     """Get all lessons for a specific session."""
-    session_lessons = {
-        1: [
-            {'file': '/01module/course_introduction.html', 'title': 'Course Introduction'},
-            {'file': '/01module/how_web_works.html', 'title': 'How the Web Works'},
-            {'file': '/01module/development_environment.html', 'title': 'Development Environment'},
-            {'file': '/01module/first_html_page.html', 'title': 'Your First HTML Page'},
-            {'file': '/01module/homework_setup.html', 'title': 'Homework: Setup'},
-        ],
-        2: [
-            {'file': '/01module/html_structure_syntax.html', 'title': 'HTML Structure & Syntax'},
-            {'file': '/01module/essential_html_tags.html', 'title': 'Essential HTML Tags'},
-            {'file': '/01module/html_forms_inputs.html', 'title': 'HTML Forms & Inputs'},
-            {'file': '/01module/html_validation_practices.html', 'title': 'HTML Validation'},
-            {'file': '/01module/homework_html_profile.html', 'title': 'Homework: HTML Profile'},
-        ],
-        3: [
-            {'file': '/01module/introduction_to_css.html', 'title': 'Introduction to CSS'},
-            {'file': '/01module/css_syntax_and_selectors.html', 'title': 'CSS Syntax & Selectors'},
-            {'file': '/01module/css_implementation_methods.html', 'title': 'CSS Implementation'},
-            {'file': '/01module/css_colors_fonts_text.html', 'title': 'Colors, Fonts & Text'},
-            {'file': '/01module/css_box_model.html', 'title': 'CSS Box Model'},
-            {'file': '/01module/homework_css_profile.html', 'title': 'Homework: CSS Profile'},
-        ],
-        4: [
-            {'file': '/01module/css_layout_tech.html', 'title': 'CSS Layout Techniques'},
-            {'file': '/01module/responsive_design.html', 'title': 'Responsive Design'},
-            {'file': '/01module/media_queries.html', 'title': 'Media Queries'},
-            {'file': '/01module/mobile_first.html', 'title': 'Mobile-First Approach'},
-            {'file': '/01module/homework_responsive_profile.html', 'title': 'Homework: Responsive'},
-        ],
-        5: [
-            {'file': '/01module/bootstrap.html', 'title': 'Introduction to Bootstrap'},
-            {'file': '/01module/bootstrap_grid.html', 'title': 'Bootstrap Grid System'},
-            {'file': '/01module/bootstrap_components.html', 'title': 'Bootstrap Components'},
-            {'file': '/01module/css_organization_best_practices.html', 'title': 'CSS Best Practices'},
-            {'file': '/01module/css_preprocessors.html', 'title': 'CSS Preprocessors'},
-            {'file': '/01module/homework_bootstrap_profile.html', 'title': 'Homework: Bootstrap'},
-        ],
-        6: [
-            {'file': '/01module/js_intro.html', 'title': 'Introduction to JavaScript'},
-            {'file': '/01module/js_syntax_fundamentals.html', 'title': 'JS Syntax & Variables'},
-            {'file': '/01module/js_operators_and_expressions.html', 'title': 'Operators & Expressions'},
-            {'file': '/01module/js_control_flow.html', 'title': 'Control Flow'},
-            {'file': '/01module/js_functions_and_scope.html', 'title': 'Functions & Scope'},
-            {'file': '/01module/homework_simple_js_programs.html', 'title': 'Homework: JS Programs'},
-        ],
-        7: [
-            {'file': '/01module/understanding_dom.html', 'title': 'Understanding the DOM'},
-            {'file': '/01module/dom_selection_manipulation.html', 'title': 'DOM Selection'},
-            {'file': '/01module/event_handling.html', 'title': 'Event Handling'},
-            {'file': '/01module/creating_removing_elements.html', 'title': 'Creating Elements'},
-            {'file': '/01module/form_validation.html', 'title': 'Form Validation'},
-            {'file': '/01module/homework_interactive.html', 'title': 'Homework: Interactive'},
-        ],
-        8: [
-            {'file': '/01module/es6_overview.html', 'title': 'ES6+ Features'},
-            {'file': '/01module/jquery_intro.html', 'title': 'Introduction to jQuery'},
-            {'file': '/01module/jquery_dom_manipulation.html', 'title': 'jQuery DOM'},
-            {'file': '/01module/jquery_animations_and_effects.html', 'title': 'jQuery Animations'},
-            {'file': '/01module/jquery_ajax.html', 'title': 'AJAX with jQuery'},
-            {'file': '/01module/homework_jquery_refactor.html', 'title': 'Homework: jQuery'},
-        ],
-        9: [
-            {'file': '/01module/php_and_wordpress.html', 'title': 'PHP and WordPress'},
-            {'file': '/01module/php_setup_xampp_mamp.html', 'title': 'PHP Setup'},
-            {'file': '/01module/php_syntax.html', 'title': 'PHP Syntax'},
-            {'file': '/01module/php_variables_data_and_operators.html', 'title': 'PHP Variables'},
-            {'file': '/01module/php_includes.html', 'title': 'PHP Includes'},
-            {'file': '/01module/homework_simple_php.html', 'title': 'Homework: PHP Script'},
-        ],
-        10: [
-            {'file': '/01module/planning_website.html', 'title': 'Planning a Website'},
-            {'file': '/01module/creating_layout.html', 'title': 'Creating Layout'},
-            {'file': '/01module/adding_interactivity_with_js.html', 'title': 'Adding Interactivity'},
-            {'file': '/01module/php_header_footer.html', 'title': 'PHP Header/Footer'},
-            {'file': '/01module/project_static_site.html', 'title': 'Project: Static Site'},
-        ],
-    }
-    return session_lessons.get(session_number, [])
-
-import os
-import re
-from bs4 import BeautifulSoup
-import sys
+    session = COURSE.session(MODULE_NUMBER, session_number)
+    if session is None:
+        return []
+    return [{'file': lesson.url, 'title': lesson.sidebar_title} for lesson in session.lessons]
 
 def get_module_files(module_dir):
     """Get all HTML files in a module directory."""
@@ -108,10 +45,7 @@ def get_module_files(module_dir):
 def extract_navigation_from_reference(reference_file):
     """Extract the navigation structure from a reference file (02 or 03 module)."""
     try:
-        with open(reference_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = get_store().soup(reference_file)
         
         # Find the sidebar navigation
         sidebar_nav = soup.find('div', class_='sidebar-nav')
@@ -126,162 +60,68 @@ def extract_navigation_from_reference(reference_file):
 
 def get_session_navigation_info(current_file):
     """Get the previous and next session links based on current file."""
-    # Map files to their sessions based on module1.html structure
-    file_to_session = {
-        # Session 1: Introduction to Web Development & Setup
-        'course_introduction.html': 1,
-        'how_web_works.html': 1,
-        'development_environment.html': 1,
-        'first_html_page.html': 1,
-        'homework_setup.html': 1,
-        
-        # Session 2: HTML Fundamentals
-        'html_structure_syntax.html': 2,
-        'essential_html_tags.html': 2,
-        'html_forms_inputs.html': 2,
-        'html_validation_practices.html': 2,
-        'homework_html_profile.html': 2,
-        
-        # Session 3: CSS Basics
-        'introduction_to_css.html': 3,
-        'css_syntax_and_selectors.html': 3,
-        'css_implementation_methods.html': 3,
-        'css_colors_fonts_text.html': 3,
-        'css_box_model.html': 3,
-        'homework_css_profile.html': 3,
-        
-        # Session 4: CSS Layout & Responsive Design
-        'css_layout_tech.html': 4,
-        'responsive_design.html': 4,
-        'media_queries.html': 4,
-        'mobile_first.html': 4,
-        'homework_responsive_profile.html': 4,
-        
-        # Session 5: CSS Frameworks & Best Practices
-        'bootstrap.html': 5,
-        'bootstrap_grid.html': 5,
-        'bootstrap_components.html': 5,
-        'bootstrap_utilities.html': 5,  # Added missing file
-        'css_organization_best_practices.html': 5,
-        'css_preprocessors.html': 5,
-        'homework_bootstrap_profile.html': 5,
-        
-        # Session 6: JavaScript Fundamentals
-        'js_intro.html': 6,
-        'js_syntax_fundamentals.html': 6,
-        'js_operators_and_expressions.html': 6,
-        'js_control_flow.html': 6,
-        'js_functions_and_scope.html': 6,
-        'homework_simple_js_programs.html': 6,
-        
-        # Session 7: DOM Manipulation with JavaScript
-        'understanding_dom.html': 7,
-        'dom_selection_manipulation.html': 7,
-        'event_handling.html': 7,
-        'creating_removing_elements.html': 7,
-        'form_validation.html': 7,
-        'homework_interactive.html': 7,
-        
-        # Session 8: Modern JavaScript & jQuery
-        'es6_overview.html': 8,
-        'jquery_intro.html': 8,
-        'jquery_dom_manipulation.html': 8,
-        'jquery_animations_and_effects.html': 8,
-        'jquery_ajax.html': 8,
-        'homework_jquery_refactor.html': 8,
-        
-        # Session 9: Introduction to PHP
-        'php_and_wordpress.html': 9,
-        'php_setup_xampp_mamp.html': 9,
-        'php_syntax.html': 9,
-        'php_variables_data_and_operators.html': 9,
-        'php_includes.html': 9,
-        'homework_simple_php.html': 9,
-        
-        # Session 10: Mini-Project: Static Website
-        'planning_website.html': 10,
-        'creating_layout.html': 10,
-        'adding_interactivity_with_js.html': 10,
-        'php_header_footer.html': 10,
-        'project_static_site.html': 10,
-    }
-    
-    # First lesson of each session - VERIFIED from module1.html
-    session_first_lessons = {
-        1: {'file': '/01module/course_introduction.html', 'title': 'Session 1: Setup'},
-        2: {'file': '/01module/html_structure_syntax.html', 'title': 'Session 2: HTML'},
-        3: {'file': '/01module/introduction_to_css.html', 'title': 'Session 3: CSS'},
-        4: {'file': '/01module/css_layout_tech.html', 'title': 'Session 4: Layout'},
-        5: {'file': '/01module/bootstrap.html', 'title': 'Session 5: Bootstrap'},
-        6: {'file': '/01module/js_intro.html', 'title': 'Session 6: JavaScript'},
-        7: {'file': '/01module/understanding_dom.html', 'title': 'Session 7: DOM'},
-        8: {'file': '/01module/es6_overview.html', 'title': 'Session 8: Modern JS'},
-        9: {'file': '/01module/php_and_wordpress.html', 'title': 'Session 9: PHP'},
-        10: {'file': '/01module/planning_website.html', 'title': 'Session 10: Project'},
-    }
-    
-    # Get filename from path
-    import os
+    # Sessions and their lessons come from the course manifest (course.json)
     filename = os.path.basename(current_file)
+    lesson = COURSE.lesson(MODULE_FOLDER, filename)
     
-    # Get current session
-    current_session = file_to_session.get(filename)
-    
-    if not current_session:
+    if not lesson:
         print(f"  ⚠ Warning: No session mapping for {filename}")
         return None
     
+    current_session = lesson.session
     result = {'current_session': current_session}
     
     # Get previous session link (if not first session)
-    if current_session > 1:
-        prev_session = current_session - 1
-        result['prev'] = session_first_lessons[prev_session]['file']
-        result['prev_title'] = session_first_lessons[prev_session]['title']
-    
-    # Get next session link (if not last session)  
-    if current_session < 10:
-        next_session = current_session + 1
-        result['next'] = session_first_lessons[next_session]['file']
-        result['next_title'] = session_first_lessons[next_session]['title']
-    elif current_session == 10:
-        # Last session links to Module 2 first lesson
-        result['next'] = '/02module/review_php_setup.html'
-        result['next_title'] = 'Module 2: PHP Setup'
+    prev_session = COURSE.session(MODULE_NUMBER, current_session - 1)
+    if prev_session:
+        result['prev'] = prev_session.lessons[0].url
+        result['prev_title'] = f"Session {prev_session.number}: {prev_session.short_name}"
+    
+    # Get next session link; the last session links to Module 2 first lesson
+    next_session = COURSE.session(MODULE_NUMBER, current_session + 1)
+    if next_session:
+        result['next'] = next_session.lessons[0].url
+        result['next_title'] = f"Session {next_session.number}: {next_session.short_name}"
+    else:
+        result['next'] = NEXT_MODULE_LINK
+        result['next_title'] = NEXT_MODULE_TITLE
     
     return result
 
 def create_01module_navigation(current_file=None):
     """Create the proper navigation structure for Module 1."""
     # Get session navigation info if current file is provided
+    nav_info = get_session_navigation_info(current_file) if current_file else None
+    return build_session_navigation(nav_info)
+
+def build_session_navigation(nav_info):
+    """Render the Module 1 sidebar for a session (None: the session overview)."""
     prev_session_html = ""
     next_session_html = ""
     current_session_num = ""
     session_lessons_html = ""
     current_session = None
     
-    if current_file:
-        nav_info = get_session_navigation_info(current_file)
-        if nav_info:
-            current_session = nav_info['current_session']
-            # Get current session number for the header
-            current_session_num = f"Session {current_session}"
-            
-            # Add previous session link if available
-            if 'prev' in nav_info:
-                prev_session_html = f'''                                    <li><a href="{nav_info['prev']}" class="sidebar-link prev-session">← Prev: {nav_info['prev_title']}</a></li>\n'''
-            
-            # Add next session link if available
-            if 'next' in nav_info:
-                next_session_html = f'''                                    <li><a href="{nav_info['next']}" class="sidebar-link next-session">Next: {nav_info['next_title']} →</a></li>\n'''
-            
-            # Get lessons for current session
-            lessons = get_session_lessons(current_session)
-            if lessons:
-                lesson_items = []
-                for lesson in lessons:
-                    lesson_items.append(f'''                                    <li><a href="{lesson['file']}" class="sidebar-link">{lesson['title']}</a></li>''')
-                session_lessons_html = '\n'.join(lesson_items)
+    if nav_info:
+        current_session = nav_info['current_session']
+        # Get current session number for the header
+        current_session_num = f"Session {current_session}"
+        
+        # Add previous session link if available
+        if 'prev' in nav_info:
+            prev_session_html = f'''                                    <li><a href="{nav_info['prev']}" class="sidebar-link prev-session">← Prev: {nav_info['prev_title']}</a></li>\n'''
+        
+        # Add next session link if available
+        if 'next' in nav_info:
+            next_session_html = f'''                                    <li><a href="{nav_info['next']}" class="sidebar-link next-session">Next: {nav_info['next_title']} →</a></li>\n'''
+        
+        # Get lessons for current session
+        lessons = get_session_lessons(current_session)
+        if lessons:
+            lesson_items = []
+            for lesson in lessons:
+                lesson_items.append(f'''                                    <li><a href="{lesson['file']}" class="sidebar-link">{lesson['title']}</a></li>''')
+            session_lessons_html = '\n'.join(lesson_items)
     
     # If no current session, default to "Sessions" and show all session links
     if not current_session_num:
@@ -320,87 +160,9 @@ def create_01module_navigation(current_file=None):
 
 def get_current_page_from_file(filepath):
     """Determine which page is current based on the filename."""
-    filename = os.path.basename(filepath)
-    # Map filenames to their lesson titles as shown in sidebar
-    page_map = {
-        # Session 1
-        'course_introduction.html': 'Course Introduction',
-        'how_web_works.html': 'How the Web Works',
-        'development_environment.html': 'Development Environment',
-        'first_html_page.html': 'Your First HTML Page',
-        'homework_setup.html': 'Homework: Setup',
-        
-        # Session 2
-        'html_structure_syntax.html': 'HTML Structure & Syntax',
-        'essential_html_tags.html': 'Essential HTML Tags',
-        'html_forms_inputs.html': 'HTML Forms & Inputs',
-        'html_validation_practices.html': 'HTML Validation',
-        'homework_html_profile.html': 'Homework: HTML Profile',
-        
-        # Session 3
-        'introduction_to_css.html': 'Introduction to CSS',
-        'css_syntax_and_selectors.html': 'CSS Syntax & Selectors',
-        'css_implementation_methods.html': 'CSS Implementation',
-        'css_colors_fonts_text.html': 'Colors, Fonts & Text',
-        'css_box_model.html': 'CSS Box Model',
-        'homework_css_profile.html': 'Homework: CSS Profile',
-        
-        # Session 4
-        'css_layout_tech.html': 'CSS Layout Techniques',
-        'responsive_design.html': 'Responsive Design',
-        'media_queries.html': 'Media Queries',
-        'mobile_first.html': 'Mobile-First Approach',
-        'homework_responsive_profile.html': 'Homework: Responsive',
-        
-        # Session 5
-        'bootstrap.html': 'Introduction to Bootstrap',
-        'bootstrap_grid.html': 'Bootstrap Grid System',
-        'bootstrap_components.html': 'Bootstrap Components',
-        'bootstrap_utilities.html': 'Bootstrap Utilities',
-        'css_organization_best_practices.html': 'CSS Best Practices',
-        'css_preprocessors.html': 'CSS Preprocessors',
-        'homework_bootstrap_profile.html': 'Homework: Bootstrap',
-        
-        # Session 6
-        'js_intro.html': 'Introduction to JavaScript',
-        'js_syntax_fundamentals.html': 'JS Syntax & Variables',
-        'js_operators_and_expressions.html': 'Operators & Expressions',
-        'js_control_flow.html': 'Control Flow',
-        'js_functions_and_scope.html': 'Functions & Scope',
-        'homework_simple_js_programs.html': 'Homework: JS Programs',
-        
-        # Session 7
-        'understanding_dom.html': 'Understanding the DOM',
-        'dom_selection_manipulation.html': 'DOM Selection',
-        'event_handling.html': 'Event Handling',
-        'creating_removing_elements.html': 'Creating Elements',
-        'form_validation.html': 'Form Validation',
-        'homework_interactive.html': 'Homework: Interactive',
-        
-        # Session 8
-        'es6_overview.html': 'ES6+ Features',
-        'jquery_intro.html': 'Introduction to jQuery',
-        'jquery_dom_manipulation.html': 'jQuery DOM',
-        'jquery_animations_and_effects.html': 'jQuery Animations',
-        'jquery_ajax.html': 'AJAX with jQuery',
-        'homework_jquery_refactor.html': 'Homework: jQuery',
-        
-        # Session 9
-        'php_and_wordpress.html': 'PHP and WordPress',
-        'php_setup_xampp_mamp.html': 'PHP Setup',
-        'php_syntax.html': 'PHP Syntax',
-        'php_variables_data_and_operators.html': 'PHP Variables',
-        'php_includes.html': 'PHP Includes',
-        'homework_simple_php.html': 'Homework: PHP Script',
-        
-        # Session 10
-        'planning_website.html': 'Planning a Website',
-        'creating_layout.html': 'Creating Layout',
-        'adding_interactivity_with_js.html': 'Adding Interactivity',
-        'php_header_footer.html': 'PHP Header/Footer',
-        'project_static_site.html': 'Project: Static Site',
-    }
-    return page_map.get(filename, '')
+    # The lesson's title as shown in the sidebar
+    lesson = COURSE.lesson(MODULE_FOLDER, os.path.basename(filepath))
+    return lesson.sidebar_title if lesson else ''
 
 def update_navigation_with_active(navigation_html, current_page):
     """Add the 'active' class to the current page in navigation."""
@@ -456,6 +218,62 @@ def update_navigation_with_active(navigation_html, current_page):
     
     return str(soup)
 
+class SessionNavigation:
+    """
+    A session's sidebar, rendered once and shared by all of its lessons.
+    The markup is normalized the way update_navigation_with_active() writes
+    it, and the offsets where each lesson's link takes its active state are
+    found up front, so with_active() is a splice instead of a reparse.
+    """
+    
+    def __init__(self, navigation_html):
+        self.html = str(BeautifulSoup(navigation_html, 'html.parser'))
+        # Link text -> the insertions that mark that link (and its <li>) active
+        self.active_edits = {}
+        open_li = None
+        open_link = None
+        for token in iter_tags(self.html):
+            if token.name == 'li' and not token.closing:
+                open_li = token
+            elif token.name == 'a' and not token.closing:
+                open_link = token if token.has_class('sidebar-link') and not (
+                    token.has_class('next-session') or token.has_class('prev-session')) else None
+            elif token.name == 'a' and open_link is not None:
+                text = unescape(self.html[open_link.end:token.start]).strip()
+                edits = [class_edit(open_link)]
+                if open_li is not None:
+                    edits.insert(0, class_edit(open_li))
+                self.active_edits.setdefault(text, []).extend(edits)
+                open_link = None
+            elif token.name == 'li' and token.closing:
+                open_li = None
+    
+    def with_active(self, current_page):
+        """The sidebar with current_page's link marked active."""
+        edits = self.active_edits.get(current_page)
+        return apply_edits(self.html, edits) if edits else self.html
+
+def class_edit(token):
+    """The insertion that adds the 'active' class to a start tag."""
+    attrs_start = token.start + 1 + len(token.name)
+    for match in ATTR_PATTERN.finditer(token.attrs):
+        if match.group(1).lower() == 'class' and match.group(2) is not None:
+            offset = attrs_start + match.end(2)
+            return (offset, offset, ' active' if match.group(2) else 'active')
+    offset = token.end - 1
+    return (offset, offset, ' class="active"')
+
+# Rendered sidebars by session number (None: no session), per process
+_session_navigation = {}
+
+def session_navigation(current_file):
+    """The shared SessionNavigation of the session a lesson belongs to."""
+    nav_info = get_session_navigation_info(current_file)
+    session = nav_info['current_session'] if nav_info else None
+    if session not in _session_navigation:
+        _session_navigation[session] = SessionNavigation(build_session_navigation(nav_info))
+    return _session_navigation[session]
+
 def add_sidebar_assets(soup):
     """Add sidebar enhancement CSS and toggle functionality to the HTML."""
     added_something = False
@@ -463,7 +281,7 @@ def add_sidebar_assets(soup):
     
     if head:
         # Check and add sidebar-enhanced.css
-        existing_enhanced_css = soup.find('link', {'href': '/assets/css/sidebar-enhanced.css'})
+        existing_enhanced_css = find_asset_tag(soup, 'link', 'href', '/assets/css/sidebar-enhanced.css')
         if not existing_enhanced_css:
             enhanced_css = soup.new_tag('link', rel='stylesheet', href='/assets/css/sidebar-enhanced.css')
             main_css = head.find('link', {'href': '/assets/css/main.css'})
@@ -474,7 +292,7 @@ def add_sidebar_assets(soup):
             added_something = True
         
         # Check and add sidebar-toggle.css
-        existing_toggle_css = soup.find('link', {'href': '/assets/css/sidebar-toggle.css'})
+        existing_toggle_css = find_asset_tag(soup, 'link', 'href', '/assets/css/sidebar-toggle.css')
         if not existing_toggle_css:
             toggle_css = soup.new_tag('link', rel='stylesheet', href='/assets/css/sidebar-toggle.css')
             # Add after sidebar-enhanced.css
@@ -493,7 +311,7 @@ def add_sidebar_assets(soup):
     body = soup.find('body')
     if body:
         # Check if sidebar-toggle.js already exists
-        existing_toggle_js = soup.find('script', {'src': '/assets/js/sidebar-toggle.js'})
+        existing_toggle_js = find_asset_tag(soup, 'script', 'src', '/assets/js/sidebar-toggle.js')
         if not existing_toggle_js:
             toggle_js = soup.new_tag('script', src='/assets/js/sidebar-toggle.js')
             body.append(toggle_js)
@@ -501,17 +319,89 @@ def add_sidebar_assets(soup):
     
     return added_something
 
-def fix_navigation_in_file(filepath, navigation_template):
-    """Fix the navigation in a single HTML file."""
+# Sidebar stylesheets in head order, and the toggle script added before </body>
+SIDEBAR_CSS_HREFS = ['/assets/css/sidebar-enhanced.css', '/assets/css/sidebar-toggle.css']
+SIDEBAR_TOGGLE_SRC = '/assets/js/sidebar-toggle.js'
+TOGGLE_SCRIPT_PATTERN = re.compile(r'<script\b[^>]*\ssrc=["\']?%s' % re.escape(SIDEBAR_TOGGLE_SRC))
+
+def sidebar_asset_edits(content):
+    """
+    Splice-mode counterpart of add_sidebar_assets(): return the insertions
+    (offset, offset, markup) that add any missing sidebar CSS/JS tags.
+    A file listed in a bundle tag's data-bundle counts as present.
+    """
+    links = {}
+    scripts = set()
+    head_end = None
+    for token in iter_tags(content):
+        if token.name == 'head' and token.closing:
+            head_end = token
+        elif token.name == 'link' and not token.closing and head_end is None:
+            links.setdefault(token.get('href'), token)
+            for source in (token.get(BUNDLE_ATTR) or '').split():
+                links.setdefault(source, token)
+        elif token.name == 'script' and not token.closing:
+            scripts.update((token.get(BUNDLE_ATTR) or '').split())
+    
+    edits = []
+    missing = [href for href in SIDEBAR_CSS_HREFS if href not in links]
+    if head_end and missing:
+        # Same placement as add_sidebar_assets(): after main.css / sidebar-enhanced.css
+        anchor = links.get(SIDEBAR_CSS_HREFS[0]) or links.get('/assets/css/main.css')
+        offset = anchor.end if anchor else head_end.start
+        markup = ''.join(f'<link rel="stylesheet" href="{href}"/>' for href in missing)
+        edits.append((offset, offset, markup))
+    
+    body_end = content.rfind('</body>')
+    if body_end != -1 and SIDEBAR_TOGGLE_SRC not in scripts and not TOGGLE_SCRIPT_PATTERN.search(content):
+        edits.append((body_end, body_end, f'<script src="{SIDEBAR_TOGGLE_SRC}"></script>'))
+    
+    return edits
+
+def splice_navigation_in_file(filepath, navigation_html):
+    """
+    Replace only the sidebar-nav markup in a file (splice mode).
+    navigation_html must already carry the active state. The rest of the
+    file is left byte-identical; no document tree is built.
+    """
     try:
         print(f"Processing: {filepath}")
         
-        # Read the file
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = get_store().read_text(filepath)
+        
+        sidebar_nav = find_element(content, 'div', class_name='sidebar-nav')
+        if sidebar_nav:
+            edits = [(sidebar_nav.start, sidebar_nav.end, navigation_html)]
+            print("  ✓ Replaced existing navigation")
+        else:
+            sidebar = find_element(content, 'aside', class_name='sidebar')
+            if not sidebar:
+                print(f"  ⚠ Warning: No sidebar found in {filepath}")
+                return False
+            edits = [(sidebar.inner_start, sidebar.inner_end, navigation_html)]
+            print("  ✓ Added navigation structure to sidebar")
         
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(content, 'html.parser')
+        asset_edits = sidebar_asset_edits(content)
+        if asset_edits:
+            print("  ✓ Added sidebar enhancements and toggle")
+        
+        if write_if_changed(filepath, apply_edits(content, edits + asset_edits)):
+            print(f"  ✓ Successfully updated {os.path.basename(filepath)}")
+        else:
+            print(f"  ✓ Already up to date: {os.path.basename(filepath)}")
+        return True
+        
+    except Exception as e:
+        print(f"  ✗ Error processing {filepath}: {e}")
+        return False
+
+def fix_navigation_in_file(filepath, navigation_template):
+    """Fix the navigation in a single HTML file (full BeautifulSoup round-trip)."""
+    try:
+        print(f"Processing: {filepath}")
+        
+        # Get a private copy of the parsed document from the shared store
+        soup = get_store().mutable_soup(filepath)
         
         # Find the sidebar nav
         sidebar_nav = soup.find('div', class_='sidebar-nav')
@@ -553,17 +443,37 @@ def fix_navigation_in_file(filepath, navigation_template):
         if add_sidebar_assets(soup):
             print(f"  ✓ Added sidebar enhancements and toggle")
         
-        # Write the updated content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(str(soup))
-        
-        print(f"  ✓ Successfully updated {os.path.basename(filepath)}")
+        # Write the updated content back (only if something changed)
+        if write_if_changed(filepath, str(soup)):
+            print(f"  ✓ Successfully updated {os.path.basename(filepath)}")
+        else:
+            print(f"  ✓ Already up to date: {os.path.basename(filepath)}")
         return True
         
     except Exception as e:
         print(f"  ✗ Error processing {filepath}: {e}")
         return False
 
+def fix_lesson_navigation(filepath, mode="splice"):
+    """Build the navigation for one lesson and apply it (safe to run in a worker process)."""
+    # Get the current page for this file
+    current_page = get_current_page_from_file(filepath)
+    
+    # Navigation with active state AND next session link for this specific file:
+    # the session's sidebar is rendered once, only the active link is stamped in
+    if current_page:
+        nav_with_active = session_navigation(filepath).with_active(current_page)
+    else:
+        nav_with_active = create_01module_navigation(filepath)
+    
+    # Fix the navigation
+    if mode == "splice":
+        result = splice_navigation_in_file(filepath, nav_with_active)
+    else:
+        result = fix_navigation_in_file(filepath, nav_with_active)
+    print()  # Empty line for readability
+    return result
+
 def analyze_current_navigation(module_dir):
     """Analyze the current state of navigation in module files."""
     print("\n=== Analyzing Current Navigation Structure ===\n")
@@ -575,10 +485,7 @@ def analyze_current_navigation(module_dir):
         print(f"\n{filename}:")
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = get_store().soup(filepath)
             
             # Check for sidebar
             sidebar = soup.find('aside', class_='sidebar')
@@ -621,6 +528,15 @@ def analyze_current_navigation(module_dir):
 def main():
     """Main function to fix navigation in all 01module files."""
     
+    parser = argparse.ArgumentParser(description="Fix the side navigation in 01module files")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of worker processes (0 = all cores)")
+    parser.add_argument("--mode", choices=["splice", "soup"], default="splice",
+                        help="splice: replace only the sidebar markup, leaving the rest of "
+                             "the file byte-identical (default); soup: re-serialize the "
+                             "whole document with BeautifulSoup")
+    args = parser.parse_args()
+    
     # Define paths - handle both Windows and WSL paths
     if os.path.exists(r"\\wsl$\Ubuntu\home\practicalace\projects\php_wordpress\01module"):
         # Windows path to WSL
@@ -677,23 +593,10 @@ def main():
         print(f"No HTML files found in {module01_dir}")
         return
     
-    success_count = 0
-    fail_count = 0
-    
-    for filepath in files:
-        # Get the current page for this file
-        current_page = get_current_page_from_file(filepath)
-        
-        # Create navigation with active state AND next session link for this specific file
-        nav_template = create_01module_navigation(filepath)
-        nav_with_active = update_navigation_with_active(nav_template, current_page)
-        
-        # Fix the navigation
-        if fix_navigation_in_file(filepath, nav_with_active):
-            success_count += 1
-        else:
-            fail_count += 1
-        print()  # Empty line for readability
+    # Fix each file (across a process pool with --jobs); results keep file order
+    results = run_per_file(partial(fix_lesson_navigation, mode=args.mode), files, jobs=args.jobs)
+    success_count = sum(1 for r in results if r["result"])
+    fail_count = len(results) - success_count
     
     # Summary
     print("=" * 60)
@@ -7,8 +7,9 @@ Changes are isolated to 02module files only.
 
 import re
 from pathlib import Path
-from datetime import datetime
-import shutil
+
+from backup_store import backup_files
+from output_writer import write_if_changed
 
 def create_flowchart_svg(mermaid_content):
     """
@@ -314,8 +315,7 @@ def process_file(file_path):
         modified_content = add_module_specific_styles(modified_content)
         
         # Write the modified content back
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(modified_content)
+        write_if_changed(file_path, modified_content)
         
         return True, f"Converted {converted_count} Mermaid diagram(s) to SVG"
         
@@ -323,14 +323,11 @@ def process_file(file_path):
         return False, f"Error: {str(e)}"
 
 def backup_directory(dir_path):
-    """Create a backup of the directory."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_path = dir_path.parent / f"{dir_path.name}_mermaid_backup_{timestamp}"
-    
-    print(f"Creating backup at: {backup_path.name}")
+    """Snapshot the directory into the shared backup store."""
+    print(f"Backing up {dir_path.name} to the backup store")
     try:
-        shutil.copytree(str(dir_path), str(backup_path))
-        print("✓ Backup created successfully")
+        snapshot = backup_files([dir_path], label=f"{dir_path.name}_mermaid")["snapshot"]
+        print(f"✓ Backup saved to snapshot: {snapshot}")
         return True
     except Exception as e:
         print(f"✗ Error creating backup: {e}")
@@ -7,10 +7,11 @@ Handles multiple diagram types and ensures changes don't affect other modules.
 
 import re
 from pathlib import Path
-from datetime import datetime
-import shutil
 import html
 
+from backup_store import backup_files
+from output_writer import write_if_changed
+
 class MermaidToSVGConverter:
     """Converter for Mermaid diagrams to inline SVG."""
     
@@ -407,8 +408,7 @@ def process_html_file(file_path):
         modified_content = remove_mermaid_dependencies(modified_content)
         
         # Save modified content
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(modified_content)
+        write_if_changed(file_path, modified_content)
         
         return True, f"Converted {count} diagram(s)"
         
@@ -417,13 +417,9 @@ def process_html_file(file_path):
 
 
 def create_backup(directory):
-    """Create a timestamped backup of the directory."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_dir = directory.parent / f"{directory.name}_mermaid_backup_{timestamp}"
-    
+    """Snapshot the directory into the shared backup store."""
     try:
-        shutil.copytree(str(directory), str(backup_dir))
-        return backup_dir
+        return backup_files([directory], label=f"{directory.name}_mermaid")["snapshot"]
     except Exception as e:
         print(f"Backup failed: {e}")
         return None
@@ -449,9 +445,9 @@ def main():
     # Backup option
     response = input("Create backup? (y/n): ")
     if response.lower() == 'y':
-        backup_dir = create_backup(module_path)
-        if backup_dir:
-            print(f"✓ Backup created: {backup_dir.name}\n")
+        snapshot = create_backup(module_path)
+        if snapshot:
+            print(f"✓ Backup saved to snapshot: {snapshot}\n")
         else:
             if input("Continue without backup? (y/n): ").lower() != 'y':
                 return
@@ -6,8 +6,9 @@ Only processes files with placeholder content, leaves properly populated files u
 
 import re
 from pathlib import Path
-from datetime import datetime
-import shutil
+
+from backup_store import backup_files
+from output_writer import write_if_changed
 
 def has_placeholder_content(file_path):
     """
@@ -158,8 +159,7 @@ def update_file_content(new_file_path, old_content):
             )
         
         # Write the updated content
-        with open(new_file_path, 'w', encoding='utf-8') as f:
-            f.write(new_html)
+        write_if_changed(new_file_path, new_html)
         
         return True
         
@@ -168,13 +168,9 @@ def update_file_content(new_file_path, old_content):
         return False
 
 def create_backup(directory):
-    """Create a backup of the directory."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_dir = directory.parent / f"{directory.name}_fix_backup_{timestamp}"
-    
+    """Snapshot the directory into the shared backup store."""
     try:
-        shutil.copytree(str(directory), str(backup_dir))
-        return backup_dir
+        return backup_files([directory], label=f"{directory.name}_fix")["snapshot"]
     except Exception as e:
         print(f"Backup failed: {e}")
         return None
@@ -205,9 +201,9 @@ def main():
     # Create backup
     response = input("Create backup before proceeding? (y/n): ")
     if response.lower() == 'y':
-        backup_dir = create_backup(module_dir)
-        if backup_dir:
-            print(f"✓ Backup created: {backup_dir.name}\n")
+        snapshot = create_backup(module_dir)
+        if snapshot:
+            print(f"✓ Backup saved to snapshot: {snapshot}\n")
         else:
             if input("Continue without backup? (y/n): ").lower() != 'y':
                 return
@@ -10,6 +10,11 @@ import re
 from bs4 import BeautifulSoup
 import sys
 
+from asset_pipeline import find_asset_tag
+from course_corpus import get_store
+from fix_pipeline import register_transform
+from output_writer import write_if_changed
+
 def get_session_lessons(session_number):
     """Get all lessons for a specific session in Module 2."""
     session_lessons = {
@@ -534,7 +539,7 @@ def add_sidebar_assets(soup):
     
     if head:
         # Check and add sidebar-enhanced.css
-        existing_enhanced_css = soup.find('link', {'href': '/assets/css/sidebar-enhanced.css'})
+        existing_enhanced_css = find_asset_tag(soup, 'link', 'href', '/assets/css/sidebar-enhanced.css')
         if not existing_enhanced_css:
             enhanced_css = soup.new_tag('link', rel='stylesheet', href='/assets/css/sidebar-enhanced.css')
             main_css = head.find('link', {'href': '/assets/css/main.css'})
@@ -545,7 +550,7 @@ def add_sidebar_assets(soup):
             added_something = True
         
         # Check and add sidebar-toggle.css
-        existing_toggle_css = soup.find('link', {'href': '/assets/css/sidebar-toggle.css'})
+        existing_toggle_css = find_asset_tag(soup, 'link', 'href', '/assets/css/sidebar-toggle.css')
         if not existing_toggle_css:
             toggle_css = soup.new_tag('link', rel='stylesheet', href='/assets/css/sidebar-toggle.css')
             # Add after sidebar-enhanced.css
@@ -564,7 +569,7 @@ def add_sidebar_assets(soup):
     body = soup.find('body')
     if body:
         # Check if sidebar-toggle.js already exists
-        existing_toggle_js = soup.find('script', {'src': '/assets/js/sidebar-toggle.js'})
+        existing_toggle_js = find_asset_tag(soup, 'script', 'src', '/assets/js/sidebar-toggle.js')
         if not existing_toggle_js:
             toggle_js = soup.new_tag('script', src='/assets/js/sidebar-toggle.js')
             body.append(toggle_js)
@@ -572,67 +577,84 @@ def add_sidebar_assets(soup):
     
     return added_something
 
+def apply_navigation(soup, filepath, navigation_template, log=print):
+    """
+    Put the session navigation into a parsed page, mark its current lesson
+    and add the sidebar assets. Returns False if the page has no sidebar.
+    """
+    # Find the sidebar nav
+    sidebar_nav = soup.find('div', class_='sidebar-nav')
+    
+    if not sidebar_nav:
+        # Try to find the sidebar container
+        sidebar = soup.find('aside', class_='sidebar')
+        if sidebar:
+            # Clear existing content and add new navigation
+            sidebar.clear()
+            new_nav = BeautifulSoup(navigation_template, 'html.parser')
+            sidebar.append(new_nav)
+            log(f"  ✓ Added navigation structure to sidebar")
+        else:
+            log(f"  ⚠ Warning: No sidebar found")
+            return False
+    else:
+        # Replace existing navigation in place, so the whitespace around it
+        # stays put and a second run leaves the page unchanged
+        new_nav = BeautifulSoup(navigation_template, 'html.parser')
+        sidebar_nav.replace_with(new_nav)
+        log(f"  ✓ Replaced existing navigation")
+    
+    # Get the current page and update active state
+    current_page = get_current_page_from_file(filepath)
+    if current_page:
+        # Find the newly added sidebar-nav and update it
+        sidebar_nav = soup.find('div', class_='sidebar-nav')
+        if sidebar_nav:
+            updated_nav = update_navigation_with_active(str(sidebar_nav), current_page)
+            new_sidebar_nav = BeautifulSoup(updated_nav, 'html.parser').find('div', class_='sidebar-nav')
+            sidebar_nav.replace_with(new_sidebar_nav)
+            log(f"  ✓ Set active state for: {current_page}")
+    else:
+        log(f"  ⚠ Could not determine current page for: {os.path.basename(filepath)}")
+    
+    # Add sidebar assets (enhanced CSS and toggle functionality)
+    if add_sidebar_assets(soup):
+        log(f"  ✓ Added sidebar enhancements and toggle")
+    return True
+
 def fix_navigation_in_file(filepath, navigation_template):
     """Fix the navigation in a single HTML file."""
     try:
-        # Read the file
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Get a private copy of the parsed document from the shared store
+        soup = get_store().mutable_soup(filepath)
         
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(content, 'html.parser')
+        if not apply_navigation(soup, filepath, navigation_template):
+            return False
         
-        # Find the sidebar nav
-        sidebar_nav = soup.find('div', class_='sidebar-nav')
-        
-        if not sidebar_nav:
-            # Try to find the sidebar container
-            sidebar = soup.find('aside', class_='sidebar')
-            if sidebar:
-                # Clear existing content and add new navigation
-                sidebar.clear()
-                new_nav = BeautifulSoup(navigation_template, 'html.parser')
-                sidebar.append(new_nav)
-                print(f"  ✓ Added navigation structure to sidebar")
-            else:
-                print(f"  ⚠ Warning: No sidebar found")
-                return False
-        else:
-            # Replace existing navigation
-            parent = sidebar_nav.parent
-            sidebar_nav.decompose()
-            new_nav = BeautifulSoup(navigation_template, 'html.parser')
-            parent.append(new_nav)
-            print(f"  ✓ Replaced existing navigation")
-        
-        # Get the current page and update active state
-        current_page = get_current_page_from_file(filepath)
-        if current_page:
-            # Find the newly added sidebar-nav and update it
-            sidebar_nav = soup.find('div', class_='sidebar-nav')
-            if sidebar_nav:
-                updated_nav = update_navigation_with_active(str(sidebar_nav), current_page)
-                new_sidebar_nav = BeautifulSoup(updated_nav, 'html.parser').find('div', class_='sidebar-nav')
-                sidebar_nav.replace_with(new_sidebar_nav)
-                print(f"  ✓ Set active state for: {current_page}")
+        # Write the updated content back (only if something changed)
+        if write_if_changed(filepath, str(soup)):
+            print(f"  ✓ Successfully updated {os.path.basename(filepath)}")
         else:
-            print(f"  ⚠ Could not determine current page for: {os.path.basename(filepath)}")
-        
-        # Add sidebar assets (enhanced CSS and toggle functionality)
-        if add_sidebar_assets(soup):
-            print(f"  ✓ Added sidebar enhancements and toggle")
-        
-        # Write the updated content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(str(soup))
-        
-        print(f"  ✓ Successfully updated {os.path.basename(filepath)}")
+            print(f"  ✓ Already up to date: {os.path.basename(filepath)}")
         return True
         
     except Exception as e:
         print(f"  ✗ Error processing {filepath}: {e}")
         return False
 
+@register_transform("navigation_02module")
+def navigation_02module_transform(content, ctx):
+    """Pipeline transform: rebuild the session navigation of a 02module page."""
+    soup = BeautifulSoup(content, 'html.parser')
+    nav_template = create_02module_navigation(ctx.file_path)
+    nav_with_active = update_navigation_with_active(nav_template, get_current_page_from_file(ctx.file_path))
+    if not apply_navigation(soup, ctx.file_path, nav_with_active, log=lambda message: None):
+        return content
+    new_content = str(soup)
+    if new_content != content:
+        ctx.log(f"✅ Fixed: {ctx.file_name} - Updated session navigation")
+    return new_content
+
 def main():
     """Main function to fix navigation in all 02module files."""
     
@@ -10,6 +10,10 @@ import re
 from bs4 import BeautifulSoup
 import sys
 
+from asset_pipeline import find_asset_tag
+from course_corpus import get_store
+from output_writer import write_if_changed
+
 def get_session_lessons(session_number):
     """Get all lessons for a specific session in Module 3."""
     session_lessons = {
@@ -448,7 +452,7 @@ def add_sidebar_assets(soup):
     
     if head:
         # Check and add sidebar-enhanced.css
-        existing_enhanced_css = soup.find('link', {'href': '/assets/css/sidebar-enhanced.css'})
+        existing_enhanced_css = find_asset_tag(soup, 'link', 'href', '/assets/css/sidebar-enhanced.css')
         if not existing_enhanced_css:
             enhanced_css = soup.new_tag('link', rel='stylesheet', href='/assets/css/sidebar-enhanced.css')
             main_css = head.find('link', {'href': '/assets/css/main.css'})
@@ -459,7 +463,7 @@ def add_sidebar_assets(soup):
             added_something = True
         
         # Check and add sidebar-toggle.css
-        existing_toggle_css = soup.find('link', {'href': '/assets/css/sidebar-toggle.css'})
+        existing_toggle_css = find_asset_tag(soup, 'link', 'href', '/assets/css/sidebar-toggle.css')
         if not existing_toggle_css:
             toggle_css = soup.new_tag('link', rel='stylesheet', href='/assets/css/sidebar-toggle.css')
             # Add after sidebar-enhanced.css
@@ -478,7 +482,7 @@ def add_sidebar_assets(soup):
     body = soup.find('body')
     if body:
         # Check if sidebar-toggle.js already exists
-        existing_toggle_js = soup.find('script', {'src': '/assets/js/sidebar-toggle.js'})
+        existing_toggle_js = find_asset_tag(soup, 'script', 'src', '/assets/js/sidebar-toggle.js')
         if not existing_toggle_js:
             toggle_js = soup.new_tag('script', src='/assets/js/sidebar-toggle.js')
             body.append(toggle_js)
@@ -489,12 +493,8 @@ def add_sidebar_assets(soup):
 def fix_navigation_in_file(filepath, navigation_template):
     """Fix the navigation in a single HTML file."""
     try:
-        # Read the file
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(content, 'html.parser')
+        # Get a private copy of the parsed document from the shared store
+        soup = get_store().mutable_soup(filepath)
         
         # Find the sidebar nav
         sidebar_nav = soup.find('div', class_='sidebar-nav')
@@ -536,11 +536,11 @@ def fix_navigation_in_file(filepath, navigation_template):
         if add_sidebar_assets(soup):
             print(f"  ✓ Added sidebar enhancements and toggle")
         
-        # Write the updated content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(str(soup))
-        
-        print(f"  ✓ Successfully updated {os.path.basename(filepath)}")
+        # Write the updated content back (only if something changed)
+        if write_if_changed(filepath, str(soup)):
+            print(f"  ✓ Successfully updated {os.path.basename(filepath)}")
+        else:
+            print(f"  ✓ Already up to date: {os.path.basename(filepath)}")
         return True
         
     except Exception as e:
@@ -7,7 +7,9 @@ This script will process every HTML file and fix common issues.
 import os
 import re
 from pathlib import Path
-from datetime import datetime
+
+from backup_store import backup_files
+from output_writer import write_if_changed
 
 def fix_all_issues_in_file(filepath):
     """Fix all known issues in a single HTML file"""
@@ -83,21 +85,11 @@ def fix_all_issues_in_file(filepath):
         
         # Save if changes were made
         if content != original_content:
-            # Create backup directory if it doesn't exist
-            backup_dir = Path(filepath).parent / "backups"
-            backup_dir.mkdir(exist_ok=True)
-            
-            # Create backup with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_name = f"{Path(filepath).stem}_{timestamp}{Path(filepath).suffix}"
-            backup_path = backup_dir / backup_name
-            
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                f.write(original_content)
+            # Snapshot the original into the shared backup store
+            backup_files([filepath], label="01module_issues")
             
             # Save fixed content
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_if_changed(filepath, content)
             
             return True, fixes_made
         
@@ -142,6 +134,6 @@ print(f"Total fixes applied: {total_fixes}")
 
 if files_modified > 0:
     print(f"\n✅ Successfully fixed {files_modified} files!")
-    print("Backups have been created in the 'backups' subdirectory")
+    print("Backups have been saved in .backup_store (python scripts/backup_store.py list)")
 else:
     print("\n✅ All files are already correct!")
@@ -3,6 +3,8 @@
 Fix all HTML entities in homework_interactive.html
 """
 
+from output_writer import write_if_changed
+
 def fix_html_entities(file_path):
     """Fix HTML entities in the file"""
     
@@ -24,9 +26,10 @@ def fix_html_entities(file_path):
     content = content.replace('=&gt;', '=>')
     content = content.replace('&amp;&amp;', '&&')
     
-    # Write the fixed content back
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    # Write the fixed content back (only if something changed)
+    if not write_if_changed(file_path, content):
+        print(f"No HTML entities to fix in {file_path}")
+        return 0
     
     # Count final entities for verification
     final_count = content.count('&lt;') + content.count('&gt;') + content.count('&amp;')
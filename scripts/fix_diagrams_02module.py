@@ -13,6 +13,9 @@ import re
 import sys
 from pathlib import Path
 
+from backup_store import backup_files
+from output_writer import write_if_changed
+
 def get_base_path():
     """Get the correct base path for WSL or Windows environment."""
     if sys.platform == "win32" or os.path.exists(r"\\wsl$"):
@@ -279,11 +282,9 @@ def process_file(filepath):
             print(f"  No diagrams found in {os.path.basename(filepath)}")
             return False
         
-        # Create backup
-        backup_path = filepath + '.diagram_backup'
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"  Created backup: {os.path.basename(backup_path)}")
+        # Snapshot the original into the shared backup store
+        snapshot = backup_files([filepath], label="diagrams_02module")["snapshot"]
+        print(f"  Backup saved to snapshot {snapshot}")
         
         # Apply all fixes
         original_length = len(content)
@@ -294,8 +295,7 @@ def process_file(filepath):
         content = add_global_diagram_styles(content)
         
         # Write the fixed content
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_if_changed(filepath, content)
         
         new_length = len(content)
         print(f"  ✓ Fixed diagrams (size: {original_length:,} → {new_length:,} bytes)")
@@ -7,8 +7,9 @@ without using regex operations that could fail on escape sequences.
 
 import re
 from pathlib import Path
-from datetime import datetime
-import shutil
+
+from backup_store import backup_files
+from output_writer import write_if_changed
 
 # The 8 remaining problematic files
 PROBLEMATIC_FILES = [
@@ -148,8 +149,7 @@ def update_file_safely(new_file_path, old_content):
             )
         
         # Write the updated content
-        with open(new_file_path, 'w', encoding='utf-8') as f:
-            f.write(new_html)
+        write_if_changed(new_file_path, new_html)
         
         return True
         
@@ -158,13 +158,9 @@ def update_file_safely(new_file_path, old_content):
         return False
 
 def create_backup(directory):
-    """Create a backup of the directory."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_dir = directory.parent / f"{directory.name}_final_fix_backup_{timestamp}"
-    
+    """Snapshot the directory into the shared backup store."""
     try:
-        shutil.copytree(str(directory), str(backup_dir))
-        return backup_dir
+        return backup_files([directory], label=f"{directory.name}_final_fix")["snapshot"]
     except Exception as e:
         print(f"Backup failed: {e}")
         return None
@@ -194,9 +190,9 @@ def main():
     # Optional backup
     response = input("Create backup? (y/n): ")
     if response.lower() == 'y':
-        backup_dir = create_backup(module_dir)
-        if backup_dir:
-            print(f"✓ Backup created: {backup_dir.name}\n")
+        snapshot = create_backup(module_dir)
+        if snapshot:
+            print(f"✓ Backup saved to snapshot: {snapshot}\n")
     
     print(f"Processing {len(PROBLEMATIC_FILES)} remaining files...")
     print("-" * 70)
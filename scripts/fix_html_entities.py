@@ -5,6 +5,8 @@ Fix HTML entities in homework_interactive.html
 
 import re
 
+from output_writer import write_if_changed
+
 def fix_html_entities(content):
     """Replace HTML entities with actual characters"""
     
@@ -39,9 +41,10 @@ def main():
         # Fix HTML entities
         fixed_content = fix_html_entities(content)
         
-        # Write back the fixed content
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(fixed_content)
+        # Write back the fixed content (only if something changed)
+        if not write_if_changed(file_path, fixed_content):
+            print(f"No HTML entities to fix in {file_path}")
+            return
         
         print(f"Successfully fixed HTML entities in {file_path}")
         
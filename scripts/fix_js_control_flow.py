@@ -5,22 +5,20 @@ Fix js_control_flow.html issues
 
 import os
 import re
-import shutil
-from datetime import datetime
+
+from backup_store import backup_files
+from output_writer import write_if_changed
 
 # Configuration
 PROJECT_ROOT = r"\\wsl$\Ubuntu\home\practicalace\projects\php_wordpress"
 MODULE_DIR = os.path.join(PROJECT_ROOT, "01module")
-BACKUP_DIR = os.path.join(PROJECT_ROOT, "01module_backups", f"control_flow_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
 
 def create_backup():
-    """Create backup of js_control_flow.html."""
-    os.makedirs(BACKUP_DIR, exist_ok=True)
+    """Snapshot js_control_flow.html into the shared backup store."""
     src = os.path.join(MODULE_DIR, "js_control_flow.html")
     if os.path.exists(src):
-        dst = os.path.join(BACKUP_DIR, "js_control_flow.html")
-        shutil.copy2(src, dst)
-        print(f"Backed up to: {dst}")
+        snapshot = backup_files([src], label="control_flow")["snapshot"]
+        print(f"Backed up to snapshot: {snapshot}")
 
 def fix_js_control_flow():
     """Fix all issues in js_control_flow.html."""
@@ -137,11 +135,11 @@ def fix_js_control_flow():
         flags=re.DOTALL
     )
     
-    # Write the fixed content
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print(f"Fixed: js_control_flow.html")
+    # Write the fixed content (only if something changed)
+    if write_if_changed(filepath, content):
+        print("Fixed: js_control_flow.html")
+    else:
+        print("Already up to date: js_control_flow.html")
     return True
 
 def main():
@@ -8,6 +8,8 @@ import os
 import re
 from pathlib import Path
 
+from output_writer import write_if_changed
+
 def check_needs_mermaid(file_path):
     """Check if the HTML file contains Mermaid diagrams."""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -103,8 +105,7 @@ def process_file(file_path):
         if check_needs_mermaid(file_path):
             updated_content = add_mermaid_support(file_path)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+            write_if_changed(file_path, updated_content)
             
             return True, f"Added/fixed Mermaid support in {filename}"
         else:
@@ -8,11 +8,18 @@ Fix Mermaid diagrams in 02module files
 - Works with Windows WSL paths
 """
 
+import argparse
 import os
 import re
 import sys
 from pathlib import Path
 
+from backup_store import backup_files
+from course_corpus import get_store
+from fix_pipeline import register_transform
+from output_writer import write_if_changed
+from parallel_runner import run_per_file
+
 def get_base_path():
     """Get the correct base path for WSL or Windows environment."""
     if sys.platform == "win32" or os.path.exists(r"\\wsl$"):
@@ -131,8 +138,10 @@ def fix_overlapping_elements(svg_content):
         
         # Try to extract position
         if tag in ['rect', 'circle', 'ellipse']:
-            x_match = re.search(r'(?:x|cx)="([^"]*)"', attrs)
-            y_match = re.search(r'(?:y|cy)="([^"]*)"', attrs)
+            # Whole attribute names only: x=" also occurs in rx=" (and BeautifulSoup
+            # writes rx before x), which shifted the shapes again on every run
+            x_match = re.search(r'(?<![\w-])(?:x|cx)="([^"]*)"', attrs)
+            y_match = re.search(r'(?<![\w-])(?:y|cy)="([^"]*)"', attrs)
             
             if x_match and y_match:
                 try:
@@ -161,9 +170,9 @@ def fix_overlapping_elements(svg_content):
             # Update in SVG content
             old_match = curr['match'].group(0)
             if 'cy=' in old_match:
-                new_match = re.sub(r'cy="[^"]*"', f'cy="{new_y}"', old_match)
+                new_match = re.sub(r'(?<![\w-])cy="[^"]*"', f'cy="{new_y}"', old_match)
             else:
-                new_match = re.sub(r'y="[^"]*"', f'y="{new_y}"', old_match)
+                new_match = re.sub(r'(?<![\w-])y="[^"]*"', f'y="{new_y}"', old_match)
             
             svg_content = svg_content.replace(old_match, new_match, 1)
     
@@ -220,9 +229,11 @@ def fix_svg_viewbox_and_size(content):
         inner = fix_overlapping_elements(inner)
         
         # Extract or calculate dimensions
-        width_match = re.search(r'width="(\d+)"', attrs)
-        height_match = re.search(r'height="(\d+)"', attrs)
-        viewbox_match = re.search(r'viewBox="([^"]*)"', attrs)
+        # Attribute names are case-insensitive (BeautifulSoup writes viewbox),
+        # and width=" must not match stroke-width="
+        width_match = re.search(r'(?<![\w-])width="(\d+)"', attrs)
+        height_match = re.search(r'(?<![\w-])height="(\d+)"', attrs)
+        viewbox_match = re.search(r'viewBox="([^"]*)"', attrs, re.IGNORECASE)
         
         # If no viewBox, try to calculate from content
         if not viewbox_match and (width_match and height_match):
@@ -363,8 +374,10 @@ rect, circle, polygon, ellipse {
 </style>
 '''
     
-    # Remove old Mermaid styles if they exist
-    content = re.sub(r'<style>\s*/\*.*?Mermaid.*?\*/.*?</style>', '', content, flags=re.DOTALL)
+    # Remove old Mermaid styles if they exist: a style block whose first
+    # comment mentions Mermaid, with the line breaks around it, so adding
+    # the styles back gives the same page on every run
+    content = re.sub(r'\n*<style>\s*/\*[^*]*Mermaid[^*]*\*/.*?</style>\n*', '', content, flags=re.DOTALL)
     
     # Add new styles before closing </head> tag
     if '</head>' in content:
@@ -372,6 +385,27 @@ rect, circle, polygon, ellipse {
     
     return content
 
+def fix_mermaid_content(content):
+    """Apply every Mermaid fix to a page's content, in order."""
+    content = fix_mermaid_container(content)
+    content = fix_svg_viewbox_and_size(content)
+    content = remove_excessive_bottom_spacing(content)
+    content = add_mermaid_specific_styles(content)
+    
+    # Final cleanup
+    content = re.sub(r'\n{4,}', '\n\n\n', content)  # No more than 3 consecutive newlines
+    return content
+
+@register_transform("mermaid_02module")
+def mermaid_02module_transform(content, ctx):
+    """Pipeline transform: fix the Mermaid diagrams of a 02module page."""
+    if not has_mermaid_content(content):
+        return content
+    new_content = fix_mermaid_content(content)
+    if new_content != content:
+        ctx.log(f"✅ Fixed: {ctx.file_name} - Fixed Mermaid diagrams")
+    return new_content
+
 def process_file(filepath):
     """Process a single HTML file to fix Mermaid diagrams."""
     
@@ -389,27 +423,12 @@ def process_file(filepath):
         
         print(f"  ✓ Mermaid content detected")
         
-        # Create backup
-        backup_path = filepath + '.mermaid_backup'
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"  ✓ Backup created: {os.path.basename(backup_path)}")
-        
         # Apply all fixes
         original_length = len(content)
+        content = fix_mermaid_content(content)
         
-        # Apply fixes in specific order
-        content = fix_mermaid_container(content)
-        content = fix_svg_viewbox_and_size(content)
-        content = remove_excessive_bottom_spacing(content)
-        content = add_mermaid_specific_styles(content)
-        
-        # Final cleanup
-        content = re.sub(r'\n{4,}', '\n\n\n', content)  # No more than 3 consecutive newlines
-        
-        # Write the fixed content
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Write the fixed content (skipped if nothing changed)
+        write_if_changed(filepath, content)
         
         new_length = len(content)
         
@@ -435,6 +454,11 @@ def process_file(filepath):
 def main():
     """Main function to process all 02module files with Mermaid diagrams."""
     
+    parser = argparse.ArgumentParser(description="Fix Mermaid diagrams in 02module files")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of worker processes (0 = all cores)")
+    args = parser.parse_args()
+    
     print("=" * 70)
     print("Mermaid Diagram Fix Script for 02module Files")
     print("=" * 70)
@@ -459,21 +483,24 @@ def main():
     print(f"\nFound {len(html_files)} HTML files in 02module")
     print("-" * 70)
     
-    fixed_count = 0
-    mermaid_files = []
+    # Quick check for Mermaid content
+    mermaid_files = [
+        filename for filename in sorted(html_files)
+        if has_mermaid_content(get_store().read_text(os.path.join(module_path, filename)))
+    ]
     
-    # Process each file
-    for filename in sorted(html_files):
-        filepath = os.path.join(module_path, filename)
-        
-        # Quick check for Mermaid content
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        if has_mermaid_content(content):
-            mermaid_files.append(filename)
-            if process_file(filepath):
-                fixed_count += 1
+    mermaid_paths = [os.path.join(module_path, filename) for filename in mermaid_files]
+    
+    # Snapshot the originals into the shared backup store before fanning out,
+    # so every file of the run lands in one snapshot
+    snapshot = backup_files(mermaid_paths, label="mermaid_02module")["snapshot"]
+    if snapshot:
+        print(f"✓ Backup saved to snapshot {snapshot}")
+    
+    # Process each file (across a process pool with --jobs)
+    results = run_per_file(process_file, mermaid_paths, jobs=args.jobs)
+    fixed_files = {os.path.basename(r["item"]) for r in results if r["result"]}
+    fixed_count = len(fixed_files)
     
     # Summary
     print("\n" + "=" * 70)
@@ -486,7 +513,7 @@ def main():
     if mermaid_files:
         print(f"\nFiles with Mermaid diagrams that were processed:")
         for fname in mermaid_files:
-            status = "✓" if fname in [f for f in mermaid_files if process_file] else "✗"
+            status = "✓" if fname in fixed_files else "✗"
             print(f"  {status} {fname}")
     
     print("\n" + "=" * 70)
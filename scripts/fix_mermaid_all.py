@@ -8,6 +8,8 @@ import os
 import re
 from pathlib import Path
 
+from output_writer import write_if_changed
+
 def has_mermaid_content(content):
     """Check if HTML content has Mermaid diagrams"""
     return 'class="mermaid"' in content or 'pre class="mermaid"' in content
@@ -43,11 +45,8 @@ def process_file(filepath):
             # Add the fix
             fixed_content = add_mermaid_fix(content)
             
-            # Write back
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(fixed_content)
-            
-            return True
+            # Write back (only if something changed)
+            return write_if_changed(filepath, fixed_content)
         elif has_mermaid_content(content) and has_mermaid_fix(content):
             print(f"Already fixed: {filepath}")
             return False
@@ -9,6 +9,9 @@ import re
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+from fix_pipeline import register_transform
+from output_writer import write_if_changed
+
 # Base path for WSL
 BASE_PATH = r"\\wsl$\Ubuntu\home\practicalace\projects\php_wordpress"
 
@@ -134,6 +137,36 @@ def convert_mermaid_to_svg(diagram_content: str, file_key: Optional[str]) -> str
     
     return diagram_content
 
+def convert_mermaid_diagrams(content: str, file_path: str) -> Tuple[str, int]:
+    """
+    Convert or restyle every Mermaid diagram in the content.
+    Returns the (possibly unchanged) content and the number of diagrams found.
+    """
+    # Find all mermaid diagrams
+    diagrams = find_mermaid_diagrams(content)
+    
+    # Get file key for specific conversions
+    file_key = get_file_key(file_path)
+    
+    # Process diagrams in reverse order to maintain positions
+    for diagram_content, start_pos, end_pos in reversed(diagrams):
+        # Convert the diagram
+        new_content = convert_mermaid_to_svg(diagram_content, file_key)
+        
+        if new_content != diagram_content:
+            # Replace in content
+            content = content[:start_pos] + new_content + content[end_pos:]
+    
+    return content, len(diagrams)
+
+@register_transform("mermaid_diagrams")
+def mermaid_diagrams_transform(content: str, ctx) -> str:
+    """Pipeline transform: convert or restyle Mermaid diagrams."""
+    new_content, diagram_count = convert_mermaid_diagrams(content, ctx.file_path)
+    if new_content != content:
+        ctx.log(f"✅ Fixed: {ctx.file_name} - Converted {diagram_count} Mermaid diagram(s)")
+    return new_content
+
 def fix_mermaid_diagrams(file_path: str) -> bool:
     """
     Fix Mermaid diagrams in a single HTML file.
@@ -143,33 +176,17 @@ def fix_mermaid_diagrams(file_path: str) -> bool:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Find all mermaid diagrams
-        diagrams = find_mermaid_diagrams(content)
+        new_content, diagram_count = convert_mermaid_diagrams(content, file_path)
         
-        if not diagrams:
+        if not diagram_count:
             print(f"⏭️  Skipped: {os.path.basename(file_path)} - No Mermaid diagrams found")
             return False
         
-        # Get file key for specific conversions
-        file_key = get_file_key(file_path)
-        
-        # Process diagrams in reverse order to maintain positions
-        modified = False
-        for diagram_content, start_pos, end_pos in reversed(diagrams):
-            # Convert the diagram
-            new_content = convert_mermaid_to_svg(diagram_content, file_key)
-            
-            if new_content != diagram_content:
-                # Replace in content
-                content = content[:start_pos] + new_content + content[end_pos:]
-                modified = True
-        
-        if modified:
+        if new_content != content:
             # Write back to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_if_changed(file_path, new_content)
             
-            print(f"✅ Fixed: {os.path.basename(file_path)} - Converted {len(diagrams)} Mermaid diagram(s)")
+            print(f"✅ Fixed: {os.path.basename(file_path)} - Converted {diagram_count} Mermaid diagram(s)")
             return True
         else:
             print(f"⏭️  Skipped: {os.path.basename(file_path)} - Mermaid diagrams already OK")
@@ -1,5 +1,7 @@
 import os
 
+from output_writer import write_if_changed
+
 # Read the file
 file_path = r"\\wsl$\Ubuntu\home\practicalace\projects\php_wordpress\01module\html_forms_inputs.html"
 
@@ -21,7 +23,6 @@ else:
     print("mermaid-universal-fix.js is already referenced")
 
 # Write the updated content back
-with open(file_path, 'w', encoding='utf-8') as f:
-    f.write(content)
+write_if_changed(file_path, content)
 
 print("File updated successfully!")
@@ -7,6 +7,8 @@ import os
 import re
 from pathlib import Path
 
+from output_writer import write_if_changed
+
 def fix_mermaid_issues(filepath):
     """Fix mermaid-related issues in a single file"""
     
@@ -39,8 +41,7 @@ def fix_mermaid_issues(filepath):
     
     # Save if changes were made
     if content != original_content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_if_changed(filepath, content)
         return True, fixes_made
     
     return False, []
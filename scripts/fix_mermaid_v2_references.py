@@ -6,6 +6,8 @@ Fix all references to mermaid-fix-v2.js in HTML files
 import os
 import re
 
+from output_writer import write_if_changed
+
 def fix_mermaid_reference(filepath):
     """Fix mermaid-fix-v2.js references in a file"""
     try:
@@ -25,8 +27,7 @@ def fix_mermaid_reference(filepath):
         )
         
         if content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_if_changed(filepath, content)
             return True
         return False
             
@@ -8,12 +8,13 @@ import os
 import re
 import shutil
 from pathlib import Path
-from datetime import datetime
+
+from backup_store import backup_files
+from output_writer import write_if_changed
 
 # Configuration
 PROJECT_ROOT = r"\\wsl$\Ubuntu\home\practicalace\projects\php_wordpress"
 MODULE_DIR = os.path.join(PROJECT_ROOT, "01module")
-BACKUP_DIR = os.path.join(PROJECT_ROOT, "01module_backups", f"session6_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
 
 # Session 6 files to process
 SESSION_6_FILES = [
@@ -37,17 +38,15 @@ NAVIGATION_ORDER = [
 ]
 
 def create_backup():
-    """Create backup of current session 6 files."""
-    os.makedirs(BACKUP_DIR, exist_ok=True)
-    
-    for filename in SESSION_6_FILES:
-        src = os.path.join(MODULE_DIR, filename)
-        if os.path.exists(src):
-            dst = os.path.join(BACKUP_DIR, filename)
-            shutil.copy2(src, dst)
-            print(f"Backed up: {filename}")
-    
-    print(f"\nBackup created at: {BACKUP_DIR}")
+    """Snapshot the current session 6 files into the shared backup store."""
+    sources = [os.path.join(MODULE_DIR, filename) for filename in SESSION_6_FILES]
+    sources = [src for src in sources if os.path.exists(src)]
+    for src in sources:
+        print(f"Backed up: {os.path.basename(src)}")
+    
+    snapshot = backup_files(sources, label="session6")["snapshot"]
+    print(f"\nBackup saved to snapshot: {snapshot}")
+    return snapshot
 
 def rename_typo_file():
     """Rename js_syntaxx1.html if it exists."""
@@ -242,8 +241,7 @@ def process_file(filename, index):
     )
     
     # Write the updated content
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    write_if_changed(filepath, content)
     
     print(f"Fixed: {filename}")
     return True
@@ -256,7 +254,7 @@ def main():
     
     # Create backup
     print("\n1. Creating backup...")
-    create_backup()
+    snapshot = create_backup()
     
     # Rename typo file
     print("\n2. Fixing filename typo...")
@@ -277,7 +275,7 @@ def main():
     print("SUMMARY")
     print("=" * 60)
     print(f"Files processed: {success_count}/{len(NAVIGATION_ORDER)}")
-    print(f"Backup location: {BACKUP_DIR}")
+    print(f"Backup snapshot: {snapshot}")
     
     # Additional checks
     print("\n4. Verifying corrections...")
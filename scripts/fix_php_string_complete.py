@@ -11,6 +11,9 @@ import re
 import os
 import html
 
+from backup_store import backup_files
+from output_writer import write_if_changed
+
 def fix_php_string_operators_complete():
     """Comprehensive fix for the PHP string operators file."""
     
@@ -179,17 +182,12 @@ echo $html;
         
         content = '\n'.join(fixed_lines)
         
-        # Create backup
-        backup_path = abs_path + '.backup2'
-        with open(abs_path, 'r', encoding='utf-8') as f:
-            backup_content = f.read()
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            f.write(backup_content)
-        print(f"Created backup at: {backup_path}")
+        # Snapshot the original into the shared backup store
+        snapshot = backup_files([abs_path], label="php_string_complete")["snapshot"]
+        print(f"Backup saved to snapshot: {snapshot}")
         
         # Write fixed content
-        with open(abs_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_if_changed(abs_path, content)
         
         print(f"Fixed file size: {len(content)} characters")
         
@@ -556,8 +554,7 @@ def create_formatting_css():
     
     try:
         os.makedirs(os.path.dirname(css_path), exist_ok=True)
-        with open(css_path, 'w', encoding='utf-8') as f:
-            f.write(css_content)
+        write_if_changed(css_path, css_content)
         print(f"\nCreated CSS file at: {css_path}")
         print("\nAdd this line to the <head> section of your HTML:")
         print('<link href="/assets/css/php_string_operators.css" rel="stylesheet"/>')
@@ -13,6 +13,9 @@ import html
 from pathlib import Path
 import sys
 
+from backup_store import backup_files
+from output_writer import write_if_changed
+
 def get_file_path():
     """Get the correct file path based on the environment."""
     
@@ -292,17 +295,12 @@ def main():
         # Final cleanup - ensure no excessive whitespace at end
         content = content.rstrip() + '\n'
         
-        # Create backup
-        backup_path = file_path + '.backup_final'
-        with open(file_path, 'r', encoding='utf-8') as f:
-            backup_content = f.read()
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            f.write(backup_content)
-        print(f"Created backup at: {backup_path}")
+        # Snapshot the original into the shared backup store
+        snapshot = backup_files([file_path], label="php_string_final")["snapshot"]
+        print(f"Backup saved to snapshot: {snapshot}")
         
         # Write fixed content
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_if_changed(file_path, content)
         
         print(f"Fixed size: {len(content):,} characters")
         
@@ -496,8 +494,7 @@ p {
     
     try:
         os.makedirs(os.path.dirname(css_path), exist_ok=True)
-        with open(css_path, 'w', encoding='utf-8') as f:
-            f.write(css_content)
+        write_if_changed(css_path, css_content)
         print(f"\nCreated clean CSS file at: {css_path}")
         print("\nAdd this line to the <head> section of your HTML:")
         print('<link href="/assets/css/php_string_operators_clean.css" rel="stylesheet"/>')
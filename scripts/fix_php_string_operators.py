@@ -11,6 +11,9 @@ import re
 import os
 from pathlib import Path
 
+from backup_store import backup_files
+from output_writer import write_if_changed
+
 def fix_php_string_operators():
     """Main function to fix all issues in the file."""
     
@@ -197,18 +200,12 @@ def fix_php_string_operators():
 </body>
 </html>"""
         
-        # Step 8: Create backup of original file
-        backup_path = abs_path + '.backup'
-        if not os.path.exists(backup_path):
-            with open(abs_path, 'r', encoding='utf-8') as original:
-                backup_content = original.read()
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                f.write(backup_content)
-            print(f"Created backup at: {backup_path}")
+        # Step 8: Snapshot the original into the shared backup store
+        snapshot = backup_files([abs_path], label="php_string_operators")["snapshot"]
+        print(f"Backup saved to snapshot: {snapshot}")
         
         # Step 9: Write the fixed content
-        with open(abs_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_if_changed(abs_path, content)
         
         print(f"File successfully fixed!")
         print(f"Final file size: {len(content)} characters")
@@ -445,8 +442,7 @@ section li {
     
     try:
         os.makedirs(os.path.dirname(css_path), exist_ok=True)
-        with open(css_path, 'w', encoding='utf-8') as f:
-            f.write(css_fixes)
+        write_if_changed(css_path, css_fixes)
         print(f"\nCreated additional CSS fixes at: {css_path}")
         print("Add this to your HTML head section:")
         print('<link href="/assets/css/php_string_operators_fixes.css" rel="stylesheet"/>')
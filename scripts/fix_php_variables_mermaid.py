@@ -6,6 +6,8 @@ Replaces broken mermaid diagrams with working inline SVG versions.
 
 import re
 
+from output_writer import write_if_changed
+
 def replace_mermaid_diagrams(content):
     """Replace all mermaid diagrams with SVG equivalents"""
     
@@ -234,8 +236,7 @@ def main():
     if updated_content != content:
         # Write back to the same file
         print(f"Writing updated content back to: {input_file}")
-        with open(input_file, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+        write_if_changed(input_file, updated_content)
         print("✓ File updated successfully!")
         
         # Check the changes
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+In-process fix pipeline for the course HTML files.
+
+Fixers register a content transform (content, context) -> content and
+validators register a read-only check. Each file is read once, passed through
+every transform in order, checked, and written back at most once.
+"""
+
+import importlib
+import os
+from typing import Callable, Dict, List, Optional
+
+from course_corpus import get_store
+from output_writer import write_if_changed
+
+# Registered transforms and checks, by name
+TRANSFORMS: Dict[str, Callable] = {}
+CHECKS: Dict[str, Callable] = {}
+
+
+class FileContext:
+    """Per-file state handed to every transform and check."""
+
+    def __init__(self, file_path: str, module: str):
+        self.file_path = file_path
+        self.file_name = os.path.basename(file_path)
+        self.module = module
+        self.messages: List[str] = []
+        self.results: Dict[str, Dict] = {}
+        self.modified = False
+        self.error: Optional[str] = None
+
+    def log(self, message: str) -> None:
+        """Record a message to print in the file's report."""
+        self.messages.append(message)
+
+
+def register_transform(name: str):
+    """Decorator registering a content transform under a name."""
+    def decorator(func: Callable) -> Callable:
+        TRANSFORMS[name] = func
+        return func
+    return decorator
+
+
+def register_check(name: str):
+    """Decorator registering a read-only check under a name."""
+    def decorator(func: Callable) -> Callable:
+        CHECKS[name] = func
+        return func
+    return decorator
+
+
+def load_fixers(module_names: List[str]) -> None:
+    """Import fixer modules by name; importing one registers its transforms and checks."""
+    for name in module_names:
+        importlib.import_module(name)
+
+
+def process_file(file_path: str, module: str, transforms: List[str],
+                 checks: List[str], dry_run: bool = False) -> FileContext:
+    """Run every transform, then every check, over a single file."""
+    ctx = FileContext(file_path, module)
+    store = get_store()
+    original = store.read_text(file_path)
+    content = original
+
+    for name in transforms:
+        content = TRANSFORMS[name](content, ctx)
+
+    for name in checks:
+        ctx.results[name] = CHECKS[name](content, ctx)
+
+    ctx.modified = content != original
+    if ctx.modified and not dry_run:
+        write_if_changed(file_path, content)
+
+    return ctx
+
+
+def run_pipeline(base_path: str, modules: List[str], transforms: List[str],
+                 checks: Optional[List[str]] = None, dry_run: bool = False) -> List[FileContext]:
+    """
+    Run the pipeline over every HTML file in the given modules.
+    Returns the per-file contexts in processing order.
+    """
+    checks = checks or []
+    unknown = [n for n in transforms if n not in TRANSFORMS] + [n for n in checks if n not in CHECKS]
+    if unknown:
+        raise KeyError(f"Unregistered pipeline step(s): {', '.join(unknown)}")
+
+    contexts = []
+    for module in modules:
+        module_path = os.path.join(base_path, module)
+        if not os.path.exists(module_path):
+            print(f"❌ Module directory not found: {module_path}")
+            continue
+
+        print(f"\n📁 Processing module: {module}")
+        print("=" * 50)
+
+        for file_path in get_store().html_files(module_path):
+            try:
+                ctx = process_file(file_path, module, transforms, checks, dry_run)
+            except Exception as e:
+                ctx = FileContext(file_path, module)
+                ctx.error = str(e)
+                print(f"❌ Error processing {file_path}: {str(e)}")
+                contexts.append(ctx)
+                continue
+
+            for message in ctx.messages:
+                print(message)
+            contexts.append(ctx)
+
+    return contexts
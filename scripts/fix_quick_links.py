@@ -9,16 +9,26 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from fix_pipeline import register_transform
+from link_graph import get_link_graph
+from output_writer import write_if_changed
+
 # Base path for WSL
 BASE_PATH = r"\\wsl$\Ubuntu\home\practicalace\projects\php_wordpress"
 
+# Pattern to pull the links out of a generated Quick Links section
+QUICK_LINK_HREF_PATTERN = re.compile(r'href="([^"]+)"')
+
 def extract_quick_links_section(content: str) -> Tuple[str, int, int]:
     """
     Extract the Quick Links section from the HTML content.
     Returns the quick links HTML, start position, and end position.
     """
-    # Pattern to find the Quick Links section
-    pattern = r'(<h4 class="sidebar-section-title">Quick Links</h4>.*?</ul>\s*</div>)'
+    # Pattern to find the Quick Links section: the heading and its list. The
+    # closing </div> of the sidebar section is left in place; matching it
+    # too dropped it on replacement, so a second run ran on to the next
+    # </ul></div> further down the page.
+    pattern = r'(<h4 class="sidebar-section-title">Quick Links</h4>\s*<ul\b[^>]*>.*?</ul>)'
     match = re.search(pattern, content, re.DOTALL)
     
     if match:
@@ -68,6 +78,36 @@ def generate_quick_links(nav_info: Dict[str, str], file_name: str) -> str:
     
     return quick_links
 
+def update_quick_links(content: str, module: str, file_name: str) -> Tuple[str, bool]:
+    """
+    Replace the Quick Links section with the standard one.
+    Returns the (possibly unchanged) content and whether a Quick Links
+    section was found.
+    """
+    # Extract current quick links section
+    current_links, start_pos, end_pos = extract_quick_links_section(content)
+    
+    if not current_links or start_pos == -1:
+        return content, False
+    
+    # Generate new quick links
+    nav_info = get_module_navigation_info(module, file_name)
+    new_quick_links = generate_quick_links(nav_info, file_name)
+    
+    # Check if update is needed (simple comparison)
+    if current_links.strip() == new_quick_links.strip():
+        return content, True
+    
+    return content[:start_pos] + new_quick_links + content[end_pos:], True
+
+@register_transform("quick_links")
+def quick_links_transform(content: str, ctx) -> str:
+    """Pipeline transform: standardize the Quick Links section."""
+    new_content, _ = update_quick_links(content, ctx.module, ctx.file_name)
+    if new_content != content:
+        ctx.log(f"✅ Fixed: {ctx.file_name} - Updated Quick Links")
+    return new_content
+
 def fix_quick_links(file_path: str, module: str) -> bool:
     """
     Fix the Quick Links section in a single HTML file.
@@ -77,33 +117,20 @@ def fix_quick_links(file_path: str, module: str) -> bool:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Extract current quick links section
-        current_links, start_pos, end_pos = extract_quick_links_section(content)
+        new_content, found = update_quick_links(content, module, os.path.basename(file_path))
         
-        if current_links and start_pos != -1:
-            # Get navigation info
-            file_name = os.path.basename(file_path)
-            nav_info = get_module_navigation_info(module, file_name)
-            
-            # Generate new quick links
-            new_quick_links = generate_quick_links(nav_info, file_name)
+        if not found:
+            print(f"⚠️  Warning: {os.path.basename(file_path)} - No Quick Links section found")
+            return False
+        
+        if new_content != content:
+            # Write back to file
+            write_if_changed(file_path, new_content)
             
-            # Check if update is needed (simple comparison)
-            if current_links.strip() != new_quick_links.strip():
-                # Replace in content
-                new_content = content[:start_pos] + new_quick_links + content[end_pos:]
-                
-                # Write back to file
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
-                
-                print(f"✅ Fixed: {os.path.basename(file_path)} - Updated Quick Links")
-                return True
-            else:
-                print(f"⏭️  Skipped: {os.path.basename(file_path)} - Quick Links already correct")
-                return False
+            print(f"✅ Fixed: {os.path.basename(file_path)} - Updated Quick Links")
+            return True
         else:
-            print(f"⚠️  Warning: {os.path.basename(file_path)} - No Quick Links section found")
+            print(f"⏭️  Skipped: {os.path.basename(file_path)} - Quick Links already correct")
             return False
             
     except Exception as e:
@@ -139,6 +166,23 @@ def process_module(module: str) -> Dict[str, int]:
     
     return stats
 
+def report_missing_targets(modules: List[str]) -> None:
+    """
+    Warn about Quick Links that point at pages which do not exist, with how
+    many lessons link to each (from the site link graph).
+    """
+    graph = get_link_graph(BASE_PATH)
+    targets = set()
+    for module in modules:
+        nav_info = get_module_navigation_info(module, "")
+        targets.update(QUICK_LINK_HREF_PATTERN.findall(generate_quick_links(nav_info, "")))
+    
+    for target in sorted(targets):
+        page = target.lstrip('/') or 'index.html'
+        if not os.path.exists(os.path.join(BASE_PATH, page)):
+            print(f"⚠️  Quick Links target {target} does not exist "
+                  f"(linked by {len(graph.linked_by(page))} pages)")
+
 def main():
     """
     Main function to process all modules.
@@ -168,6 +212,7 @@ def main():
     print(f"  Files skipped: {total_stats['skipped']}")
     print(f"  Errors: {total_stats['errors']}")
     print("=" * 50)
+    report_missing_targets(modules)
     print("✅ Quick Links standardization complete!")
 
 if __name__ == "__main__":
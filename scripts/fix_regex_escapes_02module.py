@@ -7,8 +7,9 @@ The main issue is that backslashes in the content are being interpreted as regex
 
 import re
 from pathlib import Path
-import shutil
-from datetime import datetime
+
+from backup_store import backup_files
+from output_writer import write_if_changed
 
 def fix_regex_escapes_in_content(content):
     """
@@ -106,9 +107,9 @@ def process_file(file_path):
         # Fix the content
         fixed_content = fix_regex_escapes_in_content(content)
         
-        # Write back the fixed content
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(fixed_content)
+        # Write back the fixed content (only if something changed)
+        if not write_if_changed(file_path, fixed_content):
+            return False, "Escapes already fixed"
         
         return True, "Fixed regex escapes"
         
@@ -116,13 +117,9 @@ def process_file(file_path):
         return False, f"Error: {str(e)}"
 
 def create_backup(directory):
-    """Create a backup of the directory."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_dir = directory.parent / f"{directory.name}_preprocess_backup_{timestamp}"
-    
+    """Snapshot the directory into the shared backup store."""
     try:
-        shutil.copytree(str(directory), str(backup_dir))
-        return backup_dir
+        return backup_files([directory], label=f"{directory.name}_preprocess")["snapshot"]
     except Exception as e:
         print(f"Backup failed: {e}")
         return None
@@ -179,9 +176,9 @@ def main():
     # Create backup
     response = input("Create backup of 02module_old before preprocessing? (y/n): ")
     if response.lower() == 'y':
-        backup_dir = create_backup(old_module_dir)
-        if backup_dir:
-            print(f"✓ Backup created: {backup_dir.name}\n")
+        snapshot = create_backup(old_module_dir)
+        if snapshot:
+            print(f"✓ Backup saved to snapshot: {snapshot}\n")
         else:
             if input("Continue without backup? (y/n): ").lower() != 'y':
                 return
@@ -5,6 +5,8 @@ Script to fix remaining code block placeholders in php_string_operators.html
 
 from pathlib import Path
 
+from output_writer import write_if_changed
+
 def fix_remaining_placeholders():
     """Replace remaining placeholders with appropriate PHP code."""
     
@@ -743,8 +745,7 @@ echo $output;
             print(f"- {placeholder} not found")
     
     # Write the fixed content back
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    write_if_changed(file_path, content)
     
     print("\n✨ All placeholders have been replaced!")
     print("The php_string_operators.html file is now complete with real code examples.")
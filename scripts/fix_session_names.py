@@ -7,70 +7,19 @@ This script adds descriptive session names to the sidebar section titles.
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from course_manifest import load_manifest
+from fix_pipeline import register_transform
+from output_writer import write_if_changed
 
 # Base path for WSL
 BASE_PATH = r"\\wsl$\Ubuntu\home\practicalace\projects\php_wordpress"
 
-# Session names mapping for each module
+# Session names for each module, from the course manifest (course.json)
 SESSION_NAMES = {
-    "01module": {
-        "Session 1": "Session 1: Introduction",
-        "Session 2": "Session 2: HTML Fundamentals", 
-        "Session 3": "Session 3: CSS Basics",
-        "Session 4": "Session 4: CSS Layout",
-        "Session 5": "Session 5: CSS Frameworks",
-        "Session 6": "Session 6: JavaScript Basics",
-        "Session 7": "Session 7: DOM Manipulation",
-        "Session 8": "Session 8: jQuery",
-        "Session 9": "Session 9: PHP Introduction",
-        "Session 10": "Session 10: Final Project"
-    },
-    "02module": {
-        "Session 1": "Session 1: PHP Basics",
-        "Session 2": "Session 2: Variables and Data Types",
-        "Session 3": "Session 3: Control Structures",
-        "Session 4": "Session 4: Functions",
-        "Session 5": "Session 5: Arrays",
-        "Session 6": "Session 6: Forms and User Input",
-        "Session 7": "Session 7: Working with Files",
-        "Session 8": "Session 8: Object-Oriented PHP",
-        "Session 9": "Session 9: Error Handling",
-        "Session 10": "Session 10: PHP Project"
-    },
-    "03module": {
-        "Session 1": "Session 1: Introduction to Databases",
-        "Session 2": "Session 2: Database Design",
-        "Session 3": "Session 3: SQL Basics",
-        "Session 4": "Session 4: Advanced SQL",
-        "Session 5": "Session 5: PHP and MySQL",
-        "Session 6": "Session 6: Database Project"
-    },
-    "04module": {
-        "Session 1": "Session 1: WordPress Introduction",
-        "Session 2": "Session 2: Docker Setup",
-        "Session 3": "Session 3: WordPress Installation",
-        "Session 4": "Session 4: WordPress Basics",
-        "Session 5": "Session 5: Content Management"
-    },
-    "05module": {
-        "Session 1": "Session 1: Theme Structure",
-        "Session 2": "Session 2: Template Hierarchy",
-        "Session 3": "Session 3: The Loop",
-        "Session 4": "Session 4: Custom Templates",
-        "Session 5": "Session 5: Theme Functions",
-        "Session 6": "Session 6: Customizer API",
-        "Session 7": "Session 7: Theme Project"
-    },
-    "06module": {
-        "Session 1": "Session 1: Plugin Basics",
-        "Session 2": "Session 2: Hooks and Filters",
-        "Session 3": "Session 3: Admin Pages and Settings",
-        "Session 4": "Session 4: Custom Post Types",
-        "Session 5": "Session 5: Shortcodes and Widgets",
-        "Session 6": "Session 6: Plugin Security",
-        "Session 7": "Session 7: Plugin Project"
-    }
+    module.folder: {f"Session {session.number}": session.label for session in module.sessions}
+    for module in load_manifest().modules if module.sessions
 }
 
 def find_session_title(content: str) -> Tuple[str, int, int]:
@@ -94,6 +43,37 @@ def get_session_name(module: str, session_text: str) -> str:
         return SESSION_NAMES[module].get(session_text, session_text)
     return session_text
 
+def update_session_title(content: str, module: str) -> Tuple[str, Optional[str]]:
+    """
+    Add the descriptive session name to the sidebar session title.
+    Returns the (possibly unchanged) content and the full session name,
+    or None if the content has no session title.
+    """
+    session_text, start_pos, end_pos = find_session_title(content)
+    
+    if not session_text or start_pos == -1:
+        return content, None
+    
+    # Get the full session name
+    full_session_name = get_session_name(module, session_text)
+    
+    # Check if it needs updating
+    current_full_text = content[start_pos:end_pos]
+    if full_session_name in current_full_text:
+        return content, full_session_name
+    
+    # Build the new h4 tag and replace it in the content
+    new_h4 = f'<h4 class="sidebar-section-title">{full_session_name}</h4>'
+    return content[:start_pos] + new_h4 + content[end_pos:], full_session_name
+
+@register_transform("session_names")
+def session_names_transform(content: str, ctx) -> str:
+    """Pipeline transform: add descriptive session names."""
+    new_content, full_session_name = update_session_title(content, ctx.module)
+    if new_content != content:
+        ctx.log(f"✅ Fixed: {ctx.file_name} - Added '{full_session_name}'")
+    return new_content
+
 def fix_session_names(file_path: str, module: str) -> bool:
     """
     Fix session names in a single HTML file.
@@ -103,33 +83,20 @@ def fix_session_names(file_path: str, module: str) -> bool:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Find the session title
-        session_text, start_pos, end_pos = find_session_title(content)
+        new_content, full_session_name = update_session_title(content, module)
+        
+        if full_session_name is None:
+            print(f"❌ No session title found in: {os.path.basename(file_path)}")
+            return False
         
-        if session_text and start_pos != -1:
-            # Get the full session name
-            full_session_name = get_session_name(module, session_text)
+        if new_content != content:
+            # Write back to file
+            write_if_changed(file_path, new_content)
             
-            # Check if it needs updating
-            current_full_text = content[start_pos:end_pos]
-            if full_session_name not in current_full_text:
-                # Build the new h4 tag
-                new_h4 = f'<h4 class="sidebar-section-title">{full_session_name}</h4>'
-                
-                # Replace in content
-                new_content = content[:start_pos] + new_h4 + content[end_pos:]
-                
-                # Write back to file
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
-                
-                print(f"✅ Fixed: {os.path.basename(file_path)} - Added '{full_session_name}'")
-                return True
-            else:
-                print(f"⏭️  Skipped: {os.path.basename(file_path)} - Already has full session name")
-                return False
+            print(f"✅ Fixed: {os.path.basename(file_path)} - Added '{full_session_name}'")
+            return True
         else:
-            print(f"❌ No session title found in: {os.path.basename(file_path)}")
+            print(f"⏭️  Skipped: {os.path.basename(file_path)} - Already has full session name")
             return False
             
     except Exception as e:
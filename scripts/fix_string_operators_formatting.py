@@ -6,6 +6,8 @@ Script to fix CSS class names and formatting in php_string_operators.html
 from pathlib import Path
 import re
 
+from output_writer import write_if_changed
+
 def fix_formatting():
     """Fix CSS class names and formatting consistency."""
     
@@ -66,8 +68,7 @@ def fix_formatting():
         content = re.sub(r'class="([^"]*?)_([^"]*?)"', r'class="\1-\2"', content)
     
     # Write the fixed content back
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    write_if_changed(file_path, content)
     
     print("\n✓ Fixed all CSS class names (underscores to hyphens)")
     print("✓ Fixed HTML entity encoding issues")
@@ -7,6 +7,8 @@ This script removes old fix and adds the new enhanced version
 import os
 import re
 
+from output_writer import write_if_changed
+
 def remove_old_mermaid_fix(content):
     """Remove any existing Mermaid fix script references"""
     # Remove the old fix script tag
@@ -66,8 +68,7 @@ def process_file(filepath):
             content = add_new_mermaid_fix(content)
             
             # Write back
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_if_changed(filepath, content)
             
             return True
         return False
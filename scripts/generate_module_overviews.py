@@ -7,6 +7,9 @@ import os
 from pathlib import Path
 from datetime import datetime
 
+from course_manifest import load_manifest
+from output_writer import write_if_changed
+
 # Base directory
 BASE_DIR = Path("/home/practicalace/projects/php_wordpress")
 
@@ -24,347 +27,9 @@ if not BASE_DIR.exists():
         print("❌ Could not find the project directory.")
         exit(1)
 
-# Module data structure
-modules_data = {
-    1: {
-        "title": "Web Development Fundamentals",
-        "subtitle": "HTML, CSS, JavaScript & Introduction to PHP",
-        "description": "Start your journey into web development with the foundational technologies. Learn HTML for structure, CSS for styling, JavaScript for interactivity, and get introduced to PHP.",
-        "duration": "10 Sessions",
-        "lessons": 57,
-        "color_primary": "#667eea",
-        "color_secondary": "#764ba2",
-        "topics": [
-            ("Introduction to Web Development", "How the web works, development environment setup"),
-            ("HTML Fundamentals", "HTML structure, tags, forms, and best practices"),
-            ("CSS Basics", "Styling, selectors, box model, and layouts"),
-            ("Responsive Design", "Mobile-first approach, media queries, flexbox, and grid"),
-            ("CSS Frameworks", "Bootstrap, utility classes, and CSS preprocessors"),
-            ("JavaScript Fundamentals", "Variables, functions, control flow, and scope"),
-            ("DOM Manipulation", "Selecting elements, events, and dynamic content"),
-            ("jQuery & Modern JS", "jQuery basics, ES6+, AJAX"),
-            ("Introduction to PHP", "PHP basics, syntax, and server setup"),
-            ("Mini-Project", "Build a complete 5-page static website")
-        ],
-        "skills": [
-            "HTML5 & Semantic Markup",
-            "CSS3 & Modern Layouts",
-            "Responsive Web Design",
-            "JavaScript Programming",
-            "jQuery Library",
-            "Basic PHP Syntax",
-            "Git Version Control",
-            "Web Development Tools"
-        ],
-        "projects": [
-            "Personal Portfolio Website",
-            "Responsive Landing Page",
-            "Interactive JavaScript Apps",
-            "Bootstrap Website",
-            "Static Multi-page Site"
-        ]
-    },
-    2: {
-        "title": "PHP Fundamentals",
-        "subtitle": "Master Server-Side Programming with PHP",
-        "description": "Deep dive into PHP programming. Learn everything from basic syntax to advanced object-oriented programming, database integration, and security best practices.",
-        "duration": "17 Topics",
-        "lessons": 122,
-        "color_primary": "#8b5cf6",
-        "color_secondary": "#ec4899",
-        "topics": [
-            ("PHP Basics & Setup", "Installation, syntax, variables, and data types"),
-            ("Operators & Control Structures", "All operators, conditionals, and loops"),
-            ("Functions", "Creating functions, scope, parameters, and closures"),
-            ("Arrays & Data Manipulation", "Indexed, associative, multidimensional arrays"),
-            ("Working with Forms", "Form handling, validation, and file uploads"),
-            ("Sessions & Cookies", "User sessions, cookies, and state management"),
-            ("Object-Oriented PHP", "Classes, objects, inheritance, interfaces"),
-            ("Database Operations", "MySQL, PDO, CRUD operations, prepared statements"),
-            ("APIs & Web Services", "JSON, REST APIs, creating endpoints"),
-            ("Security & Testing", "Security practices, debugging, unit testing")
-        ],
-        "skills": [
-            "PHP Programming",
-            "Object-Oriented PHP",
-            "Database Integration",
-            "Form Processing",
-            "API Development",
-            "Security Best Practices",
-            "Error Handling",
-            "Testing & Debugging"
-        ],
-        "projects": [
-            "PHP Calculator",
-            "Contact Form System",
-            "User Management System",
-            "Weather App with API",
-            "Blog CMS"
-        ]
-    },
-    3: {
-        "title": "MySQL Database Management",
-        "subtitle": "Master Database Design and SQL",
-        "description": "Learn professional database management with MySQL. Cover everything from basic SQL queries to advanced database design, optimization, and integration with PHP.",
-        "duration": "8 Sessions",
-        "lessons": 45,
-        "color_primary": "#f97316",
-        "color_secondary": "#ea580c",
-        "topics": [
-            ("Database Fundamentals", "RDBMS concepts, MySQL setup, and tools"),
-            ("SQL Basics", "SELECT, INSERT, UPDATE, DELETE operations"),
-            ("Database Design", "Normalization, relationships, and ER diagrams"),
-            ("Advanced SQL", "Joins, subqueries, views, and stored procedures"),
-            ("Indexes & Optimization", "Query optimization, indexes, and performance"),
-            ("Transactions & Security", "ACID properties, transactions, user privileges"),
-            ("PHP Integration", "PDO, MySQLi, prepared statements"),
-            ("Database Project", "Design and implement a complete database system")
-        ],
-        "skills": [
-            "SQL Query Writing",
-            "Database Design",
-            "Normalization",
-            "Query Optimization",
-            "Stored Procedures",
-            "Database Security",
-            "Backup & Recovery",
-            "PHP Integration"
-        ],
-        "projects": [
-            "E-commerce Database",
-            "Library Management System",
-            "Social Media Database",
-            "Inventory System",
-            "Analytics Dashboard"
-        ]
-    },
-    4: {
-        "title": "WordPress & Docker Setup",
-        "subtitle": "Professional WordPress Development Environment",
-        "description": "Set up a professional WordPress development environment using Docker. Understand WordPress architecture, core concepts, and development workflow.",
-        "duration": "6 Sessions",
-        "lessons": 35,
-        "color_primary": "#0891b2",
-        "color_secondary": "#0e7490",
-        "topics": [
-            ("Docker Fundamentals", "Containers, images, Docker Compose"),
-            ("WordPress Installation", "Setup, configuration, and administration"),
-            ("WordPress Architecture", "File structure, database, and core files"),
-            ("The WordPress Loop", "Template hierarchy and content display"),
-            ("WordPress APIs", "Options, Settings, Metadata APIs"),
-            ("Development Tools", "Debugging, WP-CLI, version control"),
-            ("Security Basics", "Hardening WordPress, security plugins"),
-            ("Performance", "Caching, optimization, and best practices")
-        ],
-        "skills": [
-            "Docker & Containerization",
-            "WordPress Installation",
-            "WordPress Configuration",
-            "Development Workflow",
-            "Debugging Tools",
-            "Version Control",
-            "Security Hardening",
-            "Performance Tuning"
-        ],
-        "projects": [
-            "Local Development Setup",
-            "Multi-site Installation",
-            "Staging Environment",
-            "Automated Backup System",
-            "Security Audit"
-        ]
-    },
-    5: {
-        "title": "WordPress Theme Development",
-        "subtitle": "Create Professional Custom Themes",
-        "description": "Master WordPress theme development from scratch. Learn template hierarchy, custom post types, theme customization, and modern development practices.",
-        "duration": "10 Sessions",
-        "lessons": 52,
-        "color_primary": "#10b981",
-        "color_secondary": "#059669",
-        "topics": [
-            ("Theme Structure", "Template files, functions.php, style.css"),
-            ("Template Hierarchy", "Page templates, post formats, archives"),
-            ("The Loop & WP_Query", "Custom queries, pagination, filtering"),
-            ("Custom Post Types & Taxonomies", "Creating custom content types"),
-            ("Menus & Widgets", "Navigation menus, widget areas, custom widgets"),
-            ("Theme Customizer", "Live preview, custom controls, selective refresh"),
-            ("Advanced Custom Fields", "ACF integration, flexible content"),
-            ("WooCommerce Integration", "E-commerce theme development"),
-            ("Responsive Themes", "Mobile-first, accessibility, performance"),
-            ("Theme Deployment", "Child themes, updates, distribution")
-        ],
-        "skills": [
-            "Theme Architecture",
-            "Template Development",
-            "Custom Post Types",
-            "Theme Customizer API",
-            "WooCommerce Themes",
-            "Responsive Design",
-            "Theme Security",
-            "Performance Optimization"
-        ],
-        "projects": [
-            "Blog Theme",
-            "Business Theme",
-            "Portfolio Theme",
-            "E-commerce Theme",
-            "Magazine Theme"
-        ]
-    },
-    6: {
-        "title": "WordPress Plugin Development",
-        "subtitle": "Extend WordPress with Custom Plugins",
-        "description": "Learn to build WordPress plugins from simple to complex. Master hooks, filters, database operations, admin interfaces, and plugin security.",
-        "duration": "8 Sessions",
-        "lessons": 48,
-        "color_primary": "#dc2626",
-        "color_secondary": "#b91c1c",
-        "topics": [
-            ("Plugin Architecture", "Structure, headers, activation/deactivation"),
-            ("Hooks & Filters", "Actions, filters, custom hooks, priorities"),
-            ("Database Operations", "Custom tables, queries, migrations"),
-            ("Admin Interfaces", "Settings pages, custom menus, options API"),
-            ("Shortcodes & Widgets", "Creating shortcodes, custom widgets"),
-            ("AJAX in Plugins", "Admin AJAX, frontend AJAX, REST API"),
-            ("Plugin Security", "Nonces, capabilities, data validation"),
-            ("OOP Plugin Development", "Classes, namespaces, autoloading"),
-            ("Testing & Debugging", "Unit tests, integration tests, debugging"),
-            ("Distribution", "WordPress.org repository, licensing, updates")
-        ],
-        "skills": [
-            "Plugin Architecture",
-            "WordPress Hooks",
-            "Database Management",
-            "Admin UI Development",
-            "AJAX Implementation",
-            "Security Practices",
-            "OOP in WordPress",
-            "Plugin Distribution"
-        ],
-        "projects": [
-            "Contact Form Plugin",
-            "Custom Post Type Plugin",
-            "Social Share Plugin",
-            "Backup Plugin",
-            "SEO Plugin"
-        ]
-    },
-    7: {
-        "title": "Advanced WordPress Development",
-        "subtitle": "REST API, Gutenberg & Modern WordPress",
-        "description": "Master advanced WordPress features including REST API development, Gutenberg block creation, React integration, and headless WordPress.",
-        "duration": "7 Sessions",
-        "lessons": 42,
-        "color_primary": "#7c3aed",
-        "color_secondary": "#6d28d9",
-        "topics": [
-            ("WordPress REST API", "Endpoints, authentication, custom routes"),
-            ("Gutenberg Blocks", "Block development, Block API, patterns"),
-            ("React for WordPress", "React basics, JSX, components, state"),
-            ("Dynamic Blocks", "Server-side rendering, attributes, controls"),
-            ("Block Patterns & Styles", "Reusable patterns, block styles, variations"),
-            ("Headless WordPress", "Decoupled architecture, JAMstack"),
-            ("GraphQL", "WPGraphQL, queries, mutations"),
-            ("Performance", "Caching, CDN, lazy loading, optimization"),
-            ("Multisite", "Network setup, management, development"),
-            ("Enterprise WordPress", "Scaling, security, deployment strategies")
-        ],
-        "skills": [
-            "REST API Development",
-            "Gutenberg Development",
-            "React.js",
-            "Headless CMS",
-            "GraphQL",
-            "Performance Tuning",
-            "Multisite Management",
-            "Enterprise Solutions"
-        ],
-        "projects": [
-            "Custom Gutenberg Blocks",
-            "REST API Application",
-            "Headless Blog",
-            "Block Pattern Library",
-            "React Dashboard"
-        ]
-    },
-    8: {
-        "title": "Deployment & DevOps",
-        "subtitle": "Professional WordPress Hosting & Deployment",
-        "description": "Learn to deploy WordPress professionally. Cover hosting options, server management, CI/CD pipelines, monitoring, and maintenance strategies.",
-        "duration": "5 Sessions",
-        "lessons": 30,
-        "color_primary": "#0ea5e9",
-        "color_secondary": "#0284c7",
-        "topics": [
-            ("Hosting Options", "Shared, VPS, dedicated, managed WordPress"),
-            ("Server Setup", "Linux, Apache/Nginx, PHP, MySQL configuration"),
-            ("SSL & Security", "SSL certificates, firewalls, security headers"),
-            ("Performance", "Caching strategies, CDN setup, optimization"),
-            ("CI/CD Pipelines", "Git workflows, automated testing, deployment"),
-            ("Backup & Recovery", "Backup strategies, disaster recovery"),
-            ("Monitoring", "Uptime, performance, error tracking, analytics"),
-            ("Maintenance", "Updates, security patches, database optimization"),
-            ("Scaling", "Load balancing, database replication, caching"),
-            ("Migration", "Site migration, domain transfer, data migration")
-        ],
-        "skills": [
-            "Server Management",
-            "DevOps Practices",
-            "CI/CD Implementation",
-            "Security Hardening",
-            "Performance Optimization",
-            "Backup Strategies",
-            "Monitoring Setup",
-            "Scaling Applications"
-        ],
-        "projects": [
-            "Production Deployment",
-            "CI/CD Pipeline",
-            "Monitoring Dashboard",
-            "Backup System",
-            "Load Testing"
-        ]
-    },
-    9: {
-        "title": "Final Project",
-        "subtitle": "Build a Complete WordPress Application",
-        "description": "Apply everything you've learned by building a complete, production-ready WordPress application from concept to deployment.",
-        "duration": "Capstone Project",
-        "lessons": 25,
-        "color_primary": "#f59e0b",
-        "color_secondary": "#d97706",
-        "topics": [
-            ("Project Planning", "Requirements, scope, timeline, architecture"),
-            ("Design Phase", "Wireframes, mockups, user experience"),
-            ("Database Design", "Schema design, relationships, optimization"),
-            ("Theme Development", "Custom theme from scratch"),
-            ("Plugin Development", "Custom functionality plugins"),
-            ("Content Strategy", "Content types, taxonomies, workflows"),
-            ("E-commerce Integration", "WooCommerce setup and customization"),
-            ("Testing", "Unit tests, integration tests, user testing"),
-            ("Deployment", "Production setup, launch checklist"),
-            ("Documentation", "User docs, developer docs, maintenance guide")
-        ],
-        "skills": [
-            "Project Management",
-            "Full-Stack Development",
-            "System Architecture",
-            "Quality Assurance",
-            "Documentation",
-            "Client Communication",
-            "Problem Solving",
-            "Professional Delivery"
-        ],
-        "projects": [
-            "Complete WordPress Site",
-            "Custom Theme",
-            "Custom Plugins",
-            "E-commerce Solution",
-            "Full Documentation"
-        ]
-    }
-}
+# Module data, from the course manifest (course.json)
+modules_data = {module.number: module.overview for module in load_manifest().modules if module.overview}
+
 
 def generate_module_html(module_num, data):
     """Generate HTML for a module overview page"""
@@ -1033,8 +698,7 @@ def main():
             print(f"📝 Generating {filename}...")
             html_content = generate_module_html(module_num, data)
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            write_if_changed(filepath, html_content)
             
             updated.append(filename)
             print(f"   ✅ Created: {filename}")
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Streaming tag tokenizer and in-place splicing for course HTML files.
+
+Fixers that only touch one region of a page (the sidebar, a <link> in the
+head) can locate it with iter_tags()/find_element() and replace just those
+characters with apply_edits(). Everything outside the edited spans stays
+byte-identical, and no document tree is built or re-serialized.
+
+The tokenizer only looks at tags: comments, doctypes and the raw-text bodies
+of <script>/<style>/<textarea>/<title> are skipped, so markup inside them
+(e.g. HTML in a JS string) is never mistaken for real elements.
+"""
+
+import re
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+# Elements that never have a closing tag
+VOID_ELEMENTS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr',
+])
+
+# Elements whose content is raw text, not markup
+RAW_TEXT_ELEMENTS = frozenset(['script', 'style', 'textarea', 'title'])
+
+# One alternation per construct so a single search() finds the next token
+TOKEN_PATTERN = re.compile(
+    r'<!--.*?(?:-->|\Z)'                      # comment
+    r'|<[!?][^>]*>'                            # doctype, CDATA, processing instruction
+    r'|<(?P<closing>/)?(?P<name>[a-zA-Z][\w:-]*)'
+    r'(?P<attrs>(?:"[^"]*"|\'[^\']*\'|[^\'">])*)>',
+    re.DOTALL,
+)
+ATTR_PATTERN = re.compile(
+    r'([^\s"\'>/=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+)))?'
+)
+
+
+class TagToken(NamedTuple):
+    """A start or end tag and its [start, end) offsets in the document."""
+    name: str
+    closing: bool
+    attrs: str
+    start: int
+    end: int
+
+    @property
+    def self_closing(self) -> bool:
+        return self.name in VOID_ELEMENTS or self.attrs.rstrip().endswith('/')
+
+    def get(self, attr: str) -> Optional[str]:
+        """Return an attribute's value ('' for bare attributes), or None."""
+        return get_attr(self.attrs, attr)
+
+    def has_class(self, class_name: str) -> bool:
+        return class_name in (self.get('class') or '').split()
+
+
+def get_attr(attrs: str, name: str) -> Optional[str]:
+    """Look up an attribute in the raw attribute text of a tag."""
+    for match in ATTR_PATTERN.finditer(attrs):
+        if match.group(1).lower() == name:
+            value = next((g for g in match.groups()[1:] if g is not None), '')
+            return value
+    return None
+
+
+def iter_tags(html: str, pos: int = 0) -> Iterator[TagToken]:
+    """Yield every start/end tag from pos onwards, in document order."""
+    search = TOKEN_PATTERN.search
+    while True:
+        match = search(html, pos)
+        if match is None:
+            return
+        pos = match.end()
+        name = match.group('name')
+        if name is None:
+            continue  # comment or declaration
+
+        token = TagToken(name.lower(), match.group('closing') is not None,
+                         match.group('attrs'), match.start(), pos)
+        yield token
+
+        # Skip the raw text of script/style/... up to its closing tag
+        if not token.closing and token.name in RAW_TEXT_ELEMENTS and not token.self_closing:
+            close = _raw_text_end(token.name).search(html, pos)
+            if close is None:
+                return
+            pos = close.start()
+
+
+_RAW_TEXT_END = {}
+
+
+def _raw_text_end(name: str):
+    """Compiled pattern for the closing tag of a raw-text element."""
+    if name not in _RAW_TEXT_END:
+        _RAW_TEXT_END[name] = re.compile(r'</%s\s*>' % name, re.IGNORECASE)
+    return _RAW_TEXT_END[name]
+
+
+def find_tag(html: str, name: str, pos: int = 0, closing: bool = False,
+             class_name: Optional[str] = None, **attrs) -> Optional[TagToken]:
+    """Return the first matching tag (start tag unless closing=True)."""
+    for token in iter_tags(html, pos):
+        if token.name != name or token.closing != closing:
+            continue
+        if class_name and not token.has_class(class_name):
+            continue
+        if any(token.get(key) != value for key, value in attrs.items()):
+            continue
+        return token
+    return None
+
+
+class ElementSpan(NamedTuple):
+    """Offsets of a whole element and of its content."""
+    start: int        # '<' of the start tag
+    inner_start: int  # just after the start tag
+    inner_end: int    # '<' of the end tag
+    end: int          # just after the end tag
+
+
+def find_element(html: str, name: str, class_name: Optional[str] = None,
+                 pos: int = 0, **attrs) -> Optional[ElementSpan]:
+    """
+    Locate the first <name> element with the given class/attributes and
+    return its span, matching nested elements of the same name. Returns None
+    if it is missing or never closed.
+    """
+    open_tag = find_tag(html, name, pos, class_name=class_name, **attrs)
+    if open_tag is None:
+        return None
+    if open_tag.self_closing:
+        return ElementSpan(open_tag.start, open_tag.end, open_tag.end, open_tag.end)
+
+    depth = 1
+    for token in iter_tags(html, open_tag.end):
+        if token.name != name or token.self_closing:
+            continue
+        depth += -1 if token.closing else 1
+        if depth == 0:
+            return ElementSpan(open_tag.start, open_tag.end, token.start, token.end)
+    return None
+
+
+def apply_edits(html: str, edits: List[Tuple[int, int, str]]) -> str:
+    """
+    Replace html[start:end] with text for every (start, end, text) edit.
+    Edits must not overlap; insertions use start == end.
+    """
+    parts = []
+    last = 0
+    for start, end, text in sorted(edits, key=lambda edit: (edit[0], edit[1])):
+        if start < last:
+            raise ValueError(f"Overlapping edits at offset {start}")
+        parts.append(html[last:start])
+        parts.append(text)
+        last = end
+    parts.append(html[last:])
+    return ''.join(parts)
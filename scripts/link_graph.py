@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Site-wide link graph shared by the link tools.
+
+Every href and src in index.html, the module*.html overviews and the lesson
+directories (01module, 02module, ..., 02extras) is resolved to a
+project-relative path and stored as an edge, together with the ids each page
+defines (for #fragment checks). The index keeps forward edges (page -> what
+it links to) and reverse edges (target -> pages linking to it), so "who
+links to X" is a dict lookup instead of a rescan of every file.
+
+The graph is persisted in .build_cache/link_graph.json with each page's
+fingerprint; update() only re-extracts pages whose content changed since the
+last run and drops pages that were deleted or moved.
+
+Usage:
+    python link_graph.py stats
+    python link_graph.py to 02module/php_if.html
+    python link_graph.py from module2.html
+    python link_graph.py unreachable
+    python link_graph.py broken [--anchors]
+"""
+
+import argparse
+import json
+import os
+import posixpath
+import re
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+from course_corpus import PROJECT_ROOT, get_store
+from html_splice import iter_tags
+
+GRAPH_FILE_NAME = "link_graph.json"
+GRAPH_VERSION = 1
+
+# Directories holding lesson pages, e.g. 02module and 02extras (not backups)
+LESSON_DIR_PATTERN = re.compile(r'^\d{2}(module|extras)$')
+
+# Top-level pages that are part of the site
+ROOT_PAGE_PATTERN = re.compile(r'^(index|module\d+)\.html$')
+
+# Links that leave the site or are not navigation at all
+EXTERNAL_PATTERN = re.compile(r'^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|//)')
+
+LINK_ATTRIBUTES = ('href', 'src')
+
+
+def resolve_link(source: str, value: str) -> Optional[Tuple[str, str]]:
+    """
+    Resolve an href/src found in page `source` to (target path, fragment).
+    Paths are project-relative and use '/'; directory links resolve to their
+    index.html. Returns None for external, mailto:, javascript: etc. links.
+    """
+    value = value.strip()
+    if not value or EXTERNAL_PATTERN.match(value):
+        return None
+
+    url, _, fragment = value.partition('#')
+    url = unquote(url.split('?', 1)[0])
+    if not url:
+        return source, fragment
+
+    if url.startswith('/'):
+        path = url.lstrip('/')
+    else:
+        path = posixpath.join(posixpath.dirname(source), url)
+    if not path or url.endswith('/'):
+        path = posixpath.join(path, 'index.html')
+    return posixpath.normpath(path), fragment
+
+
+def extract_links(source: str, html: str) -> Dict[str, List]:
+    """Return the resolved links and the element ids of one page."""
+    links = []
+    ids = []
+    seen = set()
+    for token in iter_tags(html):
+        if token.closing:
+            continue
+        for attr in LINK_ATTRIBUTES:
+            value = token.get(attr)
+            if value is None:
+                continue
+            resolved = resolve_link(source, value)
+            if resolved and resolved not in seen:
+                seen.add(resolved)
+                links.append(list(resolved))
+        element_id = token.get('id')
+        if element_id:
+            ids.append(element_id)
+        elif token.name == 'a' and token.get('name'):
+            ids.append(token.get('name'))
+    return {"links": links, "ids": sorted(set(ids))}
+
+
+class LinkGraph:
+    """Forward and reverse link index over every page of the site."""
+
+    def __init__(self, root=PROJECT_ROOT, graph_file: Optional[Path] = None):
+        self.root = Path(root)
+        self.graph_file = Path(graph_file) if graph_file else self.root / ".build_cache" / GRAPH_FILE_NAME
+        self.pages: Dict[str, Dict] = self._load()
+        self.forward: Dict[str, Set[str]] = {}
+        self.reverse: Dict[str, Set[str]] = {}
+        self._reachable: Optional[Set[str]] = None
+        self.dirty = False
+        for page, entry in self.pages.items():
+            self._add_edges(page, entry)
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.graph_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != GRAPH_VERSION:
+            return {}
+        return data.get("pages", {})
+
+    def _add_edges(self, page: str, entry: Dict) -> None:
+        targets = {target for target, _ in entry["links"]}
+        self.forward[page] = targets
+        for target in targets:
+            self.reverse.setdefault(target, set()).add(page)
+
+    def _remove_edges(self, page: str) -> None:
+        for target in self.forward.pop(page, ()):
+            sources = self.reverse.get(target)
+            if sources is not None:
+                sources.discard(page)
+                if not sources:
+                    del self.reverse[target]
+
+    def source_pages(self) -> List[str]:
+        """Project-relative paths of every page that belongs in the graph."""
+        pages = []
+        for name in sorted(os.listdir(self.root)):
+            path = self.root / name
+            if path.is_file() and ROOT_PAGE_PATTERN.match(name):
+                pages.append(name)
+            elif path.is_dir() and LESSON_DIR_PATTERN.match(name):
+                pages.extend(f"{name}/{file_name}" for file_name in sorted(os.listdir(path))
+                             if file_name.endswith('.html'))
+        return pages
+
+    def update(self, pages: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Bring the graph up to date with the files on disk. Only pages whose
+        mtime/size changed are read, and only pages whose content changed are
+        re-extracted. Pass `pages` to limit the refresh to those files.
+        """
+        stats = {"scanned": 0, "unchanged": 0, "removed": 0}
+        store = get_store()
+        full_update = pages is None
+        current = self.source_pages() if full_update else [self._relative(page) for page in pages]
+
+        for page in current:
+            path = self.root / page
+            if not path.exists():
+                if page in self.pages:
+                    del self.pages[page]
+                    self._remove_edges(page)
+                    stats["removed"] += 1
+                continue
+
+            stat = path.stat()
+            entry = self.pages.get(page)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                stats["unchanged"] += 1
+                continue
+
+            doc = store.get(path)
+            if entry and entry["sha1"] == doc.digest:
+                entry.update(mtime_ns=doc.mtime_ns, size=doc.size)
+                self.dirty = True
+                stats["unchanged"] += 1
+                continue
+
+            entry = {"mtime_ns": doc.mtime_ns, "size": doc.size, "sha1": doc.digest}
+            entry.update(extract_links(page, doc.text))
+            self._remove_edges(page)
+            self.pages[page] = entry
+            self._add_edges(page, entry)
+            stats["scanned"] += 1
+
+        if full_update:
+            for page in set(self.pages) - set(current):
+                del self.pages[page]
+                self._remove_edges(page)
+                stats["removed"] += 1
+
+        if stats["scanned"] or stats["removed"]:
+            self._reachable = None
+            self.dirty = True
+        return stats
+
+    def save(self) -> None:
+        """Persist the graph for the next run."""
+        self.graph_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.graph_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"version": GRAPH_VERSION, "pages": self.pages}, f, sort_keys=True)
+        os.replace(tmp_file, self.graph_file)
+        self.dirty = False
+
+    def _relative(self, path) -> str:
+        """Project-relative '/' path for a page given as a path or URL."""
+        path = str(path)
+        if os.path.isabs(path):
+            try:
+                return Path(path).resolve().relative_to(self.root.resolve()).as_posix()
+            except ValueError:
+                return path
+        return posixpath.normpath(path.replace(os.sep, '/').lstrip('/'))
+
+    # Queries
+
+    def links_from(self, page) -> Set[str]:
+        """Every target the page links to."""
+        return self.forward.get(self._relative(page), set())
+
+    def linked_by(self, target) -> Set[str]:
+        """Every page that links to the target."""
+        return self.reverse.get(self._relative(target), set())
+
+    def linked_from_dir(self, page, directory: str) -> Set[str]:
+        """File names in `directory` that the page links to."""
+        prefix = directory.strip('/') + '/'
+        return {target[len(prefix):] for target in self.links_from(page)
+                if target.startswith(prefix) and '/' not in target[len(prefix):]}
+
+    def pages_linking_into(self, directories: Iterable[str]) -> Set[str]:
+        """Pages that link to anything under one of the given directories."""
+        prefixes = tuple(directory.strip('/') + '/' for directory in directories)
+        return {source for target, sources in self.reverse.items()
+                if target.startswith(prefixes) for source in sources}
+
+    def default_roots(self) -> List[str]:
+        """Entry points of the course: the home page and module overviews."""
+        return [page for page in self.pages if '/' not in page]
+
+    def reachable(self, roots: Optional[Iterable[str]] = None) -> Set[str]:
+        """Pages reachable by following links from the roots."""
+        if roots is None and self._reachable is not None:
+            return self._reachable
+
+        start = [self._relative(root) for root in roots] if roots is not None else self.default_roots()
+        seen = set(start)
+        queue = deque(start)
+        while queue:
+            for target in self.forward.get(queue.popleft(), ()):
+                if target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+
+        if roots is None:
+            self._reachable = seen
+        return seen
+
+    def unreachable(self, roots: Optional[Iterable[str]] = None) -> List[str]:
+        """Indexed pages that no chain of links from the roots reaches."""
+        reachable = self.reachable(roots)
+        return sorted(page for page in self.pages if page not in reachable)
+
+    def broken_links(self, anchors: bool = False) -> List[Tuple[str, str]]:
+        """
+        (page, link) pairs whose target file does not exist. With anchors=True,
+        also report #fragments that name no id in an indexed target page.
+        """
+        exists: Dict[str, bool] = {}
+        broken = []
+        for page in sorted(self.pages):
+            for target, fragment in self.pages[page]["links"]:
+                if target not in exists:
+                    exists[target] = target in self.pages or (self.root / target).exists()
+                if not exists[target]:
+                    broken.append((page, target))
+                elif anchors and fragment and target in self.pages \
+                        and fragment not in self.pages[target]["ids"]:
+                    broken.append((page, f"{target}#{fragment}"))
+        return broken
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pages": len(self.pages),
+            "edges": sum(len(targets) for targets in self.forward.values()),
+            "targets": len(self.reverse),
+        }
+
+
+_graphs: Dict[str, LinkGraph] = {}
+
+
+def get_link_graph(root=PROJECT_ROOT, refresh: bool = True) -> LinkGraph:
+    """
+    Return the process-wide link graph for a site root, brought up to date
+    with the files on disk (and saved) unless refresh=False.
+    """
+    key = os.path.abspath(str(root))
+    graph = _graphs.get(key)
+    if graph is None:
+        graph = _graphs[key] = LinkGraph(root)
+    if refresh:
+        graph.update()
+        if graph.dirty:
+            graph.save()
+    return graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Site-wide link graph for the course pages")
+    parser.add_argument("--root", default=str(PROJECT_ROOT), help="site root (default: project root)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("stats", help="update the graph and show its size")
+
+    to_parser = commands.add_parser("to", help="pages that link to a file")
+    to_parser.add_argument("target")
+
+    from_parser = commands.add_parser("from", help="files a page links to")
+    from_parser.add_argument("page")
+
+    unreachable_parser = commands.add_parser("unreachable", help="pages not reachable from the entry points")
+    unreachable_parser.add_argument("roots", nargs="*", help="start pages (default: index.html and module*.html)")
+
+    broken_parser = commands.add_parser("broken", help="links to files that do not exist")
+    broken_parser.add_argument("--anchors", action="store_true", help="also check #fragments")
+
+    args = parser.parse_args()
+    graph = LinkGraph(args.root)
+    update = graph.update()
+    graph.save()
+
+    if args.command == "stats":
+        stats = graph.stats()
+        print(f"🔗 Link graph: {graph.graph_file}")
+        print(f"  Pages: {stats['pages']} ({update['scanned']} rescanned, "
+              f"{update['unchanged']} unchanged, {update['removed']} removed)")
+        print(f"  Links: {stats['edges']} to {stats['targets']} distinct targets")
+
+    elif args.command == "to":
+        for page in sorted(graph.linked_by(args.target)):
+            print(f"  ← {page}")
+        print(f"✅ {len(graph.linked_by(args.target))} pages link to {args.target}")
+
+    elif args.command == "from":
+        for target in sorted(graph.links_from(args.page)):
+            print(f"  → {target}")
+        print(f"✅ {args.page} links to {len(graph.links_from(args.page))} files")
+
+    elif args.command == "unreachable":
+        pages = graph.unreachable(args.roots or None)
+        for page in pages:
+            print(f"  ⚠ {page}")
+        print(f"✅ {len(pages)} unreachable pages")
+
+    elif args.command == "broken":
+        broken = graph.broken_links(args.anchors)
+        for page, link in broken:
+            print(f"  ✗ {page} → {link}")
+        print(f"✅ {len(broken)} broken links")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,8 @@ import shutil
 import sys
 from pathlib import Path
 
+from link_graph import get_link_graph
+
 def get_base_path():
     """Get the correct base path for WSL or Windows environment."""
     if sys.platform == "win32" or os.path.exists(r"\\wsl$"):
@@ -21,167 +23,27 @@ def get_base_path():
         # Linux/WSL environment
         return "/home/practicalace/projects/php_wordpress"
 
-def get_linked_files():
-    """Get list of files that ARE linked in module2.html."""
-    # These are the files currently linked in module2.html
-    linked_files = {
-        'review_php_setup.html',
-        'php_tags_basic_syntax.html',
-        'php_output_methods.html',
-        'php_comments.html',
-        'php_variables_and_data_types.html',
-        'php_constants.html',
-        'homework_php_script.html',
-        'php_arithmetic_operators.html',
-        'php_assignment_operators.html',
-        'php_comparison_operators.html',
-        'php_logical_operators.html',
-        'php_string_operators.html',
-        # Note: php_array_operators.html has empty link but file exists
-        'php_type_operators.html',
-        'php_operator_precedence.html',
-        'homework_php_calculator.html',
-        'php_if.html',
-        'php_if_else.html',
-        'php_if_elseif_else.html',
-        'php_switch.html',
-        'php_ternary.html',
-        'php_null_coalescing.html',
-        'homework_php_grades.html',
-        'php_for_loops.html',
-        'php_while_loops.html',
-        'php_do_while_loops.html',
-        'php_foreach_loops_with_arrays.html',
-        'php_control_break_continue.html',
-        'homework_php_loops.html',
-        'php_indexed_array.html',
-        'php_associative_arrays.html',
-        'php_multidimensional_arrays.html',
-        'php_array_functions.html',
-        'php_array_sorting.html',
-        'php_array_iteration.html',
-        'homework_php_array_creation_manipulation.html',
-        'php_function_declaration_and_calling.html',
-        'php_function_parameters_and return_values.html',
-        'php_default_parameter_values.html',
-        'php_variable_scope.html',
-        'php_anonymoous_functions_and_closures.html',
-        'php_built_in_php_functions_overview.html',
-        'homework_php_create_library_custom_functions.html',
-        'php_html_forms_review.html',
-        'php_get_vs_post_methods.html',
-        'php_accessing_form_data_get_post.html',
-        'php_form_validation_techniques.html',
-        'php_sanitizing_user_input.html',
-        'php_file_uploads.html',
-        # Note: homework_create_contact_form_validation.html is wrong name
-        'php_oop_concepts.html',
-        'php_creating_classes_and instantiating_objects.html',
-        'php_constructor_and_destructor.html',
-        'php_access_modifiers.html',
-        # Note: php_this_keyword.html has empty link but file exists
-        'php_static_properties_and_methods.html',
-        'homework_php_create_simple_class.html',
-        'php_inheritance.html',
-        'php_method_overriding.html',
-        'php_abstract_classes.html',
-        'php_interfaces.html',
-        'php_namespaces.html',
-        'php_traits.html',
-        'homework_php_extend_with_inheritance.html',
-        'php_planning_php_application.html',
-        'php_implementing_user_input.html',
-        'php_working_with_sessions_cookies.html',
-        'php_creating_reusable_php_components.html',
-    }
-    
-    # Add the files with broken links that should stay
-    # (they're referenced but with wrong names)
-    linked_files.add('php_array_operators.html')  # Has empty href but should stay
-    linked_files.add('php_this_keyword.html')     # Has empty href but should stay
-    
-    return linked_files
+# Lessons that stay even though module2.html does not link them
+# (their links there have an empty href)
+KEEP_IN_MODULE = {
+    'php_array_operators.html',
+    'php_this_keyword.html',
+}
 
-def get_unlinked_files():
-    """Get list of files to move to 02extras."""
-    # Complete list of files that should be moved
-    unlinked_files = {
-        # Framework Related
-        'homework_framework_project.html',
-        'intro_to_composer.html',
-        'laravel_basics.html',
-        'symfony_overview.html',
-        
-        # Database Related
-        'crud_operations.html',
-        'database_design.html',
-        'intro_to_mysql.html',
-        'php_mysql_connection.html',
-        
-        # Security
-        'common_vulnerabilities.html',
-        'homework_secure_app.html',
-        'password_hashing.html',
-        'secure_file_handling.html',
-        
-        # Testing
-        'debugging_techniques.html',
-        'homework_add_tests.html',
-        'testing_deployment.html',
-        'unit_testing_basics.html',
-        
-        # API Related
-        'api_authentication.html',
-        'consuming_apis.html',
-        'creating_api_endpoints.html',
-        'working_with_json.html',
-        
-        # Alternative/Duplicate Versions
-        'php_array_functions_broke.html',
-        'php_array_iteration_2.html',
-        'php_creating_reusable_corrected.html',
-        'php_sanitizing_user_input2.html',
-        
-        # Additional Exercises/Projects
-        'final_project_blog_cms.html',
-        'homework_contact_form.html',
-        'homework_oop_project.html',
-        'homework_optimization.html',
-        'homework_php_create_contact_form_validation.html',
-        'homework_user_management.html',
-        'homework_weather_app.html',
-        'project_php_dynamic_web_app_with_authentication.html',
-        'project_planning.html',
-        
-        # Deep Dive Topics
-        'control_structures_deep_dive.html',
-        'performance_optimization.html',
-        
-        # Other Topics
-        'arrays_and_data_manipulation.html',
-        'classes_and_objects.html',
-        'code_quality_tools.html',
-        'error_handling.html',
-        'file_uploads.html',
-        'form_validation_sanitization.html',
-        'functions_in_php.html',
-        'handling_form_data.html',
-        'implementing_features.html',
-        'inheritance_and_polymorphism.html',
-        'input_validation_techniques.html',
-        'interfaces_and_abstract_classes.html',
-        'intro_to_oop.html',
-        'mvc_architecture.html',
-        'namespaces_autoloading.html',
-        'php_fundamentals_review.html',
-        'php_setup_ubuntu.html',
-        'prepared_statements.html',
-        'regex_in_php.html',
-        'sessions_and_cookies.html',
-        'traits_and_generators.html',
+def get_linked_files(base_path=None):
+    """Get the set of 02module files that ARE linked in module2.html (or kept anyway)."""
+    graph = get_link_graph(base_path or get_base_path())
+    return graph.linked_from_dir('module2.html', '02module') | KEEP_IN_MODULE
+
+def get_unlinked_files(base_path=None):
+    """Get the set of 02module files that are NOT linked in module2.html."""
+    base_path = base_path or get_base_path()
+    module_path = os.path.join(base_path, "02module")
+    linked_files = get_linked_files(base_path)
+    return {
+        f for f in os.listdir(module_path)
+        if f.endswith('.html') and f not in linked_files
     }
-    
-    return unlinked_files
 
 def main():
     """Main function to move unlinked files to 02extras."""
@@ -212,8 +74,8 @@ def main():
         print(f"\n✓ Directory exists: 02extras")
     
     # Get lists of files
-    linked_files = get_linked_files()
-    unlinked_files = get_unlinked_files()
+    linked_files = get_linked_files(base_path)
+    unlinked_files = get_unlinked_files(base_path)
     
     print(f"\nFiles to keep in 02module: {len(linked_files)}")
     print(f"Files to move to 02extras: {len(unlinked_files)}")
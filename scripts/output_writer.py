@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Shared output layer for fixers and generators.
+
+write_if_changed() compares the new content with what is on disk and only
+writes when it differs, through a temp file + rename so a crash never leaves
+a half-written lesson. Every file that really changed is recorded in
+.build_cache/changed_files.txt (one path per line, relative to the project
+root) so a deploy can push just those. Generated files that a build stops
+producing are deleted with remove_file() and listed too, so the deploy has
+to treat a listed path that is missing as a deletion, e.g.:
+
+    rsync -av --files-from=.build_cache/changed_files.txt --delete-missing-args . server:/var/www/
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Union
+
+from course_corpus import CACHE_DIR, PROJECT_ROOT, get_store
+
+CHANGES_FILE = CACHE_DIR / "changed_files.txt"
+
+
+class ChangeLog:
+    """Appends every changed file to the invalidation list as it is written."""
+
+    def __init__(self, changes_file: Path = CHANGES_FILE):
+        self.changes_file = Path(changes_file)
+        self.changed: List[str] = []
+
+    def record(self, path) -> None:
+        """
+        Append a changed file to the list right away. Each entry is a single
+        O_APPEND write, so worker processes can record concurrently.
+        """
+        entry = self.relative(path)
+        if entry in self.changed:
+            return
+        self.changed.append(entry)
+        self.changes_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.changes_file, 'a', encoding='utf-8') as f:
+            f.write(entry + "\n")
+
+    @staticmethod
+    def relative(path) -> str:
+        """Path relative to the project root (absolute if outside it)."""
+        path = os.path.abspath(str(path))
+        try:
+            return Path(path).relative_to(PROJECT_ROOT).as_posix()
+        except ValueError:
+            return path
+
+
+def read_changed_files(changes_file: Path = CHANGES_FILE) -> List[str]:
+    """Return the unique paths in the invalidation list, in first-seen order."""
+    try:
+        with open(changes_file, 'r', encoding='utf-8') as f:
+            return list(dict.fromkeys(line.strip() for line in f if line.strip()))
+    except OSError:
+        return []
+
+
+def clear_changed_files(changes_file: Path = CHANGES_FILE) -> None:
+    """Empty the invalidation list, e.g. after a successful deploy."""
+    try:
+        os.remove(changes_file)
+    except FileNotFoundError:
+        pass
+
+
+_change_log: Optional[ChangeLog] = None
+
+
+def get_change_log() -> ChangeLog:
+    """Return the process-wide change log."""
+    global _change_log
+    if _change_log is None:
+        _change_log = ChangeLog()
+    return _change_log
+
+
+def atomic_write(path, content: Union[str, bytes], encoding: str = 'utf-8') -> None:
+    """Write content (text or bytes) via a temp file in the same directory and rename it into place."""
+    path = os.path.abspath(str(path))
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        if isinstance(content, bytes):
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+        else:
+            with os.fdopen(fd, 'w', encoding=encoding) as f:
+                f.write(content)
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_if_changed(path, content: Union[str, bytes], encoding: str = 'utf-8') -> bool:
+    """
+    Write content to path only if it differs from what is already there.
+    Bytes are compared and written as-is (for binary assets).
+    Returns True if the file was written (and recorded as changed).
+    """
+    binary = isinstance(content, bytes)
+    try:
+        with open(path, 'rb' if binary else 'r', encoding=None if binary else encoding) as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+
+    atomic_write(path, content, encoding)
+    get_change_log().record(path)
+    get_store().refresh(path, None if binary else content)
+    return True
+
+
+def remove_file(path) -> bool:
+    """
+    Delete a generated file that is no longer produced, and record it as
+    changed. Returns False if it did not exist.
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return False
+    get_change_log().record(path)
+    get_store().refresh(path)
+    return True
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Generated regions of lesson pages, delimited by stable markers.
+
+The page chrome a generator owns (header, breadcrumb, sidebar, lesson
+navigation, footer) is wrapped in marker comments carrying a hash of the
+region's inputs:
+
+    <!-- region:header 3f2a1b9c0d --><header class="site-header" ...>
+    ...
+    </header><!-- /region:header -->
+
+patch_regions() re-renders only the regions it is given whose input hash
+differs from the one in the page's marker and splices them in with
+apply_edits(); a generator leaves out regions a later fixer rewrites.
+everything outside the changed regions stays byte-identical, including any
+content edited by hand. Regions without markers are left alone, since
+other fixers may have rewritten that markup since the page was generated;
+with adopt=True they are found by their element (REGION_ELEMENTS),
+replaced and marked, so existing pages can be brought under patching
+without being regenerated first.
+
+Inputs are hashed rather than outputs so that a region is only rendered
+when it has to be; what is inside the markers is the generator's to
+overwrite.
+"""
+
+import re
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from build_manifest import input_hash
+from html_splice import ElementSpan, apply_edits, find_element
+
+# Region name -> (tag, class) of the element it covers
+REGION_ELEMENTS = {
+    "header": ("header", "site-header"),
+    "breadcrumb": ("nav", "breadcrumb"),
+    "sidebar": ("aside", "sidebar"),
+    "lesson-navigation": ("div", "lesson-navigation"),
+    "footer": ("footer", "site-footer"),
+}
+
+DIGEST_LENGTH = 10
+REGION_PATTERN = re.compile(r'<!-- region:([\w-]+) ([0-9a-f]+) -->.*?<!-- /region:\1 -->', re.DOTALL)
+
+
+class Region(NamedTuple):
+    """A region's input hash, and how to render its fragment when it changed."""
+    digest: str
+    render: Callable[[], str]
+
+
+class MarkedRegion(NamedTuple):
+    start: int   # '<' of the opening marker
+    end: int     # just after the closing marker
+    digest: str
+
+
+def region_digest(*inputs) -> str:
+    """Short hash of a region's inputs (template source, lesson metadata...)."""
+    return input_hash(*inputs)[:DIGEST_LENGTH]
+
+
+def begin_marker(name: str, digest: str) -> str:
+    return f"<!-- region:{name} {digest} -->"
+
+
+def end_marker(name: str) -> str:
+    return f"<!-- /region:{name} -->"
+
+
+def find_marked_regions(html: str) -> Dict[str, MarkedRegion]:
+    """The marked regions of a page by name (the first one of each name)."""
+    regions: Dict[str, MarkedRegion] = {}
+    for match in REGION_PATTERN.finditer(html):
+        regions.setdefault(match.group(1), MarkedRegion(match.start(), match.end(), match.group(2)))
+    return regions
+
+
+def region_element(html: str, name: str, pos: int = 0) -> Optional[ElementSpan]:
+    tag, class_name = REGION_ELEMENTS[name]
+    return find_element(html, tag, class_name=class_name, pos=pos)
+
+
+def mark_region(name: str, digest: str, fragment: str) -> str:
+    """
+    Wrap the region's element in a rendered fragment with its markers; what
+    comes before or after the element (indentation, comments) stays outside.
+    """
+    span = region_element(fragment, name)
+    if span is None:
+        raise ValueError(f"fragment for region {name!r} has no <{REGION_ELEMENTS[name][0]}> element")
+    return (fragment[:span.start] + begin_marker(name, digest) + fragment[span.start:span.end]
+            + end_marker(name) + fragment[span.end:])
+
+
+def marked_element(name: str, digest: str, fragment: str) -> str:
+    """Just the region's element of a rendered fragment, with its markers."""
+    span = region_element(fragment, name)
+    if span is None:
+        raise ValueError(f"fragment for region {name!r} has no <{REGION_ELEMENTS[name][0]}> element")
+    return begin_marker(name, digest) + fragment[span.start:span.end] + end_marker(name)
+
+
+def patch_regions(html: str, regions: Dict[str, Region],
+                  adopt: bool = False) -> Tuple[str, List[str], List[str], int]:
+    """
+    Splice re-rendered regions into a page where their inputs changed.
+    Returns the new page, the names of the regions patched, the names of
+    the regions the page has no markers for (with adopt, that it has no
+    element for either), and the number of bytes spliced in.
+    """
+    marked = find_marked_regions(html)
+    edits = []
+    patched = []
+    missing = []
+    for name, region in regions.items():
+        current = marked.get(name)
+        if current is not None:
+            if current.digest == region.digest:
+                continue
+            start, end = current.start, current.end
+        else:
+            span = region_element(html, name) if adopt else None
+            if span is None:
+                missing.append(name)
+                continue
+            start, end = span.start, span.end
+        edits.append((start, end, marked_element(name, region.digest, region.render())))
+        patched.append(name)
+    if not edits:
+        return html, patched, missing, 0
+    return apply_edits(html, edits), patched, missing, sum(len(text) for _, _, text in edits)
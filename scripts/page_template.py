@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Compiled page templates for the batch page generators.
+
+A template is text with {{ slot }} placeholders:
+
+    <h1>{{ title }}</h1>
+    <span>Duration: {{ duration }}</span>
+
+Template() parses it once and compiles it to a render function taking the
+slot values as keyword arguments. Rendering is a single ''.join() over the
+literal text and the values: no parsing, formatting or repeated string
+concatenation per page.
+
+bind() fills in some of the slots ahead of time and returns a new compiled
+template with those values merged into its literal text. Generators bind
+the fragments that are the same for every page of a module (header,
+footer, ...) once, so each page only renders its own slots.
+render_with_offsets() also reports where each slot's value landed, for
+fragments rendered once and then spliced per page (a session's sidebar,
+with the current lesson's link marked active).
+
+Values are inserted as they are, without escaping: the generators build
+trusted markup. They must be strings.
+"""
+
+import keyword
+import re
+from typing import Callable, Dict, List, Tuple, Union
+
+SLOT_PATTERN = re.compile(r'\{\{\s*([A-Za-z][A-Za-z0-9_]*)\s*\}\}')
+
+
+class TemplateError(ValueError):
+    """A template that cannot be compiled, or values that do not fit it."""
+
+
+class Slot(str):
+    """A slot name among a template's parts (a plain str is literal text)."""
+
+
+Part = Union[str, Slot]
+
+
+def parse(source: str, name: str = "template") -> List[Part]:
+    """Split a template into literal text and slots, in order."""
+    parts: List[Part] = []
+    position = 0
+    for match in SLOT_PATTERN.finditer(source):
+        slot = match.group(1)
+        if keyword.iskeyword(slot):
+            raise TemplateError(f"{name}: slot name {slot!r} is a Python keyword")
+        if match.start() > position:
+            parts.append(source[position:match.start()])
+        parts.append(Slot(slot))
+        position = match.end()
+    if position < len(source):
+        parts.append(source[position:])
+    return parts
+
+
+def merge_literals(parts: List[Part]) -> List[Part]:
+    """Join runs of adjacent literal text into one part."""
+    merged: List[Part] = []
+    for part in parts:
+        if merged and not isinstance(part, Slot) and not isinstance(merged[-1], Slot):
+            merged[-1] = merged[-1] + part
+        elif part:
+            merged.append(part)
+    return merged
+
+
+def compile_parts(parts: List[Part], name: str = "template") -> Callable[..., str]:
+    """
+    Compile a template's parts to a render function. The literals are bound
+    as constants of the generated function and every slot is a keyword-only
+    argument, so a missing or unknown slot fails with a TypeError naming it.
+    """
+    slots = list(dict.fromkeys(part for part in parts if isinstance(part, Slot)))
+    namespace: Dict[str, str] = {}
+    items = []
+    for part in parts:
+        if isinstance(part, Slot):
+            items.append(str(part))
+        else:
+            literal = f"_literal{len(namespace)}"
+            namespace[literal] = str(part)
+            items.append(literal)
+
+    if not items:
+        body = "''"
+    elif len(items) == 1:
+        body = items[0]
+    else:
+        body = "''.join((" + ", ".join(items) + ",))"
+    signature = ", ".join(["*"] + slots) if slots else ""
+    code = f"def render({signature}):\n    return {body}\n"
+    exec(compile(code, f"<template {name}>", "exec"), namespace)
+    return namespace["render"]
+
+
+class Template:
+    """A template parsed and compiled once, rendered with render(**slots)."""
+
+    def __init__(self, source: str, name: str = "template"):
+        self.source = source
+        self.name = name
+        self._set_parts(merge_literals(parse(source, name)))
+
+    def _set_parts(self, parts: List[Part]) -> None:
+        self.parts = parts
+        self.slots: Tuple[str, ...] = tuple(dict.fromkeys(str(part) for part in parts
+                                                          if isinstance(part, Slot)))
+        self.render = compile_parts(parts, self.name)
+
+    def bind(self, **values: str) -> "Template":
+        """
+        A copy of the template with the given slots filled in and merged into
+        its literal text; the remaining slots are left to render().
+        """
+        unknown = sorted(set(values) - set(self.slots))
+        if unknown:
+            raise TemplateError(f"{self.name}: no slot named {', '.join(unknown)}")
+        bound = Template.__new__(Template)
+        bound.source = self.source
+        bound.name = self.name
+        bound._set_parts(merge_literals([str(values[part]) if isinstance(part, Slot) and part in values
+                                         else part for part in self.parts]))
+        return bound
+
+    def render_with_offsets(self, **values: str) -> Tuple[str, Dict[str, int]]:
+        """
+        Render, and also return where in the output each slot's value starts
+        (its first occurrence). Generators render a shared fragment once this
+        way and splice per-page values in at those offsets later.
+        """
+        missing = [slot for slot in self.slots if slot not in values]
+        if missing:
+            raise TemplateError(f"{self.name}: no value for {', '.join(missing)}")
+        chunks = []
+        offsets: Dict[str, int] = {}
+        length = 0
+        for part in self.parts:
+            if isinstance(part, Slot):
+                offsets.setdefault(str(part), length)
+                part = values[part]
+            chunks.append(part)
+            length += len(part)
+        return ''.join(chunks), offsets
+
+    def __repr__(self) -> str:
+        return f"Template({self.name!r}, slots={list(self.slots)})"
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Process-pool execution for per-file fixers.
+
+run_per_file() fans files out across worker processes and returns one result
+per file in the original order. Each worker's printed output is captured and
+replayed in order, and exceptions are collected per file, so a script's
+report reads the same whether it ran with one job or many.
+"""
+
+import io
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Callable, Dict, List, Sequence
+
+
+def default_jobs() -> int:
+    """Number of worker processes to use for --jobs 0 (all cores)."""
+    return os.cpu_count() or 1
+
+
+def _run_captured(func: Callable, item) -> Dict:
+    """Call func(item) with stdout captured; never raises."""
+    buffer = io.StringIO()
+    result = {"item": item, "result": None, "output": "", "error": None}
+    try:
+        with redirect_stdout(buffer):
+            result["result"] = func(item)
+    except Exception:
+        result["error"] = traceback.format_exc()
+    result["output"] = buffer.getvalue()
+    return result
+
+
+def _run_captured_star(args) -> Dict:
+    return _run_captured(*args)
+
+
+def run_per_file(func: Callable, items: Sequence, jobs: int = 1,
+                 echo: bool = True) -> List[Dict]:
+    """
+    Run func over every item, using up to `jobs` processes (0 = all cores).
+
+    func must be a module-level function so it can be pickled. Returns a list
+    of {"item", "result", "output", "error"} dicts in the order of `items`.
+    With echo=True each file's output (and error, if any) is printed in order.
+    """
+    if jobs == 0:
+        jobs = default_jobs()
+    jobs = max(1, min(jobs, len(items) or 1))
+
+    if jobs == 1:
+        results = map(_run_captured_star, ((func, item) for item in items))
+        return [_echo(r) if echo else r for r in results]
+
+    # Larger chunks cut IPC overhead; keep several chunks per worker for balance
+    chunksize = max(1, len(items) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(_run_captured_star, ((func, item) for item in items),
+                           chunksize=chunksize)
+        return [_echo(r) if echo else r for r in results]
+
+
+def _echo(result: Dict) -> Dict:
+    """Print a captured result's output and error, then return it."""
+    if result["output"]:
+        print(result["output"], end="")
+    if result["error"]:
+        print(f"  ✗ Error processing {result['item']}:\n{result['error']}")
+    return result
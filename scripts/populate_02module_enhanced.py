@@ -7,8 +7,9 @@ This version better preserves formatting and handles special cases.
 import os
 import re
 from pathlib import Path
-from datetime import datetime
-import shutil
+
+from backup_store import backup_files
+from output_writer import write_if_changed
 
 def extract_old_content(old_file_path):
     """
@@ -64,8 +65,7 @@ def update_new_file(new_file_path, old_content):
             updated_content = new_file_content[:match.start(2)] + '\n' + old_content + '\n' + new_file_content[match.end(2):]
             
             # Write the updated content back to the file
-            with open(new_file_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+            write_if_changed(new_file_path, updated_content)
             
             return True
         else:
@@ -112,24 +112,21 @@ def update_lesson_title_and_meta(new_file_path, old_file_path):
             )
             
             # Write back
-            with open(new_file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            write_if_changed(new_file_path, new_content)
                 
     except Exception as e:
         print(f"  Could not update title: {e}")
 
 def backup_current_files():
     """
-    Create a backup of current 02module files before modification.
+    Snapshot the current 02module files into the backup store before modification.
     """
     base_path = Path(r'\\wsl$\Ubuntu\home\practicalace\projects\php_wordpress')
     module_path = base_path / '02module'
-    backup_path = base_path / f'02module_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
-    
-    print(f"Creating backup at: {backup_path}")
+    print(f"Backing up {module_path} to the backup store")
     try:
-        shutil.copytree(module_path, backup_path)
-        print("Backup created successfully")
+        snapshot = backup_files([module_path], label="02module_populate")["snapshot"]
+        print(f"Backup saved to snapshot: {snapshot}")
         return True
     except Exception as e:
         print(f"Error creating backup: {e}")
@@ -214,8 +211,7 @@ def fix_mermaid_diagrams(module_path):
                     '<script src="/assets/js/mermaid-universal-fix.js"></script>\n</body>'
                 )
                 
-                with open(html_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                write_if_changed(html_file, content)
                     
                 print(f"  Fixed Mermaid in: {html_file.name}")
     
@@ -8,8 +8,9 @@ Works on Windows with WSL paths.
 import os
 import re
 from pathlib import Path
-from datetime import datetime
-import shutil
+
+from backup_store import backup_files
+from output_writer import write_if_changed
 
 def get_base_path():
     """
@@ -105,8 +106,7 @@ def update_new_file(new_file_path, old_content):
             updated_content = new_file_content[:match.start(2)] + '\n' + old_content + '\n' + new_file_content[match.end(2):]
             
             # Write the updated content back to the file
-            with open(new_file_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+            write_if_changed(new_file_path, updated_content)
             
             return True
         else:
@@ -153,15 +153,14 @@ def update_lesson_title_and_meta(new_file_path, old_file_path):
             )
             
             # Write back
-            with open(new_file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            write_if_changed(new_file_path, new_content)
                 
     except Exception as e:
         print(f"  Could not update title: {e}")
 
 def backup_current_files():
     """
-    Create a backup of current 02module files before modification.
+    Snapshot the current 02module files into the backup store before modification.
     """
     try:
         base_path = get_base_path()
@@ -170,12 +169,10 @@ def backup_current_files():
         return False
     
     module_path = base_path / '02module'
-    backup_path = base_path / f'02module_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
-    
-    print(f"Creating backup at: {backup_path}")
+    print(f"Backing up {module_path} to the backup store")
     try:
-        shutil.copytree(str(module_path), str(backup_path))
-        print("Backup created successfully")
+        snapshot = backup_files([module_path], label="02module_populate")["snapshot"]
+        print(f"Backup saved to snapshot: {snapshot}")
         return True
     except Exception as e:
         print(f"Error creating backup: {e}")
@@ -274,8 +271,7 @@ def fix_mermaid_diagrams():
                         '<script src="/assets/js/mermaid-universal-fix.js"></script>\n</body>'
                     )
                     
-                    with open(html_file, 'w', encoding='utf-8') as f:
-                        f.write(content)
+                    write_if_changed(html_file, content)
                         
                     print(f"  Fixed Mermaid in: {html_file.name}")
         except Exception as e:
@@ -8,8 +8,9 @@ Based on the working transfer_01module.py script.
 import os
 import re
 from pathlib import Path
-from datetime import datetime
-import shutil
+
+from backup_store import backup_files
+from output_writer import write_if_changed
 
 def extract_main_content(old_file_path):
     """Extract the main content from the old HTML file."""
@@ -112,8 +113,7 @@ def process_file(filename, old_dir, new_dir):
         updated_html = update_new_file(new_file, old_content)
         
         # Write updated content
-        with open(new_file, 'w', encoding='utf-8') as f:
-            f.write(updated_html)
+        write_if_changed(new_file, updated_html)
         
         return True, f"Successfully updated {filename}"
         
@@ -121,14 +121,11 @@ def process_file(filename, old_dir, new_dir):
         return False, f"Error processing {filename}: {str(e)}"
 
 def backup_directory(dir_path):
-    """Create a backup of the directory."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_path = dir_path.parent / f"{dir_path.name}_backup_{timestamp}"
-    
-    print(f"Creating backup at: {backup_path.name}")
+    """Snapshot the directory into the shared backup store."""
+    print(f"Backing up {dir_path.name} to the backup store")
     try:
-        shutil.copytree(str(dir_path), str(backup_path))
-        print("✓ Backup created successfully")
+        snapshot = backup_files([dir_path], label=f"{dir_path.name}_populate")["snapshot"]
+        print(f"✓ Backup saved to snapshot: {snapshot}")
         return True
     except Exception as e:
         print(f"✗ Error creating backup: {e}")
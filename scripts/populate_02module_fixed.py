@@ -7,10 +7,11 @@ This version has corrected path handling for Windows accessing WSL files.
 import os
 import re
 from pathlib import Path, WindowsPath
-from datetime import datetime
-import shutil
 import sys
 
+from backup_store import backup_files
+from output_writer import write_if_changed
+
 def get_base_path():
     """
     Get the base path for the project, with proper Windows/WSL path handling.
@@ -144,8 +145,7 @@ def update_new_file(new_file_path, old_content):
             )
             
             # Write the updated content back to the file
-            with open(new_file_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+            write_if_changed(new_file_path, updated_content)
             
             return True
         else:
@@ -197,8 +197,7 @@ def update_lesson_title_and_meta(new_file_path, old_file_path):
             )
             
             # Write back
-            with open(new_file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            write_if_changed(new_file_path, new_content)
                 
     except Exception as e:
         # Silent fail - title update is not critical
@@ -206,16 +205,13 @@ def update_lesson_title_and_meta(new_file_path, old_file_path):
 
 def backup_current_files(base_path):
     """
-    Create a backup of current 02module files before modification.
+    Snapshot the current 02module files into the backup store before modification.
     """
     module_path = base_path / '02module'
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_path = base_path / f'02module_backup_{timestamp}'
-    
-    print(f"\n📁 Creating backup at: {backup_path.name}")
+    print(f"\n📁 Backing up {module_path} to the backup store")
     try:
-        shutil.copytree(str(module_path), str(backup_path))
-        print("✅ Backup created successfully")
+        snapshot = backup_files([module_path], label="02module_populate")["snapshot"]
+        print(f"✅ Backup saved to snapshot: {snapshot}")
         return True
     except Exception as e:
         print(f"❌ Error creating backup: {e}")
@@ -297,8 +293,7 @@ def fix_mermaid_diagrams(base_path):
                         '<script src="/assets/js/mermaid-universal-fix.js"></script>\n</body>'
                     )
                     
-                    with open(html_file, 'w', encoding='utf-8') as f:
-                        f.write(content)
+                    write_if_changed(html_file, content)
                     
                     files_fixed += 1
                     print(f"  🔧 Fixed Mermaid in: {html_file.name}")
@@ -11,6 +11,9 @@ from pathlib import Path
 from bs4 import BeautifulSoup
 import html
 
+from backup_store import backup_files
+from output_writer import write_if_changed
+
 def extract_old_content(old_file_path):
     """
     Extract the main content from an old module file.
@@ -92,8 +95,7 @@ def update_new_file(new_file_path, old_content):
         updated_html = str(soup.prettify())
         
         # Write the updated content back to the file
-        with open(new_file_path, 'w', encoding='utf-8') as f:
-            f.write(updated_html)
+        write_if_changed(new_file_path, updated_html)
         
         return True
     except Exception as e:
@@ -196,11 +198,8 @@ def process_modules():
 
 def backup_current_files():
     """
-    Create a backup of current 02module files before modification.
+    Snapshot the current 02module files into the backup store before modification.
     """
-    import shutil
-    from datetime import datetime
-    
     try:
         base_path = get_base_path()
     except Exception as e:
@@ -208,12 +207,10 @@ def backup_current_files():
         return False
     
     module_path = base_path / '02module'
-    backup_path = base_path / f'02module_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
-    
-    print(f"Creating backup at: {backup_path}")
+    print(f"Backing up {module_path} to the backup store")
     try:
-        shutil.copytree(module_path, backup_path)
-        print("Backup created successfully")
+        snapshot = backup_files([module_path], label="02module_populate")["snapshot"]
+        print(f"Backup saved to snapshot: {snapshot}")
         return True
     except Exception as e:
         print(f"Error creating backup: {e}")
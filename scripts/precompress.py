@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Precompresses the site for static serving: every HTML page and every CSS,
+JS and JSON asset gets a .gz (and, with the brotli package installed, a .br)
+sibling at maximum compression, e.g.
+
+    assets/dist/navigation.47a81a46d7.js
+    assets/dist/navigation.47a81a46d7.js.gz
+    assets/dist/navigation.47a81a46d7.js.br
+
+so the web server can send those as they are (nginx: gzip_static on;
+brotli_static on;) instead of compressing each response on the fly.
+
+The content hash of every compressed file is kept in
+.build_cache/precompress.json; a file whose hash is unchanged and whose
+siblings exist is skipped, so a rebuild only compresses what changed.
+Files are compressed in parallel across all cores (--jobs). Siblings of
+files that no longer exist are deleted, and new siblings are recorded in
+the change list for deployment (see output_writer.py).
+
+    python scripts/precompress.py [--jobs N] [--force]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import brotli
+except ImportError:  # .br siblings are skipped
+    brotli = None
+
+from asset_pipeline import site_pages
+from course_corpus import CACHE_DIR, PROJECT_ROOT
+from link_graph import LESSON_DIR_PATTERN
+from output_writer import atomic_write, get_change_log
+from parallel_runner import run_per_file
+
+PRECOMPRESS_CACHE_FILE = CACHE_DIR / "precompress.json"
+PRECOMPRESS_VERSION = 1
+
+# Directories whose assets are served, besides the lesson pages
+ASSET_DIRS = ("assets", "styles")
+COMPRESSIBLE_EXTENSIONS = frozenset([".html", ".css", ".js", ".json"])
+SIBLING_EXTENSIONS = (".gz", ".br")
+
+# Smaller files fit in one packet either way
+MIN_SIZE = 256
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def compressible_files(root: Path = PROJECT_ROOT) -> List[str]:
+    """Project-relative paths of the pages and assets to precompress, sorted."""
+    files = list(site_pages(root))
+    for directory in ASSET_DIRS:
+        for dir_path, dir_names, file_names in os.walk(root / directory):
+            dir_names.sort()
+            for name in sorted(file_names):
+                if os.path.splitext(name)[1] in COMPRESSIBLE_EXTENSIONS:
+                    files.append((Path(dir_path) / name).relative_to(root).as_posix())
+    return files
+
+
+def compress(data: bytes, extension: str) -> bytes:
+    if extension == ".gz":
+        # mtime=0 keeps the output identical for identical input
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    return brotli.compress(data, quality=BROTLI_QUALITY)
+
+
+def sibling_extensions() -> Tuple[str, ...]:
+    return SIBLING_EXTENSIONS if brotli is not None else (".gz",)
+
+
+def precompress_file(item: Tuple[str, Optional[str], str]) -> Dict:
+    """
+    Worker: write the compressed siblings of one file unless its content
+    hash matches the cached one and the siblings are all there.
+    """
+    path, cached_hash, root = item
+    source = Path(root) / path
+    with open(source, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    result = {"hash": digest, "size": len(data), "compressed": {}, "written": [], "skipped": False}
+    extensions = sibling_extensions() if len(data) >= MIN_SIZE else ()
+    siblings = [Path(str(source) + extension) for extension in extensions]
+    if digest == cached_hash and all(sibling.exists() for sibling in siblings):
+        result["skipped"] = True
+        result["compressed"] = {sibling.suffix: sibling.stat().st_size for sibling in siblings}
+        return result
+
+    for extension, sibling in zip(extensions, siblings):
+        compressed = compress(data, extension)
+        atomic_write(sibling, compressed)
+        result["compressed"][extension] = len(compressed)
+        result["written"].append(str(sibling))
+    return result
+
+
+def existing_siblings(root: Path = PROJECT_ROOT) -> List[str]:
+    """Project-relative paths of the .gz/.br files of pages and assets on disk."""
+    siblings = []
+    for name in sorted(os.listdir(root)):
+        path = root / name
+        if path.is_dir() and (LESSON_DIR_PATTERN.match(name) or name in ASSET_DIRS):
+            for dir_path, _, file_names in os.walk(path):
+                siblings.extend((Path(dir_path) / file_name).relative_to(root).as_posix()
+                                for file_name in file_names if file_name.endswith(SIBLING_EXTENSIONS))
+        elif name.endswith(SIBLING_EXTENSIONS):
+            siblings.append(name)
+    # e.g. a .tar.gz is not ours
+    return [sibling for sibling in siblings
+            if os.path.splitext(os.path.splitext(sibling)[0])[1] in COMPRESSIBLE_EXTENSIONS]
+
+
+def remove_stale_siblings(current: Set[str], root: Path = PROJECT_ROOT) -> List[str]:
+    """Delete the siblings not in current: their file is gone, or too small now."""
+    removed = []
+    for sibling in existing_siblings(root):
+        if sibling not in current:
+            os.remove(root / sibling)
+            removed.append(sibling)
+    return removed
+
+
+def load_cache(cache_file: Path = PRECOMPRESS_CACHE_FILE) -> Dict[str, str]:
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache.get("files", {}) if cache.get("version") == PRECOMPRESS_VERSION else {}
+
+
+def save_cache(hashes: Dict[str, str], cache_file: Path = PRECOMPRESS_CACHE_FILE) -> None:
+    Path(cache_file).parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(cache_file, json.dumps({"version": PRECOMPRESS_VERSION, "files": hashes},
+                                        separators=(',', ':')))
+
+
+def precompress(root: Path = PROJECT_ROOT, jobs: int = 0, force: bool = False,
+                cache_file: Path = PRECOMPRESS_CACHE_FILE) -> Dict:
+    """Bring every file's compressed siblings up to date."""
+    files = compressible_files(root)
+    cache = {} if force else load_cache(cache_file)
+    results = run_per_file(precompress_file, [(path, cache.get(path), str(root)) for path in files],
+                           jobs=jobs)
+
+    stats = {"files": len(files), "compressed": 0, "skipped": 0, "failed": 0,
+             "bytes": 0, "gz_bytes": 0, "br_bytes": 0}
+    hashes = {}
+    current = set()
+    change_log = get_change_log()
+    for path, result in zip(files, results):
+        if result["error"]:
+            stats["failed"] += 1
+            continue
+        outcome = result["result"]
+        hashes[path] = outcome["hash"]
+        stats["skipped" if outcome["skipped"] else "compressed"] += 1
+        stats["bytes"] += outcome["size"]
+        stats["gz_bytes"] += outcome["compressed"].get(".gz", outcome["size"])
+        stats["br_bytes"] += outcome["compressed"].get(".br", outcome["size"])
+        current.update(path + extension for extension in outcome["compressed"])
+        for sibling in outcome["written"]:
+            change_log.record(sibling)
+    stats["removed"] = len(remove_stale_siblings(current, root))
+    save_cache(hashes, cache_file)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write .gz/.br siblings of the site's pages and assets")
+    parser.add_argument("-j", "--jobs", type=int, default=0,
+                        help="worker processes (default 0: all cores)")
+    parser.add_argument("--force", action="store_true", help="ignore the cache and recompress every file")
+    args = parser.parse_args()
+
+    if brotli is None:
+        print("⚠️  brotli is not installed (pip install brotli); writing .gz siblings only")
+    started = time.perf_counter()
+    print("🗜️  Precompressing pages and assets")
+    stats = precompress(PROJECT_ROOT, jobs=args.jobs, force=args.force)
+    elapsed = time.perf_counter() - started
+
+    print(f"  {stats['compressed']} compressed, {stats['skipped']} unchanged, "
+          f"{stats['removed']} stale siblings removed")
+    if stats["bytes"]:
+        print(f"  {stats['bytes'] / 1024:.0f} KB -> gzip {stats['gz_bytes'] / 1024:.0f} KB"
+              + (f", brotli {stats['br_bytes'] / 1024:.0f} KB" if brotli is not None else ""))
+    if stats["failed"]:
+        print(f"❌ {stats['failed']} files failed in {elapsed:.1f}s")
+        return 1
+    print(f"✅ {stats['files']} files up to date in {elapsed:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Adds prefetch hints for the next lesson to every lesson page.
+
+The lesson order of Module 1 is in the course manifest (course.json, see
+course_manifest.py), but other modules still come from their generators'
+own structures (batch_update_module2.py, ...). All of them end up in the
+same markup, the "Next" button of each page's lesson-navigation block,
+
+    <a class="lesson-nav-button next" href="/01module/how_web_works.html">
+
+so that is the graph used here. For each page with a next lesson, a block
+of hints goes at the end of its <head>:
+
+    <link rel="prefetch" href="/01module/how_web_works.html" data-prefetch=""/>
+    <link rel="prefetch" href="/assets/dist/main.49768e1977.css" data-prefetch=""/>
+
+The next page itself, plus the fingerprinted bundles and shared styles it
+loads that the current page does not already load (see asset_pipeline.py
+and extract_inline_styles.py). The browser fetches them at idle priority,
+so clicking "Next" is served from the cache. Lazily loaded scripts (the
+Mermaid bundle) are left out.
+
+Run it last, after the asset pipeline: bundle names change with their
+content. Hints are marked with data-prefetch and replaced on every run, so
+re-running only rewrites pages whose hints changed.
+
+    python scripts/prefetch_hints.py [add] [--dry-run]
+    python scripts/prefetch_hints.py remove
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from asset_pipeline import DIST_URL, site_pages
+from backup_store import backup_files
+from course_corpus import PROJECT_ROOT, get_store
+from html_splice import apply_edits, iter_tags
+from link_graph import resolve_link
+from output_writer import write_if_changed
+
+PREFETCH_ATTR = "data-prefetch"
+BACKUP_LABEL = "prefetch_hints"
+
+
+def next_lesson(page: str, html: str, pages: List[str]) -> Optional[str]:
+    """The page the lesson's "Next" button leads to, if it is a site page."""
+    for token in iter_tags(html):
+        if token.name == "a" and not token.closing and token.has_class("lesson-nav-button") \
+                and token.has_class("next"):
+            resolved = resolve_link(page, token.get("href") or '')
+            if resolved and resolved[0] in pages and resolved[0] != page:
+                return resolved[0]
+            return None
+    return None
+
+
+def fingerprinted_assets(html: str) -> List[str]:
+    """URLs of the bundles and shared stylesheets a page loads up front, in order."""
+    assets = []
+    for token in iter_tags(html):
+        if token.closing or token.name not in ("link", "script"):
+            continue
+        url = token.get("href" if token.name == "link" else "src")
+        if token.name == "link" and (token.get("rel") or '').lower() != "stylesheet":
+            continue
+        if url and url.startswith(DIST_URL) and url not in assets:
+            assets.append(url)
+    return assets
+
+
+def prefetch_block(urls: List[str]) -> str:
+    return '\n'.join(f'<link rel="prefetch" href="{url}" {PREFETCH_ATTR}=""/>' for url in urls)
+
+
+def rewrite_hints(html: str, urls: List[str]) -> str:
+    """Replace the page's prefetch hints (if any) with hints for urls, at the end of <head>."""
+    edits = []
+    head_end = None
+    for token in iter_tags(html):
+        if token.name == "head" and token.closing:
+            # On its own line, before the (indented) </head>
+            line_start = html.rfind('\n', 0, token.start) + 1
+            head_end = line_start if not html[line_start:token.start].strip() else token.start
+            break
+        if token.name == "body":
+            break
+        if token.name == "link" and not token.closing and token.get(PREFETCH_ATTR) is not None:
+            # Take the line break before the hint with it
+            start = token.start - 1 if html[token.start - 1:token.start] == '\n' else token.start
+            edits.append((start, token.end, ''))
+    if urls and head_end is not None:
+        edits.append((head_end, head_end, prefetch_block(urls) + '\n'))
+    return apply_edits(html, edits) if edits else html
+
+
+def process_pages(pages: List[str], remove: bool = False, dry_run: bool = False,
+                  root: Path = PROJECT_ROOT) -> Dict:
+    """Update the prefetch hints of every page in one pass."""
+    store = get_store()
+    site = set(pages)
+    htmls = {page: store.read_text(root / page) for page in pages}
+    stats = {"pages": len(pages), "changed": 0, "hinted": 0}
+    changed = []
+    for page in pages:
+        html = htmls[page]
+        urls = []
+        target = None if remove else next_lesson(page, html, site)
+        if target is not None:
+            loaded = set(fingerprinted_assets(html))
+            urls = ['/' + target] + [url for url in fingerprinted_assets(htmls[target]) if url not in loaded]
+            stats["hinted"] += 1
+        new_html = rewrite_hints(html, urls)
+        if new_html == html:
+            continue
+        changed.append(page)
+        if not dry_run:
+            backup_files([root / page], label=BACKUP_LABEL)
+            write_if_changed(root / page, new_html)
+    stats["changed"] = len(changed)
+    stats["changed_pages"] = changed
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prefetch the next lesson and its assets from each lesson page")
+    parser.add_argument("command", nargs="?", choices=["add", "remove"], default="add",
+                        help="add (or refresh) the hints, or remove them")
+    parser.add_argument("--dry-run", action="store_true", help="only report the pages that would change")
+    args = parser.parse_args()
+
+    pages = site_pages(PROJECT_ROOT)
+    print(f"🔗 {'Removing' if args.command == 'remove' else 'Adding'} next-lesson prefetch hints "
+          f"in {len(pages)} pages")
+    stats = process_pages(pages, remove=args.command == "remove", dry_run=args.dry_run)
+    if args.command == "add":
+        print(f"  {stats['hinted']} pages have a next lesson")
+    if args.dry_run:
+        print(f"  {stats['changed']} pages would change")
+        return 0
+    print(f"✅ {stats['changed']} pages updated")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
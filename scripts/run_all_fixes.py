@@ -2,93 +2,65 @@
 """
 Master script to run all fixing scripts in sequence.
 This script orchestrates all the fixes for the PHP WordPress course files.
+
+The fixers run in-process as registered pipeline transforms: every file is
+read once, passed through each fixer in order, validated, and written back
+at most once.
 """
 
 import os
-import sys
-import subprocess
-from pathlib import Path
-from typing import List, Dict
+
+from backup_store import backup_files
+from fix_pipeline import load_fixers, run_pipeline
+import validate_structure
+
+# Fixer modules providing the transforms below
+FIXER_MODULES = [
+    "fix_session_names",
+    "fix_quick_links",
+    "fix_mermaid_diagrams",
+]
+load_fixers(FIXER_MODULES)
 
 # Base path for WSL
 BASE_PATH = r"\\wsl$\Ubuntu\home\practicalace\projects\php_wordpress"
-SCRIPTS_PATH = os.path.join(BASE_PATH, "scripts")
 
-# List of fix scripts to run in order
-FIX_SCRIPTS = [
-    "fix_session_names.py",
-    "fix_quick_links.py", 
-    "fix_mermaid_diagrams.py",
-    "validate_structure.py"  # Validation script (we'll create this next)
+# Transforms to apply to every file, in order
+FIX_TRANSFORMS = [
+    "session_names",
+    "quick_links",
+    "mermaid_diagrams",
 ]
 
-def run_script(script_name: str) -> bool:
-    """
-    Run a single fix script and return success status.
-    """
-    script_path = os.path.join(SCRIPTS_PATH, script_name)
-    
-    if not os.path.exists(script_path):
-        print(f"⚠️  Script not found: {script_name}")
-        return False
-    
-    print(f"\n{'='*60}")
-    print(f"🚀 Running: {script_name}")
-    print(f"{'='*60}")
-    
-    try:
-        # Run the script
-        result = subprocess.run(
-            [sys.executable, script_path],
-            capture_output=True,
-            text=True,
-            cwd=SCRIPTS_PATH
-        )
-        
-        # Print output
-        print(result.stdout)
-        
-        if result.stderr:
-            print(f"⚠️  Warnings/Errors:\n{result.stderr}")
-        
-        if result.returncode != 0:
-            print(f"❌ Script failed with return code: {result.returncode}")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error running script: {str(e)}")
-        return False
+# Read-only checks run on the final content of every file
+FIX_CHECKS = [
+    "validate_structure",
+]
+
+# Modules with content
+MODULES = [f"{i:02d}module" for i in range(1, 7)]
 
 def create_backup():
     """
-    Create a backup of all module directories before making changes.
+    Snapshot all module directories into the backup store before making changes.
+    Unchanged lessons are stored only once across all snapshots.
     """
-    import shutil
-    from datetime import datetime
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_dir = os.path.join(BASE_PATH, f"backup_{timestamp}")
-    
-    print(f"📦 Creating backup in: {backup_dir}")
+    print("📦 Creating backup snapshot in the backup store")
     
     try:
-        # Create backup directory
-        os.makedirs(backup_dir, exist_ok=True)
-        
-        # Backup each module
-        for i in range(1, 7):
-            module = f"{i:02d}module"
+        snapshot = None
+        new_blobs = 0
+        for module in MODULES:
             src = os.path.join(BASE_PATH, module)
-            dst = os.path.join(backup_dir, module)
-            
             if os.path.exists(src):
                 print(f"  Backing up {module}...")
-                shutil.copytree(src, dst)
+                stats = backup_files([src], label="run_all_fixes")
+                snapshot = stats["snapshot"] or snapshot
+                new_blobs += stats["new_blobs"]
         
-        print(f"✅ Backup created successfully!")
-        return backup_dir
+        print(f"✅ Backup created successfully! ({new_blobs} new file versions stored)")
+        print(f"   Restore with: python scripts/backup_store.py restore {snapshot}")
+        return snapshot
         
     except Exception as e:
         print(f"❌ Backup failed: {str(e)}")
@@ -101,15 +73,14 @@ def main():
     print("🎯 PHP WordPress Course File Fixer")
     print("=" * 60)
     print(f"Base path: {BASE_PATH}")
-    print(f"Scripts path: {SCRIPTS_PATH}")
     print("=" * 60)
     
     # Ask user if they want to create a backup
     response = input("\n💾 Create backup before proceeding? (y/n): ").strip().lower()
     
     if response == 'y':
-        backup_dir = create_backup()
-        if not backup_dir:
+        snapshot = create_backup()
+        if not snapshot:
             print("⚠️  Backup failed. Continue anyway? (y/n): ", end="")
             if input().strip().lower() != 'y':
                 print("❌ Aborted.")
@@ -117,30 +88,34 @@ def main():
     
     print("\n" + "=" * 60)
     print("🔧 Starting fixes...")
+    print(f"Transforms: {', '.join(FIX_TRANSFORMS)}")
+    print(f"Checks: {', '.join(FIX_CHECKS)}")
     print("=" * 60)
     
-    # Run each fix script
-    success_count = 0
-    failed_scripts = []
+    # Run every fixer over each file in a single pass
+    contexts = run_pipeline(BASE_PATH, MODULES, FIX_TRANSFORMS, FIX_CHECKS)
+    
+    modified_files = [ctx for ctx in contexts if ctx.modified]
+    failed_files = [ctx for ctx in contexts if ctx.error]
     
-    for script in FIX_SCRIPTS:
-        if run_script(script):
-            success_count += 1
-        else:
-            failed_scripts.append(script)
+    # Print the validation report for the final content
+    validation_results = [ctx.results["validate_structure"] for ctx in contexts
+                          if "validate_structure" in ctx.results]
+    validate_structure.print_validation_report(validation_results)
     
     # Print final summary
     print("\n" + "=" * 60)
     print("📊 FINAL SUMMARY")
     print("=" * 60)
-    print(f"✅ Successful scripts: {success_count}/{len(FIX_SCRIPTS)}")
+    print(f"📄 Files processed: {len(contexts)}")
+    print(f"✏️  Files modified: {len(modified_files)}")
     
-    if failed_scripts:
-        print(f"❌ Failed scripts:")
-        for script in failed_scripts:
-            print(f"   - {script}")
+    if failed_files:
+        print(f"❌ Failed files:")
+        for ctx in failed_files:
+            print(f"   - {ctx.module}/{ctx.file_name}: {ctx.error}")
     else:
-        print("🎉 All scripts completed successfully!")
+        print("🎉 All fixes completed successfully!")
     
     print("=" * 60)
     print("✨ Fix process complete!")
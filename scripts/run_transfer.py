@@ -8,6 +8,8 @@ import os
 import re
 from pathlib import Path
 
+from output_writer import write_if_changed
+
 def extract_main_content(old_file_path):
     """Extract the main content from the old HTML file."""
     with open(old_file_path, 'r', encoding='utf-8') as f:
@@ -119,8 +121,7 @@ def process_file(filename, old_dir, new_dir):
         updated_html = update_new_file(new_file, old_content)
         
         # Write updated content
-        with open(new_file, 'w', encoding='utf-8') as f:
-            f.write(updated_html)
+        write_if_changed(new_file, updated_html)
         
         return True, f"Successfully updated {filename}"
         
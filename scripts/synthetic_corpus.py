@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Synthetic course corpus for benchmarking the fixers.
+
+Builds a lesson tree in the current page template (site header, breadcrumb,
+sidebar with session links and Quick Links, lesson body with code blocks,
+Mermaid diagrams converted to inline SVG, lesson-navigation, footer) at any
+size. Pages are laid out as copies of the real course:
+
+    <dest>/part_0000/01module/course_introduction.html
+    <dest>/part_0000/02module/php_if.html
+    ...
+    <dest>/part_0001/01module/course_introduction.html
+
+Each part mirrors the file names of the real 01module..06module directories,
+so fixers that key on lesson names (e.g. the 01module LESSON_ORDER) do their
+real work. Output is deterministic for a given size and seed.
+
+Usage:
+    python synthetic_corpus.py /tmp/corpus_1k --pages 1000
+"""
+
+import argparse
+import os
+import random
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from course_corpus import PROJECT_ROOT
+
+MODULES = ['01module', '02module', '03module', '04module', '05module', '06module']
+
+MODULE_TITLES = {
+    '01module': 'Module 1: Web Fundamentals',
+    '02module': 'Module 2: PHP Fundamentals',
+    '03module': 'Module 3: MySQL Database',
+    '04module': 'Module 4: WordPress & Docker',
+    '05module': 'Module 5: Theme Development',
+    '06module': 'Module 6: Plugin Development',
+}
+
+# Lessons per sidebar session
+SESSION_SIZE = 6
+
+WORDS = (
+    "php variable function array loop string server request response database "
+    "query template theme plugin hook filter action class object method property "
+    "session cookie form input validation output escape include require render "
+    "markup style layout element attribute value condition operator return"
+).split()
+
+CHEVRON_LEFT = ('<svg fill="currentColor" height="20" viewbox="0 0 20 20" width="20">'
+                '<path d="M12.707 5.293a1 1 0 010 1.414L9.414 10l3.293 3.293a1 1 0 01-1.414 '
+                '1.414l-4-4a1 1 0 010-1.414l4-4a1 1 0 011.414 0z"></path></svg>')
+CHEVRON_RIGHT = ('<svg fill="currentColor" height="20" viewbox="0 0 20 20" width="20">'
+                 '<path d="M7.293 14.707a1 1 0 010-1.414L10.586 10 7.293 6.707a1 1 0 011.414-'
+                 '1.414l4 4a1 1 0 010 1.414l-4 4a1 1 0 01-1.414 0z"></path></svg>')
+
+
+def course_file_names(root: Path = PROJECT_ROOT) -> Dict[str, List[str]]:
+    """File names of the real lessons, per module (one placeholder if a module is missing)."""
+    names = {}
+    for module in MODULES:
+        module_path = root / module
+        files = sorted(f for f in os.listdir(module_path) if f.endswith('.html')) \
+            if module_path.is_dir() else []
+        names[module] = files or ['lesson_001.html']
+    return names
+
+
+def title_for(file_name: str) -> str:
+    return file_name.replace('.html', '').replace('_', ' ').title()
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    text = ' '.join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + '.'
+
+
+def generate_header(module: str) -> str:
+    items = '\n'.join(
+        f'<a class="dropdown-item{" active" if m == module else ""}" href="/module{int(m[:2])}.html">'
+        f'{MODULE_TITLES[m].replace("&", "&amp;")}</a>'
+        for m in MODULES
+    )
+    return f'''<header class="site-header" role="banner">
+<div class="header-container">
+<div class="site-branding">
+<a class="site-logo" href="/">
+<h1 class="site-title">PHP WordPress Development</h1>
+</a>
+</div>
+<nav aria-label="Main navigation" class="main-navigation" role="navigation">
+<div class="nav-menu">
+<ul class="nav-list">
+<li class="nav-item"><a class="nav-link" href="/">Home</a></li>
+<li class="nav-item dropdown">
+<button aria-haspopup="true" class="nav-link dropdown-toggle active">Modules</button>
+<div class="dropdown-menu">
+{items}
+</div>
+</li>
+<li class="nav-item"><a class="nav-link" href="/resources.html">Resources</a></li>
+</ul>
+</div>
+</nav>
+<div class="search-container">
+<div class="search-input-wrapper">
+<svg class="search-icon" fill="currentColor" height="20" viewbox="0 0 20 20" width="20">
+<path clip-rule="evenodd" d="M8 4a4 4 0 100 8 4 4 0 000-8zM2 8a6 6 0 1110.89 3.476l4.817 4.817a1 1 0 01-1.414 1.414l-4.816-4.816A6 6 0 012 8z" fill-rule="evenodd"></path>
+</svg>
+<input aria-label="Search" class="search-input" placeholder="Search lessons..." type="search"/>
+</div>
+<div class="search-results"></div>
+</div>
+</div>
+</header>'''
+
+
+def generate_breadcrumb(module: str, title: str) -> str:
+    module_num = int(module[:2])
+    return f'''<nav aria-label="Breadcrumb" class="breadcrumb container">
+<ol class="breadcrumb-list">
+<li class="breadcrumb-item">
+<a class="breadcrumb-link" href="/">Home</a>
+<span class="breadcrumb-separator">/</span>
+</li>
+<li class="breadcrumb-item">
+<a class="breadcrumb-link" href="/module{module_num}.html">Module {module_num}</a>
+<span class="breadcrumb-separator">/</span>
+</li>
+<li class="breadcrumb-item">
+<span aria-current="page" class="breadcrumb-current">{title}</span>
+</li>
+</ol>
+</nav>'''
+
+
+def generate_sidebar(module: str, files: List[str], index: int) -> str:
+    module_num = int(module[:2])
+    session = index // SESSION_SIZE
+    session_files = files[session * SESSION_SIZE:(session + 1) * SESSION_SIZE]
+    links = '\n'.join(
+        f'<li class="active"><a class="sidebar-link active" href="/{module}/{name}">{title_for(name)}</a></li>'
+        if name == files[index] else
+        f'<li><a class="sidebar-link" href="/{module}/{name}">{title_for(name)}</a></li>'
+        for name in session_files
+    )
+    return f'''<aside class="sidebar">
+<div class="sidebar-nav">
+<h3 class="sidebar-title">{MODULE_TITLES[module].replace("&", "&amp;")}</h3>
+<div class="sidebar-section">
+<h4 class="sidebar-section-title">Session {session + 1}</h4>
+<ul class="sidebar-menu">
+{links}
+</ul>
+</div>
+<div class="sidebar-section">
+<h4 class="sidebar-section-title">Quick Links</h4>
+<ul class="sidebar-menu">
+<li><a class="sidebar-link" href="/module{module_num}.html">Module Overview</a></li>
+<li><a class="sidebar-link" href="/module{module_num + 1}.html">Next Module →</a></li>
+<li><a class="sidebar-link" href="/resources.html">Resources</a></li>
+</ul>
+</div>
+</div>
+</aside>'''
+
+
+def generate_mermaid(rng: random.Random, number: int) -> str:
+    """A Mermaid diagram already converted to inline SVG, as in the live lessons."""
+    nodes = []
+    for i in range(rng.randint(3, 6)):
+        y = 40 + i * 70
+        if i % 2:
+            nodes.append(f'<polygon points="400,{y - 25} 470,{y} 400,{y + 25} 330,{y}" '
+                         f'fill="#fff3e0" stroke="#ff9800"/>')
+        else:
+            nodes.append(f'<rect x="320" y="{y - 20}" width="160" height="40" rx="6" '
+                         f'fill="#e3f2fd" stroke="#2196f3"/>')
+        nodes.append(f'<text x="400" y="{y + 5}" text-anchor="middle">{rng.choice(WORDS)}</text>')
+        if i:
+            nodes.append(f'<line x1="400" y1="{y - 45}" x2="400" y2="{y - 25}" stroke="#333" '
+                         f'marker-end="url(#arrow{number})"/>')
+    height = 80 + len(nodes) * 25
+    return f'''<div class="mermaid-converted" style="margin: 1.5rem auto 0; padding: 1rem; text-align: center; overflow: visible; max-width: 100%; min-height: auto;">
+<div style="margin-bottom: 10px; font-size: 12px; color: #6c757d;">Diagram</div>
+    <svg viewBox="0 0 800 {height}" xmlns="http://www.w3.org/2000/svg" style="max-width: 100%; height: auto; display: block; margin: 0 auto;">
+    <defs><marker id="arrow{number}" markerWidth="10" markerHeight="10" refX="5" refY="5" orient="auto"><path d="M0,0 L10,5 L0,10 z" fill="#333"/></marker></defs>
+    {"".join(nodes)}
+    </svg>
+</div>'''
+
+
+def generate_code(rng: random.Random) -> str:
+    name = rng.choice(WORDS)
+    lines = ['$%s = %d;' % (rng.choice(WORDS), rng.randint(0, 99)) for _ in range(rng.randint(2, 6))]
+    body = '\n'.join('    ' + line for line in lines)
+    return f'''<div class="code-example">
+<pre><code class="language-php">&lt;?php
+function {name}_handler() {{
+{body}
+    return ${name};
+}}
+?&gt;</code></pre>
+</div>'''
+
+
+def generate_body(rng: random.Random) -> str:
+    sections = []
+    diagram = 0
+    for _ in range(rng.randint(3, 6)):
+        parts = [f'<h2>{sentence(rng, 3)[:-1]}</h2>']
+        parts.extend(f'<p>{sentence(rng, rng.randint(12, 30))}</p>' for _ in range(rng.randint(2, 4)))
+        if rng.random() < 0.5:
+            parts.append(generate_code(rng))
+        if rng.random() < 0.3:
+            diagram += 1
+            parts.append(generate_mermaid(rng, diagram))
+        sections.append('<section class="content-section">\n' + '\n'.join(parts) + '\n</section>')
+    return '\n'.join(sections)
+
+
+def generate_navigation(module: str, files: List[str], index: int) -> str:
+    module_num = int(module[:2])
+    if index > 0:
+        prev_link, prev_title = f"/{module}/{files[index - 1]}", title_for(files[index - 1])
+    else:
+        prev_link, prev_title = f"/module{module_num}.html", f"Module {module_num} Overview"
+    if index + 1 < len(files):
+        next_link, next_title = f"/{module}/{files[index + 1]}", title_for(files[index + 1])
+    else:
+        next_link, next_title = f"/module{module_num + 1}.html", f"Module {module_num + 1}"
+    return f'''<div class="lesson-navigation">
+<a class="lesson-nav-button prev" href="{prev_link}">
+{CHEVRON_LEFT}
+<span>
+<small>Previous</small><br/>
+{prev_title}
+</span>
+</a>
+<button class="complete-lesson-btn">
+Mark as Complete
+</button>
+<a class="lesson-nav-button next" href="{next_link}">
+<span>
+<small>Next</small><br/>
+{next_title}
+</span>
+{CHEVRON_RIGHT}
+</a>
+</div>'''
+
+
+def generate_page(module: str, files: List[str], index: int, rng: random.Random) -> str:
+    """Render one synthetic lesson page."""
+    title = title_for(files[index])
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8"/>
+<meta content="width=device-width, initial-scale=1.0" name="viewport"/>
+<title>{title} - PHP WordPress Course</title>
+<meta content="{sentence(rng, 12)}" name="description"/>
+<link href="/favicon.png" rel="icon" type="image/png"/>
+<link href="/assets/css/main.css" rel="stylesheet"/><link href="/assets/css/sidebar-enhanced.css" rel="stylesheet"/><link href="/assets/css/sidebar-toggle.css" rel="stylesheet"/>
+</head>
+<body>
+<a class="sr-only" href="#main-content">Skip to main content</a>
+<div class="page-wrapper">
+{generate_header(module)}
+{generate_breadcrumb(module, title)}
+<main class="main-content" id="main-content" role="main">
+<div class="container">
+<div class="content-wrapper">
+{generate_sidebar(module, files, index)}
+<article class="lesson-content">
+<header class="lesson-header">
+<h1>{title}</h1>
+<div class="lesson-meta">
+<div class="lesson-meta-item">{CHEVRON_RIGHT}<span>{rng.randint(20, 90)} minutes</span></div>
+</div>
+</header>
+<div class="lesson-objectives">
+<h2>Learning Objectives</h2>
+<ul>
+{"".join(f"<li>{sentence(rng, 8)}</li>" for _ in range(4))}
+</ul>
+</div>
+<div class="lesson-body">
+{generate_body(rng)}
+</div>
+{generate_navigation(module, files, index)}
+</article>
+</div>
+</div>
+</main>
+<footer class="site-footer" role="contentinfo">
+<div class="footer-container">
+<p class="copyright">© 2025 PHP WordPress Development Course</p>
+</div>
+</footer>
+</div>
+<script src="/assets/js/navigation.js"></script>
+<script src="/assets/js/sidebar-toggle.js"></script>
+</body>
+</html>
+'''
+
+
+def generate_corpus(dest, pages: int, seed: int = 0) -> Dict:
+    """
+    Write `pages` synthetic lessons under dest. Returns the page count, the
+    number of parts and the total size in bytes.
+    """
+    dest = Path(dest)
+    names = course_file_names()
+    part_size = sum(len(files) for files in names.values())
+    total_bytes = 0
+
+    for page in range(pages):
+        part, offset = divmod(page, part_size)
+        for module in MODULES:
+            if offset < len(names[module]):
+                break
+            offset -= len(names[module])
+
+        module_dir = dest / f"part_{part:04d}" / module
+        if offset == 0:
+            module_dir.mkdir(parents=True, exist_ok=True)
+        rng = random.Random(seed * 1_000_003 + page)
+        content = generate_page(module, names[module], offset, rng)
+        with open(module_dir / names[module][offset], 'w', encoding='utf-8') as f:
+            f.write(content)
+        total_bytes += len(content.encode('utf-8'))
+
+    return {"pages": pages, "parts": -(-pages // part_size), "bytes": total_bytes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic course corpus")
+    parser.add_argument("dest", help="directory to create the corpus in")
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    stats = generate_corpus(args.dest, args.pages, args.seed)
+    print(f"✅ Generated {stats['pages']} pages in {stats['parts']} parts "
+          f"({stats['bytes'] / 1024 / 1024:.1f} MB) under {args.dest}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
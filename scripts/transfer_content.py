@@ -9,12 +9,14 @@ import re
 from pathlib import Path
 from bs4 import BeautifulSoup
 
+from course_corpus import get_store
+from output_writer import write_if_changed
+
 def extract_old_content(old_file_path):
     """Extract the main content from the old HTML file."""
-    with open(old_file_path, 'r', encoding='utf-8') as f:
-        old_html = f.read()
-    
-    soup = BeautifulSoup(old_html, 'html.parser')
+    store = get_store()
+    old_html = store.read_text(old_file_path)
+    soup = store.mutable_soup(old_file_path)
     
     # Extract title
     title = soup.find('title')
@@ -43,10 +45,7 @@ def extract_old_content(old_file_path):
 
 def update_new_file(new_file_path, old_content):
     """Update the new file with content from the old file."""
-    with open(new_file_path, 'r', encoding='utf-8') as f:
-        new_html = f.read()
-    
-    soup = BeautifulSoup(new_html, 'html.parser')
+    soup = get_store().mutable_soup(new_file_path)
     
     # Update title
     title_tag = soup.find('title')
@@ -165,10 +164,10 @@ def process_all_files():
             updated_html = update_new_file(new_file, old_content)
             
             # Write updated content
-            with open(new_file, 'w', encoding='utf-8') as f:
-                f.write(updated_html)
-            
-            print(f"  ✓  Successfully updated {filename}")
+            if write_if_changed(new_file, updated_html):
+                print(f"  ✓  Successfully updated {filename}")
+            else:
+                print(f"  ✓  Already up to date: {filename}")
             successful += 1
             
         except Exception as e:
@@ -5,8 +5,9 @@ This script directly copies content without using regex at all.
 """
 
 from pathlib import Path
-from datetime import datetime
-import shutil
+
+from backup_store import backup_files
+from output_writer import write_if_changed
 
 # The 8 files that need fixing
 FILES_TO_FIX = [
@@ -143,8 +144,7 @@ def rebuild_file(new_file_path, old_content):
         )
     
     # Write the result
-    with open(new_file_path, 'w', encoding='utf-8', errors='ignore') as f:
-        f.write(result)
+    write_if_changed(new_file_path, result.encode('utf-8', errors='ignore'))
     
     return True
 
@@ -172,11 +172,9 @@ def main():
     # Optional backup
     response = input("Create backup? (y/n): ")
     if response.lower() == 'y':
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_dir = module_dir.parent / f"02module_ultimate_backup_{timestamp}"
         try:
-            shutil.copytree(str(module_dir), str(backup_dir))
-            print(f"✓ Backup created: {backup_dir.name}\n")
+            snapshot = backup_files([module_dir], label="02module_ultimate")["snapshot"]
+            print(f"✓ Backup saved to snapshot: {snapshot}\n")
         except Exception as e:
             print(f"Backup failed: {e}")
             if input("Continue without backup? (y/n): ").lower() != 'y':
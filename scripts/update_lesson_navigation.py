@@ -9,6 +9,9 @@ from pathlib import Path
 from typing import Tuple, Optional
 from bs4 import BeautifulSoup
 
+from course_corpus import get_store
+from output_writer import write_if_changed
+
 # Define the lesson order from module1.html
 LESSON_ORDER = [
     # Session 1
@@ -224,12 +227,8 @@ def update_lesson_file(file_path: Path) -> bool:
     assert next_title is not None
 
     try:
-        # Read the file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(content, 'html.parser')
+        # Get a private copy of the parsed document from the shared store
+        soup = get_store().mutable_soup(file_path)
 
         # Find the existing navigation div
         nav_div = soup.find('div', class_='lesson-navigation')
@@ -247,12 +246,11 @@ def update_lesson_file(file_path: Path) -> bool:
                 # Replace the old navigation with the new one
                 nav_div.replace_with(new_nav_div)
 
-                # Write the updated content back
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    # Use prettify but maintain original formatting
-                    f.write(str(soup))
-
-                print(f"✓ Updated: {lesson_file}")
+                # Write the updated content back (only if something changed)
+                if write_if_changed(file_path, str(soup)):
+                    print(f"✓ Updated: {lesson_file}")
+                else:
+                    print(f"✓ Already up to date: {lesson_file}")
                 return True
             else:
                 print(f"✗ Error creating new navigation for: {lesson_file}")
@@ -9,135 +9,15 @@ from pathlib import Path
 from typing import Tuple, Optional
 from bs4 import BeautifulSoup
 
-# Define the lesson order from module1.html
-LESSON_ORDER = [
-    # Session 1
-    'course_introduction.html',
-    'how_web_works.html',
-    'development_environment.html',
-    'first_html_page.html',
-    'homework_setup.html',
-    # Session 2
-    'html_structure_syntax.html',
-    'essential_html_tags.html',
-    'html_forms_inputs.html',
-    'html_validation_practices.html',
-    'homework_html_profile.html',
-    # Session 3
-    'introduction_to_css.html',
-    'css_syntax_and_selectors.html',
-    'css_implementation_methods.html',
-    'css_colors_fonts_text.html',
-    'css_box_model.html',
-    'homework_css_profile.html',
-    # Session 4
-    'css_layout_tech.html',
-    'responsive_design.html',
-    'media_queries.html',
-    'mobile_first.html',
-    'homework_responsive_profile.html',
-    # Session 5
-    'bootstrap.html',
-    'bootstrap_grid.html',
-    'bootstrap_components.html',
-    'css_organization_best_practices.html',
-    'css_preprocessors.html',
-    'homework_bootstrap_profile.html',
-    # Session 6
-    'js_intro.html',
-    'js_syntax_fundamentals.html',
-    'js_operators_and_expressions.html',
-    'js_control_flow.html',
-    'js_functions_and_scope.html',
-    'homework_simple_js_programs.html',
-    # Session 7
-    'understanding_dom.html',
-    'dom_selection_manipulation.html',
-    'event_handling.html',
-    'creating_removing_elements.html',
-    'form_validation.html',
-    'homework_interactive.html',
-    # Session 8
-    'es6_overview.html',
-    'jquery_intro.html',
-    'jquery_dom_manipulation.html',
-    'jquery_animations_and_effects.html',
-    'jquery_ajax.html',
-    'homework_jquery_refactor.html',
-    # Session 9
-    'php_and_wordpress.html',
-    'php_setup_xampp_mamp.html',
-    'php_syntax.html',
-    'php_variables_data_and_operators.html',
-    'php_includes.html',
-    'homework_simple_php.html',
-    # Session 10
-    'planning_website.html',
-    'creating_layout.html',
-    'adding_interactivity_with_js.html',
-    'php_header_footer.html',
-    'project_static_site.html'
-]
-
-# Map lesson files to their display titles
-LESSON_TITLES = {
-    'course_introduction.html': 'Course Introduction',
-    'how_web_works.html': 'How the Web Works',
-    'development_environment.html': 'Development Environment',
-    'first_html_page.html': 'Your First HTML Page',
-    'homework_setup.html': 'Homework: Setup',
-    'html_structure_syntax.html': 'HTML Structure & Syntax',
-    'essential_html_tags.html': 'Essential HTML Tags',
-    'html_forms_inputs.html': 'HTML Forms & Inputs',
-    'html_validation_practices.html': 'HTML Validation & Best Practices',
-    'homework_html_profile.html': 'Homework: HTML Profile',
-    'introduction_to_css.html': 'Introduction to CSS',
-    'css_syntax_and_selectors.html': 'CSS Syntax & Selectors',
-    'css_implementation_methods.html': 'CSS Implementation Methods',
-    'css_colors_fonts_text.html': 'CSS Colors, Fonts & Text',
-    'css_box_model.html': 'The CSS Box Model',
-    'homework_css_profile.html': 'Homework: CSS Profile',
-    'css_layout_tech.html': 'CSS Layout Techniques',
-    'responsive_design.html': 'Responsive Design',
-    'media_queries.html': 'Media Queries',
-    'mobile_first.html': 'Mobile-First Approach',
-    'homework_responsive_profile.html': 'Homework: Responsive Profile',
-    'bootstrap.html': 'Introduction to Bootstrap',
-    'bootstrap_grid.html': 'Bootstrap Grid System',
-    'bootstrap_components.html': 'Bootstrap Components',
-    'css_organization_best_practices.html': 'CSS Organization & Best Practices',
-    'css_preprocessors.html': 'CSS Preprocessors',
-    'homework_bootstrap_profile.html': 'Homework: Bootstrap Profile',
-    'js_intro.html': 'Introduction to JavaScript',
-    'js_syntax_fundamentals.html': 'JavaScript Syntax & Fundamentals',
-    'js_operators_and_expressions.html': 'JavaScript Operators & Expressions',
-    'js_control_flow.html': 'JavaScript Control Flow',
-    'js_functions_and_scope.html': 'Functions & Scope',
-    'homework_simple_js_programs.html': 'Homework: Simple JS Programs',
-    'understanding_dom.html': 'Understanding the DOM',
-    'dom_selection_manipulation.html': 'DOM Selection & Manipulation',
-    'event_handling.html': 'Event Handling',
-    'creating_removing_elements.html': 'Creating & Removing Elements',
-    'form_validation.html': 'Form Validation',
-    'homework_interactive.html': 'Homework: Interactive Page',
-    'es6_overview.html': 'ES6+ Features Overview',
-    'jquery_intro.html': 'Introduction to jQuery',
-    'jquery_dom_manipulation.html': 'jQuery DOM Manipulation',
-    'jquery_animations_and_effects.html': 'jQuery Animations & Effects',
-    'jquery_ajax.html': 'AJAX with jQuery',
-    'homework_jquery_refactor.html': 'Homework: jQuery Refactor',
-    'php_and_wordpress.html': 'PHP and WordPress',
-    'php_setup_xampp_mamp.html': 'PHP Setup (XAMPP/MAMP)',
-    'php_syntax.html': 'PHP Syntax',
-    'php_variables_data_and_operators.html': 'PHP Variables & Operators',
-    'php_includes.html': 'PHP Includes',
-    'homework_simple_php.html': 'Homework: Simple PHP',
-    'planning_website.html': 'Planning a Website',
-    'creating_layout.html': 'Creating a Layout',
-    'adding_interactivity_with_js.html': 'Adding JavaScript Interactivity',
-    'php_header_footer.html': 'PHP Header & Footer',
-    'project_static_site.html': 'Final Project: Static Site'
-}
+from course_corpus import get_store
+from course_manifest import load_manifest
+from output_writer import write_if_changed
+
+MODULE_FOLDER = "01module"
+
+# The lesson order and titles come from the course manifest (course.json)
+COURSE = load_manifest()
+LESSON_ORDER = [lesson.file for lesson in COURSE.module(MODULE_FOLDER).lessons]
 
 
 def get_navigation_html(prev_link: str, prev_title: str,
@@ -173,35 +53,29 @@ def get_navigation_html(prev_link: str, prev_title: str,
 def get_navigation_for_lesson(lesson_file: str) -> Tuple[
         Optional[str], Optional[str], Optional[str], Optional[str]]:
     """Get navigation links and titles for a specific lesson"""
-    try:
-        index = LESSON_ORDER.index(lesson_file)
-    except ValueError:
+    lesson = COURSE.lesson(MODULE_FOLDER, lesson_file)
+    if lesson is None or lesson.hidden:
         print(f"Warning: {lesson_file} not found in lesson order")
         return None, None, None, None
 
     # Previous lesson
-    if index == 0:
-        prev_link = "/module1.html"
+    prev_lesson = COURSE.previous(lesson)
+    if prev_lesson is None:
+        prev_link = f"/module{lesson.module}.html"
         prev_title = "Module Overview"
     else:
-        prev_file = LESSON_ORDER[index - 1]
-        prev_link = f"/01module/{prev_file}"
-        prev_title = LESSON_TITLES.get(
-            prev_file,
-            prev_file.replace('.html', '').replace('_', ' ').title()
-        )
+        prev_link = prev_lesson.url
+        prev_title = prev_lesson.nav_title
 
     # Next lesson
-    if index == len(LESSON_ORDER) - 1:
-        next_link = "/module2.html"
-        next_title = "Module 2: PHP Fundamentals"
+    next_lesson = COURSE.next(lesson)
+    if next_lesson is None:
+        next_module = COURSE.module(lesson.module + 1)
+        next_link = f"/module{lesson.module + 1}.html"
+        next_title = f"Module {next_module.number}: {next_module.title}"
     else:
-        next_file = LESSON_ORDER[index + 1]
-        next_link = f"/01module/{next_file}"
-        next_title = LESSON_TITLES.get(
-            next_file,
-            next_file.replace('.html', '').replace('_', ' ').title()
-        )
+        next_link = next_lesson.url
+        next_title = next_lesson.nav_title
 
     return prev_link, prev_title, next_link, next_title
 
@@ -224,12 +98,8 @@ def update_lesson_file(file_path: Path) -> bool:
     assert next_title is not None
 
     try:
-        # Read the file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(content, 'html.parser')
+        # Get a private copy of the parsed document from the shared store
+        soup = get_store().mutable_soup(file_path)
 
         # Find the existing navigation div
         nav_div = soup.find('div', class_='lesson-navigation')
@@ -247,12 +117,11 @@ def update_lesson_file(file_path: Path) -> bool:
                 # Replace the old navigation with the new one
                 nav_div.replace_with(new_nav_div)
 
-                # Write the updated content back
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    # Use prettify but maintain original formatting
-                    f.write(str(soup))
-
-                print(f"✓ Updated: {lesson_file}")
+                # Write the updated content back (only if something changed)
+                if write_if_changed(file_path, str(soup)):
+                    print(f"✓ Updated: {lesson_file}")
+                else:
+                    print(f"✓ Already up to date: {lesson_file}")
                 return True
             else:
                 print(f"✗ Error creating new navigation for: {lesson_file}")
@@ -9,6 +9,9 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+from backup_store import backup_files
+from output_writer import write_if_changed
+
 # Base directory
 BASE_DIR = Path("/home/practicalace/projects/php_wordpress")
 
@@ -451,13 +454,9 @@ def main():
         try:
             print(f"📝 Processing {filename}...")
             
-            # Create backup
-            backup_path = filepath.with_suffix('.html.backup')
-            with open(filepath, 'r', encoding='utf-8') as f:
-                original_content = f.read()
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                f.write(original_content)
-            print(f"   💾 Backup created: {backup_path.name}")
+            # Snapshot the original into the shared backup store
+            snapshot = backup_files([filepath], label="module3_lessons")["snapshot"]
+            print(f"   💾 Backup saved to snapshot {snapshot}")
             
             # Extract existing content
             content = extract_lesson_content(filepath)
@@ -470,8 +469,7 @@ def main():
             new_html = create_proper_lesson_file(filename, lesson_info, content)
             
             # Save updated file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(new_html)
+            write_if_changed(filepath, new_html)
             
             updated.append(filename)
             print(f"   ✅ Updated successfully")
@@ -504,7 +502,7 @@ def main():
             print(f"   - {filename}")
     
     print("\n🎉 Update complete!")
-    print("💡 Backups saved with .backup extension")
+    print("💡 Backups saved in .backup_store (python scripts/backup_store.py list)")
     print("📝 Files now match the proper template structure")
 
 if __name__ == "__main__":
@@ -9,6 +9,9 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+from backup_store import backup_files
+from output_writer import write_if_changed
+
 # Base directory
 BASE_DIR = Path("/home/practicalace/projects/php_wordpress")
 
@@ -398,19 +401,14 @@ def main():
                 print(f"   ❌ Failed to generate HTML: {filename}")
                 continue
             
-            # Backup existing file
-            backup_path = filepath.with_suffix('.html.backup')
-            with open(filepath, 'r', encoding='utf-8') as f:
-                backup_content = f.read()
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                f.write(backup_content)
+            # Snapshot the existing file into the shared backup store
+            snapshot = backup_files([filepath], label="module_overviews")["snapshot"]
             
             # Write updated file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            write_if_changed(filepath, html_content)
             
             updated.append(filename)
-            print(f"   ✅ Updated: {filename} (backup saved as {backup_path.name})")
+            print(f"   ✅ Updated: {filename} (backup in snapshot {snapshot})")
             
         except Exception as e:
             failed.append((filename, str(e)))
@@ -436,7 +434,7 @@ def main():
     
     print(f"\n🎉 Module overview pages update complete!")
     print("✨ Original content preserved with updated structure")
-    print("💡 Backup files created with .backup extension")
+    print("💡 Backups saved in .backup_store (python scripts/backup_store.py list)")
 
 if __name__ == "__main__":
     import sys
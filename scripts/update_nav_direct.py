@@ -6,6 +6,8 @@ Direct path version - no path resolution issues
 
 import re
 
+from output_writer import write_if_changed
+
 # Define the lesson order from module1.html
 LESSON_ORDER = [
     # Session 1
@@ -236,8 +238,7 @@ def update_lesson_file(file_path, lesson_file):
             updated_content = re.sub(pattern, new_nav_html, content, count=1, flags=re.DOTALL)
             
             # Write the updated content back
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+            write_if_changed(file_path, updated_content)
             
             print(f"✓ Updated: {lesson_file}")
             return True
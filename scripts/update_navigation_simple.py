@@ -8,6 +8,8 @@ import os
 import re
 from pathlib import Path
 
+from output_writer import write_if_changed
+
 # Define the lesson order from module1.html
 LESSON_ORDER = [
     # Session 1
@@ -239,8 +241,7 @@ def update_lesson_file(file_path):
             updated_content = re.sub(pattern, new_nav_html, content, count=1, flags=re.DOTALL)
             
             # Write the updated content back
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+            write_if_changed(file_path, updated_content)
             
             print(f"✓ Updated: {lesson_file}")
             return True
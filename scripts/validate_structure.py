@@ -10,22 +10,27 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from collections import defaultdict
 
+from fix_pipeline import register_check
+
 # Base path for WSL
 BASE_PATH = r"\\wsl$\Ubuntu\home\practicalace\projects\php_wordpress"
 
 class HTMLValidator:
     """Validator for HTML course files."""
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, content: Optional[str] = None):
         self.file_path = file_path
         self.file_name = os.path.basename(file_path)
         self.module = os.path.basename(os.path.dirname(file_path))
         self.issues = []
         self.warnings = []
-        self.content = ""
+        self.content = content or ""
+        self.preloaded = content is not None
         
     def load_file(self) -> bool:
-        """Load the HTML file content."""
+        """Load the HTML file content (unless it was handed in already)."""
+        if self.preloaded:
+            return True
         try:
             with open(self.file_path, 'r', encoding='utf-8') as f:
                 self.content = f.read()
@@ -192,6 +197,11 @@ class HTMLValidator:
             "valid": len(self.issues) == 0
         }
 
+@register_check("validate_structure")
+def validate_structure_check(content: str, ctx) -> Dict:
+    """Pipeline check: validate the already-loaded content of a file."""
+    return HTMLValidator(ctx.file_path, content).validate()
+
 def validate_module(module: str) -> List[Dict]:
     """Validate all HTML files in a module."""
     module_path = os.path.join(BASE_PATH, module)
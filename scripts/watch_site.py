@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Watch the lesson directories and keep the site consistent as lessons are
+edited.
+
+Instead of re-running whole-module scripts by hand after an edit
+(run_all_fixes.py, fix_02module_navigation.py, fix_mermaid_02module.py),
+leave the watcher running:
+
+    python scripts/watch_site.py watch
+    python scripts/watch_site.py apply 02module/php_if.html
+
+It listens for saved, created, moved and deleted pages through the
+kernel's inotify API (called through ctypes, so nothing to install; where
+inotify is not available it polls mtimes instead), waits for the burst of
+events of one save to settle, and then for just the changed pages:
+
+  1. runs the fix pipeline transforms registered for their directory
+     (WATCH_TRANSFORMS) that still hold on the page, and the structure
+     check (see fix_pipeline.py), again if they changed the page, until it
+     settles;
+  2. updates the link graph, and re-assembles the search and code indexes
+     only if the text they index changed. The index builders stay in
+     memory between edits, so only the changed pages are re-extracted.
+
+Every fixer involved works on one page at a time (their navigation and
+session tables are static, not read from other pages), so an edit never
+makes other pages stale. The watcher's own writes are recognized by their
+content hash and do not trigger another pass. "apply" does the same work
+once for the given pages, e.g. from a git hook.
+
+Later build stages rewrite what some fixers produce: the navigation
+generators replace their sidebars, the asset pipeline bundles the links
+they add, extract_inline_styles.py moves the styles they inject. So a
+transform is only re-applied to a page if the page as last built already
+satisfied it (running it changed nothing); the others belong to a stage
+that ran after it, and re-applying them would undo that stage. Which
+transforms hold is recorded per page, with its content hash, in
+.build_cache/watch_fixers.json: `watch` records it for every page on
+start (the first start takes a few seconds), `apply` uses what was
+recorded before the edit, or the page as it is now if nothing was.
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from build_code_index import CODE_INDEX_FILE, CodeIndexBuilder
+from build_search_index import INDEX_DIR, SearchIndexBuilder
+from course_corpus import CACHE_DIR, PROJECT_ROOT, get_store
+from fix_pipeline import TRANSFORMS, FileContext, load_fixers, process_file
+from link_graph import LESSON_DIR_PATTERN, ROOT_PAGE_PATTERN, LinkGraph
+from output_writer import atomic_write, write_if_changed
+from run_all_fixes import FIX_CHECKS, FIX_TRANSFORMS, MODULES
+
+# Fixer modules providing the Module 2 transforms below (run_all_fixes
+# loads the others)
+FIXER_MODULES = [
+    "fix_02module_navigation",
+    "fix_mermaid_02module",
+]
+load_fixers(FIXER_MODULES)
+
+# Transforms re-applied to a changed page, by lesson directory, in order.
+# Module 2's navigation rebuilds the sidebar, so it runs before the
+# transforms that touch up the sidebar.
+WATCH_TRANSFORMS = {module: list(FIX_TRANSFORMS) for module in MODULES}
+WATCH_TRANSFORMS["02module"] = ["navigation_02module"] + FIX_TRANSFORMS + ["mermaid_02module"]
+
+# Which transforms hold on each page, as last built
+FIXER_STATE_FILE = CACHE_DIR / "watch_fixers.json"
+FIXER_STATE_VERSION = 1
+
+# Fixers work on each other's output (BeautifulSoup re-sorts the attributes
+# the regex fixers append), so a page can need another pass to settle
+MAX_PASSES = 3
+
+# Quiet time that ends a burst of events (editors save in several steps)
+DEBOUNCE_SECONDS = 0.05
+POLL_INTERVAL = 0.5
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_ONLYDIR = 0x01000000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+EVENT_HEADER = struct.Struct("iIII")
+
+# Returned by a watcher when events were lost and every page must be looked at
+RESCAN = None
+
+
+def watched_directories(root: Path = PROJECT_ROOT) -> List[Path]:
+    """The site root (overview pages) and the lesson directories."""
+    return [root] + [root / name for name in sorted(os.listdir(root))
+                     if LESSON_DIR_PATTERN.match(name) and (root / name).is_dir()]
+
+
+def is_site_page(page: str) -> bool:
+    """True for a project-relative path of a lesson or overview page."""
+    directory, _, name = page.rpartition('/')
+    if not name.endswith('.html') or name.startswith('.'):
+        return False
+    return bool(LESSON_DIR_PATTERN.match(directory)) if directory else bool(ROOT_PAGE_PATTERN.match(name))
+
+
+class InotifyWatcher:
+    """Changed files in a set of directories, from the kernel's inotify API."""
+
+    def __init__(self, directories: Iterable[Path]):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.directories: Dict[int, str] = {}
+        for directory in directories:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(str(directory)), WATCH_MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                os.close(self.fd)
+                raise OSError(errno, f"cannot watch {directory}: {os.strerror(errno)}")
+            self.directories[wd] = str(directory)
+
+    def read(self, timeout: Optional[float] = None) -> Optional[List[str]]:
+        """
+        Paths of the files that changed within timeout seconds (None: wait
+        for the next event). Returns RESCAN if the kernel dropped events.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        data = os.read(self.fd, 64 * 1024)
+        paths = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b'\0')
+            offset += EVENT_HEADER.size + length
+            if mask & IN_Q_OVERFLOW:
+                return RESCAN
+            directory = self.directories.get(wd)
+            if directory and name:
+                paths.append(os.path.join(directory, os.fsdecode(name)))
+        return paths
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """The same interface by comparing mtimes, where inotify is not available."""
+
+    def __init__(self, directories: Iterable[Path], interval: float = POLL_INTERVAL):
+        self.directories = [str(directory) for directory in directories]
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for directory in self.directories:
+            for entry in os.scandir(directory):
+                if entry.name.endswith('.html') and entry.is_file():
+                    stat = entry.stat()
+                    snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def read(self, timeout: Optional[float] = None) -> Optional[List[str]]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            if remaining > 0:
+                time.sleep(remaining)
+            snapshot = self._scan()
+            changed = [path for path in set(snapshot) | set(self.snapshot)
+                       if snapshot.get(path) != self.snapshot.get(path)]
+            self.snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(directories: List[Path], poll: bool = False):
+    """An inotify watcher, or a polling one if asked to or inotify is unavailable."""
+    if not poll:
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify is not available ({e}), polling every {POLL_INTERVAL}s instead")
+    return PollingWatcher(directories)
+
+
+def indexed_content(builder, page: str, fields: Tuple[str, ...]):
+    """What an index takes from a page (None if the page is gone), re-extracted if it changed."""
+    if not (builder.root / page).exists():
+        return None
+    entry = builder.page_entry(page)
+    return tuple(entry[field] for field in fields)
+
+
+class IndexRefresher:
+    """
+    The link graph and the search and code index builders, kept in memory so
+    that each refresh only re-extracts the changed pages.
+    """
+
+    def __init__(self, root: Path = PROJECT_ROOT):
+        self.links = LinkGraph(root)
+        self.search = SearchIndexBuilder(root)
+        self.code = CodeIndexBuilder(root)
+
+    def _changed(self, builder, pages: List[str], fields: Tuple[str, ...]) -> bool:
+        changed = False
+        for page in pages:
+            entry = builder.cache.get(page)
+            before = tuple(entry[field] for field in fields) if entry else None
+            if indexed_content(builder, page, fields) != before:
+                changed = True
+        return changed
+
+    def refresh(self, pages: List[str]) -> List[str]:
+        """Bring the indexes up to date for the changed pages. Returns the ones rebuilt."""
+        rebuilt = []
+        stats = self.links.update(pages)
+        if stats["scanned"] or stats["removed"]:
+            rebuilt.append("link graph")
+
+        if self._changed(self.search, pages, ("document", "terms")):
+            self.search.update(INDEX_DIR)
+            rebuilt.append("search index")
+
+        if self._changed(self.code, pages, ("title", "blocks")):
+            CODE_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+            write_if_changed(CODE_INDEX_FILE, self.code.build())
+            rebuilt.append("code index")
+        return rebuilt
+
+    def save(self) -> None:
+        """
+        Persist the link graph and the extraction caches. They are only
+        caches of what is on disk, so the watcher saves them when it stops
+        rather than after every edit.
+        """
+        if self.links.dirty:
+            self.links.save()
+        for builder in (self.search, self.code):
+            if builder.stats["extracted"] or builder.stats["removed"] or builder.touched:
+                builder.save_cache()
+            builder.stats.update(extracted=0, cached=0, removed=0)
+            builder.touched = False
+
+
+def module_of(page: str) -> str:
+    return page.split('/', 1)[0] if '/' in page else ""
+
+
+def holding_transforms(page: str, content: str, root: Path = PROJECT_ROOT) -> List[str]:
+    """The watch transforms of a page's directory that leave its content unchanged."""
+    module = module_of(page)
+    ctx = FileContext(str(Path(root) / page), module)
+    return [name for name in WATCH_TRANSFORMS.get(module, []) if TRANSFORMS[name](content, ctx) == content]
+
+
+class FixerState:
+    """
+    The transforms that hold on each page as last built or settled, with
+    the content hash they were recorded for.
+    """
+
+    def __init__(self, root: Path = PROJECT_ROOT, state_file: Path = FIXER_STATE_FILE):
+        self.root = Path(root)
+        self.state_file = Path(state_file)
+        self.pages: Dict[str, Dict] = self._load()
+        self.dirty = False
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get("pages", {}) if data.get("version") == FIXER_STATE_VERSION else {}
+
+    def record(self, page: str) -> List[str]:
+        """Record the transforms that hold on a page as it is now."""
+        document = get_store().get(self.root / page)
+        entry = self.pages.get(page)
+        if entry is None or entry["digest"] != document.digest:
+            entry = {"digest": document.digest, "holds": holding_transforms(page, document.text, self.root)}
+            self.pages[page] = entry
+            self.dirty = True
+        return entry["holds"]
+
+    def record_all(self, pages: Iterable[str]) -> int:
+        """Record every page whose content changed since it was last recorded. Returns how many."""
+        store = get_store()
+        stale = [page for page in pages
+                 if self.pages.get(page, {}).get("digest") != store.get(self.root / page).digest]
+        for page in stale:
+            self.record(page)
+        return len(stale)
+
+    def transforms(self, page: str) -> List[str]:
+        """
+        The transforms to re-apply to an edited page: those that held before
+        the edit, or, if it was never recorded, those that hold now.
+        """
+        if page not in self.pages:
+            return self.record(page)
+        holds = set(self.pages[page]["holds"])
+        return [name for name in WATCH_TRANSFORMS.get(module_of(page), []) if name in holds]
+
+    def forget(self, page: str) -> None:
+        if self.pages.pop(page, None) is not None:
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.state_file, json.dumps({"version": FIXER_STATE_VERSION, "pages": self.pages},
+                                                 separators=(',', ':')))
+        self.dirty = False
+
+
+class SiteWatcher:
+    """Re-applies the affected fixers and indexes to changed pages."""
+
+    def __init__(self, root: Path = PROJECT_ROOT, indexes: bool = True, state_file: Path = FIXER_STATE_FILE):
+        self.root = Path(root)
+        self.indexes = IndexRefresher(self.root) if indexes else None
+        self.fixers = FixerState(self.root, state_file)
+        # Content hash of each page as the watcher last left it
+        self.settled: Dict[str, str] = {}
+
+    def relative(self, path) -> Optional[str]:
+        try:
+            return Path(os.path.abspath(str(path))).relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+    def affected_pages(self, paths: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """The site pages among paths that were edited or deleted since the watcher last saw them."""
+        edited: Set[str] = set()
+        deleted: Set[str] = set()
+        store = get_store()
+        for path in paths:
+            page = self.relative(path)
+            if page is None or not is_site_page(page):
+                continue
+            full_path = self.root / page
+            if not full_path.exists():
+                store.refresh(full_path)
+                self.settled.pop(page, None)
+                self.fixers.forget(page)
+                deleted.add(page)
+                continue
+            if store.get(full_path).digest != self.settled.get(page):
+                edited.add(page)
+        return sorted(edited), sorted(deleted)
+
+    def apply(self, paths: Iterable[str]) -> Dict:
+        """Fix the changed pages among paths and refresh the indexes."""
+        started = time.perf_counter()
+        edited, deleted = self.affected_pages(paths)
+        stats = {"edited": edited, "deleted": deleted, "modified": [], "failed": [], "issues": 0,
+                 "indexes": []}
+        if not edited and not deleted:
+            return stats
+
+        store = get_store()
+        for page in edited:
+            module = module_of(page)
+            file_path = str(self.root / page)
+            try:
+                transforms = self.fixers.transforms(page)
+                modified = False
+                for _ in range(MAX_PASSES):
+                    ctx = process_file(file_path, module, transforms, FIX_CHECKS)
+                    if not ctx.modified:
+                        # Fixers can undo each other's edits within a pass; only
+                        # report the passes that left the page different
+                        break
+                    modified = True
+                    for message in ctx.messages:
+                        print(f"  {message}")
+            except Exception as e:
+                stats["failed"].append((page, str(e)))
+                print(f"  ❌ {page}: {e}")
+                continue
+            if modified:
+                stats["modified"].append(page)
+            issues = [issue for result in ctx.results.values() for issue in result.get("issues", [])]
+            if issues:
+                stats["issues"] += len(issues)
+                print(f"  ⚠️  {page}: {issues[0]}" + (f" (+{len(issues) - 1} more)" if len(issues) > 1 else ""))
+            self.settled[page] = store.get(file_path).digest
+            self.fixers.record(page)
+        fixed = time.perf_counter()
+
+        if self.indexes is not None:
+            stats["indexes"] = self.indexes.refresh(edited + deleted)
+        stats["fix_seconds"] = fixed - started
+        stats["seconds"] = time.perf_counter() - started
+        return stats
+
+    def save(self) -> None:
+        """Persist the fixer state and the index caches."""
+        self.fixers.save()
+        if self.indexes is not None:
+            self.indexes.save()
+
+
+def report(stats: Dict) -> None:
+    pages = len(stats["edited"]) + len(stats["deleted"])
+    if not pages:
+        return
+    summary = f"✅ {pages} page(s) consistent in {stats['fix_seconds'] * 1000:.0f} ms"
+    if stats["modified"]:
+        summary += f", {len(stats['modified'])} rewritten by the fixers"
+    if stats["indexes"]:
+        summary += f"; {', '.join(stats['indexes'])} refreshed ({stats['seconds'] * 1000:.0f} ms total)"
+    print(summary)
+
+
+def watch(site: SiteWatcher, poll: bool = False) -> None:
+    """Handle batches of changes until interrupted."""
+    directories = watched_directories(site.root)
+    pages = [site.relative(path) for directory in directories for path in sorted(directory.glob("*.html"))]
+    recorded = site.fixers.record_all(page for page in pages if is_site_page(page))
+    if recorded:
+        print(f"🔎 Recorded the fixers that hold on {recorded} page(s)")
+    watcher = open_watcher(directories, poll)
+    kind = "Polling" if isinstance(watcher, PollingWatcher) else "Watching"
+    print(f"👀 {kind} {len(directories)} directories under {site.root} (Ctrl+C to stop)")
+    try:
+        while True:
+            paths = watcher.read()
+            # Collect the rest of the burst before doing any work
+            while paths is not RESCAN:
+                more = watcher.read(DEBOUNCE_SECONDS)
+                if not more:
+                    if more is RESCAN:
+                        paths = RESCAN
+                    break
+                paths.extend(more)
+            if paths is RESCAN:
+                print("⚠️  Events were dropped, checking every page")
+                paths = [str(path) for directory in directories for path in directory.glob("*.html")]
+            stats = site.apply(paths)
+            for page in stats["deleted"]:
+                print(f"  🗑️  {page} removed")
+            report(stats)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
+        site.save()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-run only the affected fixers and indexes when lessons change")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    watch_parser = subparsers.add_parser("watch", help="watch the lesson directories until interrupted")
+    watch_parser.add_argument("--poll", action="store_true", help="poll mtimes instead of using inotify")
+    watch_parser.add_argument("--no-indexes", action="store_true",
+                              help="only run the fixers, leave the link graph and search indexes alone")
+    apply_parser = subparsers.add_parser("apply", help="process the given pages once")
+    apply_parser.add_argument("pages", nargs="+", help="page paths, e.g. 02module/php_if.html")
+    apply_parser.add_argument("--no-indexes", action="store_true",
+                              help="only run the fixers, leave the link graph and search indexes alone")
+    args = parser.parse_args()
+
+    site = SiteWatcher(indexes=not args.no_indexes)
+    if args.command == "watch":
+        watch(site, poll=args.poll)
+        return 0
+
+    paths = [os.path.abspath(page) if os.path.exists(page) else str(PROJECT_ROOT / page) for page in args.pages]
+    stats = site.apply(paths)
+    site.save()
+    report(stats)
+    if not stats["edited"] and not stats["deleted"]:
+        print("⏭️  No site pages among the given paths")
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
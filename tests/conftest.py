@@ -0,0 +1,12 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Keep the change log, caches and backups of test runs out of the project
+_scratch = tempfile.mkdtemp(prefix="course-tests-")
+os.environ.setdefault("COURSE_CACHE_DIR", os.path.join(_scratch, "cache"))
+os.environ.setdefault("COURSE_BACKUP_DIR", os.path.join(_scratch, "backups"))
+
+# The build scripts import each other as top-level modules
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
@@ -0,0 +1,73 @@
+"""asset_pipeline.py: fixers and re-runs never load a file twice."""
+
+import shutil
+from collections import Counter
+
+import pytest
+
+import asset_pipeline
+import fix_01module_navigation
+from course_corpus import PROJECT_ROOT
+from html_splice import iter_tags
+
+PAGES = [
+    "01module/adding_interactivity_with_js.html",
+    "01module/bootstrap.html",
+    "03module/aggregate_functions.html",
+]
+
+
+@pytest.fixture
+def site(tmp_path):
+    root = tmp_path / "site"
+    shutil.copytree(PROJECT_ROOT / "assets" / "css", root / "assets" / "css")
+    shutil.copytree(PROJECT_ROOT / "assets" / "js", root / "assets" / "js")
+    for page in PAGES:
+        (root / page).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(PROJECT_ROOT / page, root / page)
+    return root
+
+
+def loaded_files(html):
+    """How often each local stylesheet and script is loaded, bundled or not."""
+    counts = Counter()
+    for token in iter_tags(html):
+        if token.closing or token.name not in ("link", "script"):
+            continue
+        if token.get(asset_pipeline.BUNDLE_ATTR) is not None:
+            counts.update(token.get(asset_pipeline.BUNDLE_ATTR).split())
+        elif token.name == "script" and (token.get("src") or "").startswith("/assets/"):
+            counts[token.get("src")] += 1
+        elif token.get("rel") == "stylesheet" and (token.get("href") or "").startswith("/assets/"):
+            counts[token.get("href")] += 1
+    return counts
+
+
+def bundle(root):
+    return asset_pipeline.process_pages(PAGES, root=root, dist_dir=root / "assets" / "dist")
+
+
+@pytest.mark.parametrize("mode", ["splice", "soup"])
+def test_fixer_then_bundle_twice_loads_nothing_twice(site, mode):
+    bundle(site)
+    for page in PAGES:
+        if page.startswith("01module/"):
+            fix_01module_navigation.fix_lesson_navigation(str(site / page), mode)
+    bundle(site)
+
+    assert bundle(site)["changed"] == 0
+    for page in PAGES:
+        html = (site / page).read_text(encoding='utf-8')
+        twice = [source for source, count in loaded_files(html).items() if count > 1]
+        assert twice == [], page
+        assert "/assets/css/sidebar-enhanced.css" in loaded_files(html), page
+
+
+def test_fixer_leaves_bundled_page_alone(site):
+    page = site / PAGES[0]
+    bundle(site)
+    before = page.read_text(encoding='utf-8')
+
+    fix_01module_navigation.fix_lesson_navigation(str(page), "splice")
+
+    assert loaded_files(page.read_text(encoding='utf-8')) == loaded_files(before)
@@ -0,0 +1,65 @@
+"""build_search_index.py: an incremental rebuild writes what a full build would."""
+
+import re
+import shutil
+
+from build_search_index import SearchIndexBuilder
+from course_corpus import PROJECT_ROOT
+
+PAGES = [
+    "01module/adding_interactivity_with_js.html",
+    "01module/bootstrap.html",
+    "02module/php_if.html",
+    "03module/aggregate_functions.html",
+]
+
+
+def edit(path, pattern, replacement):
+    html = path.read_text(encoding='utf-8')
+    edited = re.sub(pattern, replacement, html, count=1)
+    assert edited != html
+    path.write_text(edited, encoding='utf-8')
+
+
+def index_files(index_dir):
+    return {path.relative_to(index_dir).as_posix(): path.read_bytes()
+            for path in sorted(index_dir.rglob("*")) if path.is_file()}
+
+
+def test_rebuild_matches_full_build(tmp_path):
+    root = tmp_path / "site"
+    for page in PAGES:
+        (root / page).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(PROJECT_ROOT / page, root / page)
+    index_dir = tmp_path / "index"
+    builder = SearchIndexBuilder(root, tmp_path / "terms.json")
+    assert builder.update(index_dir)["full"]
+
+    edit(root / PAGES[0], r'<p>', '<p>Zanzibarquux ')
+    edit(root / PAGES[2], r'<h2>', '<h2>Quokka ')
+    shutil.copyfile(root / PAGES[2], root / "02module/php_if_copy.html")
+    (root / PAGES[1]).unlink()
+    stats = builder.update(index_dir)
+
+    full_dir = tmp_path / "full"
+    SearchIndexBuilder(root, tmp_path / "full_terms.json").update(full_dir)
+    assert not stats["full"]
+    assert index_files(index_dir) == index_files(full_dir)
+
+
+def test_rebuild_leaves_other_shards_and_typeahead_alone(tmp_path):
+    root = tmp_path / "site"
+    for page in PAGES:
+        (root / page).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(PROJECT_ROOT / page, root / page)
+    index_dir = tmp_path / "index"
+    builder = SearchIndexBuilder(root, tmp_path / "terms.json")
+    builder.update(index_dir)
+
+    edit(root / PAGES[0], r'<p>', '<p>Zanzibarquux ')
+    files, stale = builder.rebuild(index_dir)
+
+    assert "typeahead.bin" not in files
+    assert not any(name.startswith(("02module/", "03module/")) for name in files)
+    assert files["terms/z.json"]["zanzibarquux"] == 1
+    assert stale == []
@@ -0,0 +1,64 @@
+"""watch_site.py: a saved page keeps its built output apart from the edit."""
+
+import re
+import shutil
+
+import pytest
+
+from course_corpus import PROJECT_ROOT
+from watch_site import SiteWatcher
+
+# Built pages whose sidebars, bundles and styles later stages rewrote
+BUILT_PAGES = [
+    "01module/adding_interactivity_with_js.html",
+    "02module/php_if.html",
+    "05module/accessibility_best_practices.html",
+]
+
+FIRST_PARAGRAPH = re.compile(r'<p>(\w+) ')
+
+
+def copy_pages(root, pages):
+    for page in pages:
+        (root / page).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(PROJECT_ROOT / page, root / page)
+
+
+def edit(path, pattern, replacement):
+    html = path.read_text(encoding='utf-8')
+    edited = pattern.sub(replacement, html, count=1)
+    assert edited != html
+    path.write_text(edited, encoding='utf-8')
+    return edited
+
+
+@pytest.mark.parametrize("recorded", [True, False], ids=["watch", "apply"])
+@pytest.mark.parametrize("page", BUILT_PAGES)
+def test_saved_page_matches_built_output_apart_from_edit(tmp_path, page, recorded):
+    root = tmp_path / "site"
+    copy_pages(root, [page])
+    site = SiteWatcher(root, indexes=False, state_file=tmp_path / "watch_fixers.json")
+    if recorded:
+        site.fixers.record_all([page])
+
+    expected = edit(root / page, FIRST_PARAGRAPH, r'<p>\1 really ')
+    stats = site.apply([str(root / page)])
+
+    assert stats["edited"] == [page]
+    assert not stats["failed"]
+    assert (root / page).read_text(encoding='utf-8') == expected
+
+
+def test_fixer_that_held_is_reapplied(tmp_path):
+    page = "03module/aggregate_functions.html"
+    root = tmp_path / "site"
+    copy_pages(root, [page])
+    site = SiteWatcher(root, indexes=False, state_file=tmp_path / "watch_fixers.json")
+    site.fixers.record_all([page])
+    built = (root / page).read_text(encoding='utf-8')
+
+    edit(root / page, re.compile(r'(<h4 class="sidebar-section-title">Session \d+)[^<]+'), r'\1')
+    stats = site.apply([str(root / page)])
+
+    assert stats["modified"] == [page]
+    assert (root / page).read_text(encoding='utf-8') == built
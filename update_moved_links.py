@@ -4,8 +4,16 @@ Update links in moved HTML files from 07module, 08module, 09module to 06module
 """
 
 import os
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from link_graph import get_link_graph
+from output_writer import write_if_changed
+
+# Module directories whose links need rewriting
+OLD_MODULE_DIRS = ['07module', '08module', '09module']
+
 def update_links_in_file(file_path):
     """Update all links in a single HTML file"""
     updates_made = []
@@ -31,8 +39,7 @@ def update_links_in_file(file_path):
         
         # Save the file if changes were made
         if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_if_changed(file_path, content)
             return updates_made
         
     except Exception as e:
@@ -80,6 +87,13 @@ def main():
     print("Updating Links in Moved HTML Files")
     print("=" * 60)
     
+    # Only files that still link into the old module directories need a rewrite
+    graph = get_link_graph(base_path.parent)
+    needs_update = {
+        Path(page).name for page in graph.pages_linking_into(OLD_MODULE_DIRS)
+        if Path(page).parent.name == base_path.name
+    }
+    
     total_files_updated = 0
     
     for filename in files_to_update:
@@ -87,7 +101,7 @@ def main():
         
         if file_path.exists():
             print(f"\nProcessing: {filename}")
-            updates = update_links_in_file(file_path)
+            updates = update_links_in_file(file_path) if filename in needs_update else []
             
             if updates:
                 total_files_updated += 1